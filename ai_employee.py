@@ -17,12 +17,15 @@ Usage:
 Commands:
     python ai_employee.py              # Run interactive CLI
     python ai_employee.py --watch      # Run file watcher in background
+    python ai_employee.py --once       # Process new Inbox files once and exit
     python ai_employee.py --dashboard  # Run live dashboard only
 
 Requirements:
     pip install -r requirements.txt
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import time
@@ -39,24 +42,43 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-# Rich library for beautiful terminal UI
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.layout import Layout
-from rich.text import Text
-from rich.spinner import Spinner
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.prompt import Prompt, Confirm
-from rich.style import Style
-from rich import box
-from rich.live import Live as RichLive
-
-# Colorama for Windows color support
-from colorama import init as colorama_init
-
-# Initialize colorama for Windows
-colorama_init()
+# Shared --profile / --profile-out handling (scripts/profiling.py)
+sys.path.insert(0, str(Path(__file__).parent.resolve() / "scripts"))
+from profiling import profile_cycle, profile_main
+
+# Rich (terminal UI) and colorama are imported by load_ui() on first use, so
+# the headless paths (--once, --watch) start without loading them
+Console = Panel = Table = Layout = Text = Spinner = None
+Progress = SpinnerColumn = TextColumn = BarColumn = None
+Prompt = Confirm = Style = box = RichLive = None
+_ui_loaded = False
+
+
+def load_ui() -> None:
+    """Import the Rich UI classes into this module and initialize colorama (once)"""
+    global Console, Panel, Table, Layout, Text, Spinner
+    global Progress, SpinnerColumn, TextColumn, BarColumn
+    global Prompt, Confirm, Style, box, RichLive, _ui_loaded
+    if _ui_loaded:
+        return
+    
+    # Rich library for beautiful terminal UI
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.layout import Layout
+    from rich.text import Text
+    from rich.spinner import Spinner
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+    from rich.prompt import Prompt, Confirm
+    from rich.style import Style
+    from rich import box
+    from rich.live import Live as RichLive
+    
+    # Colorama for Windows color support
+    from colorama import init as colorama_init
+    colorama_init()
+    _ui_loaded = True
 
 # =============================================================================
 # CONFIGURATION
@@ -256,13 +278,20 @@ class VaultData:
 class FileWatcher:
     """File watcher with real-time monitoring"""
     
-    def __init__(self, callback: Optional[Callable[[str], None]] = None):
+    def __init__(self, callback: Optional[Callable[[str], None]] = None,
+                 console: Optional[Console] = None):
         self.callback = callback
         self.running = False
         self.thread: Optional[threading.Thread] = None
-        self.console = Console()
+        self.console = console  # None: plain output, no UI modules needed
         self.processed_files: set = set()
     
+    def _notify(self, message: str) -> None:
+        if self.console is not None:
+            self.console.print(f"[dim]{message}[/dim]")
+        else:
+            print(message)
+    
     def start(self) -> None:
         """Start watching in background thread"""
         VaultData.ensure_folders()
@@ -270,14 +299,14 @@ class FileWatcher:
         self.running = True
         self.thread = threading.Thread(target=self._watch_loop, daemon=True)
         self.thread.start()
-        self.console.print(f"[dim]👁️ File watcher started - Monitoring Inbox/[/dim]")
+        self._notify("👁️ File watcher started - Monitoring Inbox/")
     
     def stop(self) -> None:
         """Stop watching"""
         self.running = False
         if self.thread:
             self.thread.join(timeout=5)
-        self.console.print(f"[dim]⏹️ File watcher stopped[/dim]")
+        self._notify("⏹️ File watcher stopped")
     
     def _watch_loop(self) -> None:
         """Main watch loop"""
@@ -287,24 +316,39 @@ class FileWatcher:
                     time.sleep(WATCH_INTERVAL)
                     continue
                 
-                current_files = {f.name for f in INBOX_FOLDER.iterdir() if f.is_file()}
-                
-                for filename in current_files:
-                    if filename not in self.processed_files:
-                        # New file detected!
-                        self._create_task(filename)
-                        self.processed_files.add(filename)
-                        VaultData.save_processed_file(filename)
-                        
-                        if self.callback:
-                            self.callback(f"new:{filename}")
-                
+                # One watch cycle (profiled with --profile-cycles N)
+                with profile_cycle():
+                    self.scan_once()
                 time.sleep(WATCH_INTERVAL)
                 
             except Exception as e:
                 VaultData.log_error(f"Watcher error: {e}")
                 time.sleep(WATCH_INTERVAL)
     
+    def scan_once(self) -> List[str]:
+        """
+        Create tasks for Inbox files not seen before.
+        
+        Returns:
+            list: Filenames that were new in this scan
+        """
+        if not INBOX_FOLDER.exists():
+            return []
+        
+        current_files = {f.name for f in INBOX_FOLDER.iterdir() if f.is_file()}
+        new_files = sorted(current_files - self.processed_files)
+        
+        for filename in new_files:
+            # New file detected!
+            self._create_task(filename)
+            self.processed_files.add(filename)
+            VaultData.save_processed_file(filename)
+            
+            if self.callback:
+                self.callback(f"new:{filename}")
+        
+        return new_files
+    
     def _create_task(self, filename: str) -> None:
         """Create a task file for new inbox file"""
         try:
@@ -593,6 +637,7 @@ class AIEmployeeCLI:
     """Main unified CLI application"""
     
     def __init__(self, mode: str = "interactive"):
+        load_ui()
         self.console = Console()
         self.mode = mode  # "interactive", "dashboard", "watch"
         self.running = True
@@ -730,7 +775,7 @@ class AIEmployeeCLI:
         self.load_data()
         
         # Restart watcher and auto-refresh
-        self.watcher = FileWatcher(callback=self.handle_event)
+        self.watcher = FileWatcher(callback=self.handle_event, console=self.console)
         self.watcher.start()
         self.start_auto_refresh()
         
@@ -797,7 +842,7 @@ Log all actions in System_Log.md for tracking.
             time.sleep(1.5)
 
         # Start file watcher in background
-        self.watcher = FileWatcher(callback=self.handle_event)
+        self.watcher = FileWatcher(callback=self.handle_event, console=self.console)
         self.watcher.start()
 
         # Start auto-refresh in background
@@ -856,7 +901,7 @@ Log all actions in System_Log.md for tracking.
         self.clear_screen()
         
         # Start file watcher
-        self.watcher = FileWatcher(callback=self.handle_event)
+        self.watcher = FileWatcher(callback=self.handle_event, console=self.console)
         self.watcher.start()
         
         # Start auto-refresh
@@ -1055,6 +1100,7 @@ Log all actions in System_Log.md for tracking.
 
 def print_banner():
     """Print startup banner"""
+    load_ui()
     console = Console()
     banner = """
 +==========================================================+
@@ -1065,18 +1111,53 @@ def print_banner():
     console.print("[bold cyan]" + banner + "[/bold cyan]")
 
 
+def process_once() -> Dict[str, int]:
+    """
+    Headless processing pass (python ai_employee.py --once): plan the files
+    in the vault Inbox, create review tasks for new files in Inbox/, and
+    exit. Used by the inbox watcher's AI processing trigger, so it prints
+    plain text and never starts the UI.
+    
+    The watcher records every file in Logs/processed_files.txt as soon as it
+    detects it, before triggering this pass, so that list cannot decide what
+    is processed here: the task planner keeps its own tracker.
+    
+    Returns:
+        dict: Statistics about the pass
+    """
+    from task_planner import TaskPlanner
+    from metrics_registry import write_textfile
+    
+    VaultData.ensure_folders()
+    watcher = FileWatcher()
+    watcher.processed_files = VaultData.load_processed_files()
+    with profile_cycle():
+        planner_stats = TaskPlanner().process_inbox()
+        new_files = watcher.scan_once()
+    write_textfile("task_planner")
+    
+    for filename in new_files:
+        print(f"Task created: {filename}")
+    print(f"Planned {planner_stats['plans_created']} vault Inbox file(s), "
+          f"created {len(new_files)} review task(s)")
+    return dict(planner_stats, new_files=len(new_files), pending_tasks=len(VaultData.get_pending_tasks()))
+
+
 def main():
     """Main entry point"""
-    console = Console()
-    
     # Parse arguments
+    if len(sys.argv) > 1 and sys.argv[1] == "--once":
+        if process_once()["errors"]:
+            sys.exit(1)
+        return
+    
     mode = "interactive"
     if len(sys.argv) > 1:
         if sys.argv[1] == "--dashboard":
             mode = "dashboard"
         elif sys.argv[1] == "--watch":
-            # Just run watcher mode
-            console.print("[cyan]Starting file watcher only...[/cyan]")
+            # Just run watcher mode (headless: no UI modules)
+            print("Starting file watcher only...")
             VaultData.ensure_folders()
             watcher = FileWatcher()
             watcher.start()
@@ -1085,7 +1166,7 @@ def main():
                     time.sleep(1)
             except KeyboardInterrupt:
                 watcher.stop()
-                console.print("[yellow]Watcher stopped[/yellow]")
+                print("Watcher stopped")
             return
     
     print_banner()
@@ -1095,4 +1176,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    profile_main(main, "ai_employee")
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Batched Logging Pipeline for the Business MCP Server
+
+logger.info() on a FileHandler/StreamHandler takes the handler lock, writes
+and flushes synchronously on the caller's thread - in the MCP server, that is
+the event loop. This module moves the I/O to one background thread:
+
+- callers only enqueue the record (InProcessQueueHandler)
+- BatchingLogListener drains whatever has accumulated (up to max_batch
+  records), writes the whole batch, then flushes each handler once
+
+Under light load every record is still flushed immediately; under heavy load
+flushes are amortized over the batch.
+
+Usage:
+    listener = install_queue_logging([file_handler, stream_handler])
+    ...
+    listener.stop()
+
+Benchmark:
+    python log_pipeline.py --messages 100000
+"""
+
+import argparse
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from typing import Optional
+
+# =============================================================================
+# Configuration Defaults
+# =============================================================================
+
+DEFAULT_MAX_BATCH = 1000
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_STOP = object()
+
+
+# =============================================================================
+# Deferred-flush Handlers
+# =============================================================================
+
+
+class DeferredFlushMixin:
+    """
+    Write records without flushing; the listener flushes once per batch.
+
+    Replaces StreamHandler.emit, which flushes after every record.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                # FileHandler opened with delay=True
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchFileHandler(DeferredFlushMixin, logging.FileHandler):
+    """FileHandler that leaves flushing to BatchingLogListener."""
+
+
+class BatchStreamHandler(DeferredFlushMixin, logging.StreamHandler):
+    """StreamHandler that leaves flushing to BatchingLogListener."""
+
+
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+
+    The stock prepare() formats and copies every record so it can be pickled
+    to another process; here the record only needs its message frozen (in
+    case args are mutated later), which keeps the caller's cost minimal.
+    Formatting happens on the writer thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# =============================================================================
+# Listener
+# =============================================================================
+
+
+class BatchingLogListener:
+    """
+    Background thread that writes queued log records in batches.
+
+    Args:
+        log_queue: Queue fed by an InProcessQueueHandler
+        handlers: Handlers that do the actual writing
+        max_batch: Most records written between two flushes
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, handlers: list[logging.Handler],
+                 max_batch: int = DEFAULT_MAX_BATCH):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.max_batch = max(1, max_batch)
+        self.batches = 0
+        self.records = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def _handle(self, record: logging.LogRecord) -> None:
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _flush(self) -> None:
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for record in batch:
+                if record is _STOP:
+                    stopping = True
+                    continue
+                self._handle(record)
+                self.records += 1
+            self.batches += 1
+            self._flush()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write everything queued so far, then stop the thread."""
+        if self._thread is None:
+            return
+        self.queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        self._flush()
+
+
+def install_queue_logging(handlers: list[logging.Handler], level: int = logging.INFO,
+                          max_batch: int = DEFAULT_MAX_BATCH) -> BatchingLogListener:
+    """
+    Route the root logger through a queue to a batching writer thread.
+
+    Args:
+        handlers: Output handlers (their formatters are used as-is)
+        level: Root logger level
+
+    Returns:
+        The started listener; call stop() at shutdown to drain the queue
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = InProcessQueueHandler(log_queue)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = BatchingLogListener(log_queue, handlers, max_batch=max_batch)
+    listener.start()
+    return listener
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+
+def _time_logging(logger: logging.Logger, messages: int) -> float:
+    start = time.perf_counter()
+    for index in range(messages):
+        logger.info(f"BUSINESS_ACTIVITY: benchmark message {index}")
+    return time.perf_counter() - start
+
+
+def run_benchmark(messages: int, max_batch: int = DEFAULT_MAX_BATCH) -> dict[str, float]:
+    """
+    Compare direct logging with the queued, batched pipeline.
+
+    Both runs mirror the server: every record goes to a log file and to a
+    stream (standing in for stderr, here redirected to a file).
+
+    Returns:
+        dict of messages/sec for the caller and for end-to-end delivery
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="log_bench_") as tmp_dir:
+        logger = logging.getLogger("business-mcp.benchmark")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+
+        def outputs(prefix, file_class, stream_class):
+            stream = open(os.path.join(tmp_dir, f"{prefix}.stderr"), "w")
+            handlers = [file_class(os.path.join(tmp_dir, f"{prefix}.log")), stream_class(stream)]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            return handlers, stream
+
+        # Baseline: write and flush on the calling thread
+        handlers, stream = outputs("direct", logging.FileHandler, logging.StreamHandler)
+        for handler in handlers:
+            logger.addHandler(handler)
+        elapsed = _time_logging(logger, messages)
+        for handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+        stream.close()
+        results["direct_msgs_per_sec"] = messages / elapsed
+
+        # Queued: the caller only enqueues; the listener writes in batches
+        handlers, stream = outputs("batched", BatchFileHandler, BatchStreamHandler)
+        log_queue = queue.SimpleQueue()
+        listener = BatchingLogListener(log_queue, handlers, max_batch=max_batch)
+        listener.start()
+        queue_handler = InProcessQueueHandler(log_queue)
+        logger.addHandler(queue_handler)
+        start = time.perf_counter()
+        caller_elapsed = _time_logging(logger, messages)
+        listener.stop()
+        total_elapsed = time.perf_counter() - start
+        logger.removeHandler(queue_handler)
+        for handler in handlers:
+            handler.close()
+        stream.close()
+
+        with open(os.path.join(tmp_dir, "batched.log"), "rb") as f:
+            written = sum(1 for _ in f)
+
+        results["queued_caller_msgs_per_sec"] = messages / caller_elapsed
+        results["queued_end_to_end_msgs_per_sec"] = messages / total_elapsed
+        results["batches"] = listener.batches
+        results["written"] = written
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the batched MCP logging pipeline")
+    parser.add_argument("--messages", type=int, default=100000, help="Messages to log")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="Records per flush")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.messages, args.max_batch)
+    print(f"Messages:                 {args.messages}")
+    print(f"Direct (file + stream):   {results['direct_msgs_per_sec']:>12,.0f} msgs/sec")
+    print(f"Queued (caller side):     {results['queued_caller_msgs_per_sec']:>12,.0f} msgs/sec")
+    print(f"Queued (end to end):      {results['queued_end_to_end_msgs_per_sec']:>12,.0f} msgs/sec")
+    print(f"Batches flushed:          {results['batches']:>12,}")
+    if results["written"] != args.messages:
+        print(f"WARNING: only {results['written']} of {args.messages} lines written", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
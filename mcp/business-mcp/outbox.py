@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Durable Outbox for the Business MCP Server
+
+Outbound emails and LinkedIn posts are written to an SQLite queue before any
+network call is made. The MCP tool returns the message id as soon as the row
+is committed, and a small pool of worker threads delivers in the background:
+
+- failed deliveries are retried with exponential backoff (plus jitter) until
+  max_attempts, unless the handler raises PermanentDeliveryError
+- deliveries per destination are throttled by token buckets (RateLimiter),
+  and a handler raising RetryAfterError pauses that destination
+- kinds with a batch handler are claimed and delivered several due messages
+  per destination at a time (e.g. emails over one SMTP session)
+- an idempotency key makes repeated enqueues of the same action a no-op, and
+  identical content queued again within a kind's coalescing window is merged
+- messages left "sending" by a crashed process are picked up again on start
+
+Delivery is at-least-once: a crash between a successful send and recording
+it means the message is sent again on the next start.
+
+Usage:
+    outbox = Outbox(db_path, handlers={"email": deliver_email})
+    outbox.start()
+    message_id, duplicate = outbox.enqueue("email", "smtp", {"to": ...})
+"""
+
+import hashlib
+import json
+import random
+import sqlite3
+import threading
+import time
+import uuid
+import logging
+from typing import Any, Callable, Optional
+
+from rate_limiter import RateLimiter, RetryAfterError
+
+logger = logging.getLogger("business-mcp")
+
+# =============================================================================
+# Configuration Defaults
+# =============================================================================
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_BASE_DELAY = 5.0        # seconds before the first retry
+DEFAULT_MAX_DELAY = 900.0       # cap on the backoff between retries
+DEFAULT_BATCH_SIZE = 20         # messages claimed per batch handler call
+POLL_INTERVAL = 1.0             # idle workers re-check the queue this often
+
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    idempotency_key TEXT UNIQUE,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    last_error TEXT,
+    result TEXT,
+    content_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt);
+"""
+
+# Columns added after the first release, with their definitions
+MIGRATIONS = {
+    "content_hash": "TEXT",
+}
+
+
+class PermanentDeliveryError(Exception):
+    """Raised by a handler when retrying cannot help (e.g. recipient refused)."""
+
+
+# =============================================================================
+# Outbox
+# =============================================================================
+
+
+class Outbox:
+    """
+    SQLite-backed outbound queue with a background delivery worker pool.
+
+    Args:
+        db_path: SQLite file (created if missing)
+        handlers: Maps a message kind to a callable taking the payload dict
+                  and returning a JSON-serializable result
+        workers: Number of delivery threads
+        max_attempts: Attempts before a message is marked failed
+        base_delay, max_delay: Exponential backoff bounds in seconds
+        rate_limiter: Token buckets per destination (unlimited if None)
+        coalesce_windows: Seconds per kind within which identical content
+                          (same destination and payload) is merged
+        batch_handlers: Maps a kind to a callable taking a list of payloads
+                        (same destination) and returning one outcome per
+                        payload: a result, or the exception for that message
+        batch_size: Most messages handed to one batch handler call
+    """
+
+    def __init__(self, db_path: str, handlers: dict[str, Callable[[dict], Any]],
+                 workers: int = DEFAULT_WORKERS, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 base_delay: float = DEFAULT_BASE_DELAY, max_delay: float = DEFAULT_MAX_DELAY,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 coalesce_windows: Optional[dict[str, float]] = None,
+                 batch_handlers: Optional[dict[str, Callable[[list[dict]], list[Any]]]] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db_path = db_path
+        self.handlers = handlers
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.coalesce_windows = dict(coalesce_windows or {})
+        self.batch_handlers = dict(batch_handlers or {})
+        self.batch_size = max(1, batch_size)
+
+        self._local = threading.local()
+        self._claim_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(outbox)")}
+            for column, definition in MIGRATIONS.items():
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE outbox ADD COLUMN {column} {definition}")
+            conn.execute("CREATE INDEX IF NOT EXISTS outbox_content ON outbox (content_hash, created)")
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections cannot be shared)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def enqueue(self, kind: str, destination: str, payload: dict[str, Any],
+                idempotency_key: Optional[str] = None) -> tuple[str, bool]:
+        """
+        Durably queue a message for delivery.
+
+        Args:
+            kind: Handler name (e.g. "email", "linkedin")
+            destination: Rate-limit bucket (e.g. the SMTP host)
+            payload: JSON-serializable handler arguments
+            idempotency_key: Optional caller key; re-enqueueing it is a no-op
+
+        Returns:
+            (message_id, duplicate) where duplicate is True if the key already
+            existed or the content was coalesced into a recent message
+        """
+        return self.enqueue_many([(kind, destination, payload, idempotency_key)])[0]
+
+    def enqueue_many(self, items: list[tuple[str, str, dict[str, Any], Optional[str]]]) -> list[tuple[str, bool]]:
+        """Queue several messages in one transaction. See enqueue()."""
+        for kind, _, _, _ in items:
+            if kind not in self.handlers:
+                raise ValueError(f"No outbox handler for '{kind}'")
+
+        now = time.time()
+        results = []
+        conn = self._connect()
+        with conn:
+            for kind, destination, payload, key in items:
+                if key:
+                    row = conn.execute("SELECT id FROM outbox WHERE idempotency_key = ?", (key,)).fetchone()
+                    if row:
+                        results.append((row["id"], True))
+                        continue
+
+                content = json.dumps(payload, sort_keys=True)
+                content_hash = hashlib.sha256(f"{kind}\0{destination}\0{content}".encode("utf-8")).hexdigest()
+                window = self.coalesce_windows.get(kind, 0)
+                if window > 0:
+                    row = conn.execute(
+                        "SELECT id FROM outbox WHERE content_hash = ? AND created >= ? AND status != ? "
+                        "ORDER BY created DESC LIMIT 1",
+                        (content_hash, now - window, STATUS_FAILED)
+                    ).fetchone()
+                    if row:
+                        logger.info(f"Outbox coalesced duplicate {kind} into {row['id']}")
+                        results.append((row["id"], True))
+                        continue
+
+                message_id = uuid.uuid4().hex
+                conn.execute(
+                    "INSERT INTO outbox (id, kind, destination, payload, idempotency_key, status, "
+                    "next_attempt, created, updated, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (message_id, kind, destination, content, key or None,
+                     STATUS_PENDING, now, now, now, content_hash)
+                )
+                results.append((message_id, False))
+        self._wakeup.set()
+        return results
+
+    def get(self, message_id: str) -> Optional[dict[str, Any]]:
+        """Status of one message (payload omitted), or None if unknown."""
+        row = self._connect().execute(
+            "SELECT id, kind, destination, status, attempts, next_attempt, created, updated, "
+            "last_error, result FROM outbox WHERE id = ?", (message_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def counts(self) -> dict[str, int]:
+        """Number of messages per status."""
+        rows = self._connect().execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    # -------------------------------------------------------------------------
+    # Delivery
+    # -------------------------------------------------------------------------
+
+    def _claim(self) -> list[sqlite3.Row]:
+        """
+        Atomically take the next due message whose destination is not throttled.
+
+        For kinds with a batch handler, further due messages of the same kind
+        and destination are taken with it while the rate limiter allows.
+        """
+        now = time.time()
+        with self._claim_lock:
+            throttled = self.rate_limiter.blocked()
+            placeholders = ",".join("?" * len(throttled))
+            query = "SELECT * FROM outbox WHERE status = ? AND next_attempt <= ?"
+            if throttled:
+                query += f" AND destination NOT IN ({placeholders})"
+            query += " ORDER BY next_attempt, created LIMIT 1"
+
+            conn = self._connect()
+            with conn:
+                row = conn.execute(query, (STATUS_PENDING, now, *throttled)).fetchone()
+                if row is None:
+                    return []
+                self.rate_limiter.try_acquire(row["destination"])
+                rows = [row]
+
+                if row["kind"] in self.batch_handlers and self.batch_size > 1:
+                    candidates = conn.execute(
+                        "SELECT * FROM outbox WHERE status = ? AND next_attempt <= ? AND kind = ? "
+                        "AND destination = ? AND id != ? ORDER BY next_attempt, created LIMIT ?",
+                        (STATUS_PENDING, now, row["kind"], row["destination"], row["id"], self.batch_size - 1)
+                    ).fetchall()
+                    for candidate in candidates:
+                        if not self.rate_limiter.try_acquire(row["destination"]):
+                            break
+                        rows.append(candidate)
+
+                conn.executemany("UPDATE outbox SET status = ?, updated = ? WHERE id = ?",
+                                 [(STATUS_SENDING, now, claimed["id"]) for claimed in rows])
+            return rows
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.8, 1.2)
+
+    def _deliver(self, rows: list[sqlite3.Row]) -> None:
+        """Hand claimed messages to their handler and record each outcome."""
+        kind = rows[0]["kind"]
+        payloads = [json.loads(row["payload"]) for row in rows]
+        batch_handler = self.batch_handlers.get(kind)
+        try:
+            if batch_handler is not None:
+                outcomes = list(batch_handler(payloads))
+                if len(outcomes) != len(rows):
+                    raise ValueError(f"Batch handler for '{kind}' returned {len(outcomes)} "
+                                     f"outcome(s) for {len(rows)} message(s)")
+            else:
+                outcomes = [self.handlers[kind](payloads[0])]
+        except Exception as e:
+            outcomes = [e] * len(rows)
+
+        for row, outcome in zip(rows, outcomes):
+            self._record(row, outcome)
+
+    def _record(self, row: sqlite3.Row, outcome: Any) -> None:
+        """Store one delivery outcome: a handler result or the exception it raised."""
+        attempts = row["attempts"] + 1
+        conn = self._connect()
+        if isinstance(outcome, RetryAfterError):
+            # Provider-requested back-off: hold the whole destination and do
+            # not count it against max_attempts
+            now = time.time()
+            self.rate_limiter.pause(row["destination"], outcome.seconds)
+            logger.warning(f"Outbox {row['destination']} asked to retry after {outcome.seconds:.0f}s")
+            with conn:
+                conn.execute(
+                    "UPDATE outbox SET status = ?, next_attempt = ?, updated = ?, last_error = ? WHERE id = ?",
+                    (STATUS_PENDING, now + outcome.seconds, now, str(outcome), row["id"])
+                )
+            return
+        if isinstance(outcome, Exception):
+            now = time.time()
+            permanent = isinstance(outcome, PermanentDeliveryError)
+            if permanent or attempts >= self.max_attempts:
+                status, next_attempt = STATUS_FAILED, now
+                logger.error(f"Outbox {row['kind']} {row['id']} failed after {attempts} attempt(s): {outcome}")
+            else:
+                status, next_attempt = STATUS_PENDING, now + self._backoff(attempts)
+                logger.warning(f"Outbox {row['kind']} {row['id']} attempt {attempts} failed, "
+                               f"retrying in {next_attempt - now:.0f}s: {outcome}")
+            with conn:
+                conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?, updated = ?, "
+                    "last_error = ? WHERE id = ?",
+                    (status, attempts, next_attempt, now, str(outcome), row["id"])
+                )
+            return
+
+        with conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, updated = ?, last_error = NULL, "
+                "result = ? WHERE id = ?",
+                (STATUS_SENT, attempts, time.time(), json.dumps(outcome, default=str), row["id"])
+            )
+
+    def process_due(self) -> int:
+        """Deliver every message that is due right now. Returns how many were attempted."""
+        processed = 0
+        while not self._stop.is_set():
+            rows = self._claim()
+            if not rows:
+                break
+            self._deliver(rows)
+            processed += len(rows)
+        return processed
+
+    def _worker(self) -> None:
+        while not self._stop.is_set():
+            if self.process_due() == 0:
+                self._wakeup.wait(POLL_INTERVAL)
+                self._wakeup.clear()
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def recover(self) -> int:
+        """Return messages stuck in "sending" (from a crashed process) to the queue."""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("UPDATE outbox SET status = ?, updated = ? WHERE status = ?",
+                                  (STATUS_PENDING, time.time(), STATUS_SENDING))
+        if cursor.rowcount:
+            logger.warning(f"Outbox recovered {cursor.rowcount} interrupted message(s)")
+        return cursor.rowcount
+
+    def start(self) -> None:
+        """Recover interrupted messages and start the delivery workers."""
+        if self._threads:
+            return
+        self.recover()
+        self._stop.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"outbox-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the workers; queued messages stay on disk for the next start."""
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Rate Limiting for the Business MCP Server
+
+Token buckets per platform (e.g. "linkedin", "smtp:<host>") decide when the
+outbox may deliver the next message to that platform. A bucket holds up to
+`burst` tokens and refills at `rate_per_minute`, so short bursts go out at
+once and sustained load is smoothed to the configured rate instead of
+tripping the provider's limits.
+
+When a provider still answers 429/503 with a Retry-After header, the handler
+raises RetryAfterError and the whole platform is paused until that time.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# =============================================================================
+# Errors
+# =============================================================================
+
+
+class RetryAfterError(Exception):
+    """The provider asked us to back off for `seconds` before trying again."""
+
+    def __init__(self, seconds: float, message: str = ""):
+        super().__init__(message or f"Rate limited, retry after {seconds:g}s")
+        self.seconds = max(0.0, seconds)
+
+
+def parse_retry_after(value: Optional[str], default: float = 60.0) -> float:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or HTTP-date).
+
+    Args:
+        value: Header value, or None if absent
+        default: Used when the header is missing or unparseable
+    """
+    if not value:
+        return default
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# =============================================================================
+# Token Bucket
+# =============================================================================
+
+
+class TokenBucket:
+    """
+    Classic token bucket, plus a pause for server-requested back-off.
+
+    Args:
+        rate_per_minute: Sustained rate tokens are added at; 0 or less means
+                         unlimited (the bucket then only enforces pauses)
+        burst: Maximum tokens held (messages allowed back to back)
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.unlimited = rate_per_minute <= 0
+        self.rate = max(0.0, rate_per_minute) / 60.0
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: Optional[float] = None) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.unlimited or self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def try_acquire(self, now: Optional[float] = None) -> bool:
+        """Take a token if one is available."""
+        now = time.monotonic() if now is None else now
+        if self.wait_time(now) > 0:
+            return False
+        if not self.unlimited:
+            self.tokens -= 1
+        return True
+
+    def pause(self, seconds: float, now: Optional[float] = None) -> None:
+        """Hold all sends for `seconds` (e.g. from Retry-After)."""
+        now = time.monotonic() if now is None else now
+        self.paused_until = max(self.paused_until, now + seconds)
+
+
+# =============================================================================
+# Rate Limiter
+# =============================================================================
+
+
+class RateLimiter:
+    """
+    Token buckets keyed by destination. Destinations without a bucket are
+    unlimited.
+
+    Args:
+        limits: Maps destination to (rate_per_minute, burst); a rate of 0 or
+                less leaves that destination unlimited
+    """
+
+    def __init__(self, limits: Optional[dict[str, tuple[float, int]]] = None):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+        for destination, (rate, burst) in (limits or {}).items():
+            if rate > 0:
+                self._buckets[destination] = TokenBucket(rate, burst)
+
+    def wait_time(self, destination: str) -> float:
+        """Seconds until `destination` may be sent to."""
+        with self._lock:
+            bucket = self._buckets.get(destination)
+            return bucket.wait_time() if bucket else 0.0
+
+    def try_acquire(self, destination: str) -> bool:
+        """Consume a token for `destination` if one is available."""
+        with self._lock:
+            bucket = self._buckets.get(destination)
+            return bucket.try_acquire() if bucket else True
+
+    def blocked(self) -> list[str]:
+        """Destinations that cannot be sent to right now."""
+        with self._lock:
+            return [dest for dest, bucket in self._buckets.items() if bucket.wait_time() > 0]
+
+    def pause(self, destination: str, seconds: float) -> None:
+        """Hold `destination` for `seconds`, creating an unlimited bucket if needed."""
+        with self._lock:
+            bucket = self._buckets.get(destination)
+            if bucket is None:
+                bucket = self._buckets[destination] = TokenBucket(0)
+            bucket.pause(seconds)
@@ -5,21 +5,56 @@ Business MCP Server - Production Ready
 A Model Context Protocol (MCP) server for external business operations.
 Provides capabilities for sending emails, creating LinkedIn posts, and logging business actions.
 
+Emails and LinkedIn posts are written to a durable outbox (vault/outbox.db) and
+delivered by background workers with retries, so tools return a message id
+immediately and provider outages do not lose messages.
+
+Startup is kept light: logging is configured in main(), and the SMTP stack,
+outbox workers and HTTPS setup are warmed in the background once the client
+has connected. Run with --profile-startup to print a cold-start breakdown.
+
 Server Name: business-mcp
 """
 
+import time
+
+_STARTUP_T0 = time.perf_counter()
+
 import os
 import sys
-import smtplib
+import json
+import atexit
+import asyncio
+import argparse
 import logging
+import threading
 from datetime import datetime
-from email.mime.text import MIMEText
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from log_pipeline import BatchFileHandler, BatchStreamHandler, LOG_FORMAT, install_queue_logging
+from outbox import Outbox, PermanentDeliveryError
+from rate_limiter import RateLimiter, RetryAfterError, parse_retry_after
+from tool_runner import ToolRunner
+
+# Operational metrics shared with scripts/ (optional when deployed on its own)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "scripts"))
+try:
+    from metrics_registry import REGISTRY, TextfileWriter, counter, gauge, histogram
+    HAS_METRICS = True
+except ImportError:
+    HAS_METRICS = False
+
+if TYPE_CHECKING:
+    from email.mime.text import MIMEText
+    from smtp_pool import SMTPConnectionPool
+
+# Cold-start phases (seconds since the module started loading)
+STARTUP_TIMINGS: dict[str, float] = {"imports": time.perf_counter() - _STARTUP_T0}
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -32,23 +67,98 @@ EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "true").lower() == "true"
 EMAIL_FROM = os.getenv("EMAIL_FROM", EMAIL_USERNAME)
 
+# SMTP session pooling (sessions stay authenticated between tool calls)
+EMAIL_POOL_SIZE = int(os.getenv("EMAIL_POOL_SIZE", 4))
+EMAIL_POOL_IDLE_SECONDS = float(os.getenv("EMAIL_POOL_IDLE_SECONDS", 120))
+EMAIL_MAX_MESSAGES_PER_CONNECTION = int(os.getenv("EMAIL_MAX_MESSAGES_PER_CONNECTION", 100))
+
+# LinkedIn API endpoint and request timeout (seconds)
+LINKEDIN_API_URL = os.getenv("LINKEDIN_API_URL", "https://api.linkedin.com/v2/shares")
+LINKEDIN_TIMEOUT_SECONDS = float(os.getenv("LINKEDIN_TIMEOUT_SECONDS", 20))
+
+# Blocking tool execution: worker threads, per-tool timeouts and concurrency
+TOOL_WORKERS = int(os.getenv("TOOL_WORKERS", 8))
+TOOL_TIMEOUTS = {
+    "send_email": float(os.getenv("SEND_EMAIL_TIMEOUT_SECONDS", 60)),
+    "send_emails": float(os.getenv("SEND_EMAILS_TIMEOUT_SECONDS", 300)),
+    "post_linkedin": float(os.getenv("POST_LINKEDIN_TIMEOUT_SECONDS", 45)),
+    "log_activity": float(os.getenv("LOG_ACTIVITY_TIMEOUT_SECONDS", 60)),
+}
+TOOL_CONCURRENCY = {
+    "send_email": EMAIL_POOL_SIZE,
+    "send_emails": max(1, EMAIL_POOL_SIZE // 2),
+    "post_linkedin": int(os.getenv("LINKEDIN_CONCURRENCY", 2)),
+}
+
 # Logging Configuration
 PROJECT_ROOT = os.getenv("PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 LOG_FILE_PATH = os.path.join(PROJECT_ROOT, "vault", "Logs", "business.log")
 
-# Ensure log directory exists
-os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
+# Durable outbox for emails and LinkedIn posts
+OUTBOX_DB_PATH = os.getenv("OUTBOX_DB_PATH", os.path.join(PROJECT_ROOT, "vault", "outbox.db"))
+OUTBOX_WORKERS = int(os.getenv("OUTBOX_WORKERS", 2))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 8))
+
+# Token buckets per platform: sustained rate per minute and burst size (rate 0 = unlimited)
+EMAIL_RATE_PER_MINUTE = float(os.getenv("EMAIL_RATE_PER_MINUTE", 0))
+EMAIL_BURST = int(os.getenv("EMAIL_BURST", 10))
+LINKEDIN_RATE_PER_MINUTE = float(os.getenv("LINKEDIN_RATE_PER_MINUTE", 6))
+LINKEDIN_BURST = int(os.getenv("LINKEDIN_BURST", 3))
+
+# Identical LinkedIn posts queued within this many seconds are merged into one
+LINKEDIN_COALESCE_SECONDS = float(os.getenv("LINKEDIN_COALESCE_SECONDS", 600))
+
+# Background warm-up after the client connects (outbox, SMTP session, HTTPS)
+MCP_PREWARM = os.getenv("MCP_PREWARM", "true").lower() == "true"
+PREWARM_DELAY_SECONDS = float(os.getenv("PREWARM_DELAY_SECONDS", 2))
+
+# Seconds between rewrites of Logs/metrics/business_mcp.prom
+METRICS_INTERVAL_SECONDS = float(os.getenv("METRICS_INTERVAL_SECONDS", 15))
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE_PATH),
-        logging.StreamHandler(sys.stderr)
-    ]
-)
 logger = logging.getLogger("business-mcp")
+log_listener = None
+metrics_writer = None
+
+
+def configure_logging():
+    """
+    Configures logging on first call: callers only enqueue records; a writer
+    thread writes them to the file and stderr in batches.
+    
+    Returns:
+        The running log listener
+    """
+    global log_listener
+    if log_listener is None:
+        os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
+        handlers = [BatchFileHandler(LOG_FILE_PATH, delay=True), BatchStreamHandler(sys.stderr)]
+        for handler in handlers:
+            handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        log_listener = install_queue_logging(handlers, level=logging.INFO)
+        atexit.register(log_listener.stop)
+    return log_listener
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+if HAS_METRICS:
+    TOOL_SECONDS = histogram("business_mcp_tool_seconds", "MCP tool call duration", ["tool"])
+    TOOL_ERRORS = counter("business_mcp_tool_errors_total", "MCP tool calls that returned an error", ["tool"])
+    SMTP_SEND_SECONDS = histogram("business_mcp_smtp_send_seconds", "Time to hand one email to the SMTP server")
+    SMTP_FAILURES = counter("business_mcp_smtp_failures_total", "Emails the SMTP server did not accept")
+    OUTBOX_MESSAGES = gauge("business_mcp_outbox_messages", "Outbox messages by delivery status", ["status"])
+
+
+def collect_outbox_depth() -> None:
+    """Refresh the outbox gauges before each metrics write"""
+    if _outbox is not None:
+        for status, count in _outbox.counts().items():
+            OUTBOX_MESSAGES.labels(status).set(count)
+
+
+if HAS_METRICS:
+    REGISTRY.on_collect(collect_outbox_depth)
 
 # =============================================================================
 # MCP Server Initialization
@@ -56,10 +166,52 @@ logger = logging.getLogger("business-mcp")
 
 server = Server("business-mcp")
 
+# Blocking actions (smtplib, urllib) run here instead of on the event loop
+tool_runner = ToolRunner(max_workers=TOOL_WORKERS, timeouts=TOOL_TIMEOUTS, limits=TOOL_CONCURRENCY)
+
 # =============================================================================
 # Business Logic Functions
 # =============================================================================
 
+_smtp_pool: "SMTPConnectionPool | None" = None
+_smtp_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> "SMTPConnectionPool":
+    """
+    Returns the shared SMTP connection pool, creating it on first use.
+    """
+    global _smtp_pool
+    # Tool actions run on worker threads, so creation must not race
+    with _smtp_pool_lock:
+        if _smtp_pool is None:
+            # smtplib/email are deferred: importing them costs ~30ms of cold start
+            from smtp_pool import SMTPConnectionPool
+            _smtp_pool = SMTPConnectionPool(
+                EMAIL_HOST,
+                EMAIL_PORT,
+                username=EMAIL_USERNAME,
+                password=EMAIL_PASSWORD,
+                use_tls=EMAIL_USE_TLS,
+                max_size=EMAIL_POOL_SIZE,
+                idle_timeout=EMAIL_POOL_IDLE_SECONDS,
+                max_messages=EMAIL_MAX_MESSAGES_PER_CONNECTION
+            )
+    return _smtp_pool
+
+
+def build_email(to: str, subject: str, body: str) -> "MIMEText":
+    """
+    Builds a plain-text email from the configured sender.
+    """
+    from email.mime.text import MIMEText
+    
+    msg = MIMEText(body)
+    msg["Subject"] = subject
+    msg["From"] = EMAIL_FROM
+    msg["To"] = to
+    return msg
+
 
 def send_email_action(to: str, subject: str, body: str) -> dict[str, Any]:
     """
@@ -76,32 +228,74 @@ def send_email_action(to: str, subject: str, body: str) -> dict[str, Any]:
     if not EMAIL_USERNAME or EMAIL_USERNAME == "":
         raise ValueError("EMAIL_USERNAME environment variable is not configured")
     
-    msg = MIMEText(body)
-    msg["Subject"] = subject
-    msg["From"] = EMAIL_FROM
-    msg["To"] = to
+    import smtplib
+    
+    msg = build_email(to, subject, body)
 
+    start = time.perf_counter()
     try:
-        with smtplib.SMTP(EMAIL_HOST, EMAIL_PORT) as smtp_server:
-            if EMAIL_USE_TLS:
-                smtp_server.starttls()
-            if EMAIL_PASSWORD:
-                smtp_server.login(EMAIL_USERNAME, EMAIL_PASSWORD)
-            smtp_server.sendmail(EMAIL_FROM, [to], msg.as_string())
+        get_smtp_pool().send(EMAIL_FROM, msg)
+        if HAS_METRICS:
+            SMTP_SEND_SECONDS.observe(time.perf_counter() - start)
         
         logger.info(f"Email sent successfully to {to} with subject: {subject}")
         return {"status": "success", "message": f"Email sent to {to}"}
+    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused) as e:
+        logger.error(f"SMTP server refused email to {to}: {e}")
+        if HAS_METRICS:
+            SMTP_FAILURES.inc()
+        raise PermanentDeliveryError(f"Email refused: {e}")
     except smtplib.SMTPAuthenticationError as e:
         logger.error(f"SMTP authentication failed: {e}")
         raise ValueError(f"Email authentication failed: {e}")
     except smtplib.SMTPException as e:
         logger.error(f"SMTP error occurred: {e}")
+        if HAS_METRICS:
+            SMTP_FAILURES.inc()
         raise ValueError(f"Failed to send email: {e}")
     except Exception as e:
         logger.error(f"Failed to send email to {to}: {e}")
         raise ValueError(f"Failed to send email: {e}")
 
 
+def send_email_batch(payloads: list[dict[str, str]]) -> list[Any]:
+    """
+    Delivers queued emails over as few pooled SMTP sessions as possible.
+    
+    Args:
+        payloads: Outbox email payloads (to, subject, body) for one SMTP host
+    
+    Returns:
+        one outcome per payload: a result dict, or the exception to record
+    """
+    if not EMAIL_USERNAME or EMAIL_USERNAME == "":
+        error = ValueError("EMAIL_USERNAME environment variable is not configured")
+        return [error] * len(payloads)
+    
+    messages = [build_email(p["to"], p["subject"], p["body"]) for p in payloads]
+    
+    start = time.perf_counter()
+    results = get_smtp_pool().send_many(EMAIL_FROM, messages)
+    elapsed = time.perf_counter() - start
+    
+    outcomes: list[Any] = []
+    for payload, result in zip(payloads, results):
+        if result["status"] == "success":
+            if HAS_METRICS:
+                SMTP_SEND_SECONDS.observe(elapsed / len(payloads))
+            logger.info(f"Email sent successfully to {payload['to']} with subject: {payload['subject']}")
+            outcomes.append({"status": "success", "message": f"Email sent to {payload['to']}"})
+            continue
+        if HAS_METRICS:
+            SMTP_FAILURES.inc()
+        logger.error(f"Failed to send email to {payload['to']}: {result['error']}")
+        if result.get("refused"):
+            outcomes.append(PermanentDeliveryError(f"Email refused: {result['error']}"))
+        else:
+            outcomes.append(ValueError(f"Failed to send email: {result['error']}"))
+    return outcomes
+
+
 def post_linkedin_action(content: str) -> dict[str, Any]:
     """
     Posts content to LinkedIn.
@@ -124,12 +318,13 @@ def post_linkedin_action(content: str) -> dict[str, Any]:
                 "message": "LinkedIn post request logged (requires LINKEDIN_ACCESS_TOKEN for actual posting)"
             }
         
-        # LinkedIn API integration (v2 API)
+        # LinkedIn API integration (v2 API). urllib.request stays deferred like
+        # smtplib: it costs ~13ms of cold start (http.client, ssl), prewarm()
+        # loads it early, and later posts only pay a sys.modules lookup here
         import urllib.request
         import urllib.error
-        import json
         
-        api_url = "https://api.linkedin.com/v2/shares"
+        api_url = LINKEDIN_API_URL
         headers = {
             "Authorization": f"Bearer {linkedin_token}",
             "Content-Type": "application/json",
@@ -157,16 +352,167 @@ def post_linkedin_action(content: str) -> dict[str, Any]:
         data = json.dumps(payload).encode("utf-8")
         req = urllib.request.Request(api_url, data=data, headers=headers, method="POST")
         
-        with urllib.request.urlopen(req) as response:
-            result = json.loads(response.read().decode("utf-8"))
-            logger.info(f"LinkedIn post created successfully: {result.get('id', 'unknown')}")
-            return {"status": "success", "message": f"LinkedIn post created: {result.get('id', 'unknown')}"}
+        try:
+            with urllib.request.urlopen(req, timeout=LINKEDIN_TIMEOUT_SECONDS) as response:
+                result = json.loads(response.read().decode("utf-8"))
+                logger.info(f"LinkedIn post created successfully: {result.get('id', 'unknown')}")
+                return {"status": "success", "message": f"LinkedIn post created: {result.get('id', 'unknown')}"}
+        except urllib.error.HTTPError as e:
+            # Throttled: let the outbox pause LinkedIn for as long as asked
+            if e.code in (429, 503):
+                delay = parse_retry_after(e.headers.get("Retry-After"))
+                raise RetryAfterError(delay, f"LinkedIn returned HTTP {e.code}, retry after {delay:.0f}s")
+            # Any other 4xx means the post itself is rejected
+            if 400 <= e.code < 500:
+                raise PermanentDeliveryError(f"LinkedIn rejected the post: HTTP {e.code} {e.reason}")
+            raise
     
+    except (PermanentDeliveryError, RetryAfterError) as e:
+        logger.error(f"Failed to post to LinkedIn: {e}")
+        raise
     except Exception as e:
         logger.error(f"Failed to post to LinkedIn: {e}")
         raise ValueError(f"Failed to post to LinkedIn: {e}")
 
 
+# =============================================================================
+# Outbox (queued delivery)
+# =============================================================================
+
+OUTBOX_HANDLERS = {
+    "email": lambda payload: send_email_action(payload["to"], payload["subject"], payload["body"]),
+    "linkedin": lambda payload: post_linkedin_action(payload["content"]),
+}
+
+# Due emails for the same host are sent back to back on one pooled session
+OUTBOX_BATCH_HANDLERS = {
+    "email": send_email_batch,
+}
+
+_outbox: Outbox | None = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox(start: bool = True) -> Outbox:
+    """
+    Returns the shared outbox, creating it on first use.
+    
+    Args:
+        start: Start the delivery workers (resuming queued messages)
+    """
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = Outbox(
+                OUTBOX_DB_PATH,
+                OUTBOX_HANDLERS,
+                workers=OUTBOX_WORKERS,
+                max_attempts=OUTBOX_MAX_ATTEMPTS,
+                rate_limiter=RateLimiter({
+                    f"smtp:{EMAIL_HOST}": (EMAIL_RATE_PER_MINUTE, EMAIL_BURST),
+                    "linkedin": (LINKEDIN_RATE_PER_MINUTE, LINKEDIN_BURST)
+                }),
+                coalesce_windows={"linkedin": LINKEDIN_COALESCE_SECONDS},
+                batch_handlers=OUTBOX_BATCH_HANDLERS
+            )
+        if start:
+            _outbox.start()
+    return _outbox
+
+
+def _queued_response(message_id: str, duplicate: bool) -> dict[str, Any]:
+    status = "duplicate" if duplicate else "queued"
+    return {"status": status, "message_id": message_id}
+
+
+def queue_email_action(to: str, subject: str, body: str, idempotency_key: str | None = None) -> dict[str, Any]:
+    """
+    Queues an email for delivery by the outbox workers.
+    
+    Args:
+        to: Recipient email address
+        subject: Email subject
+        body: Email body content
+        idempotency_key: Optional key; repeating it returns the original message id
+    
+    Returns:
+        dict with status ("queued" or "duplicate") and message_id
+    """
+    if not EMAIL_USERNAME or EMAIL_USERNAME == "":
+        raise ValueError("EMAIL_USERNAME environment variable is not configured")
+    
+    message_id, duplicate = get_outbox().enqueue(
+        "email", f"smtp:{EMAIL_HOST}", {"to": to, "subject": subject, "body": body}, idempotency_key
+    )
+    logger.info(f"Email to {to} queued as {message_id}")
+    return _queued_response(message_id, duplicate)
+
+
+def send_emails_action(emails: list[dict[str, str]]) -> dict[str, Any]:
+    """
+    Queues a batch of emails in one transaction.
+    
+    Args:
+        emails: List of dicts with to, subject, body and optional idempotency_key
+    
+    Returns:
+        dict with status, queued/duplicate counts and message ids in input order
+    """
+    if not EMAIL_USERNAME or EMAIL_USERNAME == "":
+        raise ValueError("EMAIL_USERNAME environment variable is not configured")
+    
+    for index, email in enumerate(emails):
+        if not isinstance(email, dict) or not all(email.get(key) for key in ("to", "subject", "body")):
+            raise ValueError(f"Email #{index + 1} is missing required fields: to, subject, body")
+    
+    results = get_outbox().enqueue_many([
+        ("email", f"smtp:{EMAIL_HOST}",
+         {"to": email["to"], "subject": email["subject"], "body": email["body"]},
+         email.get("idempotency_key"))
+        for email in emails
+    ])
+    duplicates = sum(1 for _, duplicate in results if duplicate)
+    logger.info(f"Queued {len(results) - duplicates} email(s), {duplicates} duplicate(s)")
+    return {
+        "status": "queued",
+        "queued": len(results) - duplicates,
+        "duplicates": duplicates,
+        "message_ids": [message_id for message_id, _ in results]
+    }
+
+
+def queue_linkedin_action(content: str, idempotency_key: str | None = None) -> dict[str, Any]:
+    """
+    Queues a LinkedIn post for delivery by the outbox workers.
+    
+    Returns:
+        dict with status ("queued" or "duplicate") and message_id
+    """
+    message_id, duplicate = get_outbox().enqueue("linkedin", "linkedin", {"content": content}, idempotency_key)
+    logger.info(f"LinkedIn post queued as {message_id}")
+    return _queued_response(message_id, duplicate)
+
+
+def outbox_status_action(message_id: str | None = None) -> dict[str, Any]:
+    """
+    Reports delivery status of one queued message, or queue totals.
+    
+    Args:
+        message_id: Id returned when the message was queued (optional)
+    
+    Returns:
+        dict with the message's status, or message counts per status
+    """
+    outbox = get_outbox()
+    if not message_id:
+        return {"status": "success", "counts": outbox.counts()}
+    
+    message = outbox.get(message_id)
+    if message is None:
+        raise ValueError(f"Unknown message id: {message_id}")
+    return message
+
+
 def log_activity_action(messages: list[str]) -> dict[str, Any]:
     """
     Logs business actions to the business log file.
@@ -198,10 +544,12 @@ async def list_tools() -> list[Tool]:
     """
     List all available tools provided by the Business MCP Server.
     """
+    # Clients list tools right after the handshake: a good moment to warm up
+    schedule_prewarm()
     return [
         Tool(
             name="send_email",
-            description="Send an email to a recipient with a subject and body content",
+            description="Queue an email to a recipient with a subject and body content; returns a message id",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -216,25 +564,70 @@ async def list_tools() -> list[Tool]:
                     "body": {
                         "type": "string",
                         "description": "Email body content"
+                    },
+                    "idempotency_key": {
+                        "type": "string",
+                        "description": "Optional key; repeating it will not send the email twice"
                     }
                 },
                 "required": ["to", "subject", "body"]
             }
         ),
+        Tool(
+            name="send_emails",
+            description="Queue a batch of emails for delivery over pooled SMTP sessions; returns message ids",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "emails": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "to": {"type": "string"},
+                                "subject": {"type": "string"},
+                                "body": {"type": "string"},
+                                "idempotency_key": {"type": "string"}
+                            },
+                            "required": ["to", "subject", "body"]
+                        },
+                        "description": "List of emails to send"
+                    }
+                },
+                "required": ["emails"]
+            }
+        ),
         Tool(
             name="post_linkedin",
-            description="Create a post on LinkedIn with the provided content",
+            description="Queue a post on LinkedIn with the provided content; returns a message id",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "content": {
                         "type": "string",
                         "description": "The content to post on LinkedIn"
+                    },
+                    "idempotency_key": {
+                        "type": "string",
+                        "description": "Optional key; repeating it will not post twice"
                     }
                 },
                 "required": ["content"]
             }
         ),
+        Tool(
+            name="outbox_status",
+            description="Check delivery status of a queued email or LinkedIn post, or totals for the whole outbox",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "message_id": {
+                        "type": "string",
+                        "description": "Message id returned when the message was queued (omit for totals)"
+                    }
+                }
+            }
+        ),
         Tool(
             name="log_activity",
             description="Log business actions and messages to the business activity log",
@@ -267,6 +660,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     Returns:
         List of TextContent with the result
     """
+    start = time.perf_counter()
     try:
         if name == "send_email":
             to = arguments.get("to", "")
@@ -276,7 +670,18 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             if not to or not subject or not body:
                 raise ValueError("Missing required arguments: to, subject, body")
             
-            result = send_email_action(to, subject, body)
+            result = await tool_runner.run(
+                name, queue_email_action, to, subject, body, arguments.get("idempotency_key")
+            )
+            return [TextContent(type="text", text=str(result))]
+        
+        elif name == "send_emails":
+            emails = arguments.get("emails", [])
+            
+            if not emails or not isinstance(emails, list):
+                raise ValueError("Missing or invalid required argument: emails (must be a list)")
+            
+            result = await tool_runner.run(name, send_emails_action, emails)
             return [TextContent(type="text", text=str(result))]
         
         elif name == "post_linkedin":
@@ -285,7 +690,13 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             if not content:
                 raise ValueError("Missing required argument: content")
             
-            result = post_linkedin_action(content)
+            result = await tool_runner.run(
+                name, queue_linkedin_action, content, arguments.get("idempotency_key")
+            )
+            return [TextContent(type="text", text=str(result))]
+        
+        elif name == "outbox_status":
+            result = await tool_runner.run(name, outbox_status_action, arguments.get("message_id"))
             return [TextContent(type="text", text=str(result))]
         
         elif name == "log_activity":
@@ -294,7 +705,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             if not messages or not isinstance(messages, list):
                 raise ValueError("Missing or invalid required argument: messages (must be a list)")
             
-            result = log_activity_action(messages)
+            result = await tool_runner.run(name, log_activity_action, messages)
             return [TextContent(type="text", text=str(result))]
         
         else:
@@ -302,7 +713,105 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     
     except Exception as e:
         logger.error(f"Tool call failed for {name}: {e}")
+        if HAS_METRICS:
+            TOOL_ERRORS.labels(name).inc()
         return [TextContent(type="text", text=f'{{"status": "error", "message": "{str(e)}"}}')]
+    finally:
+        if HAS_METRICS:
+            TOOL_SECONDS.labels(name).observe(time.perf_counter() - start)
+
+# =============================================================================
+# Startup and Warm-up
+# =============================================================================
+
+_prewarm_started = False
+
+
+def prewarm(deliver: bool = True) -> dict[str, float]:
+    """
+    Does the expensive first-use work ahead of the first tool call: opens the
+    outbox (and starts delivering queued messages), opens and authenticates an
+    SMTP session, and loads the HTTPS stack used for LinkedIn.
+    
+    Args:
+        deliver: Start the outbox workers (False when only profiling)
+    
+    Returns:
+        dict of seconds spent per step
+    """
+    timings = {}
+    
+    start = time.perf_counter()
+    outbox = get_outbox(start=deliver)
+    logger.info(f"Outbox: {OUTBOX_DB_PATH} {outbox.counts()}")
+    timings["outbox"] = time.perf_counter() - start
+    
+    if EMAIL_USERNAME:
+        start = time.perf_counter()
+        try:
+            pool = get_smtp_pool()
+            pool.release(pool.acquire())
+        except Exception as e:
+            logger.warning(f"SMTP warm-up failed (will retry on first send): {e}")
+        timings["smtp"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    import socket
+    import urllib.request
+    from urllib.parse import urlparse
+    # Build the opener urlopen() would otherwise create on the first post
+    urllib.request.install_opener(urllib.request.build_opener())
+    if os.getenv("LINKEDIN_ACCESS_TOKEN"):
+        host = urlparse(LINKEDIN_API_URL).hostname
+        try:
+            socket.getaddrinfo(host, 443)
+        except OSError as e:
+            logger.warning(f"Could not resolve {host}: {e}")
+    timings["https"] = time.perf_counter() - start
+    
+    logger.info("Warm-up complete: " + ", ".join(f"{step} {seconds * 1000:.0f}ms" for step, seconds in timings.items()))
+    return timings
+
+
+def schedule_prewarm() -> None:
+    """
+    Runs prewarm() once on the tool executor, off the event loop.
+    """
+    global _prewarm_started
+    if _prewarm_started or not MCP_PREWARM:
+        return
+    _prewarm_started = True
+    tool_runner.executor.submit(prewarm)
+
+
+def profile_startup() -> None:
+    """
+    Prints the cold-start breakdown (module load, logging, server options,
+    and what the background warm-up would cost) without serving.
+    """
+    start = time.perf_counter()
+    configure_logging()
+    STARTUP_TIMINGS["logging"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    server.create_initialization_options()
+    STARTUP_TIMINGS["init_options"] = time.perf_counter() - start
+    ready = time.perf_counter() - _STARTUP_T0
+    
+    warm = prewarm(deliver=False)
+    
+    print("Business MCP Server cold start", file=sys.stderr)
+    for phase, seconds in STARTUP_TIMINGS.items():
+        print(f"  {phase:<20} {seconds * 1000:8.1f} ms", file=sys.stderr)
+    print(f"  {'ready to serve':<20} {ready * 1000:8.1f} ms", file=sys.stderr)
+    print("Background warm-up (after handshake)", file=sys.stderr)
+    for step, seconds in warm.items():
+        print(f"  {step:<20} {seconds * 1000:8.1f} ms", file=sys.stderr)
+    
+    _outbox.stop()
+    if _smtp_pool is not None:
+        _smtp_pool.close_all()
+    log_listener.stop()
 
 # =============================================================================
 # Server Entry Point
@@ -314,18 +823,43 @@ async def main():
     Main entry point for the MCP server.
     Runs the server using stdio transport.
     """
+    global metrics_writer
+    configure_logging()
     logger.info("Business MCP Server starting...")
+    if HAS_METRICS:
+        metrics_writer = TextfileWriter("business_mcp", METRICS_INTERVAL_SECONDS).start()
     logger.info(f"Log file: {LOG_FILE_PATH}")
     logger.info(f"Email host: {EMAIL_HOST}:{EMAIL_PORT}")
+    logger.info(f"Ready to serve in {(time.perf_counter() - _STARTUP_T0) * 1000:.0f}ms")
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    # Warm up once the client has had time to connect (list_tools may start it sooner)
+    asyncio.get_running_loop().call_later(PREWARM_DELAY_SECONDS, schedule_prewarm)
+    
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        tool_runner.shutdown()
+        if metrics_writer is not None:
+            metrics_writer.stop()
+        if _outbox is not None:
+            _outbox.stop()
+        log_listener.stop()
+        if _smtp_pool is not None:
+            _smtp_pool.close_all()
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Business MCP Server")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print a cold-start timing breakdown and exit")
+    args = parser.parse_args()
+    
+    if args.profile_startup:
+        profile_startup()
+    else:
+        asyncio.run(main())
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+SMTP Connection Pool for the Business MCP Server
+
+Keeps authenticated SMTP sessions open between tool calls so that sending an
+email no longer pays for a TCP connect, STARTTLS handshake and AUTH round trip
+every time. Connections are:
+
+- health checked with NOOP before reuse once they have been idle for a while
+- evicted after EMAIL_POOL_IDLE_SECONDS without use (by a background reaper)
+- rotated after EMAIL_MAX_MESSAGES_PER_CONNECTION messages, since most
+  providers cap the number of messages per session
+- discarded (and the send retried once) when the server drops them
+
+Uses only the standard library, so it can be exercised against any local SMTP
+stand-in such as aiosmtpd.
+"""
+
+import smtplib
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from email.message import Message
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger("business-mcp")
+
+# =============================================================================
+# Configuration Defaults
+# =============================================================================
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 120          # seconds before an unused session is closed
+DEFAULT_HEALTH_CHECK_AFTER = 15     # seconds idle before a NOOP probe on reuse
+DEFAULT_MAX_MESSAGES = 100          # messages per session before reconnecting
+DEFAULT_CONNECT_TIMEOUT = 30        # socket timeout for connect and commands
+DEFAULT_ACQUIRE_TIMEOUT = 60        # seconds to wait for a free session
+
+# Errors that only affect a single message; the session stays usable
+MESSAGE_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+# =============================================================================
+# Pooled Connection
+# =============================================================================
+
+
+class PooledConnection:
+    """An authenticated SMTP session plus the bookkeeping the pool needs."""
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.created = time.monotonic()
+        self.last_used = self.created
+        self.messages_sent = 0
+
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self.last_used
+
+    def is_healthy(self) -> bool:
+        """Probe the session with NOOP; any error means it is unusable."""
+        try:
+            code, _ = self.smtp.noop()
+            return code == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def close(self) -> None:
+        """QUIT politely, falling back to dropping the socket."""
+        try:
+            self.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            try:
+                self.smtp.close()
+            except OSError:
+                pass
+
+
+# =============================================================================
+# Connection Pool
+# =============================================================================
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of authenticated SMTP sessions to a single server.
+
+    Args:
+        host, port: SMTP server address
+        username, password: Credentials; login is skipped without a password
+        use_tls: Upgrade each new session with STARTTLS
+        max_size: Maximum number of sessions open at once
+        idle_timeout: Seconds an unused session is kept before it is closed
+        health_check_after: Idle seconds after which a session is probed with NOOP
+        max_messages: Messages sent over one session before it is replaced
+        connect_timeout: Socket timeout for connecting and SMTP commands
+    """
+
+    def __init__(self, host: str, port: int, username: str = "", password: str = "",
+                 use_tls: bool = True, max_size: int = DEFAULT_POOL_SIZE,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 health_check_after: float = DEFAULT_HEALTH_CHECK_AFTER,
+                 max_messages: int = DEFAULT_MAX_MESSAGES,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.max_messages = max(1, max_messages)
+        self.connect_timeout = connect_timeout
+
+        self._idle: list[PooledConnection] = []
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._reaper: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {"opened": 0, "reused": 0, "evicted": 0, "unhealthy": 0, "sent": 0}
+
+    # -------------------------------------------------------------------------
+    # Session lifecycle
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> PooledConnection:
+        """Open, upgrade and authenticate a new session."""
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.connect_timeout)
+        try:
+            smtp.ehlo()
+            if self.use_tls:
+                smtp.starttls()
+                smtp.ehlo()
+            if self.password:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+
+        with self._cond:
+            self.stats["opened"] += 1
+        logger.info(f"SMTP session opened to {self.host}:{self.port}")
+        self._start_reaper()
+        return PooledConnection(smtp)
+
+    def acquire(self, timeout: float = DEFAULT_ACQUIRE_TIMEOUT) -> PooledConnection:
+        """
+        Check out a healthy session, reusing an idle one when possible.
+
+        Raises:
+            TimeoutError: If every session stays busy for `timeout` seconds
+        """
+        deadline = time.monotonic() + timeout
+        stale = []
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SMTP pool is closed")
+            while True:
+                # Most recently used first: it is the least likely to have timed out
+                while self._idle:
+                    conn = self._idle.pop()
+                    if conn.idle_seconds() > self.idle_timeout:
+                        self.stats["evicted"] += 1
+                        stale.append(conn)
+                        continue
+                    self._in_use += 1
+                    break
+                else:
+                    conn = None
+
+                if conn is not None or self._in_use < self.max_size:
+                    if conn is None:
+                        self._in_use += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No SMTP session free after {timeout}s")
+                self._cond.wait(remaining)
+
+        for old in stale:
+            old.close()
+
+        try:
+            if conn is not None and conn.idle_seconds() > self.health_check_after and not conn.is_healthy():
+                with self._cond:
+                    self.stats["unhealthy"] += 1
+                conn.close()
+                conn = None
+            if conn is None:
+                return self._connect()
+            with self._cond:
+                self.stats["reused"] += 1
+            return conn
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn: PooledConnection, broken: bool = False) -> None:
+        """Return a session to the pool, closing it if broken or worn out."""
+        conn.last_used = time.monotonic()
+        keep = not broken and not self._closed and conn.messages_sent < self.max_messages
+        with self._cond:
+            self._in_use -= 1
+            if keep:
+                self._idle.append(conn)
+            self._cond.notify()
+        if not keep:
+            conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """Context manager around acquire()/release()."""
+        conn = self.acquire()
+        broken = False
+        try:
+            yield conn
+        except MESSAGE_ERRORS:
+            raise
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(conn, broken=broken)
+
+    # -------------------------------------------------------------------------
+    # Idle eviction
+    # -------------------------------------------------------------------------
+
+    def evict_idle(self) -> int:
+        """Close sessions idle longer than idle_timeout. Returns how many."""
+        with self._cond:
+            expired = [c for c in self._idle if c.idle_seconds() > self.idle_timeout]
+            self._idle = [c for c in self._idle if c not in expired]
+            self.stats["evicted"] += len(expired)
+        for conn in expired:
+            conn.close()
+        if expired:
+            logger.info(f"Evicted {len(expired)} idle SMTP session(s)")
+        return len(expired)
+
+    def _start_reaper(self) -> None:
+        """Start the background eviction thread once the first session exists."""
+        with self._cond:
+            if self._reaper is not None or self._closed:
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name="smtp-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        interval = max(1.0, self.idle_timeout / 2)
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed, timeout=interval)
+                if self._closed:
+                    return
+            self.evict_idle()
+
+    def close_all(self) -> None:
+        """Close every idle session and stop the reaper."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn in idle:
+            conn.close()
+
+    # -------------------------------------------------------------------------
+    # Sending
+    # -------------------------------------------------------------------------
+
+    def _sendmail(self, conn: PooledConnection, from_addr: str, msg: Message) -> None:
+        to_addrs = [addr.strip() for addr in str(msg["To"]).split(",") if addr.strip()]
+        conn.smtp.sendmail(from_addr, to_addrs, msg.as_string())
+        conn.messages_sent += 1
+        with self._cond:
+            self.stats["sent"] += 1
+
+    def send(self, from_addr: str, msg: Message) -> None:
+        """
+        Send one message over a pooled session.
+
+        A session the server has silently dropped is replaced and the send
+        retried once; other errors propagate unchanged.
+        """
+        for attempt in range(2):
+            try:
+                with self.connection() as conn:
+                    self._sendmail(conn, from_addr, msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                if attempt:
+                    raise
+                logger.warning("SMTP session dropped by server, reconnecting")
+
+    def send_many(self, from_addr: str, messages: list[Message]) -> list[dict[str, Any]]:
+        """
+        Send a batch back to back over as few sessions as possible.
+
+        Failures are reported per message instead of aborting the batch: a
+        refused recipient leaves the session usable, while a dropped session
+        is replaced before continuing with the next message.
+
+        Returns:
+            list of {"to", "status", "error"?, "refused"?} in input order;
+            "refused" is True when the server rejected the sender or
+            recipients, so resending the same message cannot succeed
+        """
+        results: list[dict[str, Any]] = []
+        index = 0
+        retried = False
+
+        while index < len(messages):
+            try:
+                conn = self.acquire()
+            except Exception as e:
+                # Cannot reach the server at all: report the rest as failed
+                for msg in messages[index:]:
+                    results.append({"to": msg["To"], "status": "error", "error": str(e)})
+                break
+
+            broken = False
+            try:
+                while index < len(messages) and conn.messages_sent < self.max_messages:
+                    msg = messages[index]
+                    try:
+                        self._sendmail(conn, from_addr, msg)
+                        results.append({"to": msg["To"], "status": "success"})
+                    except MESSAGE_ERRORS as e:
+                        refused = isinstance(e, (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused))
+                        results.append({"to": msg["To"], "status": "error", "error": str(e), "refused": refused})
+                    index += 1
+                    retried = False
+            except (smtplib.SMTPException, OSError) as e:
+                broken = True
+                # A dropped session gets one retry on a fresh one; anything
+                # else (or a second drop) fails just this message
+                if isinstance(e, smtplib.SMTPServerDisconnected) and not retried:
+                    retried = True
+                    logger.warning("SMTP session dropped by server, reconnecting")
+                else:
+                    results.append({"to": messages[index]["To"], "status": "error", "error": str(e)})
+                    index += 1
+                    retried = False
+            finally:
+                self.release(conn, broken=broken)
+
+        return results
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Blocking Tool Runner for the Business MCP Server
+
+The MCP handlers are async, but the actions behind them (smtplib, urllib)
+block. Running them directly on the event loop means one slow SMTP server
+stalls every other MCP request. ToolRunner moves each action onto a bounded
+thread pool and adds:
+
+- a per-tool timeout, so the caller gets an answer even if the provider hangs
+- a per-tool concurrency limit, so a burst of calls cannot exhaust the pool
+  or hammer a provider
+
+A timed-out action cannot be interrupted (Python threads cannot be killed);
+it keeps its concurrency slot until it really finishes, so a hung provider
+only ever ties up `limit` workers.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("business-mcp")
+
+# =============================================================================
+# Configuration Defaults
+# =============================================================================
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT = 60.0      # seconds per tool call
+DEFAULT_LIMIT = 4           # concurrent calls per tool
+
+
+class ToolTimeoutError(TimeoutError):
+    """A tool call did not finish within its timeout."""
+
+
+# =============================================================================
+# Tool Runner
+# =============================================================================
+
+
+class ToolRunner:
+    """
+    Runs blocking tool actions off the event loop.
+
+    Args:
+        max_workers: Size of the shared thread pool
+        timeouts: Seconds allowed per tool name (falls back to default_timeout)
+        limits: Concurrent calls allowed per tool name (falls back to default_limit)
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 timeouts: Optional[dict[str, float]] = None,
+                 limits: Optional[dict[str, int]] = None,
+                 default_timeout: float = DEFAULT_TIMEOUT,
+                 default_limit: int = DEFAULT_LIMIT):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        self.timeouts = dict(timeouts or {})
+        self.limits = dict(limits or {})
+        self.default_timeout = default_timeout
+        self.default_limit = default_limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore:
+        if name not in self._semaphores:
+            self._semaphores[name] = asyncio.Semaphore(max(1, self.limits.get(name, self.default_limit)))
+        return self._semaphores[name]
+
+    @staticmethod
+    def _finished(semaphore: asyncio.Semaphore, future: asyncio.Future) -> None:
+        semaphore.release()
+        # Retrieve the outcome so an abandoned (timed-out) call does not log
+        # "exception was never retrieved"
+        if not future.cancelled():
+            future.exception()
+
+    async def run(self, name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run func(*args, **kwargs) on the thread pool under the tool's limits.
+
+        Args:
+            name: Tool name used to look up the timeout and concurrency limit
+            func: Blocking callable
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            ToolTimeoutError: If waiting for a slot plus running exceeds the timeout
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self.timeouts.get(name, self.default_timeout)
+        deadline = loop.time() + timeout
+        semaphore = self._semaphore(name)
+
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise ToolTimeoutError(f"{name} is busy: no free slot within {timeout:g}s")
+
+        future = loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+        # Free the slot when the work actually ends, not when the caller gives up
+        future.add_done_callback(functools.partial(self._finished, semaphore))
+
+        try:
+            # shield() keeps wait_for from cancelling the future (and releasing early)
+            return await asyncio.wait_for(asyncio.shield(future), max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            logger.error(f"Tool {name} timed out after {timeout:g}s; it may still complete in the background")
+            raise ToolTimeoutError(f"{name} timed out after {timeout:g}s (the action may still complete)")
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running actions are left to finish."""
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Accounting Aggregates - Vectorized Financial Reports
+
+Loads the ledger sidecar columns (see ledger_engine.py) straight into NumPy
+arrays and computes weekly, monthly and per-category income/expense/net with
+boolean masks, bincount and cumsum. No Markdown parsing and no per-row
+Python loops, so multi-year ledgers with millions of rows summarize in
+milliseconds.
+
+Usage:
+    from accounting_aggregates import load_ledger_arrays, summarize_by_period
+    arrays = load_ledger_arrays(engine)
+    months = summarize_by_period(arrays, "month")
+
+Requirements:
+    pip install numpy
+"""
+
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Any
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from ledger_engine import LedgerEngine, COLUMNS, TYPE_INCOME, TYPE_EXPENSE
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# date.toordinal() of the Unix epoch, to convert ordinals to datetime64[D]
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+PERIODS = ("week", "month")
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def require_numpy() -> None:
+    """Raise a helpful error when NumPy is not installed"""
+    if not HAS_NUMPY:
+        raise RuntimeError("numpy is required for vectorized reports (pip install numpy)")
+
+
+def load_ledger_arrays(engines) -> Dict[str, Any]:
+    """
+    Load the ledger columns into NumPy arrays.
+
+    Args:
+        engines: A LedgerEngine or a list of them (e.g. archived months plus
+                 the live month); each is synced first if stale
+
+    Returns:
+        dict with days, types, cents and labels arrays plus label_names
+    """
+    require_numpy()
+    if isinstance(engines, LedgerEngine):
+        engines = [engines]
+
+    parts = {name: [] for name in ("days", "types", "cents", "labels")}
+    label_ids: Dict[str, int] = {}
+
+    for engine in engines:
+        engine.sync()
+        arrays = {}
+        for name in parts:
+            arrays[name] = np.fromfile(engine.column_path(name), dtype=np.dtype(COLUMNS[name]))
+
+        # Guard against a torn append: only keep rows present in every column
+        rows = min(len(values) for values in arrays.values())
+
+        # Each ledger has its own label dictionary; map it onto a shared one
+        names = engine.label_names()
+        mapping = np.array([label_ids.setdefault(label, len(label_ids)) for label in names] or [0], dtype=np.int64)
+
+        for name in parts:
+            values = arrays[name][:rows]
+            parts[name].append(mapping[values] if name == "labels" else values)
+
+    result = {}
+    for name, chunks in parts.items():
+        dtype = np.int64 if name == "labels" else np.dtype(COLUMNS[name])
+        result[name] = np.concatenate(chunks) if chunks else np.array([], dtype=dtype)
+    result["label_names"] = list(label_ids)
+    return result
+
+
+def _split_amounts(arrays: Dict[str, Any], mask=None):
+    """Income and expense cents as separate arrays (zero where not applicable)"""
+    types = arrays["types"]
+    cents = arrays["cents"]
+    if mask is not None:
+        types = types[mask]
+        cents = cents[mask]
+    income = np.where(types == TYPE_INCOME, cents, 0)
+    expense = np.where(types == TYPE_EXPENSE, cents, 0)
+    return income, expense
+
+
+def range_mask(arrays: Dict[str, Any], start: Optional[date] = None, end: Optional[date] = None):
+    """Boolean mask of rows dated start..end inclusive (open-ended if None)"""
+    days = arrays["days"]
+    mask = np.ones(len(days), dtype=bool)
+    if start is not None:
+        mask &= days >= start.toordinal()
+    if end is not None:
+        mask &= days <= end.toordinal()
+    return mask
+
+
+# =============================================================================
+# AGGREGATIONS
+# =============================================================================
+
+def summarize_range(arrays: Dict[str, Any], start: Optional[date] = None,
+                    end: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Total income, expense and net for a date range.
+
+    Returns:
+        dict with income, expense, net and count
+    """
+    mask = range_mask(arrays, start, end)
+    income, expense = _split_amounts(arrays, mask)
+    income_total = int(income.sum())
+    expense_total = int(expense.sum())
+    return {
+        "income": income_total / 100,
+        "expense": expense_total / 100,
+        "net": (income_total - expense_total) / 100,
+        "count": int(mask.sum())
+    }
+
+
+def _period_keys(days, period: str):
+    """Map day ordinals to week (Monday-based) or month bucket numbers"""
+    if period == "week":
+        # Ordinal 1 (0001-01-01) is a Monday, so this aligns buckets to ISO weeks
+        return (days.astype(np.int64) - 1) // 7
+    if period == "month":
+        as_dates = (days.astype(np.int64) - EPOCH_ORDINAL).astype("datetime64[D]")
+        return as_dates.astype("datetime64[M]").astype(np.int64)
+    raise ValueError(f"Unknown period '{period}'. Use one of: {', '.join(PERIODS)}")
+
+
+def _period_label(key: int, period: str) -> str:
+    """Human label for a bucket number produced by _period_keys"""
+    if period == "week":
+        monday = date.fromordinal(int(key) * 7 + 1)
+        year, week, _ = monday.isocalendar()
+        return f"{year}-W{week:02d}"
+    return str(np.datetime64(int(key), "M"))
+
+
+def summarize_by_period(arrays: Dict[str, Any], period: str = "month",
+                        start: Optional[date] = None, end: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    Income/expense/net per week or month, with a running balance.
+
+    Args:
+        arrays: Output of load_ledger_arrays()
+        period: "week" or "month"
+        start, end: Optional inclusive date bounds
+
+    Returns:
+        list of dicts (period, income, expense, net, balance, count), oldest first
+    """
+    mask = range_mask(arrays, start, end)
+    if not mask.any():
+        return []
+
+    keys = _period_keys(arrays["days"][mask], period)
+    base = int(keys.min())
+    buckets = keys - base
+    income, expense = _split_amounts(arrays, mask)
+
+    size = int(buckets.max()) + 1
+    income_sums = np.bincount(buckets, weights=income, minlength=size)
+    expense_sums = np.bincount(buckets, weights=expense, minlength=size)
+    counts = np.bincount(buckets, minlength=size)
+    net_sums = income_sums - expense_sums
+    balance = np.cumsum(net_sums)
+
+    rows = []
+    for index in np.flatnonzero(counts):
+        rows.append({
+            "period": _period_label(base + int(index), period),
+            "income": round(float(income_sums[index]) / 100, 2),
+            "expense": round(float(expense_sums[index]) / 100, 2),
+            "net": round(float(net_sums[index]) / 100, 2),
+            "balance": round(float(balance[index]) / 100, 2),
+            "count": int(counts[index])
+        })
+    return rows
+
+
+def summarize_by_category(arrays: Dict[str, Any], start: Optional[date] = None,
+                          end: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    Income/expense/net per description (category), largest net first.
+
+    Returns:
+        list of dicts (category, income, expense, net, count)
+    """
+    mask = range_mask(arrays, start, end)
+    if not mask.any():
+        return []
+
+    labels = arrays["labels"][mask]
+    income, expense = _split_amounts(arrays, mask)
+    size = len(arrays["label_names"])
+    income_sums = np.bincount(labels, weights=income, minlength=size)
+    expense_sums = np.bincount(labels, weights=expense, minlength=size)
+    counts = np.bincount(labels, minlength=size)
+    net_sums = income_sums - expense_sums
+
+    rows = []
+    for index in np.argsort(-net_sums, kind="stable"):
+        if counts[index] == 0:
+            continue
+        rows.append({
+            "category": arrays["label_names"][index],
+            "income": round(float(income_sums[index]) / 100, 2),
+            "expense": round(float(expense_sums[index]) / 100, 2),
+            "net": round(float(net_sums[index]) / 100, 2),
+            "count": int(counts[index])
+        })
+    return rows
+
+
+def month_bounds(year: int, month: int):
+    """First and last date of a calendar month"""
+    first = date(year, month, 1)
+    next_month = date(year + (month // 12), month % 12 + 1, 1)
+    return first, next_month - timedelta(days=1)
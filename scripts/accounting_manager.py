@@ -1,8 +1,15 @@
 
 import argparse
 import os
+import sys
 from datetime import datetime, timedelta
-import re
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ledger_engine import LedgerEngine, MARKDOWN_HEADER, parse_ledger_row, to_cents
+from ledger_archive import LedgerArchive, month_key
+import accounting_aggregates as aggregates
+from metrics_store import record_event
+from profiling import add_profile_arguments, profile_main
 
 ACCOUNTING_FILE = "AI_Employee_Vault/Accounting/Current_Month.md"
 LOG_FILE_PATH = "vault/Logs/business.log"
@@ -20,10 +27,7 @@ def ensure_file_exists(filepath):
     """Ensures the accounting file exists with headers if it's new."""
     if not os.path.exists(filepath):
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("| Date       | Type    | Amount  | Description              |
-")
-            f.write("|------------|---------|---------|--------------------------|
-")
+            f.write(MARKDOWN_HEADER)
 
 def parse_markdown_table(filepath):
     """Parses the Markdown table from the accounting file."""
@@ -34,28 +38,54 @@ def parse_markdown_table(filepath):
             # Skip header and separator lines
             data_lines = lines[2:]
             for line in data_lines:
-                parts = [p.strip() for p in line.strip().split('|')]
-                if len(parts) == 5 and parts[0] == '' and parts[4] == '': # Ensure it's a valid row
-                    try:
-                        date_str, trans_type, amount_str, description = parts[1], parts[2], parts[3], parts[4]
-                        amount = float(amount_str)
-                        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                        transactions.append({
-                            'date': date_obj,
-                            'type': trans_type,
-                            'amount': amount,
-                            'description': description
-                        })
-                    except (ValueError, TypeError) as e:
-                        print(f"Warning: Could not parse line '{line.strip()}': {e}")
+                try:
+                    row = parse_ledger_row(line)
+                    if row is None: # Not a valid row
+                        continue
+                    date_obj, trans_type, amount, description = row
+                    transactions.append({
+                        'date': datetime.combine(date_obj, datetime.min.time()),
+                        'type': trans_type,
+                        'amount': amount,
+                        'description': description
+                    })
+                except (ValueError, TypeError) as e:
+                    print(f"Warning: Could not parse line '{line.strip()}': {e}")
     except FileNotFoundError:
         pass # File doesn't exist yet, will be created by ensure_file_exists
     return transactions
 
+def get_archive():
+    """Returns the monthly archive, rolling finished months out of the live ledger first."""
+    ensure_file_exists(ACCOUNTING_FILE)
+    archive = LedgerArchive(ACCOUNTING_FILE)
+    archive.ensure_rolled_over()
+    return archive
+
+def get_ledger():
+    """Returns the indexed ledger for the live month, creating the file if needed."""
+    get_archive()
+    return LedgerEngine(ACCOUNTING_FILE)
+
+def get_ledgers_for_range(start_date, end_date):
+    """Returns the archived month ledgers overlapping the range plus the live ledger."""
+    archive = get_archive()
+    return archive.engines_for_range(start_date, end_date) + [LedgerEngine(ACCOUNTING_FILE)]
+
+def combine_totals(*totals):
+    """Adds several income/expense/net/count dicts together (in cents, to avoid drift)."""
+    income = sum(to_cents(t['income']) for t in totals)
+    expense = sum(to_cents(t['expense']) for t in totals)
+    return {
+        'income': income / 100,
+        'expense': expense / 100,
+        'net': (income - expense) / 100,
+        'count': sum(t['count'] for t in totals)
+    }
+
 def format_transaction_row(date, trans_type, amount, description):
     """Formats a single transaction into a Markdown table row."""
-    return f"| {date.strftime('%Y-%m-%d')} | {trans_type:<7} | {amount:>7.2f} | {description:<24} |
-"
+    return f"| {date.strftime('%Y-%m-%d')} | {trans_type:<7} | {amount:>7.2f} | {description:<24} |\n"
 
 def log_activity(message):
     """Logs a message to the business log."""
@@ -63,8 +93,7 @@ def log_activity(message):
     log_message = f"[{timestamp}] [ACCOUNTING_SCRIPT] {message}"
     try:
         with open(LOG_FILE_PATH, 'a', encoding='utf-8') as f:
-            f.write(log_message + '
-')
+            f.write(log_message + '\n')
         print(f"Logged to {LOG_FILE_PATH}: {message}")
     except Exception as e:
         print(f"Error logging to {LOG_FILE_PATH}: {e}")
@@ -80,10 +109,18 @@ def log_transaction(date_str, trans_type, amount, description):
         if amount <= 0:
             raise ValueError("Amount must be positive.")
 
-        # Append new transaction to the file
-        with open(ACCOUNTING_FILE, 'a', encoding='utf-8') as f:
-            f.write(format_transaction_row(date_obj, trans_type.lower(), amount, description))
+        # Append new transaction to the file and the ledger index.
+        # Back-dated entries for an already archived month go to that month's ledger.
+        row_text = format_transaction_row(date_obj, trans_type.lower(), amount, description)
+        archive = get_archive()
+        live_month = archive.rollup().get('live_month') or month_key(datetime.now())
+        if month_key(date_obj) < live_month:
+            archive.append_row(month_key(date_obj), row_text)
+        else:
+            LedgerEngine(ACCOUNTING_FILE).append_row(row_text)
         
+        record_event(f"{trans_type.lower()}_cents", to_cents(amount), day=date_obj,
+                     detail=f"{date_str} {trans_type.lower()} {amount:.2f} {description}")
         log_activity(f"Logged transaction: {date_str}, {trans_type}, {amount:.2f}, {description}")
         print(f"Transaction logged successfully: {date_str}, {trans_type}, {amount:.2f}, {description}")
 
@@ -92,11 +129,89 @@ def log_transaction(date_str, trans_type, amount, description):
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
+# --- Summary API ---
+def _as_date(value):
+    """Accepts a date, datetime or YYYY-MM-DD string and returns a date."""
+    if isinstance(value, str):
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+def get_summary(start_date, end_date):
+    """
+    Returns structured income/expense data for start_date..end_date (inclusive).
+
+    Intended for in-process callers such as the CEO briefing: nothing is
+    printed or logged, and every value is JSON-serializable for charts.
+    """
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    ledgers = get_ledgers_for_range(start_date, end_date)
+    totals = combine_totals(*(ledger.range_totals(start_date, end_date) for ledger in ledgers))
+
+    transactions = []
+    daily = {}
+    rows = [t for ledger in ledgers for t in ledger.transactions_between(start_date, end_date)]
+    rows.sort(key=lambda t: t['date'])
+    for t in rows:
+        day = t['date'].strftime('%Y-%m-%d')
+        transactions.append({
+            'date': day,
+            'type': t['type'],
+            'amount': t['amount'],
+            'description': t['description']
+        })
+        bucket = daily.setdefault(day, {'income': 0.0, 'expense': 0.0})
+        if t['type'] in bucket:
+            bucket[t['type']] += t['amount']
+
+    daily_series = []
+    day = start_date
+    while day <= end_date:
+        key = day.strftime('%Y-%m-%d')
+        bucket = daily.get(key, {'income': 0.0, 'expense': 0.0})
+        daily_series.append({
+            'date': key,
+            'income': round(bucket['income'], 2),
+            'expense': round(bucket['expense'], 2),
+            'net': round(bucket['income'] - bucket['expense'], 2)
+        })
+        day += timedelta(days=1)
+
+    return {
+        'start_date': start_date.strftime('%Y-%m-%d'),
+        'end_date': end_date.strftime('%Y-%m-%d'),
+        'income': totals['income'],
+        'expense': totals['expense'],
+        'net': totals['net'],
+        'count': totals['count'],
+        'transactions': transactions,
+        'daily': daily_series
+    }
+
+def get_weekly_summary(end_date=None):
+    """Returns get_summary() for the 7 days ending on end_date inclusive (defaults to today)."""
+    end_date = _as_date(end_date) if end_date else datetime.now().date()
+    return get_summary(end_date - timedelta(days=6), end_date)
+
+def get_totals():
+    """Returns total income, expense, net and transaction count (archived snapshots plus the live month)."""
+    archive = get_archive()
+    return combine_totals(archive.all_time_totals(), LedgerEngine(ACCOUNTING_FILE).totals())
+
+def get_ytd_summary(year=None):
+    """Returns year-to-date totals from the year's snapshot rollup plus the live month."""
+    year = year or datetime.now().year
+    archive = get_archive()
+    start, _ = aggregates.month_bounds(year, 1)
+    _, end = aggregates.month_bounds(year, 12)
+    live = LedgerEngine(ACCOUNTING_FILE).range_totals(start, end)
+    summary = combine_totals(archive.year_totals(year), live)
+    summary['year'] = year
+    return summary
+
 def generate_weekly_summary(end_date_str=None):
     """Generates a summary of transactions for the past 7 days."""
-    ensure_file_exists(ACCOUNTING_FILE)
-    transactions = parse_markdown_table(ACCOUNTING_FILE)
-
     if end_date_str:
         try:
             end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
@@ -106,26 +221,17 @@ def generate_weekly_summary(end_date_str=None):
     else:
         end_date = datetime.now()
 
-    start_date = end_date - timedelta(days=7)
-
-    weekly_income = 0.0
-    weekly_expense = 0.0
+    summary = get_weekly_summary(end_date)
+    weekly_income = summary['income']
+    weekly_expense = summary['expense']
     
     summary_lines = [f"Weekly Financial Summary (ending {end_date.strftime('%Y-%m-%d')})"]
     summary_lines.append("========================================================")
 
-    for t in transactions:
-        if start_date <= t['date'] <= end_date:
-            if t['type'] == 'income':
-                weekly_income += t['amount']
-            elif t['type'] == 'expense':
-                weekly_expense += t['amount']
-            
-            # Format date for display
-            display_date = t['date'].strftime('%Y-%m-%d')
-            # Truncate description if too long for consistent display
-            display_desc = (t['description'][:20] + '...') if len(t['description']) > 20 else t['description']
-            summary_lines.append(f"- {display_date} | {t['type'].capitalize():<7} | {t['amount']:>8.2f} | {display_desc}")
+    for t in summary['transactions']:
+        # Truncate description if too long for consistent display
+        display_desc = (t['description'][:20] + '...') if len(t['description']) > 20 else t['description']
+        summary_lines.append(f"- {t['date']} | {t['type'].capitalize():<7} | {t['amount']:>8.2f} | {display_desc}")
 
     summary_lines.append("--------------------------------------------------------")
     summary_lines.append(f"Total Income: {weekly_income:>8.2f}")
@@ -133,34 +239,108 @@ def generate_weekly_summary(end_date_str=None):
     summary_lines.append(f"Net: {weekly_income - weekly_expense:>10.2f}")
     summary_lines.append("========================================================")
 
-    output = "
-".join(summary_lines)
+    output = "\n".join(summary_lines)
     print(output)
     log_activity(f"Generated weekly summary ending {end_date.strftime('%Y-%m-%d')}")
 
 def generate_totals():
     """Generates total income and total expenses."""
-    ensure_file_exists(ACCOUNTING_FILE)
-    transactions = parse_markdown_table(ACCOUNTING_FILE)
-
-    total_income = 0.0
-    total_expense = 0.0
-
-    for t in transactions:
-        if t['type'] == 'income':
-            total_income += t['amount']
-        elif t['type'] == 'expense':
-            total_expense += t['amount']
-
-    output = f"Total Financial Summary:
-========================================================
-Total Income:  {total_income:>10.2f}
-Total Expense: {total_expense:>10.2f}
-Net:           {total_income - total_expense:>10.2f}
-========================================================"
+    totals = get_totals()
+    total_income = totals['income']
+    total_expense = totals['expense']
+
+    output = f"Total Financial Summary:\n========================================================\nTotal Income:  {total_income:>10.2f}\nTotal Expense: {total_expense:>10.2f}\nNet:           {total_income - total_expense:>10.2f}\n========================================================"
     print(output)
     log_activity("Generated total income/expense summary")
 
+def generate_monthly_summary(year=None):
+    """Generates a per-month income/expense table for a calendar year."""
+    year = year or datetime.now().year
+    try:
+        start, _ = aggregates.month_bounds(year, 1)
+        _, end = aggregates.month_bounds(year, 12)
+        arrays = aggregates.load_ledger_arrays(get_ledgers_for_range(start, end))
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return
+
+    months = aggregates.summarize_by_period(arrays, "month", start, end)
+
+    summary_lines = [f"Monthly Financial Summary ({year})"]
+    summary_lines.append("========================================================")
+    summary_lines.append(f"{'Month':<8} | {'Income':>10} | {'Expense':>10} | {'Net':>10} | {'Balance':>10}")
+    for m in months:
+        summary_lines.append(f"{m['period']:<8} | {m['income']:>10.2f} | {m['expense']:>10.2f} | {m['net']:>10.2f} | {m['balance']:>10.2f}")
+    if not months:
+        summary_lines.append("- No transactions recorded for this year.")
+
+    totals = aggregates.summarize_range(arrays, start, end)
+    summary_lines.append("--------------------------------------------------------")
+    summary_lines.append(f"Total Income:  {totals['income']:>10.2f}")
+    summary_lines.append(f"Total Expense: {totals['expense']:>10.2f}")
+    summary_lines.append(f"Net:           {totals['net']:>10.2f}")
+    summary_lines.append("========================================================")
+
+    print("\n".join(summary_lines))
+    log_activity(f"Generated monthly summary for {year}")
+
+def generate_range_summary(start_date_str, end_date_str, group_by="category"):
+    """Generates a summary for an arbitrary date range, grouped by week, month or category."""
+    try:
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+    except ValueError:
+        print("Error: Invalid date format. Please use YYYY-MM-DD.")
+        return
+    try:
+        arrays = aggregates.load_ledger_arrays(get_ledgers_for_range(start_date, end_date))
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return
+
+    if group_by == "category":
+        groups = aggregates.summarize_by_category(arrays, start_date, end_date)
+        key = "category"
+    else:
+        groups = aggregates.summarize_by_period(arrays, group_by, start_date, end_date)
+        key = "period"
+
+    summary_lines = [f"Financial Summary {start_date} to {end_date} (by {group_by})"]
+    summary_lines.append("========================================================")
+    for g in groups:
+        label = (g[key][:20] + '...') if len(g[key]) > 20 else g[key]
+        summary_lines.append(f"- {label:<23} | +{g['income']:>9.2f} | -{g['expense']:>9.2f} | {g['net']:>10.2f}")
+    if not groups:
+        summary_lines.append("- No transactions in this range.")
+
+    totals = aggregates.summarize_range(arrays, start_date, end_date)
+    summary_lines.append("--------------------------------------------------------")
+    summary_lines.append(f"Total Income:  {totals['income']:>10.2f}")
+    summary_lines.append(f"Total Expense: {totals['expense']:>10.2f}")
+    summary_lines.append(f"Net:           {totals['net']:>10.2f}")
+    summary_lines.append("========================================================")
+
+    print("\n".join(summary_lines))
+    log_activity(f"Generated range summary {start_date} to {end_date} by {group_by}")
+
+def generate_ytd_summary(year=None):
+    """Generates year-to-date income and expense from monthly snapshots plus the live month."""
+    summary = get_ytd_summary(year)
+
+    output = f"Year-to-Date Financial Summary ({summary['year']}):\n========================================================\nTotal Income:  {summary['income']:>10.2f}\nTotal Expense: {summary['expense']:>10.2f}\nNet:           {summary['net']:>10.2f}\nTransactions:  {summary['count']:>10}\n========================================================"
+    print(output)
+    log_activity(f"Generated year-to-date summary for {summary['year']}")
+
+def reindex_all():
+    """Rebuilds the live ledger index and every archived month's index and snapshot."""
+    archive = get_archive()
+    rows = LedgerEngine(ACCOUNTING_FILE).rebuild()
+    for key in archive.archived_months():
+        rows += archive.month_engine(key).rebuild()
+        archive.write_snapshot(key)
+    archive.write_rollup()
+    return rows
+
 # --- Main Execution ---
 def main():
     parser = argparse.ArgumentParser(description="Accounting Manager Skill")
@@ -178,7 +358,25 @@ def main():
     parser_weekly.add_argument("--end-date", type=str, help="Optional: End date for the summary (YYYY-MM-DD). Defaults to today.")
 
     # Totals sub-parser
-    parser_totals = subparsers.add_parser("totals", help="Generate total income and expense")
+    subparsers.add_parser("totals", help="Generate total income and expense")
+
+    # Monthly summary sub-parser
+    parser_monthly = subparsers.add_parser("monthly-summary", help="Generate a per-month summary for a year")
+    parser_monthly.add_argument("--year", type=int, help="Optional: Year to summarize. Defaults to the current year.")
+
+    # Range summary sub-parser
+    parser_range = subparsers.add_parser("range-summary", help="Generate a summary for a date range")
+    parser_range.add_argument("--start-date", type=str, required=True, help="Start date of the range (YYYY-MM-DD)")
+    parser_range.add_argument("--end-date", type=str, required=True, help="End date of the range (YYYY-MM-DD)")
+    parser_range.add_argument("--by", type=str, default="category", choices=['category', 'week', 'month'], help="Grouping for the breakdown (default: category)")
+
+    # Year-to-date sub-parser
+    parser_ytd = subparsers.add_parser("ytd-summary", help="Generate year-to-date income and expense")
+    parser_ytd.add_argument("--year", type=int, help="Optional: Year to summarize. Defaults to the current year.")
+
+    # Reindex sub-parser
+    subparsers.add_parser("reindex", help="Rebuild ledger indexes and monthly snapshots from the Markdown files")
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
@@ -188,6 +386,15 @@ def main():
         generate_weekly_summary(args.end_date)
     elif args.action == "totals":
         generate_totals()
+    elif args.action == "monthly-summary":
+        generate_monthly_summary(args.year)
+    elif args.action == "range-summary":
+        generate_range_summary(args.start_date, args.end_date, args.by)
+    elif args.action == "ytd-summary":
+        generate_ytd_summary(args.year)
+    elif args.action == "reindex":
+        rows = reindex_all()
+        print(f"Ledger index rebuilt: {rows} transactions")
 
 if __name__ == "__main__":
-    main()
+    profile_main(main, "accounting")
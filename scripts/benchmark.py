@@ -0,0 +1,725 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Synthetic-Vault Performance Suite
+
+Generates a synthetic vault of configurable size (inbox drops, pending
+tasks, approvals, multi-MB logs, a large ledger) and times the pipeline
+against it:
+
+    watcher    Inbox scan cost and vault-event detection latency
+    status     Scheduler status, health probes and published statuses
+    dashboard  One dashboard refresh, cold and warm
+    approvals  Approval scan over Needs_Action
+    briefing   CEO briefing generation, cold (ledger index build) and warm
+    planner    Task planner throughput over the whole inbox
+
+The vault is built in a temporary directory next to a copy of scripts/, and
+each case runs in a worker process inside that copy, so the modules' own
+path constants point at the synthetic vault and the real one is never
+touched. Results are written as JSON to Logs/benchmarks/ and can be
+compared across commits:
+
+    python scripts/benchmark.py --size small
+    python scripts/benchmark.py --size medium --cases planner,dashboard
+    python scripts/benchmark.py --compare Logs/benchmarks/<baseline>.json
+
+With --compare the exit code is 1 when any timing regressed by more than
+--threshold (default 20%), so the suite can gate a CI job.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+
+VAULT_DIR = BASE_DIR / "AI_Employee_Vault"
+LOGS_DIR = BASE_DIR / "Logs"
+RESULTS_DIR = LOGS_DIR / "benchmarks"
+
+SCHEMA_VERSION = 1
+
+# Vault sizes: inbox drops, pending tasks, approvals, MB of logs, ledger rows
+PRESETS = {
+    "small": {"inbox": 50, "tasks": 200, "approvals": 20, "log_mb": 1, "ledger_rows": 2000},
+    "medium": {"inbox": 500, "tasks": 2000, "approvals": 200, "log_mb": 8, "ledger_rows": 20000},
+    "large": {"inbox": 5000, "tasks": 20000, "approvals": 2000, "log_mb": 32, "ledger_rows": 200000},
+}
+
+# The planner consumes the inbox, so it runs last
+CASES = ("watcher", "status", "dashboard", "approvals", "briefing", "planner")
+
+DEFAULT_REPEAT = 5
+WORKER_TIMEOUT_SECONDS = 1800
+
+# A timing regresses when it is this much slower than the baseline...
+REGRESSION_THRESHOLD = 0.20
+# ...and slower by more than this many milliseconds (ignores timer noise)
+NOISE_FLOOR_MS = 1.0
+
+# Output locations the workers must not inherit from the caller's shell
+ISOLATED_ENV_VARS = ("METRICS_DIR", "METRICS_DB_PATH", "TRACE_DIR", "PROFILE_DIR")
+
+# Days of ledger history and of briefing logs in the synthetic vault
+LEDGER_DAYS = 365
+LOG_DAYS = 28
+
+SEED = 20260301
+
+
+# =============================================================================
+# SYNTHETIC VAULT
+# =============================================================================
+
+INBOX_TEMPLATE = """---
+type: {kind}
+priority: {priority}
+created_at: {created}
+---
+
+# {title}
+
+## Task Description
+
+{sentence} Reference #{i}.
+
+## Required Actions
+
+- Review the request from client{i}@example.com
+- Draft a response and schedule a follow-up
+- Update the tracker
+"""
+
+PLAN_TEMPLATE = """---
+type: plan
+source_file: task_{i}.md
+priority: {priority}
+status: pending
+created_at: {created}
+---
+
+# Plan: task_{i}.md
+
+## Reasoning
+
+{sentence}
+
+## Steps
+
+- [ ] Analyze the request
+- [ ] Execute the required actions
+- [ ] Move to Done
+"""
+
+APPROVAL_TEMPLATE = """---
+type: approval_request
+action: {kind}
+status: pending_approval
+approval_required: true
+created_at: {created}
+---
+
+# Approval Request {i}
+
+{sentence}
+
+Approved: [ ]
+Rejected: [ ]
+"""
+
+SENTENCES = [
+    "Send the quarterly invoice to the client and confirm payment terms.",
+    "Urgent: reply to the customer email about the delayed shipment.",
+    "Post the product update on LinkedIn and share it with the team.",
+    "Schedule a meeting with the accountant to review expenses.",
+    "Clean up old records and archive last month's reports.",
+]
+KINDS = ["email", "invoice", "social_media", "meeting", "maintenance"]
+PRIORITIES = ["low", "medium", "high"]
+
+
+def _write_files(folder: Path, count: int, name: Callable[[int], str],
+                 template: str, rng: random.Random, age_days: int = 0) -> int:
+    """Write `count` templated files, spreading their mtimes over age_days"""
+    folder.mkdir(parents=True, exist_ok=True)
+    now = time.time()
+    written = 0
+    for i in range(count):
+        created = datetime.now() - timedelta(days=rng.uniform(0, age_days)) if age_days else datetime.now()
+        path = folder / name(i)
+        path.write_text(template.format(
+            i=i,
+            kind=KINDS[i % len(KINDS)],
+            priority=PRIORITIES[i % len(PRIORITIES)],
+            created=created.strftime("%Y-%m-%d %H:%M:%S"),
+            title=f"Synthetic task {i}",
+            sentence=SENTENCES[i % len(SENTENCES)],
+        ), encoding="utf-8")
+        if age_days:
+            os.utime(path, (now, created.timestamp()))
+        written += 1
+    return written
+
+
+def _write_action_log(path: Path, size_bytes: int, rng: random.Random) -> int:
+    """Append-ordered action.log lines until the file reaches size_bytes"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line_size = 80
+    lines = max(1, size_bytes // line_size)
+    start = datetime.now() - timedelta(days=LOG_DAYS)
+    step = timedelta(days=LOG_DAYS) / lines
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            ts = (start + step * i).strftime("%Y-%m-%d %H:%M:%S")
+            f.write(f"[{ts}] TASK_PLANNER: Analyzing task_{rng.randrange(100000)}.md\n")
+    return lines
+
+
+def _write_ledger(path: Path, rows: int, rng: random.Random) -> int:
+    """
+    `rows` transactions over the last LEDGER_DAYS days, laid out as after
+    a month rollover: past months indexed in the archive, the current month
+    in the live ledger (left unindexed, as after a restart).
+    """
+    from ledger_engine import MARKDOWN_HEADER
+    from ledger_archive import LedgerArchive, month_key
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    start = datetime.now() - timedelta(days=LEDGER_DAYS - 1)
+    labels = ["Client payment", "Software subscription", "Office supplies", "Consulting", "Travel"]
+    months: Dict[str, List[str]] = {}
+    for i in range(rows):
+        day = start + timedelta(days=i * LEDGER_DAYS // max(rows, 1))
+        trans_type = "income" if i % 3 == 0 else "expense"
+        amount = rng.uniform(5, 2500)
+        label = labels[i % len(labels)]
+        months.setdefault(month_key(day.date()), []).append(
+            f"| {day.strftime('%Y-%m-%d')} | {trans_type:<7} | {amount:>7.2f} | {label:<24} |\n")
+
+    live_month = month_key(datetime.now().date())
+    archive = LedgerArchive(path)
+    archive.archive_dir.mkdir(parents=True, exist_ok=True)
+    for key, lines in sorted(months.items()):
+        target = path if key == live_month else archive.month_path(key)
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(MARKDOWN_HEADER)
+            f.writelines(lines)
+        if key != live_month:
+            archive.month_engine(key).rebuild()
+            archive.write_snapshot(key)
+    if not path.exists():
+        path.write_text(MARKDOWN_HEADER, encoding="utf-8")
+    archive.write_rollup(live_month)
+    return rows
+
+
+def generate_vault(root: Path, sizes: Dict[str, int], seed: int = SEED) -> Dict[str, Any]:
+    """
+    Build a synthetic vault and a copy of scripts/ under root.
+
+    Args:
+        root: Empty directory laid out like the repository root
+        sizes: inbox, tasks, approvals, log_mb and ledger_rows
+        seed: Random seed, so runs with the same sizes are comparable
+
+    Returns:
+        dict: What was generated (file counts, bytes, seconds taken)
+    """
+    import briefing_collector
+
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    root = Path(root)
+    shutil.copytree(SCRIPT_DIR, root / "scripts", ignore=shutil.ignore_patterns("__pycache__"))
+
+    vault = root / "AI_Employee_Vault"
+    logs = root / "Logs"
+    for folder in ["Inbox", "Needs_Action", "Needs_Approval", "Done", "Reports", "Accounting"]:
+        (vault / folder).mkdir(parents=True, exist_ok=True)
+    logs.mkdir(parents=True, exist_ok=True)
+
+    tasks = sizes["tasks"]
+    plans = tasks // 2
+    _write_files(vault / "Inbox", sizes["inbox"], lambda i: f"inbox_{i:06d}.md", INBOX_TEMPLATE, rng)
+    _write_files(vault / "Needs_Action", plans, lambda i: f"Plan_task_{i:06d}.md", PLAN_TEMPLATE, rng, age_days=30)
+    _write_files(vault / "Needs_Action", tasks - plans, lambda i: f"task_{i:06d}.md", INBOX_TEMPLATE, rng, age_days=30)
+    _write_files(vault / "Needs_Action", sizes["approvals"], lambda i: f"approval_{i:06d}.md",
+                 APPROVAL_TEMPLATE, rng)
+    _write_files(vault / "Needs_Approval", sizes["approvals"], lambda i: f"approval_{i:06d}.md",
+                 APPROVAL_TEMPLATE, rng)
+    _write_files(vault / "Done", tasks, lambda i: f"done_{i:06d}.md", INBOX_TEMPLATE, rng, age_days=30)
+
+    # Half of the log budget goes to action.log (dashboard, health), half to
+    # the briefing logs under vault/Logs/
+    log_bytes = sizes["log_mb"] * 1024 * 1024
+    action_lines = _write_action_log(logs / "action.log", log_bytes // 2, rng)
+    (logs / "watcher_errors.log").write_text(
+        "".join(f"[2026-03-01 00:00:{i % 60:02d}] ERROR: synthetic error {i}\n" for i in range(500)),
+        encoding="utf-8")
+    briefing_lines_per_day = max(3, (log_bytes // 2) // (85 * LOG_DAYS))
+    briefing_lines = briefing_collector.generate_synthetic_logs(
+        str(root / "vault" / "Logs"), LOG_DAYS, briefing_lines_per_day, datetime.now())
+
+    _write_ledger(vault / "Accounting" / "Current_Month.md", sizes["ledger_rows"], rng)
+
+    vault_bytes = sum(f.stat().st_size for f in vault.rglob("*") if f.is_file())
+    log_total = sum(f.stat().st_size for folder in [logs, root / "vault" / "Logs"]
+                    for f in folder.glob("*.log"))
+    return {
+        **sizes,
+        "action_log_lines": action_lines,
+        "briefing_log_lines": briefing_lines,
+        "vault_mb": round(vault_bytes / (1024 * 1024), 2),
+        "logs_mb": round(log_total / (1024 * 1024), 2),
+        "generate_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    """Swallow the console output of the code under test"""
+    with redirect_stdout(io.StringIO()):
+        yield
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Time func() `repeat` times.
+
+    Returns:
+        dict: median_ms, min_ms and max_ms
+    """
+    timings = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        with quiet():
+            func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+    }
+
+
+def once_ms(func: Callable[[], Any]) -> Tuple[float, Any]:
+    """Time a single call; returns (milliseconds, result)"""
+    started = time.perf_counter()
+    with quiet():
+        result = func()
+    return round((time.perf_counter() - started) * 1000, 3), result
+
+
+# =============================================================================
+# CASES (run inside the synthetic vault's copy of scripts/)
+# =============================================================================
+
+def bench_watcher(repeat: int) -> Dict[str, Any]:
+    """Inbox scan cost and how quickly a dropped file reaches the event hub"""
+    import watch_inbox
+    from vault_events import EventHub, VaultWatcher, HAS_WATCHDOG, STATUS_DIR, ACTION_LOG
+
+    inbox = VAULT_DIR / "Inbox"
+    processed = set(watch_inbox.get_inbox_md_files())
+    processed.discard(min(processed, default=""))
+    scan = measure(lambda: watch_inbox.check_for_new_files(processed), repeat)
+
+    hub = EventHub()
+    watcher = VaultWatcher(hub, VAULT_DIR, STATUS_DIR, ACTION_LOG)
+    watcher.start()
+    latencies = []
+    drops = []
+    try:
+        hub.wait(0, 10)
+        for i in range(max(1, repeat)):
+            after = hub.last_id
+            drop = inbox / f"bench_drop_{i}.md"
+            dropped_at = time.perf_counter()
+            drop.write_text("# Dropped\n", encoding="utf-8")
+            drops.append(drop)
+            deadline = dropped_at + 10
+            while time.perf_counter() < deadline:
+                events = hub.wait(after, deadline - time.perf_counter())
+                if any(event == "counts" for _, event, _ in events):
+                    latencies.append((time.perf_counter() - dropped_at) * 1000)
+                    break
+                if events:
+                    after = events[-1][0]
+    finally:
+        watcher.stop()
+        for drop in drops:
+            drop.unlink(missing_ok=True)
+
+    return {
+        "inbox_files": len(processed) + 1,
+        "scan": scan,
+        "detect_latency_ms": round(statistics.median(latencies), 3) if latencies else None,
+        "detected": len(latencies),
+        "detection": "watchdog" if HAS_WATCHDOG else f"poll every {watcher.interval}s",
+    }
+
+
+def bench_status(repeat: int) -> Dict[str, Any]:
+    """The queries behind `run_ai_employee.py --status` and the health panel"""
+    import health_monitor
+    import vault_events
+    from run_ai_employee import get_scheduler_status
+
+    cold_ms, _ = once_ms(lambda: health_monitor.get_health(force=True))
+    return {
+        "scheduler_status": measure(get_scheduler_status, repeat),
+        "health_cold_ms": cold_ms,
+        "health_cached": measure(health_monitor.get_health, repeat),
+        "read_statuses": measure(vault_events.read_statuses, repeat),
+    }
+
+
+def bench_dashboard(repeat: int) -> Dict[str, Any]:
+    """One web dashboard refresh (the data calls of web_dashboard.py)"""
+    import dashboard_data as data
+
+    needs_action = VAULT_DIR / "Needs_Action"
+    needs_approval = VAULT_DIR / "Needs_Approval"
+
+    def refresh():
+        data.get_task_counts(VAULT_DIR)
+        latest = data.get_latest_plan()
+        if latest:
+            data.get_summary(latest, data.PLAN_PREFIX)
+        data.list_files(VAULT_DIR / "Inbox", ".md")
+        data.paginate(data.get_summaries(needs_action, ".md", data.PLAN_PREFIX), 1)
+        data.paginate(data.get_summaries(needs_approval, ".md"), 1)
+        data.get_recent_actions(50)
+        data.tail_lines(LOGS_DIR / "watcher_errors.log", 200)
+
+    def reset():
+        data.clear_cache()
+        for path in [data.INDEX_FILE, data.LATEST_PLAN_FILE]:
+            Path(path).unlink(missing_ok=True)
+
+    reset()
+    cold_ms, _ = once_ms(refresh)
+    data.clear_cache()
+    index_ms, _ = once_ms(refresh)
+    return {
+        "cold_ms": cold_ms,
+        "indexed_ms": index_ms,
+        "warm": measure(refresh, repeat),
+    }
+
+
+def bench_approvals(repeat: int) -> Dict[str, Any]:
+    """Approval scan over Needs_Action (dry run, so it can be repeated)"""
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("requests_approval", SCRIPT_DIR / "requests-approval.py")
+    approvals = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(approvals)
+
+    def scan():
+        checker = approvals.ApprovalChecker(dry_run=True)
+        return checker.check_all()
+
+    _, stats = once_ms(scan)
+    return {
+        "files": len(scan_folder(VAULT_DIR / "Needs_Action")),
+        "pending": stats.get("pending", 0),
+        "scan": measure(scan, repeat),
+    }
+
+
+def bench_briefing(repeat: int) -> Dict[str, Any]:
+    """CEO briefing generation; the first run also builds the ledger index"""
+    import ceo_briefing_generator as briefing
+
+    def generate():
+        briefing.generate_ceo_briefing(datetime.now())
+
+    cold_ms, _ = once_ms(generate)
+    return {
+        "cold_ms": cold_ms,
+        "warm": measure(generate, repeat),
+    }
+
+
+def bench_planner(repeat: int) -> Dict[str, Any]:
+    """Task planner throughput over the whole inbox (runs once: it moves files)"""
+    from task_planner import TaskPlanner
+
+    planner = TaskPlanner(dry_run=False)
+    elapsed_ms, stats = once_ms(planner.process_inbox)
+    files = stats["files_processed"]
+    return {
+        "files_processed": files,
+        "errors": stats["errors"],
+        "total_ms": elapsed_ms,
+        "ms_per_file": round(elapsed_ms / files, 3) if files else None,
+        "files_per_second": round(files / (elapsed_ms / 1000), 1) if files and elapsed_ms else None,
+    }
+
+
+def scan_folder(folder: Path) -> List[str]:
+    return [entry.name for entry in os.scandir(folder) if entry.is_file()] if folder.exists() else []
+
+
+CASE_FUNCTIONS = {
+    "watcher": bench_watcher,
+    "status": bench_status,
+    "dashboard": bench_dashboard,
+    "approvals": bench_approvals,
+    "briefing": bench_briefing,
+    "planner": bench_planner,
+}
+
+
+# =============================================================================
+# DRIVER
+# =============================================================================
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        result = subprocess.run(["git", *args], cwd=str(BASE_DIR), capture_output=True,
+                                text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def run_case(root: Path, case: str, repeat: int) -> Dict[str, Any]:
+    """
+    Run one case in a worker process inside the synthetic vault.
+
+    Returns:
+        dict: The case results, or {"error": ...} if the worker failed
+    """
+    env = {key: value for key, value in os.environ.items() if key not in ISOLATED_ENV_VARS}
+    env["TRACING"] = "0"
+    try:
+        result = subprocess.run(
+            [sys.executable, str(root / "scripts" / "benchmark.py"), "--worker", case, "--repeat", str(repeat)],
+            cwd=str(root), env=env, capture_output=True, text=True, timeout=WORKER_TIMEOUT_SECONDS,
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {WORKER_TIMEOUT_SECONDS}s"}
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        return {"error": (result.stderr.strip().splitlines() or ["worker failed"])[-1]}
+    return json.loads(lines[-1])
+
+
+def run_benchmarks(sizes: Dict[str, int], cases: List[str], repeat: int = DEFAULT_REPEAT,
+                   keep: bool = False, label: str = "custom") -> Dict[str, Any]:
+    """
+    Generate a synthetic vault and run the selected cases against it.
+
+    Args:
+        sizes: inbox, tasks, approvals, log_mb and ledger_rows
+        cases: Case names, run in CASES order
+        repeat: Timed repetitions per measurement
+        keep: Keep the synthetic vault directory afterwards
+        label: Size preset name recorded in the results
+
+    Returns:
+        dict: Results document (see write_results)
+    """
+    root = Path(tempfile.mkdtemp(prefix="vault_bench_"))
+    try:
+        vault = generate_vault(root, sizes)
+        results = {}
+        for case in [c for c in CASES if c in cases]:
+            print(f"  {case:<10} ...", end="", flush=True)
+            started = time.perf_counter()
+            results[case] = run_case(root, case, repeat)
+            status = results[case].get("error", f"{time.perf_counter() - started:.1f}s")
+            print(f" {status}")
+        return {
+            "schema": SCHEMA_VERSION,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git("rev-parse", "--short", "HEAD"),
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "size": label,
+            "repeat": repeat,
+            "vault": vault,
+            "results": results,
+        }
+    finally:
+        if keep:
+            print(f"Synthetic vault kept at {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def write_results(document: Dict[str, Any], directory: Path = RESULTS_DIR) -> Path:
+    """Write results to Logs/benchmarks/<timestamp>_<commit>_<size>.json"""
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = directory / f"{stamp}_{document.get('commit') or 'nogit'}_{document.get('size')}.json"
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    return path
+
+
+# =============================================================================
+# COMPARISON
+# =============================================================================
+
+def flatten_timings(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """
+    Comparable metrics keyed by dotted path, e.g. "dashboard.warm.median_ms".
+
+    Only medians, single-shot *_ms timings and files_per_second are
+    compared; min/max are too noisy to gate on.
+    """
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_timings(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            if key in ("min_ms", "max_ms"):
+                continue
+            if key.endswith("_ms") or key == "files_per_second":
+                flat[name] = float(value)
+    return flat
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare two results documents metric by metric.
+
+    Returns:
+        list: One dict per shared metric with baseline, current, change
+              (fraction, positive = worse) and regressed
+    """
+    before = flatten_timings(baseline.get("results", {}))
+    after = flatten_timings(current.get("results", {}))
+    rows = []
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name], after[name]
+        higher_is_better = name.endswith("files_per_second")
+        if old == 0:
+            change = 0.0
+        elif higher_is_better:
+            change = (old - new) / old
+        else:
+            change = (new - old) / old
+        regressed = change > threshold and (higher_is_better or new - old > NOISE_FLOOR_MS)
+        rows.append({"metric": name, "baseline": old, "current": new,
+                     "change": round(change, 4), "regressed": regressed})
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]], baseline: Dict[str, Any]) -> None:
+    print(f"\nCompared with {baseline.get('commit')} ({baseline.get('created_at')}, size {baseline.get('size')}):")
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else ""
+        print(f"  {row['metric']:<40} {row['baseline']:>12.3f} -> {row['current']:>12.3f} "
+              f"{row['change'] * 100:>+7.1f}%  {flag}")
+
+
+def print_results(document: Dict[str, Any]) -> None:
+    vault = document["vault"]
+    print(f"\nVault: {vault['inbox']} inbox, {vault['tasks']} tasks, {vault['approvals']} approvals, "
+          f"{vault['logs_mb']} MB logs, {vault['ledger_rows']} ledger rows")
+    for name, value in flatten_timings(document["results"]).items():
+        print(f"  {name:<40} {value:>12.3f}")
+    for case, result in document["results"].items():
+        if "error" in result:
+            print(f"  {case:<40} ERROR: {result['error']}")
+
+
+# =============================================================================
+# CLI ENTRY POINT
+# =============================================================================
+
+def main() -> int:
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the AI Employee pipeline against a synthetic vault"
+    )
+    parser.add_argument("--size", choices=sorted(PRESETS), default="small",
+                        help="Vault size preset (default: small)")
+    for key in PRESETS["small"]:
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, dest=key,
+                            help=f"Override the preset's {key.replace('_', ' ')}")
+    parser.add_argument("--cases", type=str, default=",".join(CASES),
+                        help=f"Comma-separated cases to run (default: {','.join(CASES)})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Timed repetitions per measurement (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--output", type=str, help="Results file (default: Logs/benchmarks/...)")
+    parser.add_argument("--compare", type=str, help="Baseline results file to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help=f"Regression threshold as a fraction (default: {REGRESSION_THRESHOLD})")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic vault for inspection")
+    parser.add_argument("--worker", choices=CASES, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker:
+        result = CASE_FUNCTIONS[args.worker](args.repeat)
+        print(json.dumps(result))
+        return 0
+
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        print(f"[ERROR] Unknown case(s): {', '.join(unknown)}")
+        return 1
+
+    sizes = dict(PRESETS[args.size])
+    overridden = False
+    for key in sizes:
+        if getattr(args, key) is not None:
+            sizes[key] = getattr(args, key)
+            overridden = True
+    label = f"{args.size}+custom" if overridden else args.size
+
+    print(f"Benchmarking ({label}): {', '.join(cases)}")
+    document = run_benchmarks(sizes, cases, args.repeat, args.keep, label)
+    print_results(document)
+
+    path = Path(args.output) if args.output else None
+    if path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    else:
+        path = write_results(document)
+    print(f"\nResults written to {path}")
+
+    failed = any("error" in result for result in document["results"].values())
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        rows = compare_results(baseline, document, args.threshold)
+        print_comparison(rows, baseline)
+        if any(row["regressed"] for row in rows):
+            print(f"\n[FAIL] Regressions above {args.threshold:.0%}")
+            return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
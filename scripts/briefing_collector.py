@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Briefing Collector - Single-Pass Log Metrics
+
+Streams each vault/Logs file used by the CEO briefing exactly once and fills
+every metric in the same pass. One compiled alternation regex matches all
+event markers, and log dates are compared as fixed-offset string slices
+(ISO dates sort lexicographically), so no line is ever run through strptime.
+Because the logs are append-only, each file is bisected to the start of the
+reporting window and read only until the window has passed, so a year of
+history costs about as much as the week being reported.
+
+Usage:
+    python scripts/briefing_collector.py --benchmark             # 1 year of synthetic logs
+    python scripts/briefing_collector.py --benchmark --days 90 --lines-per-day 5000
+
+    from briefing_collector import collect_log_metrics
+    metrics = collect_log_metrics("vault/Logs/", week_start, week_end)
+    metrics["emails"]["count"], metrics["linkedin_posts"]["recent"]
+"""
+
+import os
+import re
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Metric name -> event markers that count towards it
+METRIC_MARKERS = {
+    "emails": ["Email sent successfully", "sent reply"],
+    "linkedin_posts": ["BUSINESS_ACTIVITY: LinkedIn post requested:"],
+}
+
+# Log file -> metrics it is allowed to contribute to
+LOG_SOURCES = {
+    "emails_sent.log": ("emails",),
+    "gmail_watcher.log": ("emails",),
+    "business.log": ("linkedin_posts",),
+}
+
+# Number of example lines kept per metric for the report
+DEFAULT_SAMPLE_LIMIT = 5
+
+
+# Logs are append-only, so timestamps are (nearly) sorted. Seeking starts this
+# many days before the window and stops this many days after it, tolerating
+# lines written slightly out of order by concurrent writers.
+ORDER_SLACK_DAYS = 1
+
+# Below this many bytes the bisection stops and the scan just streams
+SEEK_GRANULARITY = 64 * 1024
+
+
+def build_matcher(metric_markers: Dict[str, List[str]]) -> "re.Pattern":
+    """Compile all markers into one bytes regex with a named group per metric"""
+    groups = []
+    for metric, markers in metric_markers.items():
+        alternatives = b"|".join(re.escape(marker.encode("utf-8")) for marker in markers)
+        groups.append(b"(?P<" + metric.encode("ascii") + b">" + alternatives + b")")
+    return re.compile(b"|".join(groups))
+
+
+MATCHER = build_matcher(METRIC_MARKERS)
+
+
+# =============================================================================
+# SCANNING
+# =============================================================================
+
+def slice_log_date(line: bytes) -> Optional[bytes]:
+    """
+    Return the YYYY-MM-DD prefix of a log line without parsing it.
+
+    Handles both "[2026-03-02 10:00:00] ..." (scripts) and
+    "2026-03-02 10:00:00,123 - ..." (Python logging) formats.
+    """
+    start = 1 if line[:1] == b"[" else 0
+    day = line[start:start + 10]
+    if len(day) == 10 and day[4:5] == b"-" and day[7:8] == b"-" and day[:4].isdigit():
+        return day
+    return None
+
+
+def _day_bytes(value: datetime, shift_days: int = 0) -> bytes:
+    return (value + timedelta(days=shift_days)).strftime("%Y-%m-%d").encode("ascii")
+
+
+def empty_metrics(metric_names=None) -> Dict[str, Dict[str, Any]]:
+    """Metric dict with zero counts"""
+    return {name: {"count": 0, "recent": []} for name in (metric_names or METRIC_MARKERS)}
+
+
+def _first_day_after(f, offset: int) -> Optional[bytes]:
+    """Date of the first dated line starting after offset (None at EOF)"""
+    f.seek(offset)
+    if offset:
+        f.readline()  # skip the partial line we landed in
+    for line in f:
+        day = slice_log_date(line)
+        if day is not None:
+            return day
+    return None
+
+
+def seek_to_day(f, size: int, day: bytes) -> int:
+    """
+    Bisect an append-only log for a line-aligned offset before the first line dated >= day.
+
+    Returns:
+        int: Offset to start streaming from (0 if the window starts at the top)
+    """
+    lo, hi = 0, size
+    while hi - lo > SEEK_GRANULARITY:
+        mid = (lo + hi) // 2
+        found = _first_day_after(f, mid)
+        if found is None or found >= day:
+            hi = mid
+        else:
+            lo = mid
+    f.seek(lo)
+    if lo:
+        f.readline()
+    return f.tell()
+
+
+def scan_log_file(filepath: str, allowed: tuple, week_start_date: datetime, week_end_date: datetime,
+                  metrics: Dict[str, Dict[str, Any]], sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+                  matcher: "re.Pattern" = MATCHER, seek: bool = True) -> int:
+    """
+    Stream one log file and add matching lines to metrics in place.
+
+    Args:
+        filepath: Log file to read
+        allowed: Metric names this file may contribute to
+        week_start_date, week_end_date: Inclusive reporting window
+        metrics: Output of empty_metrics(), updated in place
+        seek: Bisect to the window instead of reading the file from the top
+
+    Returns:
+        int: Bytes read
+    """
+    first_day, last_day = _day_bytes(week_start_date), _day_bytes(week_end_date)
+    stop_day = _day_bytes(week_end_date, ORDER_SLACK_DAYS)
+    search = matcher.search
+
+    with open(filepath, "rb") as f:
+        start = 0
+        if seek:
+            size = os.fstat(f.fileno()).st_size
+            start = seek_to_day(f, size, _day_bytes(week_start_date, -ORDER_SLACK_DAYS))
+        for line in f:
+            if seek:
+                day = slice_log_date(line)
+                if day is not None and day > stop_day:
+                    break
+            match = search(line)
+            if match is None:
+                continue
+            metric = match.lastgroup
+            if metric not in allowed:
+                continue
+            if not seek:
+                day = slice_log_date(line)
+            if day is None or day < first_day or day > last_day:
+                continue
+            entry = metrics[metric]
+            entry["count"] += 1
+            if len(entry["recent"]) < sample_limit:
+                entry["recent"].append(f"- {line.decode('utf-8', errors='replace').strip()}")
+        return f.tell() - start
+
+
+def collect_log_metrics(log_dir: str, week_start_date: datetime, week_end_date: datetime,
+                        sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+                        sources: Optional[Dict[str, tuple]] = None,
+                        seek: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect every log-derived briefing metric in one pass per file.
+
+    Args:
+        log_dir: Directory holding the log files (e.g. "vault/Logs/")
+        week_start_date, week_end_date: Inclusive reporting window
+        sample_limit: Example lines kept per metric
+        sources: Optional override of LOG_SOURCES
+        seek: Bisect each file to the window (set False for logs that are not time-ordered)
+
+    Returns:
+        dict: metric -> {"count": int, "recent": [lines]}, plus "errors" if any file failed
+    """
+    metrics = empty_metrics()
+    errors = []
+
+    for filename, allowed in (sources or LOG_SOURCES).items():
+        filepath = os.path.join(log_dir, filename)
+        if not os.path.exists(filepath):
+            continue
+        try:
+            scan_log_file(filepath, allowed, week_start_date, week_end_date, metrics, sample_limit, seek=seek)
+        except OSError as e:
+            errors.append(f"{filename}: {e}")
+
+    if errors:
+        metrics["errors"] = errors
+    return metrics
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def _baseline_scan(log_dir: str, week_start_date: datetime, week_end_date: datetime) -> Dict[str, int]:
+    """The previous approach: one pass per metric, strptime on every matching line"""
+    counts = {}
+    for metric, markers in METRIC_MARKERS.items():
+        counts[metric] = 0
+        for filename, allowed in LOG_SOURCES.items():
+            filepath = os.path.join(log_dir, filename)
+            if metric not in allowed or not os.path.exists(filepath):
+                continue
+            with open(filepath, "r", encoding="utf-8") as f:
+                for line in f:
+                    if any(marker in line for marker in markers):
+                        try:
+                            log_date_str = line.split(']')[0].strip('[')
+                            log_date = datetime.strptime(log_date_str.split(' ')[0], '%Y-%m-%d')
+                            if week_start_date <= log_date <= week_end_date:
+                                counts[metric] += 1
+                        except (ValueError, IndexError):
+                            continue
+    return counts
+
+
+def generate_synthetic_logs(log_dir: str, days: int, lines_per_day: int, end_date: datetime) -> int:
+    """
+    Write synthetic emails_sent.log, gmail_watcher.log and business.log files.
+
+    Returns:
+        int: Total number of lines written
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    templates = {
+        "emails_sent.log": [
+            "[{ts}] [MAILER] Email sent successfully to client{i}@example.com",
+            "[{ts}] [MAILER] Queued message {i}",
+        ],
+        "gmail_watcher.log": [
+            "[{ts}] Gmail watcher: Processed email ID {i}, sent reply.",
+            "[{ts}] Gmail watcher: No new messages",
+            "[{ts}] Gmail watcher: Checked inbox",
+        ],
+        "business.log": [
+            "{ts},000 - business-mcp - INFO - BUSINESS_ACTIVITY: LinkedIn post requested: Update {i}",
+            "{ts},000 - business-mcp - INFO - BUSINESS_ACTIVITY: Client call logged {i}",
+            "{ts},000 - business-mcp - INFO - Email sent successfully to lead{i}@example.com",
+        ],
+    }
+    total = 0
+    start = end_date - timedelta(days=days - 1)
+    per_file = max(1, lines_per_day // len(templates))
+    for filename, lines in templates.items():
+        with open(os.path.join(log_dir, filename), "w", encoding="utf-8") as f:
+            for day_offset in range(days):
+                day = start + timedelta(days=day_offset)
+                for i in range(per_file):
+                    ts = (day + timedelta(seconds=i * 86400 // per_file)).strftime("%Y-%m-%d %H:%M:%S")
+                    f.write(lines[i % len(lines)].format(ts=ts, i=i) + "\n")
+                    total += 1
+    return total
+
+
+def run_benchmark(days: int = 365, lines_per_day: int = 3000, repeat: int = 3) -> Dict[str, Any]:
+    """Time the single-pass collector against the per-metric baseline"""
+    tmp_dir = tempfile.mkdtemp(prefix="briefing_bench_")
+    try:
+        end_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        total_lines = generate_synthetic_logs(tmp_dir, days, lines_per_day, end_date)
+        size_mb = sum(os.path.getsize(os.path.join(tmp_dir, f)) for f in os.listdir(tmp_dir)) / (1024 * 1024)
+        week_start = end_date - timedelta(days=6)
+
+        def best_of(func):
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                result = func()
+                timings.append(time.perf_counter() - started)
+            return min(timings), result
+
+        single_time, single = best_of(lambda: collect_log_metrics(tmp_dir, week_start, end_date))
+        full_time, full = best_of(lambda: collect_log_metrics(tmp_dir, week_start, end_date, seek=False))
+        baseline_time, baseline = best_of(lambda: _baseline_scan(tmp_dir, week_start, end_date))
+
+        matches = all(single[m]["count"] == full[m]["count"] == baseline[m] for m in METRIC_MARKERS)
+        return {
+            "days": days,
+            "lines": total_lines,
+            "size_mb": round(size_mb, 1),
+            "single_pass_s": round(single_time, 4),
+            "full_scan_s": round(full_time, 3),
+            "baseline_s": round(baseline_time, 3),
+            "speedup": round(baseline_time / single_time, 2) if single_time else None,
+            "full_scan_speedup": round(baseline_time / full_time, 2) if full_time else None,
+            "counts": {m: single[m]["count"] for m in METRIC_MARKERS},
+            "counts_match": matches
+        }
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# =============================================================================
+# CLI ENTRY POINT
+# =============================================================================
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="Briefing Collector - Single-pass log metrics for the CEO briefing"
+    )
+    parser.add_argument("--benchmark", action="store_true", help="Benchmark against a synthetic year of logs")
+    parser.add_argument("--days", type=int, default=365, help="Days of synthetic logs (default: 365)")
+    parser.add_argument("--lines-per-day", type=int, default=3000, help="Synthetic lines per day (default: 3000)")
+    parser.add_argument("--log-dir", type=str, default="vault/Logs/", help="Log directory to scan (default: vault/Logs/)")
+    parser.add_argument("--week-end", type=str, help="Last day of the window to scan (YYYY-MM-DD). Defaults to today.")
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = run_benchmark(args.days, args.lines_per_day)
+        print(f"Synthetic logs: {result['days']} days, {result['lines']:,} lines, {result['size_mb']} MB")
+        print(f"Single-pass, seeking:   {result['single_pass_s']:.4f}s ({result['speedup']}x)")
+        print(f"Single-pass, full scan: {result['full_scan_s']:.3f}s ({result['full_scan_speedup']}x)")
+        print(f"Per-metric baseline:    {result['baseline_s']:.3f}s")
+        print(f"Counts: {result['counts']} | Match: {result['counts_match']}")
+        return 0 if result["counts_match"] else 1
+
+    if args.week_end:
+        try:
+            week_end = datetime.strptime(args.week_end, "%Y-%m-%d")
+        except ValueError:
+            print("Error: Invalid --week-end format. Please use YYYY-MM-DD.")
+            return 1
+    else:
+        week_end = datetime.now()
+    metrics = collect_log_metrics(args.log_dir, week_end - timedelta(days=6), week_end)
+    for name, entry in metrics.items():
+        if name == "errors":
+            continue
+        print(f"{name}: {entry['count']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,35 @@
 
 import argparse
 import os
+import sys
+import time
+import threading
 from datetime import datetime, timedelta
-import glob
-import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import accounting_manager
+import briefing_collector
+import metrics_store
+import report_writer
+import health_monitor
+from profiling import add_profile_arguments, profile_main
 
 REPORT_FILE = "AI_Employee_Vault/Reports/CEO_Weekly.md"
+REPORT_ARCHIVE_DIR = "AI_Employee_Vault/Reports/CEO_Weekly/"
 LOG_DIR = "vault/Logs/"
-ACCOUNTING_SCRIPT = "scripts/accounting_manager.py"
+DEFAULT_TREND_WEEKS = 4
+
+# Seconds each collector may take before its section is reported as unavailable.
+# The metrics store gets longer because its first run backfills all history.
+COLLECTOR_TIMEOUTS = {
+    "stored_metrics": 60,
+    "pending_approvals": 10,
+    "income_expense": 30,
+    "system_health": 10,
+    "tasks_completed": 30,
+    "log_metrics": 30,
+}
+DEFAULT_COLLECTOR_TIMEOUT = 30
 
 # --- Ensure Directories Exist ---
 def ensure_directories():
@@ -42,66 +64,31 @@ def get_tasks_completed(week_start_date, week_end_date):
         print(f"Error getting tasks completed: {e}")
         return 0, [f"Error retrieving task data: {e}"]
 
-def get_emails_sent(week_start_date, week_end_date):
-    """Counts emails sent from log files within the week."""
-    email_log_patterns = [
-        os.path.join(LOG_DIR, "emails_sent.log"),
-        os.path.join(LOG_DIR, "gmail_watcher.log")
-    ]
-    total_emails = 0
-    recent_emails = []
+def get_log_metrics(week_start_date, week_end_date):
+    """Reads every briefing log once and returns all log-derived metrics (see briefing_collector.py)."""
     try:
-        for log_pattern in email_log_patterns:
-            if os.path.exists(log_pattern):
-                with open(log_pattern, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        # Basic check for email sent entries. This pattern might need refinement based on actual log format.
-                        # Example log entry: [2026-03-02 10:00:00] [ACCOUNTING_SCRIPT] Email sent successfully to user@example.com
-                        # Or from gmail_watcher: [2026-03-01 09:30:00] Gmail watcher: Processed email ID 12345, sent reply.
-                        if "Email sent successfully" in line or "sent reply" in line:
-                            try:
-                                # Extract date from log line (assuming YYYY-MM-DD HH:MM:SS format at start of line)
-                                log_date_str = line.split(']')[0].strip('[')
-                                log_date = datetime.strptime(log_date_str.split(' ')[0], '%Y-%m-%d')
-                                if week_start_date <= log_date <= week_end_date:
-                                    total_emails += 1
-                                    if len(recent_emails) < 5:
-                                        recent_emails.append(f"- {line.strip()}")
-                            except (ValueError, IndexError):
-                                continue # Skip lines that don't match expected date format
-        return total_emails, recent_emails
+        return briefing_collector.collect_log_metrics(LOG_DIR, week_start_date, week_end_date)
     except Exception as e:
-        print(f"Error getting emails sent: {e}")
-        return 0, [f"Error retrieving email logs: {e}"]
+        print(f"Error scanning logs: {e}")
+        metrics = briefing_collector.empty_metrics()
+        metrics["errors"] = [str(e)]
+        return metrics
+
+def _metric_result(metrics, name, label):
+    """(count, recent lines) for one metric, surfacing scan errors like the old per-metric readers."""
+    if metrics.get("errors") and not metrics[name]["count"]:
+        return 0, [f"Error retrieving {label} logs: {'; '.join(metrics['errors'])}"]
+    return metrics[name]["count"], metrics[name]["recent"]
 
-def get_linkedin_posts(week_start_date, week_end_date):
+def get_emails_sent(week_start_date, week_end_date, metrics=None):
+    """Counts emails sent from log files within the week."""
+    metrics = metrics or get_log_metrics(week_start_date, week_end_date)
+    return _metric_result(metrics, "emails", "email")
+
+def get_linkedin_posts(week_start_date, week_end_date, metrics=None):
     """Counts LinkedIn posts from log files within the week."""
-    linkedin_log_patterns = [
-        os.path.join(LOG_DIR, "business.log") # Assuming MCP server logs LinkedIn posts here
-        # Add other potential LinkedIn log files if they exist
-    ]
-    total_posts = 0
-    recent_posts = []
-    try:
-        for log_pattern in linkedin_log_patterns:
-            if os.path.exists(log_pattern):
-                with open(log_pattern, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        # Example log entry: [2026-03-01 11:00:00] BUSINESS_ACTIVITY: LinkedIn post requested: This is my LinkedIn post content!...
-                        if "BUSINESS_ACTIVITY: LinkedIn post requested:" in line:
-                            try:
-                                log_date_str = line.split(']')[0].strip('[')
-                                log_date = datetime.strptime(log_date_str.split(' ')[0], '%Y-%m-%d')
-                                if week_start_date <= log_date <= week_end_date:
-                                    total_posts += 1
-                                    if len(recent_posts) < 5:
-                                        recent_posts.append(f"- {line.strip()}")
-                            except (ValueError, IndexError):
-                                continue
-        return total_posts, recent_posts
-    except Exception as e:
-        print(f"Error getting LinkedIn posts: {e}")
-        return 0, [f"Error retrieving LinkedIn logs: {e}"]
+    metrics = metrics or get_log_metrics(week_start_date, week_end_date)
+    return _metric_result(metrics, "linkedin_posts", "LinkedIn")
 
 def get_pending_approvals():
     """Counts pending approval items in AI_Employee_Vault/Needs_Approval/."""
@@ -120,37 +107,29 @@ def get_pending_approvals():
         return 0, [f"Error retrieving approval data: {e}"]
 
 def get_weekly_income_expense(week_start_date, week_end_date):
-    """Gets the weekly income/expense summary by running the accounting manager script."""
+    """Gets the weekly income/expense summary from the accounting ledger (in-process)."""
     try:
-        # We need to run the accounting_manager.py script to get the weekly summary
-        # The end_date for the summary should be the end of our reporting week.
-        # We need to format it as YYYY-MM-DD for the script.
-        end_date_str = week_end_date.strftime('%Y-%m-%d')
-        
-        # Construct the command to run the accounting script
-        command = [
-            "python",
-            ACCOUNTING_SCRIPT,
-            "weekly-summary",
-            f"--end-date={end_date_str}"
-        ]
-        
-        # Execute the command
-        # We need to capture stdout for the summary
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        
-        # The output is expected to be the formatted summary
-        summary = result.stdout.strip()
-        return summary
-    except FileNotFoundError:
-        return "Accounting script not found. Please ensure it is installed and in the PATH."
-    except subprocess.CalledProcessError as e:
-        return f"Error generating accounting summary: {e.stderr.strip()}"
+        return accounting_manager.get_summary(week_start_date, week_end_date)
     except Exception as e:
-        return f"An unexpected error occurred while fetching accounting summary: {e}"
+        print(f"Error getting accounting summary: {e}")
+        return {"error": f"An unexpected error occurred while fetching accounting summary: {e}"}
+
+def write_income_expense(writer, summary):
+    """Writes the structured accounting summary as a table plus up to 10 transactions."""
+    if "error" in summary:
+        writer.paragraph(summary["error"])
+        return
+    writer.table(["Income", "Expense", "Net", "Transactions"],
+                 [[f"{summary['income']:.2f}", f"{summary['expense']:.2f}", f"{summary['net']:.2f}", summary['count']]])
+    writer.bullets(
+        (f"{t['date']} | {t['type'].capitalize()} | {t['amount']:.2f} | {t['description']}"
+         for t in summary['transactions'][:10]),  # List up to 10 transactions
+        empty="No transactions recorded this week."
+    )
+    writer.data("income_expense", summary)
 
 def get_system_health():
-    """Performs a basic system health check."""
+    """Checks output directories and reports the shared health probes (see health_monitor.py)."""
     health_status = "OK"
     details = []
 
@@ -173,15 +152,187 @@ def get_system_health():
         health_status = "WARNING"
         details.append(f"Cannot write to output directories ({e}). Check permissions.")
 
-    # Add more checks as needed (e.g., disk space, process status)
-    # For now, a basic check is sufficient.
     if not details:
         details.append("Directory permissions check passed.")
 
+    # Disk, logs, retry queue, scheduler, pending tasks and watcher lag (cached with a TTL)
+    health = health_monitor.get_health()
+    for probe in health['probes']:
+        details.append(f"**{probe['status']}** {health_monitor.describe_probe(probe)}")
+    if health_monitor.STATUS_ORDER[health['status']] > health_monitor.STATUS_ORDER[health_status]:
+        health_status = health['status']
+
     return health_status, details
 
+def get_stored_metrics(week_start_date, week_end_date, trend_weeks=DEFAULT_TREND_WEEKS):
+    """
+    Reads the week's counters and the week-over-week trend from the metrics store (see metrics_store.py).
+    Returns None if the store is unavailable, so the caller can fall back to scanning raw files.
+    """
+    try:
+        store = metrics_store.get_store()
+        store.ensure_ready()
+        totals = store.week_totals(week_start_date, week_end_date)
+        result = {}
+        for metric in ("tasks_completed", "emails_sent", "linkedin_posts"):
+            samples = store.samples(metric, week_start_date, week_end_date)
+            result[metric] = (totals[metric], [f"- {detail}" for detail in samples])
+        result["trend"] = store.weekly_trend(week_start_date, trend_weeks) if trend_weeks > 0 else []
+        return result
+    except Exception as e:
+        print(f"Metrics store unavailable, scanning raw files instead: {e}")
+        return None
+
+TREND_COLUMNS = [
+    ("tasks_completed", "Tasks"),
+    ("emails_sent", "Emails"),
+    ("linkedin_posts", "LinkedIn"),
+    ("approvals", "Approvals"),
+]
+
+def write_trend(writer, trend):
+    """Writes the weekly trend from the metrics store as a table plus the change vs the previous week."""
+    headers = ["Week"] + [label for _, label in TREND_COLUMNS] + ["Income", "Expense", "Net"]
+    rows = []
+    for week in trend:
+        values = week['metrics']
+        start = datetime.strptime(week['week_start'], '%Y-%m-%d')
+        iso_year, iso_week, _ = start.isocalendar()
+        income, expense = values['income_cents'] / 100, values['expense_cents'] / 100
+        rows.append([f"{iso_year}-W{iso_week:02d} ({week['week_start']})"]
+                    + [values[metric] for metric, _ in TREND_COLUMNS]
+                    + [f"{income:.2f}", f"{expense:.2f}", f"{income - expense:.2f}"])
+    writer.table(headers, rows)
+
+    if len(trend) >= 2:
+        current, previous = trend[-1]['metrics'], trend[-2]['metrics']
+        changes = [f"{label} {current[metric] - previous[metric]:+d}" for metric, label in TREND_COLUMNS]
+        net_change = ((current['income_cents'] - current['expense_cents'])
+                      - (previous['income_cents'] - previous['expense_cents'])) / 100
+        changes.append(f"Net {net_change:+.2f}")
+        writer.paragraph(f"**Change vs previous week:** {', '.join(changes)}")
+    writer.data("trend", trend)
+
+# --- Collector Framework ---
+def collector(name, func, *args, fallback=None, timeout=None, fallbacks=()):
+    """
+    Describes one data collector for run_collectors().
+
+    fallback(message) builds the value used when the collector fails or times out,
+    so a slow source only degrades its own report section.
+
+    fallbacks are collectors that supply the data instead when this one yields
+    None (fails, times out or returns None); their results are added under
+    their own names.
+    """
+    return {
+        "name": name,
+        "func": func,
+        "args": args,
+        "fallback": fallback or (lambda message: None),
+        "timeout": timeout or COLLECTOR_TIMEOUTS.get(name, DEFAULT_COLLECTOR_TIMEOUT),
+        "fallbacks": list(fallbacks),
+    }
+
+def run_collectors(collectors, timeout_override=None):
+    """
+    Runs independent collectors concurrently, each with its own timeout.
+
+    Collectors run on daemon threads, so one that hangs can neither block the
+    report nor keep the process alive after the report is written.
+
+    A collector's fallbacks start as soon as it yields None, or early enough
+    to finish by its deadline while it is still running, so a timed-out
+    collector does not add the fallbacks' timeout on top of its own.
+
+    Returns:
+        (results, timings): results maps name -> value (or fallback value);
+        timings is a list of dicts with name, status (ok/error/timeout) and ms.
+    """
+    outcomes = {}
+    launched = {}
+    lock = threading.Lock()
+
+    def timeout_of(spec):
+        return timeout_override or spec["timeout"]
+
+    def launch(spec):
+        with lock:
+            if spec["name"] in launched:
+                return
+            thread = threading.Thread(target=run, args=(spec,), name=f"collector-{spec['name']}", daemon=True)
+            launched[spec["name"]] = (thread, time.perf_counter())
+        thread.start()
+
+    def launch_fallbacks(spec, early=False):
+        # An early start is skipped once the collector has produced data
+        outcome = outcomes.get(spec["name"])
+        if early and outcome is not None and outcome[0] is not None:
+            return
+        for fallback_spec in spec["fallbacks"]:
+            launch(fallback_spec)
+
+    def run(spec):
+        started = time.perf_counter()
+        try:
+            value, error = spec["func"](*spec["args"]), None
+        except Exception as e:
+            value, error = None, e
+        outcomes[spec["name"]] = (value, error, (time.perf_counter() - started) * 1000)
+        if value is None:
+            launch_fallbacks(spec)
+
+    def collect(spec, results, timings):
+        name = spec["name"]
+        thread, started = launched[name]
+        timeout = timeout_of(spec)
+        thread.join(max(0.0, started + timeout - time.perf_counter()))
+        if name not in outcomes:
+            print(f"Collector '{name}' timed out after {timeout}s")
+            results[name] = spec["fallback"](f"Data unavailable: collector timed out after {timeout}s.")
+            timings.append({"name": name, "status": "timeout", "ms": (time.perf_counter() - started) * 1000})
+            return
+        value, error, elapsed_ms = outcomes[name]
+        if error is not None:
+            print(f"Collector '{name}' failed: {error}")
+            results[name] = spec["fallback"](f"Data unavailable: {error}")
+            timings.append({"name": name, "status": "error", "ms": elapsed_ms})
+        else:
+            results[name] = value
+            timings.append({"name": name, "status": "ok", "ms": elapsed_ms})
+
+    timers = []
+    for spec in collectors:
+        launch(spec)
+        if spec["fallbacks"]:
+            lead = timeout_of(spec) - max(timeout_of(f) for f in spec["fallbacks"])
+            timer = threading.Timer(max(0.0, lead), launch_fallbacks, args=(spec, True))
+            timer.daemon = True
+            timer.start()
+            timers.append(timer)
+
+    results, timings = {}, []
+    try:
+        for spec in collectors:
+            collect(spec, results, timings)
+            if spec["fallbacks"] and results[spec["name"]] is None:
+                launch_fallbacks(spec)
+                for fallback_spec in spec["fallbacks"]:
+                    collect(fallback_spec, results, timings)
+    finally:
+        for timer in timers:
+            timer.cancel()
+    return results, timings
+
+def write_timings(writer, timings, total_ms):
+    """Writes collector timings as a table for the report footer."""
+    rows = [[timing['name'], timing['status'], f"{timing['ms']:.1f}"] for timing in timings]
+    rows.append(["**total (wall clock)**", "", f"{total_ms:.1f}"])
+    writer.table(["Collector", "Status", "Time (ms)"], rows)
+    writer.data("timings", {"collectors": timings, "total_ms": round(total_ms, 1)})
+
 # --- Report Generation ---
-def generate_ceo_briefing(report_date):
+def generate_ceo_briefing(report_date, trend_weeks=DEFAULT_TREND_WEEKS, collector_timeout=None):
     """Generates the full CEO weekly briefing report."""
     ensure_directories()
 
@@ -212,96 +363,91 @@ def generate_ceo_briefing(report_date):
     print(f"Generating report for week: {start_of_reporting_week.strftime('%Y-%m-%d')} to {end_of_reporting_week.strftime('%Y-%m-%d')}")
 
     # --- Gather Data ---
-    tasks_completed_count, recent_tasks = get_tasks_completed(start_of_reporting_week, end_of_reporting_week)
-    emails_sent_count, recent_emails = get_emails_sent(start_of_reporting_week, end_of_reporting_week)
-    linkedin_posts_count, recent_posts = get_linkedin_posts(start_of_reporting_week, end_of_reporting_week)
-    pending_approvals_count, pending_items = get_pending_approvals()
-    accounting_summary = get_weekly_income_expense(end_of_reporting_week)
-    health_status, health_details = get_system_health()
-
-    # --- Compile Report ---
-    report_content = []
-    report_content.append(f"# CEO Weekly Briefing Report
-")
-    report_content.append(f"**Period:** {start_of_reporting_week.strftime('%Y-%m-%d')} - {end_of_reporting_week.strftime('%Y-%m-%d')}
-")
-
-    report_content.append(f"## Key Metrics Summary
-")
-    report_content.append(f"*   **Tasks Completed:** {tasks_completed_count}
-")
-    report_content.append(f"*   **Emails Sent:** {emails_sent_count}
-")
-    report_content.append(f"*   **LinkedIn Posts:** {linkedin_posts_count}
-")
-    report_content.append(f"*   **Pending Approvals:** {pending_approvals_count}
-")
-
-    report_content.append(f"
-## Detailed Sections
-")
-
-    # Tasks Completed Details
-    report_content.append(f"### Tasks Completed ({tasks_completed_count} total)
-")
-    if recent_tasks:
-        report_content.extend(recent_tasks)
-    else:
-        report_content.append("- No tasks completed this week.")
-    report_content.append("
-")
-
-    # Emails Sent Details
-    report_content.append(f"### Emails Sent ({emails_sent_count} total)
-")
-    if recent_emails:
-        report_content.extend(recent_emails)
-    else:
-        report_content.append("- No emails sent this week.")
-    report_content.append("
-")
-
-    # LinkedIn Posts Details
-    report_content.append(f"### LinkedIn Posts ({linkedin_posts_count} total)
-")
-    if recent_posts:
-        report_content.extend(recent_posts)
-    else:
-        report_content.append("- No LinkedIn posts made this week.")
-    report_content.append("
-")
-
-    # Pending Approvals Details
-    report_content.append(f"### Pending Approvals ({pending_approvals_count} items)
-")
-    if pending_items:
-        report_content.extend(pending_items)
+    # Independent collectors run concurrently; a slow or failing one only degrades its own section.
+    # Counters come pre-aggregated from the metrics store; raw files are only scanned if it is unavailable.
+    gather_started = time.perf_counter()
+    week = (start_of_reporting_week, end_of_reporting_week)
+    # Emails and LinkedIn posts come from one pass over the logs
+    results, timings = run_collectors([
+        collector("stored_metrics", get_stored_metrics, *week, trend_weeks, fallbacks=[
+            collector("tasks_completed", get_tasks_completed, *week, fallback=lambda message: (0, [f"- {message}"])),
+            collector("log_metrics", get_log_metrics, *week,
+                      fallback=lambda message: dict(briefing_collector.empty_metrics(), errors=[message])),
+        ]),
+        collector("pending_approvals", get_pending_approvals, fallback=lambda message: (0, [f"- {message}"])),
+        collector("income_expense", get_weekly_income_expense, *week, fallback=lambda message: {"error": message}),
+        collector("system_health", get_system_health, fallback=lambda message: ("WARNING", [message])),
+    ], collector_timeout)
+
+    stored = results['stored_metrics']
+    if stored is not None:
+        tasks_completed_count, recent_tasks = stored['tasks_completed']
+        emails_sent_count, recent_emails = stored['emails_sent']
+        linkedin_posts_count, recent_posts = stored['linkedin_posts']
     else:
-        report_content.append("- No items pending approval.")
-    report_content.append("
-")
-
-    # Income/Expense Summary
-    report_content.append(f"### Weekly Income/Expense Summary
-")
-    report_content.append(accounting_summary)
-    report_content.append("
-")
-
-    # System Health
-    report_content.append(f"### System Health ({health_status})
-")
-    for detail in health_details:
-        report_content.append(f"- {detail}")
-    report_content.append("
-")
-
-    # Write to file
+        tasks_completed_count, recent_tasks = results['tasks_completed']
+        log_metrics = results['log_metrics']
+        emails_sent_count, recent_emails = get_emails_sent(*week, log_metrics)
+        linkedin_posts_count, recent_posts = get_linkedin_posts(*week, log_metrics)
+    pending_approvals_count, pending_items = results['pending_approvals']
+    accounting_summary = results['income_expense']
+    health_status, health_details = results['system_health']
+    gather_ms = (time.perf_counter() - gather_started) * 1000
+
+    # --- Write Report ---
+    # Sections stream to Markdown, HTML and JSON at once; each ISO week gets its own files
+    # and CEO_Weekly.md/.html/.json are refreshed as copies of the latest week.
+    version = report_writer.iso_week_key(start_of_reporting_week)
+    period = f"{start_of_reporting_week.strftime('%Y-%m-%d')} - {end_of_reporting_week.strftime('%Y-%m-%d')}"
     try:
-        with open(REPORT_FILE, 'w', encoding='utf-8') as f:
-            f.write('
-'.join(report_content))
-        print(f"Successfully generated CEO Weekly Briefing: {REPORT_FILE}")
+        with report_writer.open_report(REPORT_ARCHIVE_DIR, version, latest_base=os.path.splitext(REPORT_FILE)[0]) as writer:
+            writer.begin("CEO Weekly Briefing Report", {"Period": period, "Week": version})
+
+            writer.section("Key Metrics Summary")
+            writer.key_values([
+                ("Tasks Completed", tasks_completed_count),
+                ("Emails Sent", emails_sent_count),
+                ("LinkedIn Posts", linkedin_posts_count),
+                ("Pending Approvals", pending_approvals_count),
+            ])
+            writer.data("metrics", {
+                "tasks_completed": tasks_completed_count,
+                "emails_sent": emails_sent_count,
+                "linkedin_posts": linkedin_posts_count,
+                "pending_approvals": pending_approvals_count,
+            })
+            writer.data("period", {"start": start_of_reporting_week.strftime('%Y-%m-%d'),
+                                   "end": end_of_reporting_week.strftime('%Y-%m-%d'), "week": version})
+
+            writer.section("Detailed Sections")
+
+            writer.section(f"Tasks Completed ({tasks_completed_count} total)", 3)
+            writer.bullets(recent_tasks, empty="No tasks completed this week.")
+
+            writer.section(f"Emails Sent ({emails_sent_count} total)", 3)
+            writer.bullets(recent_emails, empty="No emails sent this week.")
+
+            writer.section(f"LinkedIn Posts ({linkedin_posts_count} total)", 3)
+            writer.bullets(recent_posts, empty="No LinkedIn posts made this week.")
+
+            writer.section(f"Pending Approvals ({pending_approvals_count} items)", 3)
+            writer.bullets(pending_items, empty="No items pending approval.")
+
+            writer.section("Weekly Income/Expense Summary", 3)
+            write_income_expense(writer, accounting_summary)
+
+            if stored is not None and stored['trend']:
+                writer.section(f"Week-over-Week Trend (last {len(stored['trend'])} weeks)", 3)
+                write_trend(writer, stored['trend'])
+
+            writer.section(f"System Health ({health_status})", 3)
+            writer.bullets(health_details)
+            writer.data("system_health", {"status": health_status, "details": health_details})
+
+            writer.rule()
+            writer.section("Report Generation", 3)
+            write_timings(writer, timings, gather_ms)
+        print(f"Successfully generated CEO Weekly Briefing: {REPORT_FILE} (archived as {version} in {REPORT_ARCHIVE_DIR})")
     except Exception as e:
         print(f"Error writing report to {REPORT_FILE}: {e}")
 
@@ -314,6 +460,11 @@ def main():
     # Optional: Specify a date to generate the report for (defaults to today)
     # This is useful for testing or generating reports for past weeks.
     parser.add_argument("--report-date", type=str, help="Date to base the report week on (YYYY-MM-DD). Defaults to today.")
+    parser.add_argument("--trend-weeks", type=int, default=DEFAULT_TREND_WEEKS,
+                        help=f"Weeks in the week-over-week trend section (default: {DEFAULT_TREND_WEEKS}, 0 to disable).")
+    parser.add_argument("--collector-timeout", type=float,
+                        help="Override the per-collector timeout in seconds (defaults are in COLLECTOR_TIMEOUTS).")
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
 
@@ -327,7 +478,7 @@ def main():
         else:
             report_date = datetime.now()
         
-        generate_ceo_briefing(report_date)
+        generate_ceo_briefing(report_date, args.trend_weeks, args.collector_timeout)
 
 if __name__ == "__main__":
-    main()
+    profile_main(main, "ceo_briefing")
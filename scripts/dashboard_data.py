@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Dashboard Data Layer - Cached Vault Access for web_dashboard.py
+
+Streamlit re-runs the whole dashboard script on every interaction. Reading
+the vault directly on each rerun means globbing five folders, reading the
+full action log and stat-ing every Plan_*.md. This module keeps the results
+in process-level caches (they survive reruns because the module stays
+imported) with two levels of freshness:
+
+- within TTL_SECONDS a cached value is returned with no disk I/O at all
+- after that, one stat() per watched path decides whether to recompute:
+  folder listings are keyed on the directory mtime (which changes when a
+  file is added, removed or renamed), files on (mtime, size)
+
+The action log is read from the end (tail_lines), and the newest plan is
+found through a small pointer file that task_planner.py updates whenever
+it writes a plan, instead of sorting every plan by mtime.
+
+Plan and approval lists are rendered from a summary index
+(Logs/vault_index.json: title, priority, reasoning excerpt per file) so a
+page load costs the same however many plans are active; full bodies are
+only read when one is opened.
+
+Usage:
+    from dashboard_data import get_task_counts, get_recent_actions, get_latest_plan
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Callable, Iterable, Tuple
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+
+VAULT_DIR = BASE_DIR / "AI_Employee_Vault"
+NEEDS_ACTION_DIR = VAULT_DIR / "Needs_Action"
+LOGS_DIR = BASE_DIR / "Logs"
+ACTION_LOG = LOGS_DIR / "action.log"
+LATEST_PLAN_FILE = LOGS_DIR / "latest_plan.json"
+INDEX_FILE = LOGS_DIR / "vault_index.json"
+
+# Seconds a cached value is trusted without even a stat()
+TTL_SECONDS = 5.0
+
+# Folders shown in the task counters, with the file suffix counted ("" = all)
+COUNTED_FOLDERS = {
+    "Inbox": ".md",
+    "Needs_Action": ".md",
+    "Needs_Approval": ".md",
+    "Done": ".md",
+    "Errors": "",
+}
+
+# Filesystem timestamps are coarse (a few ms, up to 2s on FAT): a path
+# changed within this window of a scan may change again without its mtime
+# moving, so such signatures are not trusted for revalidation
+RACY_WINDOW_NS = 2_000_000_000
+
+PLAN_PREFIX = "Plan_"
+TAIL_BLOCK_SIZE = 8192
+
+# Summaries are built from the head of a file only
+SUMMARY_READ_BYTES = 16384
+EXCERPT_CHARS = 600
+REASONING_HEADING = "## 🧠 Reasoning (Chain-of-Thought)"
+DEFAULT_PAGE_SIZE = 20
+
+
+# =============================================================================
+# MTIME-KEYED TTL CACHE
+# =============================================================================
+
+def path_signature(path: Path) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file or folder, or (0, 0) if it does not exist"""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (0, 0)
+
+
+class MtimeCache:
+    """
+    TTL cache whose entries are also invalidated when watched paths change.
+
+    Entries younger than ttl are returned without touching the disk; older
+    ones are revalidated with one stat() per watched path and recomputed only
+    if a signature changed (or was too recent to trust).
+    """
+
+    def __init__(self, ttl: float = TTL_SECONDS):
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[float, tuple, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def get(self, key: Any, paths: List[Path], compute: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        now_ns = time.time_ns()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and now - entry[0] < self.ttl:
+            self.hits += 1
+            return entry[2]
+
+        signature = tuple(path_signature(p) for p in paths)
+        if entry and entry[1] == signature:
+            self.revalidations += 1
+            with self._lock:
+                self._entries[key] = (now, signature, entry[2])
+            return entry[2]
+
+        self.misses += 1
+        value = compute()
+        if any(now_ns - mtime < RACY_WINDOW_NS for mtime, _ in signature):
+            signature = None
+        with self._lock:
+            self._entries[key] = (now, signature, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = MtimeCache()
+
+
+def clear_cache() -> None:
+    """Drop every cached value (e.g. for a forced refresh)"""
+    _cache.clear()
+
+
+def cached(key: Any, paths: List[Path], compute: Callable[[], Any]) -> Any:
+    """Cache compute() in the shared dashboard cache, keyed on the given paths"""
+    return _cache.get(key, paths, compute)
+
+
+# =============================================================================
+# FOLDER LISTINGS
+# =============================================================================
+
+def scan_files(folder: Path, suffix: str = "", prefix: str = "") -> List[str]:
+    """File names in a folder matching prefix/suffix, via one uncached scandir pass"""
+    try:
+        with os.scandir(folder) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file()
+            )
+    except OSError:
+        return []
+
+
+def scan_mtimes(folder: Path, suffix: str = "", prefix: str = "") -> Dict[str, int]:
+    """mtime_ns per matching file name, from the same uncached scandir pass as scan_files()"""
+    mtimes = {}
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file():
+                    try:
+                        mtimes[entry.name] = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+    except OSError:
+        pass
+    return mtimes
+
+
+def list_files(folder: Path, suffix: str = "", prefix: str = "") -> List[str]:
+    """
+    Sorted file names in a folder, cached on the folder's mtime.
+
+    Args:
+        folder: Folder to list
+        suffix: Only names ending with this (e.g. ".md")
+        prefix: Only names starting with this (e.g. "Plan_")
+    """
+    folder = Path(folder)
+    return _cache.get(("list", str(folder), suffix, prefix), [folder],
+                      lambda: scan_files(folder, suffix, prefix))
+
+
+def get_task_counts(vault_dir: Path = VAULT_DIR) -> Dict[str, int]:
+    """Number of items per vault stage; each folder is only rescanned when it changes"""
+    return {name: len(list_files(vault_dir / name, suffix)) for name, suffix in COUNTED_FOLDERS.items()}
+
+
+# =============================================================================
+# FILE CONTENTS
+# =============================================================================
+
+def read_text(path: Path) -> str:
+    """File contents, cached on (mtime, size); empty string if missing"""
+    path = Path(path)
+
+    def load():
+        try:
+            return path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return ""
+
+    return _cache.get(("text", str(path)), [path], load)
+
+
+def load_json(path: Path) -> Dict[str, Any]:
+    """Parsed JSON file, cached on (mtime, size); {} if missing or invalid"""
+    path = Path(path)
+
+    def load():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    return _cache.get(("json", str(path)), [path], load)
+
+
+def tail_lines(path: Path, limit: int) -> List[str]:
+    """
+    Last `limit` lines of a file, reading backwards from the end in blocks
+    so the cost depends on `limit`, not on the file size.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b""
+            while position > 0 and data.count(b"\n") <= limit:
+                step = min(TAIL_BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+    except OSError:
+        return []
+
+    lines = data.decode("utf-8", errors="replace").splitlines(keepends=True)
+    return lines[-limit:] if limit > 0 else []
+
+
+def get_recent_actions(limit: int = 10, log_file: Path = ACTION_LOG) -> List[str]:
+    """Newest `limit` action log lines, newest first"""
+    log_file = Path(log_file)
+    return _cache.get(("tail", str(log_file), limit), [log_file],
+                      lambda: tail_lines(log_file, limit)[::-1])
+
+
+# =============================================================================
+# LATEST PLAN POINTER
+# =============================================================================
+
+def record_latest_plan(plan_path: Path, pointer_file: Path = LATEST_PLAN_FILE) -> None:
+    """
+    Point the dashboard at a newly written plan (called by task_planner.py).
+
+    Written atomically so a reader never sees a partial file.
+    """
+    pointer_file = Path(pointer_file)
+    pointer = {"path": str(plan_path), "name": Path(plan_path).name,
+               "updated_at": datetime.now().isoformat(timespec="seconds")}
+    try:
+        pointer_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = pointer_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(pointer), encoding="utf-8")
+        os.replace(tmp_file, pointer_file)
+    except OSError:
+        pass
+
+
+def _newest_plan(plans_dir: Path) -> Optional[Path]:
+    """Fallback when the pointer is missing or stale: newest Plan_*.md by mtime"""
+    newest, newest_mtime = None, -1
+    for name in list_files(plans_dir, ".md", PLAN_PREFIX):
+        try:
+            mtime = os.stat(plans_dir / name).st_mtime_ns
+        except OSError:
+            continue
+        if mtime > newest_mtime:
+            newest, newest_mtime = plans_dir / name, mtime
+    return newest
+
+
+def get_latest_plan(plans_dir: Path = NEEDS_ACTION_DIR,
+                    pointer_file: Path = LATEST_PLAN_FILE) -> Optional[Path]:
+    """
+    Path of the newest active plan.
+
+    Reads the pointer maintained by task_planner.py; only if it is missing or
+    the plan has since left the folder does it fall back to a scan (cached on
+    the folder mtime), then repairs the pointer.
+    """
+    plans_dir, pointer_file = Path(plans_dir), Path(pointer_file)
+
+    def resolve():
+        pointer = load_json(pointer_file)
+        name = pointer.get("name")
+        if name and (plans_dir / name).exists():
+            return plans_dir / name
+        newest = _newest_plan(plans_dir)
+        if newest is not None and newest.name != name:
+            record_latest_plan(newest, pointer_file)
+        return newest
+
+    return _cache.get(("latest_plan", str(plans_dir)), [pointer_file, plans_dir], resolve)
+
+
+# =============================================================================
+# SUMMARY INDEX
+# =============================================================================
+
+def _parse_frontmatter(text: str) -> Tuple[Dict[str, str], str]:
+    """Split `---` frontmatter (simple key: value lines) from the body"""
+    if not text.startswith("---"):
+        return {}, text
+    end = text.find("\n---", 3)
+    if end == -1:
+        return {}, text
+    fields = {}
+    for line in text[3:end].splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            fields[key.strip()] = value.strip()
+    return fields, text[end + 4:]
+
+
+def summarize_markdown(text: str, name: str) -> Dict[str, Any]:
+    """
+    Title, priority, type and a short excerpt of a plan or approval file.
+
+    The excerpt is the plan's reasoning section when present, otherwise the
+    first paragraph of the body.
+
+    Args:
+        text: File contents (the head is enough)
+        name: File name, used as the title fallback
+    """
+    fields, body = _parse_frontmatter(text)
+
+    title = fields.get("title", "")
+    if not title:
+        for line in body.splitlines():
+            if line.startswith("# "):
+                title = line[2:].strip()
+                break
+
+    if REASONING_HEADING in body:
+        excerpt = body.split(REASONING_HEADING, 1)[1].split("\n## ", 1)[0]
+    else:
+        paragraphs = [p for p in body.split("\n\n") if p.strip() and not p.lstrip().startswith("#")]
+        excerpt = paragraphs[0] if paragraphs else ""
+    excerpt = excerpt.strip()
+    if len(excerpt) > EXCERPT_CHARS:
+        excerpt = excerpt[:EXCERPT_CHARS].rstrip() + "…"
+
+    return {
+        "title": title or name,
+        "priority": fields.get("priority", ""),
+        "type": fields.get("type", ""),
+        "created_at": fields.get("created_at", ""),
+        "excerpt": excerpt,
+    }
+
+
+def _read_head(path: Path) -> str:
+    with open(path, "rb") as f:
+        return f.read(SUMMARY_READ_BYTES).decode("utf-8", errors="ignore")
+
+
+def _load_index(index_file: Path) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            return json.load(f).get("folders", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_index(index_file: Path, folders: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = index_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps({"version": 1, "folders": folders}), encoding="utf-8")
+        os.replace(tmp_file, index_file)
+    except OSError:
+        pass
+
+
+_index_lock = threading.Lock()
+
+
+def index_summaries(files: Iterable[Tuple[Path, Optional[str]]], index_file: Path = INDEX_FILE) -> None:
+    """
+    Add or refresh the summaries of several files with a single index rewrite
+    (called by task_planner.py once per inbox run with the plans it wrote, so
+    the dashboard never has to re-read them).
+
+    Args:
+        files: (path, contents) pairs; contents of None are read from disk
+    """
+    entries = []
+    for path, content in files:
+        path = Path(path)
+        try:
+            text = content if content is not None else _read_head(path)
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        entries.append((path, dict(summarize_markdown(text, path.name), mtime_ns=mtime_ns)))
+    if not entries:
+        return
+    with _index_lock:
+        folders = _load_index(Path(index_file))
+        for path, entry in entries:
+            folders.setdefault(path.parent.name, {})[path.name] = entry
+        _save_index(Path(index_file), folders)
+
+
+def index_summary(path: Path, content: Optional[str] = None, index_file: Path = INDEX_FILE) -> None:
+    """
+    Add or refresh one file's summary in the index.
+
+    Args:
+        path: The plan or approval file
+        content: Its contents if already in memory; read from disk otherwise
+    """
+    index_summaries([(path, content)], index_file)
+
+
+def _build_summaries(folder: Path, suffix: str, prefix: str, index_file: Path) -> List[Dict[str, Any]]:
+    mtimes = scan_mtimes(folder, suffix, prefix)
+    with _index_lock:
+        folders = _load_index(index_file)
+        indexed = folders.get(folder.name, {})
+        matching = {name: entry for name, entry in indexed.items()
+                    if name.startswith(prefix) and name.endswith(suffix)}
+        # An entry is only reused while the file still has the mtime it was summarized at
+        entries = {name: matching[name] for name, mtime_ns in mtimes.items()
+                   if name in matching and matching[name].get("mtime_ns") == mtime_ns}
+        changed = len(entries) != len(matching)
+
+        for name in sorted(mtimes):
+            if name in entries:
+                continue
+            try:
+                text = _read_head(folder / name)
+            except OSError:
+                continue
+            entries[name] = dict(summarize_markdown(text, name), mtime_ns=mtimes[name])
+            changed = True
+
+        # Entries outside this prefix/suffix filter are kept as they are
+        if changed:
+            kept = {name: entry for name, entry in indexed.items() if name not in matching}
+            kept.update(entries)
+            folders[folder.name] = kept
+            _save_index(index_file, folders)
+
+    summaries = [dict(entry, name=name) for name, entry in entries.items()]
+    summaries.sort(key=lambda entry: entry.get("mtime_ns", 0), reverse=True)
+    return summaries
+
+
+def get_summaries(folder: Path, suffix: str = ".md", prefix: str = "",
+                  index_file: Path = INDEX_FILE) -> List[Dict[str, Any]]:
+    """
+    Summaries of the files in a folder, newest first.
+
+    Served from the index; only files it has not seen yet or whose mtime
+    differs from their entry are read (their first SUMMARY_READ_BYTES), and
+    entries for removed files are dropped. Cached on the folder's mtime like
+    list_files(), so a file rewritten in place (rather than replaced) is
+    re-read on the next rebuild of the folder.
+
+    Returns:
+        List of {"name", "title", "priority", "type", "created_at", "excerpt", "mtime_ns"}
+    """
+    folder, index_file = Path(folder), Path(index_file)
+    return _cache.get(("summaries", str(folder), suffix, prefix), [folder],
+                      lambda: _build_summaries(folder, suffix, prefix, index_file))
+
+
+def get_summary(path: Path, prefix: str = "", index_file: Path = INDEX_FILE) -> Optional[Dict[str, Any]]:
+    """Summary of one file, via get_summaries() of its folder with the same prefix"""
+    path = Path(path)
+    for entry in get_summaries(path.parent, path.suffix, prefix, index_file):
+        if entry["name"] == path.name:
+            return entry
+    return None
+
+
+def paginate(items: List[Any], page: int, page_size: int = DEFAULT_PAGE_SIZE) -> Tuple[List[Any], int]:
+    """
+    One page of items.
+
+    Args:
+        page: 1-based page number (clamped to the valid range)
+
+    Returns:
+        (items on that page, number of pages)
+    """
+    pages = max(1, -(-len(items) // page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    return items[start:start + page_size], pages
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Health Monitor - System Health Probes with Cached Results
+
+Probes the resources that turn into outages when they run out, and keeps a
+short history so growth is visible before a limit is hit:
+
+    disk_free            Free space on the vault's disk
+    log_size             Total size of Logs/ and vault/Logs/
+    retry_queue          Depth and growth rate of the error retry queue
+    scheduler            Scheduler lock liveness and time since the last cycle
+    oldest_pending_task  Age of the oldest task waiting in Needs_Action
+    watcher_lag          Age of the oldest Inbox file the watcher has not processed
+
+Results are cached in-process and on disk (Logs/health_cache.json) with a
+TTL, so the CEO briefing, `run_ai_employee.py --status` and the web dashboard
+share one set of probe results instead of each re-walking the vault.
+
+Usage:
+    python scripts/health_monitor.py            # Print health (cached)
+    python scripts/health_monitor.py --force    # Re-run all probes
+    python scripts/health_monitor.py --json
+
+    from health_monitor import get_health
+    health = get_health()
+    health["status"], health["probes"]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+
+VAULT_DIR = BASE_DIR / "AI_Employee_Vault"
+INBOX_DIR = VAULT_DIR / "Inbox"
+NEEDS_ACTION_DIR = VAULT_DIR / "Needs_Action"
+LOGS_DIR = BASE_DIR / "Logs"
+LOG_DIRS = [LOGS_DIR, BASE_DIR / "vault" / "Logs"]
+
+LOCK_FILE = LOGS_DIR / "scheduler.lock"
+SCHEDULER_LOG_FILE = LOGS_DIR / "ai_employee.log"
+WATCHER_TRACKER = LOGS_DIR / "processed_files.txt"
+RETRY_QUEUE_FILES = [LOGS_DIR / "error_retry_queue.json", LOGS_DIR / "retry_queue.json"]
+CACHE_FILE = LOGS_DIR / "health_cache.json"
+
+DEFAULT_TTL_SECONDS = 60
+HISTORY_LENGTH = 48  # readings kept per probe for growth rates
+
+# Scheduler cycle interval (see run_ai_employee.py); a cycle older than
+# SCHEDULER_STALE_CYCLES intervals means the daemon is stuck
+SCHEDULER_INTERVAL_SECONDS = 360
+SCHEDULER_STALE_CYCLES = 3
+
+# (warning, critical) thresholds
+THRESHOLDS = {
+    "disk_free_percent": (10.0, 5.0),           # below
+    "log_size_mb": (100.0, 500.0),              # above
+    "retry_queue_depth": (10, 50),              # above
+    "retry_queue_oldest_hours": (1.0, 24.0),    # above: retries that keep failing
+    "oldest_pending_task_hours": (24.0, 72.0),  # above
+    "watcher_lag_minutes": (15.0, 60.0),        # above
+}
+
+STATUS_OK = "OK"
+STATUS_WARNING = "WARNING"
+STATUS_CRITICAL = "CRITICAL"
+STATUS_ORDER = {STATUS_OK: 0, STATUS_WARNING: 1, STATUS_CRITICAL: 2}
+
+# Tail read size for finding the scheduler's last cycle
+TAIL_BYTES = 64 * 1024
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def _probe(name: str, status: str, value: Any, summary: str, **extra) -> Dict[str, Any]:
+    result = {"name": name, "status": status, "value": value, "summary": summary}
+    result.update(extra)
+    return result
+
+
+def _above(value: float, key: str) -> str:
+    warning, critical = THRESHOLDS[key]
+    if value >= critical:
+        return STATUS_CRITICAL
+    if value >= warning:
+        return STATUS_WARNING
+    return STATUS_OK
+
+
+def _below(value: float, key: str) -> str:
+    warning, critical = THRESHOLDS[key]
+    if value <= critical:
+        return STATUS_CRITICAL
+    if value <= warning:
+        return STATUS_WARNING
+    return STATUS_OK
+
+
+def format_size(size_bytes: float) -> str:
+    """Convert bytes to human-readable format"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size_bytes < 1024 or unit == "GB":
+            return f"{size_bytes:.0f} {unit}" if unit == "B" else f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024
+    return f"{size_bytes:.1f} GB"
+
+
+def format_age(seconds: float) -> str:
+    """Convert seconds to a short human-readable age"""
+    if seconds < 120:
+        return f"{seconds:.0f}s"
+    if seconds < 7200:
+        return f"{seconds / 60:.0f} min"
+    if seconds < 172800:
+        return f"{seconds / 3600:.1f} h"
+    return f"{seconds / 86400:.1f} days"
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    try:
+        for entry in os.scandir(path):
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    total += _dir_size(Path(entry.path))
+            except OSError:
+                continue
+    except OSError:
+        pass
+    return total
+
+
+def _oldest_mtime(path: Path, suffix: Optional[str] = None, exclude=None) -> (int, Optional[float]):
+    """(file count, oldest mtime) for files directly in path"""
+    count, oldest = 0, None
+    if not path.exists():
+        return 0, None
+    for entry in os.scandir(path):
+        if not entry.is_file() or (suffix and not entry.name.endswith(suffix)):
+            continue
+        if exclude and entry.name in exclude:
+            continue
+        count += 1
+        mtime = entry.stat().st_mtime
+        oldest = mtime if oldest is None else min(oldest, mtime)
+    return count, oldest
+
+
+def _last_line_containing(path: Path, marker: str) -> Optional[str]:
+    """Last line of a (possibly large) log containing marker, reading only its tail"""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - TAIL_BYTES))
+            lines = f.read().decode("utf-8", errors="replace").splitlines()
+    except OSError:
+        return None
+    for line in reversed(lines):
+        if marker in line:
+            return line
+    return None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+
+
+# =============================================================================
+# PROBES
+# =============================================================================
+
+def probe_disk_free() -> Dict[str, Any]:
+    usage = shutil.disk_usage(BASE_DIR)
+    percent = usage.free / usage.total * 100 if usage.total else 0.0
+    return _probe("disk_free", _below(percent, "disk_free_percent"), round(percent, 1),
+                  f"{format_size(usage.free)} free of {format_size(usage.total)} ({percent:.1f}%)",
+                  free_bytes=usage.free, total_bytes=usage.total)
+
+
+def probe_log_size() -> Dict[str, Any]:
+    sizes = {str(path): _dir_size(path) for path in LOG_DIRS if path.exists()}
+    total = sum(sizes.values())
+    size_mb = total / (1024 * 1024)
+    return _probe("log_size", _above(size_mb, "log_size_mb"), round(size_mb, 2),
+                  f"{format_size(total)} across {len(sizes)} log folder(s)", bytes=total, folders=sizes)
+
+
+def probe_retry_queue() -> Dict[str, Any]:
+    depth, oldest = 0, None
+    for path in RETRY_QUEUE_FILES:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+        except (FileNotFoundError, ValueError):
+            continue
+        if isinstance(items, dict):
+            items = items.get("queue", items.get("items", []))
+        depth += len(items)
+        for item in items:
+            added = item.get("added_at") if isinstance(item, dict) else None
+            if added and (oldest is None or added < oldest):
+                oldest = added
+    status = _above(depth, "retry_queue_depth")
+    summary = f"{depth} item(s) waiting"
+    age_hours = None
+    if oldest:
+        try:
+            age = time.time() - datetime.fromisoformat(oldest).timestamp()
+            age_hours = round(age / 3600, 2)
+            summary += f", oldest queued {format_age(age)} ago"
+            status = max(status, _above(age_hours, "retry_queue_oldest_hours"), key=STATUS_ORDER.get)
+        except ValueError:
+            pass
+    return _probe("retry_queue", status, depth, summary, oldest_added_at=oldest, oldest_age_hours=age_hours)
+
+
+def probe_scheduler() -> Dict[str, Any]:
+    pid, alive = None, False
+    if LOCK_FILE.exists():
+        try:
+            pid = int(LOCK_FILE.read_text().strip())
+            alive = _pid_alive(pid)
+        except (ValueError, OSError):
+            pid = None
+
+    last_cycle_age = None
+    line = _last_line_containing(SCHEDULER_LOG_FILE, "Cycle complete")
+    if line and line.startswith("["):
+        try:
+            last_cycle = datetime.strptime(line[1:line.index("]")], "%Y-%m-%d %H:%M:%S")
+            last_cycle_age = time.time() - last_cycle.timestamp()
+        except ValueError:
+            pass
+
+    stale_after = SCHEDULER_INTERVAL_SECONDS * SCHEDULER_STALE_CYCLES
+    if pid is not None and not alive:
+        status, summary = STATUS_WARNING, f"Stale lock: PID {pid} is not running"
+    elif alive and last_cycle_age is not None and last_cycle_age > stale_after:
+        status, summary = STATUS_CRITICAL, f"Running (PID {pid}) but no cycle for {format_age(last_cycle_age)}"
+    elif alive:
+        status, summary = STATUS_OK, f"Running (PID {pid})"
+    else:
+        status, summary = STATUS_WARNING, "Not running"
+    if last_cycle_age is not None and "no cycle" not in summary:
+        summary += f", last cycle {format_age(last_cycle_age)} ago"
+    return _probe("scheduler", status, alive, summary, pid=pid,
+                  last_cycle_age_seconds=round(last_cycle_age) if last_cycle_age is not None else None)
+
+
+def probe_oldest_pending_task() -> Dict[str, Any]:
+    count, oldest = _oldest_mtime(NEEDS_ACTION_DIR, ".md")
+    if oldest is None:
+        return _probe("oldest_pending_task", STATUS_OK, 0.0, "No pending tasks", count=0)
+    hours = (time.time() - oldest) / 3600
+    return _probe("oldest_pending_task", _above(hours, "oldest_pending_task_hours"), round(hours, 2),
+                  f"{count} pending, oldest waiting {format_age(hours * 3600)}", count=count)
+
+
+def probe_watcher_lag() -> Dict[str, Any]:
+    processed = set()
+    try:
+        with open(WATCHER_TRACKER, "r", encoding="utf-8") as f:
+            processed = {line.strip() for line in f if line.strip()}
+    except FileNotFoundError:
+        pass
+    count, oldest = _oldest_mtime(INBOX_DIR, ".md", exclude=processed)
+    if oldest is None:
+        return _probe("watcher_lag", STATUS_OK, 0.0, "Inbox fully processed", unprocessed=0)
+    minutes = (time.time() - oldest) / 60
+    return _probe("watcher_lag", _above(minutes, "watcher_lag_minutes"), round(minutes, 1),
+                  f"{count} unprocessed, oldest waiting {format_age(minutes * 60)}", unprocessed=count)
+
+
+PROBES = [
+    probe_disk_free,
+    probe_log_size,
+    probe_retry_queue,
+    probe_scheduler,
+    probe_oldest_pending_task,
+    probe_watcher_lag,
+]
+
+
+# =============================================================================
+# CACHED HEALTH
+# =============================================================================
+
+_memory_cache: Dict[str, Any] = {}
+
+
+def _read_cache() -> Dict[str, Any]:
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _write_cache(health: Dict[str, Any]) -> None:
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(health, f, indent=2)
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError:
+        pass  # caching is best-effort
+
+
+def _growth_per_hour(history: List[List[float]]) -> Optional[float]:
+    """Change per hour between the oldest and newest reading"""
+    if len(history) < 2:
+        return None
+    (t0, v0), (t1, v1) = history[0], history[-1]
+    if t1 - t0 < 60:
+        return None
+    return (v1 - v0) / ((t1 - t0) / 3600)
+
+
+def run_probes(previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run every probe now and attach growth rates from the previous readings.
+
+    Returns:
+        dict with status (worst probe), checked_at, checked_ts and probes
+    """
+    previous_probes = {p["name"]: p for p in (previous or {}).get("probes", [])}
+    now = time.time()
+    probes = []
+    for probe in PROBES:
+        try:
+            result = probe()
+        except Exception as e:
+            name = probe.__name__.replace("probe_", "")
+            result = _probe(name, STATUS_WARNING, None, f"Probe failed: {e}")
+
+        if isinstance(result["value"], (int, float)) and not isinstance(result["value"], bool):
+            history = previous_probes.get(result["name"], {}).get("history", [])
+            history = (history + [[now, result["value"]]])[-HISTORY_LENGTH:]
+            result["history"] = history
+            growth = _growth_per_hour(history)
+            if growth is not None:
+                result["growth_per_hour"] = round(growth, 2)
+        probes.append(result)
+
+    overall = max((p["status"] for p in probes), key=STATUS_ORDER.get, default=STATUS_OK)
+    return {
+        "status": overall,
+        "checked_at": datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"),
+        "checked_ts": now,
+        "probes": probes
+    }
+
+
+def get_health(ttl: float = DEFAULT_TTL_SECONDS, force: bool = False) -> Dict[str, Any]:
+    """
+    Health for all probes, served from cache while younger than ttl seconds.
+
+    Checks the in-process cache, then Logs/health_cache.json (shared by
+    every process), and only runs the probes when both are stale.
+    """
+    global _memory_cache
+    now = time.time()
+    if not force:
+        if _memory_cache and now - _memory_cache.get("checked_ts", 0) < ttl:
+            return _memory_cache
+        cached = _read_cache()
+        if cached and now - cached.get("checked_ts", 0) < ttl:
+            _memory_cache = cached
+            return cached
+    else:
+        cached = _read_cache()
+
+    health = run_probes(cached or _memory_cache)
+    _write_cache(health)
+    _memory_cache = health
+    return health
+
+
+def describe_probe(probe: Dict[str, Any]) -> str:
+    """One-line description, including growth when it is notable"""
+    text = f"{probe['name']}: {probe['summary']}"
+    growth = probe.get("growth_per_hour")
+    if growth and probe["name"] in ("retry_queue", "log_size"):
+        unit = " MB" if probe["name"] == "log_size" else ""
+        text += f" (trend {growth:+.1f}{unit}/h)"
+    return text
+
+
+# =============================================================================
+# CLI ENTRY POINT
+# =============================================================================
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(description="Health Monitor - System health probes")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and re-run all probes")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL_SECONDS,
+                        help=f"Cache TTL in seconds (default: {DEFAULT_TTL_SECONDS})")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON")
+
+    args = parser.parse_args()
+    health = get_health(args.ttl, args.force)
+
+    if args.json:
+        print(json.dumps(health, indent=2))
+    else:
+        print(f"System health: {health['status']} (checked {health['checked_at']})")
+        for probe in health["probes"]:
+            print(f"  [{probe['status']:<8}] {describe_probe(probe)}")
+    return 0 if health["status"] != STATUS_CRITICAL else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Ledger Archive - Monthly Rollover and Snapshots
+
+Rolls finished months out of AI_Employee_Vault/Accounting/Current_Month.md
+into one archived ledger per month and writes a pre-computed snapshot for
+each archived month, so totals and year-to-date reports combine a handful
+of snapshot numbers with the live month instead of scanning all history.
+
+Layout (AI_Employee_Vault/Accounting/Archive/):
+    2026-02.md             archived Markdown ledger (same table format)
+    2026-02.ledger/        its indexed sidecar (see ledger_engine.py)
+    2026-02.snapshot.json  totals plus per-description aggregates
+    snapshots.json         rollup of all snapshots by month, year and overall
+
+Rollover runs automatically on first use in a new month. Transactions
+back-dated into an archived month are appended to that month's ledger and
+its snapshot is refreshed.
+"""
+
+import os
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from ledger_engine import LedgerEngine, MARKDOWN_HEADER, HEADER_LINES, parse_ledger_row, to_cents
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+ARCHIVE_DIR_NAME = "Archive"
+ROLLUP_FILE_NAME = "snapshots.json"
+
+
+def month_key(value) -> str:
+    """YYYY-MM key for a date or datetime"""
+    return value.strftime("%Y-%m")
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write JSON atomically so readers never see a half-written file"""
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _empty_totals() -> Dict[str, int]:
+    return {"income_cents": 0, "expense_cents": 0, "count": 0}
+
+
+def _add_totals(target: Dict[str, int], snapshot: Dict[str, Any]) -> None:
+    target["income_cents"] += to_cents(snapshot["income"])
+    target["expense_cents"] += to_cents(snapshot["expense"])
+    target["count"] += snapshot["count"]
+
+
+def totals_from_cents(totals: Dict[str, int]) -> Dict[str, Any]:
+    """Convert a rollup entry to the income/expense/net/count dict used in reports"""
+    return {
+        "income": totals["income_cents"] / 100,
+        "expense": totals["expense_cents"] / 100,
+        "net": (totals["income_cents"] - totals["expense_cents"]) / 100,
+        "count": totals["count"]
+    }
+
+
+# =============================================================================
+# LEDGER ARCHIVE
+# =============================================================================
+
+class LedgerArchive:
+    """
+    Monthly archive of ledgers next to the live Current_Month.md.
+
+    Usage:
+        archive = LedgerArchive(ACCOUNTING_FILE)
+        archive.ensure_rolled_over()
+        archive.rollup()["all"]
+    """
+
+    def __init__(self, live_path):
+        self.live_path = Path(live_path)
+        self.archive_dir = self.live_path.parent / ARCHIVE_DIR_NAME
+        self.rollup_path = self.archive_dir / ROLLUP_FILE_NAME
+
+    # -------------------------------------------------------------------------
+    # Paths
+    # -------------------------------------------------------------------------
+
+    def month_path(self, key: str) -> Path:
+        return self.archive_dir / f"{key}.md"
+
+    def snapshot_path(self, key: str) -> Path:
+        return self.archive_dir / f"{key}.snapshot.json"
+
+    def month_engine(self, key: str) -> LedgerEngine:
+        """Indexed ledger for an archived month, creating the file if needed"""
+        path = self.month_path(key)
+        if not path.exists():
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(MARKDOWN_HEADER)
+        return LedgerEngine(path)
+
+    def archived_months(self) -> List[str]:
+        """Sorted YYYY-MM keys of all archived months"""
+        return sorted(self.rollup().get("months", {}))
+
+    # -------------------------------------------------------------------------
+    # Snapshots
+    # -------------------------------------------------------------------------
+
+    def rollup(self) -> Dict[str, Any]:
+        """The snapshots.json rollup (empty dict if nothing was archived yet)"""
+        return _read_json(self.rollup_path)
+
+    def snapshot(self, key: str) -> Dict[str, Any]:
+        """Snapshot for one archived month"""
+        return _read_json(self.snapshot_path(key))
+
+    def write_snapshot(self, key: str) -> Dict[str, Any]:
+        """Compute and store the snapshot for an archived month"""
+        engine = self.month_engine(key)
+        snapshot = {"month": key}
+        snapshot.update(engine.totals())
+        snapshot["descriptions"] = engine.label_totals()
+        snapshot["generated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        _write_json(self.snapshot_path(key), snapshot)
+        return snapshot
+
+    def write_rollup(self, live_month: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Rebuild snapshots.json from the per-month snapshots.
+
+        Only runs on rollover or back-dated entries, and reads one small
+        file per archived month.
+        """
+        previous = self.rollup()
+        rollup = {
+            "live_month": live_month or previous.get("live_month"),
+            "months": {},
+            "years": {},
+            "all": _empty_totals()
+        }
+        for path in sorted(self.archive_dir.glob("*.snapshot.json")):
+            snapshot = _read_json(path)
+            if not snapshot:
+                continue
+            key = snapshot["month"]
+            month_totals = _empty_totals()
+            _add_totals(month_totals, snapshot)
+            rollup["months"][key] = month_totals
+            _add_totals(rollup["years"].setdefault(key[:4], _empty_totals()), snapshot)
+            _add_totals(rollup["all"], snapshot)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(self.rollup_path, rollup)
+        return rollup
+
+    # -------------------------------------------------------------------------
+    # Rollover
+    # -------------------------------------------------------------------------
+
+    def ensure_rolled_over(self, today: Optional[date] = None) -> List[str]:
+        """
+        Move rows dated before the current month out of the live ledger.
+
+        Cheap when nothing has to move: the rollup records which month is
+        live, so only the first call in a new month reads the live file.
+
+        Returns:
+            list: YYYY-MM keys of months that received rows
+        """
+        live_month = month_key(today or date.today())
+        if self.rollup().get("live_month") == live_month or not self.live_path.exists():
+            return []
+
+        with open(self.live_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        header, body = lines[:HEADER_LINES], lines[HEADER_LINES:]
+
+        keep = []
+        moved: Dict[str, List[str]] = {}
+        for line in body:
+            try:
+                row = parse_ledger_row(line)
+            except (ValueError, TypeError):
+                row = None
+            if row is not None and month_key(row[0]) < live_month:
+                moved.setdefault(month_key(row[0]), []).append(line if line.endswith("\n") else line + "\n")
+            else:
+                keep.append(line)
+
+        for key, rows in sorted(moved.items()):
+            engine = self.month_engine(key)
+            for row_text in rows:
+                engine.append_row(row_text)
+            self.write_snapshot(key)
+
+        if moved:
+            tmp_path = self.live_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(header or [MARKDOWN_HEADER])
+                f.writelines(keep)
+            os.replace(tmp_path, self.live_path)
+
+        self.write_rollup(live_month)
+        return sorted(moved)
+
+    def append_row(self, key: str, row_text: str) -> int:
+        """Append a back-dated row to an archived month and refresh its snapshot"""
+        row_id = self.month_engine(key).append_row(row_text)
+        self.write_snapshot(key)
+        self.write_rollup()
+        return row_id
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def engines_for_range(self, start: date, end: date) -> List[LedgerEngine]:
+        """Archived month ledgers overlapping start..end, oldest first"""
+        first, last = month_key(start), month_key(end)
+        return [self.month_engine(key) for key in self.archived_months() if first <= key <= last]
+
+    def all_time_totals(self) -> Dict[str, Any]:
+        """Totals across every archived month (O(1))"""
+        return totals_from_cents(self.rollup().get("all", _empty_totals()))
+
+    def year_totals(self, year: int) -> Dict[str, Any]:
+        """Totals across archived months of one year (O(1))"""
+        return totals_from_cents(self.rollup().get("years", {}).get(str(year), _empty_totals()))
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+Ledger Engine - Indexed Accounting Storage
+
+Keeps AI_Employee_Vault/Accounting/Current_Month.md as the human-readable
+ledger and maintains a binary, append-only columnar sidecar next to it, so
+reports never have to re-parse the Markdown table.
+
+Sidecar layout (Current_Month.ledger/):
+    days.bin     int32   transaction date as days (date.toordinal())
+    types.bin    uint8   TYPE_INCOME / TYPE_EXPENSE
+    cents.bin    int64   amount in cents
+    offsets.bin  int64   byte offset of the Markdown row (for descriptions)
+    labels.bin   uint32  description id, dictionary-encoded via labels.txt
+    labels.txt           one distinct description per line (append-only)
+    order.bin    uint32  row ids sorted by date (the date index)
+    daily.idx    <iqqq>  one record per day: day, running income,
+                         running expense, running row count
+    meta.json            Markdown size/mtime at the last sync
+
+Totals are read from the last daily.idx record (O(1)); date-range totals
+are two binary searches over daily.idx (O(log n)). If the Markdown file is
+edited by hand, the sidecar is detected as stale and rebuilt from it.
+
+Usage:
+    engine = LedgerEngine(Path("AI_Employee_Vault/Accounting/Current_Month.md"))
+    engine.append_row("| 2026-03-02 | income  |  500.00 | Client payment           |\\n")
+    engine.totals()
+    engine.range_totals(date(2026, 3, 1), date(2026, 3, 7))
+"""
+
+import os
+import json
+import struct
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SIDECAR_SUFFIX = ".ledger"
+SIDECAR_VERSION = 2
+
+# Transaction type codes stored in types.bin
+TYPE_UNKNOWN = 0
+TYPE_INCOME = 1
+TYPE_EXPENSE = 2
+
+TYPE_CODES = {"income": TYPE_INCOME, "expense": TYPE_EXPENSE}
+TYPE_NAMES = {TYPE_INCOME: "income", TYPE_EXPENSE: "expense", TYPE_UNKNOWN: "unknown"}
+
+# Column files: name -> array typecode
+COLUMNS = {
+    "days": "i",
+    "types": "B",
+    "cents": "q",
+    "offsets": "q",
+    "labels": "I",
+}
+ORDER_TYPECODE = "I"
+
+# daily.idx record: day, running income cents, running expense cents, running rows
+DAILY_RECORD = struct.Struct("<iqqq")
+
+# Header written at the top of every Markdown ledger
+MARKDOWN_HEADER = (
+    "| Date       | Type    | Amount  | Description              |\n"
+    "|------------|---------|---------|--------------------------|\n"
+)
+
+# Number of header lines (title row + separator) in the Markdown table
+HEADER_LINES = 2
+
+
+# =============================================================================
+# ROW PARSING
+# =============================================================================
+
+def parse_ledger_row(line: str) -> Optional[Tuple[date, str, float, str]]:
+    """
+    Parse a single Markdown ledger row.
+
+    Args:
+        line: A line such as "| 2026-03-02 | income  |  500.00 | Client |"
+
+    Returns:
+        (date, type, amount, description), or None if the line is not a table row
+
+    Raises:
+        ValueError: If the line is a table row but the date or amount is invalid
+    """
+    parts = [p.strip() for p in line.strip().split('|')]
+    if len(parts) != 6 or parts[0] != '' or parts[5] != '':
+        return None
+
+    date_str, trans_type, amount_str, description = parts[1], parts[2], parts[3], parts[4]
+    amount = float(amount_str)
+    date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
+    return date_obj, trans_type.lower(), amount, description
+
+
+def to_cents(amount: float) -> int:
+    """Convert a currency amount to integer cents"""
+    return int(round(amount * 100))
+
+
+# =============================================================================
+# LEDGER ENGINE
+# =============================================================================
+
+class LedgerEngine:
+    """
+    Indexed, append-only view over a Markdown accounting ledger.
+
+    Usage:
+        engine = LedgerEngine(ACCOUNTING_FILE)
+        engine.append_row(row_text)
+        summary = engine.range_totals(start, end)
+    """
+
+    def __init__(self, markdown_path):
+        self.markdown_path = Path(markdown_path)
+        self.sidecar_dir = self.markdown_path.with_suffix(SIDECAR_SUFFIX)
+        self.meta_path = self.sidecar_dir / "meta.json"
+        self.order_path = self.sidecar_dir / "order.bin"
+        self.daily_path = self.sidecar_dir / "daily.idx"
+        self.labels_path = self.sidecar_dir / "labels.txt"
+
+    # -------------------------------------------------------------------------
+    # Sidecar bookkeeping
+    # -------------------------------------------------------------------------
+
+    def column_path(self, name: str) -> Path:
+        """Path of a column file inside the sidecar"""
+        return self.sidecar_dir / f"{name}.bin"
+
+    def _markdown_signature(self) -> Dict[str, int]:
+        """Size and mtime of the Markdown file, used to detect hand edits"""
+        try:
+            stat = self.markdown_path.stat()
+            return {"md_size": stat.st_size, "md_mtime_ns": stat.st_mtime_ns}
+        except FileNotFoundError:
+            return {"md_size": 0, "md_mtime_ns": 0}
+
+    def _load_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_meta(self, rows: int) -> None:
+        meta = {"version": SIDECAR_VERSION, "rows": rows}
+        meta.update(self._markdown_signature())
+        tmp_path = self.meta_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+    def _column_rows(self) -> Optional[int]:
+        """Row count shared by all column files, or None if they disagree"""
+        counts = set()
+        for name, typecode in COLUMNS.items():
+            path = self.column_path(name)
+            size = path.stat().st_size if path.exists() else 0
+            itemsize = array(typecode).itemsize
+            if size % itemsize:
+                return None
+            counts.add(size // itemsize)
+        return counts.pop() if len(counts) == 1 else None
+
+    def is_stale(self) -> bool:
+        """True if the sidecar no longer matches the Markdown file"""
+        meta = self._load_meta()
+        if meta.get("version") != SIDECAR_VERSION:
+            return True
+        signature = self._markdown_signature()
+        if meta.get("md_size") != signature["md_size"] or meta.get("md_mtime_ns") != signature["md_mtime_ns"]:
+            return True
+        return self._column_rows() != meta.get("rows")
+
+    def sync(self) -> None:
+        """Rebuild the sidecar if it is missing or stale"""
+        if self.is_stale():
+            self.rebuild()
+
+    @property
+    def row_count(self) -> int:
+        self.sync()
+        return self._column_rows() or 0
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    def rebuild(self) -> int:
+        """
+        Rebuild every sidecar file from the Markdown ledger.
+
+        Returns:
+            int: Number of rows indexed
+        """
+        self.sidecar_dir.mkdir(parents=True, exist_ok=True)
+        columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        labels: Dict[str, int] = {}
+
+        if self.markdown_path.exists():
+            with open(self.markdown_path, "rb") as f:
+                offset = 0
+                for line_no, raw in enumerate(f):
+                    line_offset = offset
+                    offset += len(raw)
+                    if line_no < HEADER_LINES:
+                        continue
+                    line = raw.decode("utf-8", errors="replace")
+                    try:
+                        row = parse_ledger_row(line)
+                    except (ValueError, TypeError) as e:
+                        print(f"Warning: Could not parse line '{line.strip()}': {e}")
+                        continue
+                    if row is None:
+                        continue
+                    date_obj, trans_type, amount, description = row
+                    columns["days"].append(date_obj.toordinal())
+                    columns["types"].append(TYPE_CODES.get(trans_type, TYPE_UNKNOWN))
+                    columns["cents"].append(to_cents(amount))
+                    columns["offsets"].append(line_offset)
+                    columns["labels"].append(labels.setdefault(description, len(labels)))
+
+        for name, values in columns.items():
+            with open(self.column_path(name), "wb") as f:
+                values.tofile(f)
+        with open(self.labels_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{label}\n" for label in labels)
+
+        self._reindex(columns["days"], columns["types"], columns["cents"])
+        rows = len(columns["days"])
+        self._save_meta(rows)
+        return rows
+
+    def _reindex(self, days: array, types: array, cents: array) -> None:
+        """Rewrite order.bin and daily.idx from full columns"""
+        order = array(ORDER_TYPECODE, sorted(range(len(days)), key=days.__getitem__))
+
+        with open(self.order_path, "wb") as f:
+            order.tofile(f)
+
+        with open(self.daily_path, "wb") as f:
+            income = expense = rows = 0
+            current_day = None
+            for row_id in order:
+                day = days[row_id]
+                if current_day is not None and day != current_day:
+                    f.write(DAILY_RECORD.pack(current_day, income, expense, rows))
+                current_day = day
+                if types[row_id] == TYPE_INCOME:
+                    income += cents[row_id]
+                elif types[row_id] == TYPE_EXPENSE:
+                    expense += cents[row_id]
+                rows += 1
+            if current_day is not None:
+                f.write(DAILY_RECORD.pack(current_day, income, expense, rows))
+
+    def _read_full_columns(self) -> Dict[str, array]:
+        columns = {}
+        for name, typecode in COLUMNS.items():
+            values = array(typecode)
+            path = self.column_path(name)
+            with open(path, "rb") as f:
+                values.frombytes(f.read())
+            columns[name] = values
+        return columns
+
+    # -------------------------------------------------------------------------
+    # Appending
+    # -------------------------------------------------------------------------
+
+    def append_row(self, row_text: str) -> int:
+        """
+        Append a formatted Markdown row to the ledger and index it.
+
+        Args:
+            row_text: A row produced by format_transaction_row()
+
+        Returns:
+            int: Row id of the new transaction
+
+        Raises:
+            ValueError: If row_text is not a valid ledger row
+        """
+        row = parse_ledger_row(row_text)
+        if row is None:
+            raise ValueError(f"Not a ledger row: {row_text.strip()}")
+        date_obj, trans_type, amount, description = row
+
+        self.sync()
+        row_id = self._column_rows() or 0
+        label_id = self._label_id(description)
+
+        with open(self.markdown_path, "ab") as f:
+            line_offset = f.seek(0, os.SEEK_END)
+            f.write(row_text.encode("utf-8"))
+
+        day = date_obj.toordinal()
+        type_code = TYPE_CODES.get(trans_type, TYPE_UNKNOWN)
+        cents = to_cents(amount)
+        values = {"days": day, "types": type_code, "cents": cents, "offsets": line_offset, "labels": label_id}
+        for name, typecode in COLUMNS.items():
+            with open(self.column_path(name), "ab") as f:
+                array(typecode, [values[name]]).tofile(f)
+
+        last = self._read_daily(self._daily_count() - 1)
+        if last is None or day >= last[0]:
+            self._extend_index(row_id, day, type_code, cents, last)
+        else:
+            # Back-dated entry: the date index has to be rebuilt from columns
+            columns = self._read_full_columns()
+            self._reindex(columns["days"], columns["types"], columns["cents"])
+
+        self._save_meta(row_id + 1)
+        return row_id
+
+    def label_names(self) -> List[str]:
+        """Distinct descriptions, indexed by the ids stored in labels.bin"""
+        try:
+            with open(self.labels_path, "r", encoding="utf-8") as f:
+                return [line.rstrip("\n") for line in f]
+        except FileNotFoundError:
+            return []
+
+    def _label_id(self, description: str) -> int:
+        """Dictionary id for a description, registering it if new"""
+        labels = {label: i for i, label in enumerate(self.label_names())}
+        if description in labels:
+            return labels[description]
+        with open(self.labels_path, "a", encoding="utf-8") as f:
+            f.write(f"{description}\n")
+        return len(labels)
+
+    def _extend_index(self, row_id: int, day: int, type_code: int, cents: int,
+                      last: Optional[Tuple[int, int, int, int]]) -> None:
+        """Add an in-order row to order.bin and daily.idx without a rebuild"""
+        with open(self.order_path, "ab") as f:
+            array(ORDER_TYPECODE, [row_id]).tofile(f)
+
+        _, income, expense, rows = last if last else (day, 0, 0, 0)
+        if type_code == TYPE_INCOME:
+            income += cents
+        elif type_code == TYPE_EXPENSE:
+            expense += cents
+        record = DAILY_RECORD.pack(day, income, expense, rows + 1)
+
+        with open(self.daily_path, "r+b" if self.daily_path.exists() else "wb") as f:
+            if last is not None and last[0] == day:
+                f.seek(-DAILY_RECORD.size, os.SEEK_END)
+            else:
+                f.seek(0, os.SEEK_END)
+            f.write(record)
+
+    # -------------------------------------------------------------------------
+    # Date index lookups
+    # -------------------------------------------------------------------------
+
+    def _daily_count(self) -> int:
+        try:
+            return self.daily_path.stat().st_size // DAILY_RECORD.size
+        except FileNotFoundError:
+            return 0
+
+    def _read_daily(self, index: int, f=None) -> Optional[Tuple[int, int, int, int]]:
+        """Read one daily.idx record by position"""
+        if index < 0:
+            return None
+        if f is None:
+            if not self.daily_path.exists():
+                return None
+            with open(self.daily_path, "rb") as handle:
+                return self._read_daily(index, handle)
+        f.seek(index * DAILY_RECORD.size)
+        data = f.read(DAILY_RECORD.size)
+        if len(data) < DAILY_RECORD.size:
+            return None
+        return DAILY_RECORD.unpack(data)
+
+    def _floor_record(self, f, count: int, day: int) -> Tuple[int, int, int, int]:
+        """
+        Binary search daily.idx for the last record with record.day <= day.
+
+        Returns:
+            The running totals at that record, or zeros if there is none
+        """
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._read_daily(mid, f)[0] <= day:
+                lo = mid + 1
+            else:
+                hi = mid
+        record = self._read_daily(lo - 1, f)
+        return record if record else (day, 0, 0, 0)
+
+    def _window(self, start: date, end: date) -> Tuple[Tuple[int, int, int, int], Tuple[int, int, int, int]]:
+        """Running totals just before start and at end"""
+        self.sync()
+        count = self._daily_count()
+        if count == 0:
+            return (0, 0, 0, 0), (0, 0, 0, 0)
+        with open(self.daily_path, "rb") as f:
+            before = self._floor_record(f, count, start.toordinal() - 1)
+            upto = self._floor_record(f, count, end.toordinal())
+        return before, upto
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def totals(self) -> Dict[str, Any]:
+        """
+        Total income and expense across the whole ledger (O(1)).
+
+        Returns:
+            dict with income, expense, net and count
+        """
+        self.sync()
+        last = self._read_daily(self._daily_count() - 1)
+        _, income, expense, rows = last if last else (0, 0, 0, 0)
+        return _summary(income, expense, rows)
+
+    def range_totals(self, start: date, end: date) -> Dict[str, Any]:
+        """
+        Income and expense for transactions dated start..end inclusive (O(log n)).
+
+        Returns:
+            dict with income, expense, net and count
+        """
+        if end < start:
+            return _summary(0, 0, 0)
+        before, upto = self._window(start, end)
+        return _summary(upto[1] - before[1], upto[2] - before[2], upto[3] - before[3])
+
+    def label_totals(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Income/expense per description across the whole ledger.
+
+        Used once per month when a snapshot is written, so it reads the
+        columns directly rather than going through NumPy.
+
+        Returns:
+            dict mapping description -> totals dict
+        """
+        self.sync()
+        columns = self._read_full_columns()
+        names = self.label_names()
+        sums: Dict[int, List[int]] = {}
+        for type_code, cents, label in zip(columns["types"], columns["cents"], columns["labels"]):
+            bucket = sums.setdefault(label, [0, 0, 0])
+            if type_code == TYPE_INCOME:
+                bucket[0] += cents
+            elif type_code == TYPE_EXPENSE:
+                bucket[1] += cents
+            bucket[2] += 1
+        return {names[label]: _summary(*bucket) for label, bucket in sums.items()}
+
+    def transactions_between(self, start: date, end: date) -> List[Dict[str, Any]]:
+        """
+        List transactions dated start..end inclusive, in date order.
+
+        Only the matching rows are read: their ids come from order.bin and
+        their descriptions from the Markdown row offsets.
+
+        Returns:
+            list of dicts with date, type, amount and description
+        """
+        if end < start:
+            return []
+        before, upto = self._window(start, end)
+        first, last = before[3], upto[3]
+        if last <= first:
+            return []
+
+        order = array(ORDER_TYPECODE)
+        with open(self.order_path, "rb") as f:
+            f.seek(first * order.itemsize)
+            order.frombytes(f.read((last - first) * order.itemsize))
+
+        transactions = []
+        handles = {name: open(self.column_path(name), "rb") for name in ("types", "cents", "offsets")}
+        try:
+            with open(self.markdown_path, "rb") as md:
+                for row_id in order:
+                    values = {}
+                    for name, handle in handles.items():
+                        column = array(COLUMNS[name])
+                        handle.seek(row_id * column.itemsize)
+                        column.frombytes(handle.read(column.itemsize))
+                        values[name] = column[0]
+                    md.seek(values["offsets"])
+                    line = md.readline().decode("utf-8", errors="replace")
+                    row = parse_ledger_row(line)
+                    if row is None:
+                        continue
+                    date_obj, _, _, description = row
+                    transactions.append({
+                        'date': datetime.combine(date_obj, datetime.min.time()),
+                        'type': TYPE_NAMES[values["types"]],
+                        'amount': values["cents"] / 100,
+                        'description': description
+                    })
+        finally:
+            for handle in handles.values():
+                handle.close()
+        return transactions
+
+
+def _summary(income_cents: int, expense_cents: int, count: int) -> Dict[str, Any]:
+    """Build a totals dict from cent amounts"""
+    return {
+        "income": income_cents / 100,
+        "expense": expense_cents / 100,
+        "net": (income_cents - expense_cents) / 100,
+        "count": count
+    }
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Metrics Registry - Prometheus-style Operational Metrics
+
+In-process counters, gauges and histograms shared by the scheduler, task
+planner, approval checker, inbox watcher and business MCP server. Each
+process renders its registry in the Prometheus text format to
+Logs/metrics/<component>.prom (the node_exporter textfile-collector
+layout), and the files are merged for scraping:
+
+    http://127.0.0.1:8765/metrics       (served by vault_events.py)
+    python scripts/metrics_registry.py --serve --port 9108
+    python scripts/metrics_registry.py  # print the merged metrics
+
+This is operational telemetry (latencies, queue depths, throughput), kept
+separate from the business KPIs in metrics_store.py.
+
+Usage:
+    from metrics_registry import counter, histogram, write_textfile
+
+    FILES = counter("task_planner_files_processed_total", "Inbox files planned")
+    FILE_SECONDS = histogram("task_planner_file_seconds", "Time to plan one file")
+
+    with FILE_SECONDS.time():
+        ...
+    FILES.inc()
+    write_textfile("task_planner")
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+
+METRICS_DIR = Path(os.environ.get("METRICS_DIR", BASE_DIR / "Logs" / "metrics"))
+
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9108
+
+# Latency buckets in seconds: sub-millisecond file operations up to
+# multi-minute subprocess runs
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+TEXTFILE_INTERVAL_SECONDS = 15.0
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# =============================================================================
+# METRIC TYPES
+# =============================================================================
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class _Metric:
+    """A named metric family with optional labels; children hold the values."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values, **labels):
+        """The child for one combination of label values"""
+        if labels:
+            values = tuple(labels[name] for name in self.labelnames)
+        key = tuple(str(v) for v in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+            return child
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels()")
+        return self.labels()
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            labels = dict(zip(self.labelnames, key))
+            yield from child.samples(self.name, labels)
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name, labels):
+        yield name, labels, self.value
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (use a *_total name)."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+
+class _GaugeChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def samples(self, name, labels):
+        yield name, labels, self.value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (queue depth, throughput)."""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[index] += 1
+                    break
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def samples(self, name, labels):
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            yield f"{name}_bucket", dict(labels, le=_format_value(bound)), cumulative
+        yield f"{name}_bucket", dict(labels, le="+Inf"), count
+        yield f"{name}_sum", labels, total
+        yield f"{name}_count", labels, count
+
+
+class Histogram(_Metric):
+    """Distribution of observations (latencies) in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if b != float("inf")))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self):
+        """Context manager observing the elapsed seconds"""
+        return self._default().time()
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class MetricsRegistry:
+    """
+    Named metrics of one process.
+
+    counter()/gauge()/histogram() return the existing metric when the name is
+    already registered, so modules can declare their metrics at import time
+    without coordinating.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, documentation: str, labelnames, **kwargs) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, tuple(labelnames), **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames=(),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def on_collect(self, callback: Callable[[], None]) -> None:
+        """Run callback before each render (e.g. to refresh queue-depth gauges)"""
+        self._collectors.append(callback)
+
+    def render(self, const_labels: Optional[Dict[str, str]] = None) -> str:
+        """
+        All metrics in the Prometheus text exposition format.
+
+        Args:
+            const_labels: Labels added to every sample (e.g. the component)
+        """
+        for callback in self._collectors:
+            try:
+                callback()
+            except Exception:
+                pass
+
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            samples = list(metric.samples())
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in samples:
+                if const_labels:
+                    labels = dict(const_labels, **labels)
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+REGISTRY = MetricsRegistry()
+
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+
+
+# =============================================================================
+# TEXTFILE EXPORT
+# =============================================================================
+
+def write_textfile(component: str, registry: MetricsRegistry = REGISTRY,
+                   directory: Path = METRICS_DIR) -> Optional[Path]:
+    """
+    Write the registry to <directory>/<component>.prom atomically.
+
+    Every sample gets a component="<component>" label so files from several
+    processes can be merged. Errors are ignored: metrics must never break
+    the instrumented code.
+
+    Returns:
+        Path written, or None on failure
+    """
+    directory = Path(directory)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / f"{component}.prom"
+        tmp_file = directory / f".{component}.prom.tmp"
+        tmp_file.write_text(registry.render({"component": component}), encoding="utf-8")
+        os.replace(tmp_file, target)
+        return target
+    except OSError:
+        return None
+
+
+class TextfileWriter:
+    """
+    Rewrites a component's textfile every `interval` seconds on a daemon
+    thread, for long-running processes (MCP server, watchers).
+    """
+
+    def __init__(self, component: str, interval: float = TEXTFILE_INTERVAL_SECONDS,
+                 registry: MetricsRegistry = REGISTRY, directory: Path = METRICS_DIR):
+        self.component = component
+        self.interval = interval
+        self.registry = registry
+        self.directory = directory
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            write_textfile(self.component, self.registry, self.directory)
+
+    def start(self) -> "TextfileWriter":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"metrics-{self.component}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the thread and write a final snapshot"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(5)
+            self._thread = None
+        write_textfile(self.component, self.registry, self.directory)
+
+
+def collect_textfiles(directory: Path = METRICS_DIR) -> str:
+    """
+    Merge every *.prom file in directory into one exposition, with each
+    family's HELP/TYPE emitted once and its samples from all files grouped.
+    """
+    families: Dict[str, Dict[str, Any]] = {}
+    directory = Path(directory)
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".prom"))
+    except OSError:
+        return ""
+
+    for name in names:
+        try:
+            text = (directory / name).read_text(encoding="utf-8")
+        except OSError:
+            continue
+        family = None
+        for line in text.splitlines():
+            if line.startswith("# HELP ") or line.startswith("# TYPE "):
+                parts = line.split(" ", 3)
+                if len(parts) < 4:
+                    continue
+                family = families.setdefault(parts[2], {"help": "", "type": "untyped", "samples": []})
+                family["help" if parts[1] == "HELP" else "type"] = parts[3]
+            elif line and not line.startswith("#") and family is not None:
+                family["samples"].append(line)
+
+    lines = []
+    for family_name, family in families.items():
+        lines.append(f"# HELP {family_name} {family['help']}")
+        lines.append(f"# TYPE {family_name} {family['type']}")
+        lines.extend(family["samples"])
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+# =============================================================================
+# HTTP ENDPOINT
+# =============================================================================
+
+def start_metrics_server(host: str = METRICS_HOST, port: int = METRICS_PORT,
+                         directory: Path = METRICS_DIR):
+    """
+    Serve GET /metrics (the merged textfiles) on a background thread.
+
+    http.server is imported here so instrumented processes do not pay for it.
+
+    Returns:
+        The ThreadingHTTPServer; call shutdown() to stop
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = collect_textfiles(directory).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+# =============================================================================
+# CLI ENTRY POINT
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or serve the merged operational metrics")
+    parser.add_argument("--serve", action="store_true", help="Serve /metrics over HTTP")
+    parser.add_argument("--host", default=METRICS_HOST, help=f"Bind address (default: {METRICS_HOST})")
+    parser.add_argument("--port", type=int, default=METRICS_PORT, help=f"Port (default: {METRICS_PORT})")
+    parser.add_argument("--dir", type=Path, default=METRICS_DIR, help="Textfile directory")
+    args = parser.parse_args()
+
+    if not args.serve:
+        sys.stdout.write(collect_textfiles(args.dir) or f"No metrics in {args.dir}\n")
+        return
+
+    server = start_metrics_server(args.host, args.port, args.dir)
+    print(f"Serving metrics on http://{args.host}:{args.port}/metrics from {args.dir}. Press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
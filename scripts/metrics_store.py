@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Metrics Store - Daily Counters for the CEO Briefing
+
+Accumulates per-day counters as events happen so briefings and trend reports
+read a few pre-aggregated rows instead of rescanning the vault and logs.
+
+Metrics:
+    tasks_completed   task_planner.py moving a file to Done (plus Done/ catch-up)
+    emails_sent       "Email sent successfully" / "sent reply" log lines
+    linkedin_posts    "BUSINESS_ACTIVITY: LinkedIn post requested:" log lines
+    approvals         requests-approval.py detecting an approval
+    income_cents      accounting_manager.py logging an income transaction
+    expense_cents     accounting_manager.py logging an expense transaction
+
+Counters are fed two ways:
+    - record_event() hooks in the scripts that own the event
+    - catch_up(), which tails the logs from a saved offset and lists Done/,
+      for events written by processes that have no hook (e.g. gmail watcher)
+Events with a natural key (a file name scoped by its mtime or day, see
+task_key() and approval_key()) are de-duplicated, so a hook and the catch-up
+never count the same task or approval twice, while a later file that reuses
+the name still counts.
+
+Storage is SQLite (stdlib) at Logs/metrics.db; override with METRICS_DB_PATH.
+
+Usage:
+    python scripts/metrics_store.py backfill        # Rebuild all counters from raw sources
+    python scripts/metrics_store.py catch-up        # Ingest only what changed since last run
+    python scripts/metrics_store.py trend --weeks 12
+
+    from metrics_store import record_event
+    record_event("tasks_completed", key=task_key("task.md", mtime_ns), detail="task.md")
+"""
+
+import os
+import sys
+import sqlite3
+import argparse
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import briefing_collector
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+
+DB_PATH = Path(os.getenv("METRICS_DB_PATH", str(BASE_DIR / "Logs" / "metrics.db")))
+
+# Raw sources used by catch-up and backfill
+VAULT_LOG_DIR = BASE_DIR / "vault" / "Logs"
+DONE_DIR = BASE_DIR / "AI_Employee_Vault" / "Done"
+ACTION_LOG_FILE = BASE_DIR / "Logs" / "action.log"
+ACCOUNTING_FILE = BASE_DIR / "AI_Employee_Vault" / "Accounting" / "Current_Month.md"
+
+METRICS = (
+    "tasks_completed",
+    "emails_sent",
+    "linkedin_posts",
+    "approvals",
+    "income_cents",
+    "expense_cents",
+)
+
+# briefing_collector metric name -> store metric name
+COLLECTOR_METRICS = {"emails": "emails_sent", "linkedin_posts": "linkedin_posts"}
+
+# requests-approval.py writes this to action.log for every approval
+APPROVAL_MARKER = b"APPROVAL: Detected approval for "
+
+# Example lines kept per metric per day for the briefing's detail sections
+SAMPLES_PER_DAY = 5
+
+# Bumped when event keys change; a store with older keys is rebuilt by backfill
+KEY_FORMAT = "2"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_metrics (
+    day TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, metric)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS metric_samples (
+    day TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    detail TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_samples_metric_day ON metric_samples (metric, day);
+CREATE TABLE IF NOT EXISTS seen_events (
+    metric TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (metric, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS log_cursors (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _day_str(value) -> str:
+    """YYYY-MM-DD for a date, datetime or string"""
+    if isinstance(value, str):
+        return value[:10]
+    return value.isoformat()[:10]
+
+
+def task_key(name: str, mtime_ns: int) -> str:
+    """Dedup key for a file in Done/: its name and mtime"""
+    return f"{name}@{mtime_ns}"
+
+
+def approval_key(name: str, day) -> str:
+    """Dedup key for an approval: the file name and the day it was approved"""
+    return f"{_day_str(day)}/{name}"
+
+
+# =============================================================================
+# METRICS STORE
+# =============================================================================
+
+class MetricsStore:
+    """
+    SQLite-backed daily counters.
+
+    Usage:
+        store = MetricsStore()
+        store.ensure_ready()
+        store.week_totals(week_start, week_end)
+        store.weekly_trend(week_start, weeks=12)
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path or DB_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=10)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def _record(self, metric: str, day: str, value: int, key: Optional[str], detail: Optional[str]) -> bool:
+        """Increment one counter inside the current transaction (no commit)"""
+        if key is not None:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO seen_events (metric, key) VALUES (?, ?)", (metric, key)
+            )
+            if cursor.rowcount == 0:
+                return False
+        self.conn.execute(
+            "INSERT INTO daily_metrics (day, metric, value) VALUES (?, ?, ?) "
+            "ON CONFLICT (day, metric) DO UPDATE SET value = value + excluded.value",
+            (day, metric, value)
+        )
+        if detail:
+            (samples,) = self.conn.execute(
+                "SELECT COUNT(*) FROM metric_samples WHERE metric = ? AND day = ?", (metric, day)
+            ).fetchone()
+            if samples < SAMPLES_PER_DAY:
+                self.conn.execute(
+                    "INSERT INTO metric_samples (day, metric, detail) VALUES (?, ?, ?)", (day, metric, detail)
+                )
+        return True
+
+    def record(self, metric: str, value: int = 1, day=None, key: Optional[str] = None,
+               detail: Optional[str] = None) -> bool:
+        """
+        Add value to a metric's counter for a day.
+
+        Args:
+            metric: One of METRICS
+            value: Amount to add (cents for income/expense)
+            day: date, datetime or YYYY-MM-DD (defaults to today)
+            key: Optional unique event key; repeated keys are ignored
+            detail: Optional example line for the briefing
+
+        Returns:
+            bool: True if counted, False if the key was already seen
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Use one of: {', '.join(METRICS)}")
+        with self.conn:
+            return self._record(metric, _day_str(day or date.today()), int(value), key, detail)
+
+    # -------------------------------------------------------------------------
+    # Ingestion
+    # -------------------------------------------------------------------------
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (key, value)
+        )
+
+    def _ingest_log(self, filepath: Path, allowed: tuple, approvals: bool = False) -> int:
+        """
+        Count new complete lines of a log since its saved cursor.
+
+        Restarts from the top when the file was rotated or truncated.
+
+        Returns:
+            int: Events counted
+        """
+        if not filepath.exists():
+            return 0
+        stat = filepath.stat()
+        path_key = str(filepath.resolve())
+        row = self.conn.execute("SELECT inode, offset FROM log_cursors WHERE path = ?", (path_key,)).fetchone()
+        offset = row[1] if row and row[0] == stat.st_ino and row[1] <= stat.st_size else 0
+        if offset == stat.st_size:
+            return 0
+
+        counted = 0
+        search = briefing_collector.MATCHER.search
+        with open(filepath, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partial line still being written; pick it up next time
+                offset += len(line)
+                day = briefing_collector.slice_log_date(line)
+                if day is None:
+                    continue
+                text = line.decode("utf-8", errors="replace").strip()
+                if approvals:
+                    index = line.find(APPROVAL_MARKER)
+                    if index < 0:
+                        continue
+                    name = line[index + len(APPROVAL_MARKER):].decode("utf-8", errors="replace").strip()
+                    name = name.split(" (by ")[0]
+                    day = day.decode("ascii")
+                    counted += self._record("approvals", day, 1, approval_key(name, day), text)
+                    continue
+                match = search(line)
+                if match is None or match.lastgroup not in allowed:
+                    continue
+                counted += self._record(COLLECTOR_METRICS[match.lastgroup], day.decode("ascii"), 1, None, text)
+
+        self.conn.execute(
+            "INSERT INTO log_cursors (path, inode, offset) VALUES (?, ?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET inode = excluded.inode, offset = excluded.offset",
+            (path_key, stat.st_ino, offset)
+        )
+        return counted
+
+    def _ingest_done_dir(self, done_dir: Path, force: bool = False) -> int:
+        """Count files in Done/ not seen before (skipped while the folder is unchanged)"""
+        if not done_dir.exists():
+            return 0
+        mtime = str(done_dir.stat().st_mtime_ns)
+        meta_key = f"done_dir_mtime:{done_dir.resolve()}"
+        if not force and self._get_meta(meta_key) == mtime:
+            return 0
+        counted = 0
+        for entry in os.scandir(done_dir):
+            if not entry.is_file():
+                continue
+            mtime_ns = entry.stat().st_mtime_ns
+            day = datetime.fromtimestamp(mtime_ns / 1e9).strftime("%Y-%m-%d")
+            counted += self._record("tasks_completed", day, 1, task_key(entry.name, mtime_ns),
+                                    f"{entry.name} (Completed: {day})")
+        self._set_meta(meta_key, mtime)
+        return counted
+
+    def catch_up(self, log_dir=VAULT_LOG_DIR, done_dir=DONE_DIR, action_log=ACTION_LOG_FILE) -> int:
+        """
+        Ingest events written since the last run.
+
+        Cost is proportional to new log bytes plus one Done/ listing when
+        that folder changed, not to the length of history.
+
+        Returns:
+            int: Events counted
+        """
+        counted = 0
+        with self.conn:
+            for filename, allowed in briefing_collector.LOG_SOURCES.items():
+                counted += self._ingest_log(Path(log_dir) / filename, allowed)
+            counted += self._ingest_log(Path(action_log), (), approvals=True)
+            counted += self._ingest_done_dir(Path(done_dir))
+        return counted
+
+    def backfill(self, log_dir=VAULT_LOG_DIR, done_dir=DONE_DIR, action_log=ACTION_LOG_FILE,
+                 accounting_file=ACCOUNTING_FILE) -> Dict[str, int]:
+        """
+        Rebuild every counter from the raw sources.
+
+        Run once on first use, or after hand edits to the ledger.
+
+        Returns:
+            dict: metric -> total after the rebuild
+        """
+        with self.conn:
+            for table in ("daily_metrics", "metric_samples", "seen_events", "log_cursors", "meta"):
+                self.conn.execute(f"DELETE FROM {table}")
+            for filename, allowed in briefing_collector.LOG_SOURCES.items():
+                self._ingest_log(Path(log_dir) / filename, allowed)
+            self._ingest_log(Path(action_log), (), approvals=True)
+            self._ingest_done_dir(Path(done_dir), force=True)
+            self._backfill_ledger(Path(accounting_file))
+            self._set_meta("backfilled_at", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self._set_meta("key_format", KEY_FORMAT)
+        return self.range_totals(date.min, date.max)
+
+    def _backfill_ledger(self, accounting_file: Path) -> None:
+        """Per-day income/expense from the live and archived ledgers"""
+        if not accounting_file.exists():
+            return
+        from ledger_engine import LedgerEngine, to_cents
+        from ledger_archive import LedgerArchive
+
+        archive = LedgerArchive(accounting_file)
+        engines = archive.engines_for_range(date.min, date.max) + [LedgerEngine(accounting_file)]
+        for engine in engines:
+            for t in engine.transactions_between(date.min, date.max):
+                if t["type"] in ("income", "expense"):
+                    self._record(f"{t['type']}_cents", _day_str(t["date"]), to_cents(t["amount"]), None, None)
+
+    def ensure_ready(self, **sources) -> None:
+        """Backfill on first use (or when event keys changed format), otherwise catch up"""
+        if self._get_meta("backfilled_at") is None or self._get_meta("key_format") != KEY_FORMAT:
+            self.backfill(**sources)
+        else:
+            sources.pop("accounting_file", None)
+            self.catch_up(**sources)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def range_totals(self, start, end) -> Dict[str, int]:
+        """Sum of every metric over start..end inclusive"""
+        totals = {metric: 0 for metric in METRICS}
+        rows = self.conn.execute(
+            "SELECT metric, SUM(value) FROM daily_metrics WHERE day BETWEEN ? AND ? GROUP BY metric",
+            (_day_str(start), _day_str(end))
+        )
+        for metric, value in rows:
+            totals[metric] = value
+        return totals
+
+    def week_totals(self, week_start, week_end) -> Dict[str, int]:
+        """Alias of range_totals() for one reporting week"""
+        return self.range_totals(week_start, week_end)
+
+    def samples(self, metric: str, start, end, limit: int = SAMPLES_PER_DAY) -> List[str]:
+        """Example lines recorded for a metric in start..end, oldest first"""
+        rows = self.conn.execute(
+            "SELECT detail FROM metric_samples WHERE metric = ? AND day BETWEEN ? AND ? "
+            "ORDER BY day, rowid LIMIT ?",
+            (metric, _day_str(start), _day_str(end), limit)
+        )
+        return [detail for (detail,) in rows]
+
+    def weekly_trend(self, last_week_start, weeks: int = 4) -> List[Dict[str, Any]]:
+        """
+        Weekly totals for the `weeks` weeks ending with the week starting last_week_start.
+
+        One grouped query regardless of how many weeks are requested.
+
+        Returns:
+            list of dicts (week_start, week_end, metrics), oldest first
+        """
+        if isinstance(last_week_start, str):
+            last_week_start = datetime.strptime(last_week_start, "%Y-%m-%d").date()
+        if isinstance(last_week_start, datetime):
+            last_week_start = last_week_start.date()
+        first_week_start = last_week_start - timedelta(weeks=weeks - 1)
+        last_day = last_week_start + timedelta(days=6)
+
+        result = []
+        for index in range(weeks):
+            week_start = first_week_start + timedelta(weeks=index)
+            result.append({
+                "week_start": week_start.strftime("%Y-%m-%d"),
+                "week_end": (week_start + timedelta(days=6)).strftime("%Y-%m-%d"),
+                "metrics": {metric: 0 for metric in METRICS}
+            })
+
+        rows = self.conn.execute(
+            "SELECT CAST((julianday(day) - julianday(?)) / 7 AS INTEGER) AS bucket, metric, SUM(value) "
+            "FROM daily_metrics WHERE day BETWEEN ? AND ? GROUP BY bucket, metric",
+            (_day_str(first_week_start), _day_str(first_week_start), _day_str(last_day))
+        )
+        for bucket, metric, value in rows:
+            if 0 <= bucket < weeks and metric in METRICS:
+                result[bucket]["metrics"][metric] = value
+        return result
+
+
+# =============================================================================
+# HOOK HELPERS
+# =============================================================================
+
+# SQLite connections may not be shared across threads, so keep one per thread
+_thread_local = threading.local()
+
+
+def get_store() -> MetricsStore:
+    """Store at DB_PATH for the calling thread"""
+    store = getattr(_thread_local, "store", None)
+    if store is None:
+        store = _thread_local.store = MetricsStore()
+    return store
+
+
+def record_event(metric: str, value: int = 1, day=None, key: Optional[str] = None,
+                 detail: Optional[str] = None) -> bool:
+    """
+    Record an event from a hook. Never raises: metrics must not break the caller.
+
+    Returns:
+        bool: True if counted
+    """
+    try:
+        return get_store().record(metric, value, day, key, detail)
+    except Exception as e:
+        print(f"[METRICS] Failed to record {metric}: {e}", file=sys.stderr)
+        return False
+
+
+# =============================================================================
+# CLI ENTRY POINT
+# =============================================================================
+
+def main():
+    """Main CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="Metrics Store - Daily counters for the CEO briefing"
+    )
+    parser.add_argument("action", choices=["backfill", "catch-up", "trend"], help="Action to perform")
+    parser.add_argument("--weeks", type=int, default=4, help="Weeks to show for 'trend' (default: 4)")
+
+    args = parser.parse_args()
+    store = get_store()
+
+    if args.action == "backfill":
+        totals = store.backfill()
+        print(f"Backfilled {store.db_path}")
+        for metric, value in totals.items():
+            print(f"  {metric}: {value}")
+    elif args.action == "catch-up":
+        print(f"Ingested {store.catch_up()} new events")
+    else:
+        store.ensure_ready()
+        today = date.today()
+        for week in store.weekly_trend(today - timedelta(days=today.weekday()), args.weeks):
+            values = ", ".join(f"{metric}={value}" for metric, value in week["metrics"].items())
+            print(f"{week['week_start']}: {values}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Profiling - Shared --profile Facility for CLI Entry Points
+
+Wraps a script's main() in a profiler without editing its code paths:
+
+    python scripts/task_planner.py --profile
+    python scripts/run_ai_employee.py --once --profile --profile-mode sample --profile-out cycle.folded
+    python scripts/run_ai_employee.py --daemon --profile --profile-cycles 3
+
+Modes:
+    cprofile  Deterministic cProfile; writes a pstats file
+              (python -m pstats FILE, snakeviz FILE)
+    sample    Low-overhead stack sampler; writes collapsed stacks, one
+              "frame;frame;leaf count" line per stack (flamegraph.pl,
+              speedscope, https://www.speedscope.app)
+
+With --profile-cycles N only the first N scheduler/watch cycles are
+profiled, after which the profile is written and the daemon keeps running
+unprofiled, so hot paths can be measured on a production instance.
+Profiles default to Logs/profiles/<component>_<timestamp>.prof|.folded.
+
+Usage:
+    from profiling import add_profile_arguments, profile_cycle, profile_main
+
+    parser = argparse.ArgumentParser()
+    add_profile_arguments(parser)       # only for --help; profile_main strips them
+
+    while running:
+        with profile_cycle():
+            run_cycle()
+
+    if __name__ == "__main__":
+        profile_main(main, "scheduler")
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Any, Callable, Iterator, Tuple
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+
+PROFILES_DIR = Path(os.environ.get("PROFILE_DIR", BASE_DIR / "Logs" / "profiles"))
+
+MODES = ("cprofile", "sample")
+EXTENSIONS = {"cprofile": ".prof", "sample": ".folded"}
+
+# Seconds between stack samples in sample mode
+SAMPLE_INTERVAL = 0.005
+
+# Rows printed in the summary after a profile is written
+REPORT_LIMIT = 15
+
+
+# =============================================================================
+# SAMPLING PROFILER
+# =============================================================================
+
+def _frame_label(code) -> str:
+    return f"{Path(code.co_filename).stem}:{code.co_name}"
+
+
+class _Sampler(threading.Thread):
+    """Periodically records the call stack of one thread as collapsed stacks"""
+
+    def __init__(self, target_ident: int, interval: float, counts: Counter):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.target_ident = target_ident
+        self.interval = interval
+        self.counts = counts
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_ident)
+            stack = []
+            while frame is not None:
+                if frame.f_code.co_filename != __file__:
+                    stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+# =============================================================================
+# PROFILER
+# =============================================================================
+
+class Profiler:
+    """
+    A cProfile or sampling profiler that can be enabled and disabled
+    repeatedly (results accumulate) and saved once at the end.
+    """
+
+    def __init__(self, mode: str = "cprofile", out: Optional[Path] = None,
+                 component: str = "profile", interval: float = SAMPLE_INTERVAL):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode '{mode}' (expected one of {MODES})")
+        self.mode = mode
+        self.component = component
+        self.interval = interval
+        self.out = Path(out) if out else default_output(component, mode)
+        self.samples: Counter = Counter()
+        self.enabled_seconds = 0.0
+        self._sampler: Optional[_Sampler] = None
+        self._started = 0.0
+        self._profile = None
+        if mode == "cprofile":
+            import cProfile
+            self._profile = cProfile.Profile()
+
+    def enable(self) -> None:
+        """Start (or resume) profiling the calling thread"""
+        self._started = time.perf_counter()
+        if self._profile is not None:
+            self._profile.enable()
+        else:
+            self._sampler = _Sampler(threading.get_ident(), self.interval, self.samples)
+            self._sampler.start()
+
+    def disable(self) -> None:
+        """Pause profiling"""
+        if self._profile is not None:
+            self._profile.disable()
+        elif self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+        self.enabled_seconds += time.perf_counter() - self._started
+
+    def save(self) -> Path:
+        """
+        Write the profile: a pstats dump in cprofile mode, collapsed stacks
+        in sample mode.
+
+        Returns:
+            Path: The written file
+        """
+        self.out.parent.mkdir(parents=True, exist_ok=True)
+        if self._profile is not None:
+            self._profile.dump_stats(str(self.out))
+        else:
+            with open(self.out, "w", encoding="utf-8") as f:
+                for stack, count in sorted(self.samples.items()):
+                    f.write(f"{stack} {count}\n")
+        return self.out
+
+    def report(self, limit: int = REPORT_LIMIT) -> str:
+        """Short text summary of the hottest functions"""
+        if self._profile is not None:
+            import pstats
+            stream = io.StringIO()
+            stats = pstats.Stats(self._profile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(limit)
+            return stream.getvalue()
+
+        total = sum(self.samples.values())
+        if not total:
+            return "No samples collected\n"
+        own: Counter = Counter()
+        for stack, count in self.samples.items():
+            own[stack.rsplit(";", 1)[-1]] += count
+        lines = [f"{total} samples every {self.interval * 1000:g} ms (self time)"]
+        for label, count in own.most_common(limit):
+            lines.append(f"{count / total:>7.1%}  {count:>6}  {label}")
+        return "\n".join(lines) + "\n"
+
+
+def default_output(component: str, mode: str, directory: Path = PROFILES_DIR) -> Path:
+    """Logs/profiles/<component>_<timestamp>.prof|.folded"""
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return Path(directory) / f"{component}_{stamp}{EXTENSIONS[mode]}"
+
+
+# =============================================================================
+# CYCLE PROFILING
+# =============================================================================
+
+class CycleProfiler:
+    """Profiles only the first N cycles of a long-running loop"""
+
+    def __init__(self, profiler: Profiler, cycles: int):
+        self.profiler = profiler
+        self.remaining = cycles
+        self.profiled = 0
+        self.saved: Optional[Path] = None
+
+    @contextmanager
+    def cycle(self) -> Iterator[None]:
+        """Profile this cycle if the budget allows; save after the last one"""
+        if self.remaining <= 0:
+            yield
+            return
+        self.profiler.enable()
+        try:
+            yield
+        finally:
+            self.profiler.disable()
+            self.remaining -= 1
+            self.profiled += 1
+            if self.remaining == 0:
+                self.finish()
+
+    def finish(self) -> Optional[Path]:
+        """Write the profile if any cycle ran and it was not written yet"""
+        if self.saved is None and self.profiled:
+            self.saved = _save_and_report(self.profiler, f"{self.profiled} cycle(s)")
+        return self.saved
+
+
+_cycle_profiler: Optional[CycleProfiler] = None
+
+
+@contextmanager
+def profile_cycle() -> Iterator[None]:
+    """
+    Mark one iteration of a daemon loop. A no-op unless the process was
+    started with --profile-cycles N.
+    """
+    if _cycle_profiler is None:
+        yield
+        return
+    with _cycle_profiler.cycle():
+        yield
+
+
+# =============================================================================
+# CLI INTEGRATION
+# =============================================================================
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """
+    Register --profile, --profile-mode, --profile-out and --profile-cycles
+    on a parser.
+
+    Args:
+        parser: Parser to extend (also used on its own by parse_profile_args)
+
+    Returns:
+        ArgumentParser: The same parser
+    """
+    group = parser.add_argument_group("profiling")
+    group.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile this run and write the result to Logs/profiles/"
+    )
+    group.add_argument(
+        "--profile-mode",
+        choices=MODES,
+        default="cprofile",
+        help="cprofile: pstats file (default); sample: collapsed stacks for flame graphs"
+    )
+    group.add_argument(
+        "--profile-out",
+        type=str,
+        help="Profile output file (default: Logs/profiles/<component>_<timestamp>.prof|.folded)"
+    )
+    group.add_argument(
+        "--profile-cycles",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Daemon/watch mode: profile only the first N cycles, then keep running"
+    )
+    return parser
+
+
+def parse_profile_args(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    """
+    Split the profiling options from the rest of a command line.
+
+    Args:
+        argv: Arguments without the program name
+
+    Returns:
+        (profile options, remaining arguments)
+    """
+    parser = add_profile_arguments(argparse.ArgumentParser(add_help=False))
+    return parser.parse_known_args(argv)
+
+
+def _save_and_report(profiler: Profiler, scope: str) -> Optional[Path]:
+    try:
+        path = profiler.save()
+    except OSError as e:
+        print(f"[PROFILE] Could not write profile: {e}", file=sys.stderr)
+        return None
+    print(f"\n[PROFILE] {profiler.mode} profile of {scope} "
+          f"({profiler.enabled_seconds:.2f}s) written to {path}", file=sys.stderr)
+    print(profiler.report(), file=sys.stderr)
+    return path
+
+
+def profile_main(main: Callable[[], Any], component: str) -> Any:
+    """
+    Run a CLI entry point, profiling it when --profile was given.
+
+    The profiling options are removed from sys.argv before main() parses
+    its own arguments. Without --profile-cycles the whole run is profiled;
+    with it, only loops wrapped in profile_cycle() are.
+
+    Args:
+        main: The script's main function
+        component: Name used for the default output file
+
+    Returns:
+        Whatever main() returns (SystemExit propagates after saving)
+    """
+    global _cycle_profiler
+
+    options, remaining = parse_profile_args(sys.argv[1:])
+    sys.argv[1:] = remaining
+    if not (options.profile or options.profile_cycles > 0):
+        return main()
+
+    profiler = Profiler(options.profile_mode, options.profile_out, component)
+    if options.profile_cycles > 0:
+        _cycle_profiler = CycleProfiler(profiler, options.profile_cycles)
+        try:
+            return main()
+        finally:
+            _cycle_profiler.finish()
+            _cycle_profiler = None
+
+    profiler.enable()
+    try:
+        return main()
+    finally:
+        profiler.disable()
+        _save_and_report(profiler, "the run")
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Report Writer - Streaming Multi-Format Reports
+
+Streams report sections to Markdown, HTML and JSON sinks at the same time,
+so a report is written once as it is built instead of being assembled as a
+list of Markdown lines and converted afterwards. Dashboards read the JSON
+(structured blocks plus raw data) without re-parsing Markdown.
+
+Reports are versioned (e.g. by ISO week); each version keeps its own files,
+so older reports are never overwritten:
+
+    AI_Employee_Vault/Reports/CEO_Weekly/
+        2026-W42.md / 2026-W42.html / 2026-W42.json
+        index.json                        # every version and its files
+    AI_Employee_Vault/Reports/CEO_Weekly.md (.html, .json)  # copy of the latest
+
+Each sink writes to a ".partial" file that is renamed into place only when
+the whole report succeeded, so readers never see a half-written report.
+
+Usage:
+    with open_report("AI_Employee_Vault/Reports/CEO_Weekly", "2026-W42",
+                     latest_base="AI_Employee_Vault/Reports/CEO_Weekly") as writer:
+        writer.begin("CEO Weekly Briefing Report", {"period": "..."})
+        writer.section("Key Metrics Summary")
+        writer.key_values([("Tasks Completed", 3)])
+        writer.data("metrics", {"tasks_completed": 3})
+"""
+
+import os
+import re
+import json
+import html
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+FORMATS = ("md", "html", "json")
+PARTIAL_SUFFIX = ".partial"
+INDEX_FILE_NAME = "index.json"
+
+HTML_STYLE = (
+    "body{font-family:-apple-system,Segoe UI,Roboto,sans-serif;max-width:960px;margin:2em auto;padding:0 1em;color:#222}"
+    "table{border-collapse:collapse;margin:0.5em 0}th,td{border:1px solid #ccc;padding:4px 8px}"
+    "th{background:#f4f4f4}td.num{text-align:right}hr{margin:2em 0}"
+)
+
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_NUMERIC = re.compile(r"^[-+]?[$]?[\d,]*\.?\d+%?$")
+
+
+def _strip_bullet(item: str) -> str:
+    """Accept items that already carry a Markdown list marker"""
+    item = str(item)
+    return item[2:] if item.startswith("- ") else item
+
+
+def _inline_html(text: str) -> str:
+    """Escape text and render **bold** spans"""
+    return _BOLD.sub(r"<strong>\1</strong>", html.escape(str(text)))
+
+
+def _plain(text: str) -> str:
+    """Text without Markdown emphasis, for JSON consumers"""
+    return _BOLD.sub(r"\1", str(text))
+
+
+# =============================================================================
+# SINKS
+# =============================================================================
+
+class ReportSink:
+    """Base sink: writes to <path>.partial and renames on finish()"""
+
+    extension = ""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + PARTIAL_SUFFIX)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.f = open(self.partial_path, "w", encoding="utf-8")
+
+    def begin(self, title: str, meta: Dict[str, Any]) -> None: ...
+    def section(self, title: str, level: int) -> None: ...
+    def paragraph(self, text: str) -> None: ...
+    def bullets(self, items: List[str]) -> None: ...
+    def key_values(self, pairs: List[Tuple[str, Any]]) -> None: ...
+    def table(self, headers: List[str], rows: List[List[Any]]) -> None: ...
+    def rule(self) -> None: ...
+    def data(self, key: str, value: Any) -> None: ...
+    def end(self) -> None: ...
+
+    def finish(self) -> Path:
+        self.f.close()
+        os.replace(self.partial_path, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        self.f.close()
+        try:
+            os.remove(self.partial_path)
+        except OSError:
+            pass
+
+
+class MarkdownSink(ReportSink):
+    extension = "md"
+
+    def begin(self, title, meta):
+        self.f.write(f"# {title}\n\n")
+        for label, value in meta.items():
+            self.f.write(f"**{label}:** {value}\n\n")
+
+    def section(self, title, level):
+        self.f.write(f"{'#' * level} {title}\n\n")
+
+    def paragraph(self, text):
+        self.f.write(f"{text}\n\n")
+
+    def bullets(self, items):
+        for item in items:
+            self.f.write(f"- {item}\n")
+        self.f.write("\n")
+
+    def key_values(self, pairs):
+        self.bullets([f"**{label}:** {value}" for label, value in pairs])
+
+    def table(self, headers, rows):
+        self.f.write("| " + " | ".join(headers) + " |\n")
+        self.f.write("|" + "---|" * len(headers) + "\n")
+        for row in rows:
+            self.f.write("| " + " | ".join(str(cell) for cell in row) + " |\n")
+        self.f.write("\n")
+
+    def rule(self):
+        self.f.write("---\n\n")
+
+
+class HtmlSink(ReportSink):
+    extension = "html"
+
+    def begin(self, title, meta):
+        self.f.write("<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n")
+        self.f.write(f"<title>{html.escape(title)}</title>\n<style>{HTML_STYLE}</style>\n</head>\n<body>\n")
+        self.f.write(f"<h1>{html.escape(title)}</h1>\n")
+        for label, value in meta.items():
+            self.f.write(f"<p><strong>{html.escape(label)}:</strong> {_inline_html(value)}</p>\n")
+
+    def section(self, title, level):
+        level = min(max(level, 1), 6)
+        self.f.write(f"<h{level}>{_inline_html(title)}</h{level}>\n")
+
+    def paragraph(self, text):
+        self.f.write(f"<p>{_inline_html(text)}</p>\n")
+
+    def bullets(self, items):
+        self.f.write("<ul>\n")
+        for item in items:
+            self.f.write(f"<li>{_inline_html(item)}</li>\n")
+        self.f.write("</ul>\n")
+
+    def key_values(self, pairs):
+        self.bullets([f"**{label}:** {value}" for label, value in pairs])
+
+    def table(self, headers, rows):
+        self.f.write("<table>\n<tr>" + "".join(f"<th>{_inline_html(h)}</th>" for h in headers) + "</tr>\n")
+        for row in rows:
+            cells = []
+            for cell in row:
+                css = ' class="num"' if _NUMERIC.match(str(cell)) else ""
+                cells.append(f"<td{css}>{_inline_html(cell)}</td>")
+            self.f.write("<tr>" + "".join(cells) + "</tr>\n")
+        self.f.write("</table>\n")
+
+    def rule(self):
+        self.f.write("<hr>\n")
+
+    def end(self):
+        self.f.write("</body>\n</html>\n")
+
+
+class JsonSink(ReportSink):
+    """
+    Streams {"title", "meta", "sections": [...], "data": {...}}.
+
+    Each section is written as soon as the next one starts; data values
+    are small and written at the end.
+    """
+
+    extension = "json"
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.current: Optional[Dict[str, Any]] = None
+        self.sections_written = 0
+        self.values: Dict[str, Any] = {}
+
+    def _flush_section(self):
+        if self.current is None:
+            return
+        self.f.write(",\n" if self.sections_written else "\n")
+        self.f.write(json.dumps(self.current, default=str))
+        self.sections_written += 1
+        self.current = None
+
+    def _block(self, block: Dict[str, Any]):
+        if self.current is None:
+            self.current = {"title": "", "level": 2, "blocks": []}
+        self.current["blocks"].append(block)
+
+    def begin(self, title, meta):
+        self.f.write('{"title": ' + json.dumps(title) + ', "meta": ' + json.dumps(meta, default=str))
+        self.f.write(', "sections": [')
+
+    def section(self, title, level):
+        self._flush_section()
+        self.current = {"title": _plain(title), "level": level, "blocks": []}
+
+    def paragraph(self, text):
+        self._block({"type": "paragraph", "text": _plain(text)})
+
+    def bullets(self, items):
+        self._block({"type": "bullets", "items": [_plain(item) for item in items]})
+
+    def key_values(self, pairs):
+        self._block({"type": "key_values", "items": [{"label": label, "value": value} for label, value in pairs]})
+
+    def table(self, headers, rows):
+        self._block({"type": "table", "headers": [_plain(h) for h in headers],
+                     "rows": [[_plain(cell) for cell in row] for row in rows]})
+
+    def data(self, key, value):
+        self.values[key] = value
+
+    def end(self):
+        self._flush_section()
+        self.f.write('\n], "data": ' + json.dumps(self.values, default=str, indent=2) + "}\n")
+
+
+SINK_TYPES = {sink.extension: sink for sink in (MarkdownSink, HtmlSink, JsonSink)}
+
+
+# =============================================================================
+# REPORT WRITER
+# =============================================================================
+
+class ReportWriter:
+    """
+    Fans report events out to several sinks as they happen.
+
+    Use as a context manager: on success every sink is finalized, copied to
+    the "latest" aliases and recorded in index.json; on error the partial
+    files are removed and the previous reports stay untouched.
+    """
+
+    def __init__(self, sinks: List[ReportSink], archive_dir: Optional[Path] = None,
+                 version: Optional[str] = None, latest_base: Optional[Path] = None):
+        self.sinks = sinks
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self.version = version
+        self.latest_base = Path(latest_base) if latest_base else None
+        self.title = ""
+        self.files: Dict[str, str] = {}
+
+    def _emit(self, method: str, *args) -> None:
+        for sink in self.sinks:
+            getattr(sink, method)(*args)
+
+    # Content -----------------------------------------------------------------
+
+    def begin(self, title: str, meta: Optional[Dict[str, Any]] = None) -> None:
+        self.title = title
+        self._emit("begin", title, meta or {})
+
+    def section(self, title: str, level: int = 2) -> None:
+        self._emit("section", title, level)
+
+    def paragraph(self, text: str) -> None:
+        self._emit("paragraph", text)
+
+    def bullets(self, items: Iterable[str], empty: Optional[str] = None) -> None:
+        """Bullet list; `empty` is shown when there are no items"""
+        items = [_strip_bullet(item) for item in items]
+        if not items and empty:
+            items = [empty]
+        self._emit("bullets", items)
+
+    def key_values(self, pairs: List[Tuple[str, Any]]) -> None:
+        self._emit("key_values", list(pairs))
+
+    def table(self, headers: List[str], rows: List[List[Any]]) -> None:
+        self._emit("table", list(headers), [list(row) for row in rows])
+
+    def rule(self) -> None:
+        self._emit("rule")
+
+    def data(self, key: str, value: Any) -> None:
+        """Structured value for machine readers (JSON only)"""
+        self._emit("data", key, value)
+
+    # Lifecycle ---------------------------------------------------------------
+
+    def close(self) -> Dict[str, str]:
+        """Finalize all sinks; returns format -> path of the versioned files"""
+        self._emit("end")
+        for sink in self.sinks:
+            self.files[sink.extension] = str(sink.finish())
+        is_latest = True
+        if self.archive_dir is not None and self.version:
+            is_latest = _update_index(self.archive_dir, self.version, self.title, self.files) == self.version
+        # Regenerating an older version must not replace the latest aliases
+        if self.latest_base is not None and is_latest:
+            for extension, path in self.files.items():
+                _copy_atomic(Path(path), self.latest_base.with_suffix(f".{extension}"))
+        return self.files
+
+    def abort(self) -> None:
+        for sink in self.sinks:
+            sink.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+def _copy_atomic(source: Path, target: Path) -> None:
+    tmp_path = target.with_name(target.name + PARTIAL_SUFFIX)
+    shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
+def read_index(archive_dir) -> Dict[str, Any]:
+    """index.json of a report archive (empty structure if missing)"""
+    try:
+        with open(Path(archive_dir) / INDEX_FILE_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"latest": None, "reports": {}}
+
+
+def _update_index(archive_dir: Path, version: str, title: str, files: Dict[str, str]) -> str:
+    """Record a version in index.json; returns the latest version"""
+    index = read_index(archive_dir)
+    index["reports"][version] = {
+        "title": title,
+        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "files": files
+    }
+    index["reports"] = dict(sorted(index["reports"].items()))
+    index["latest"] = max(index["reports"])
+    tmp_path = archive_dir / (INDEX_FILE_NAME + PARTIAL_SUFFIX)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, archive_dir / INDEX_FILE_NAME)
+    return index["latest"]
+
+
+def iso_week_key(value) -> str:
+    """YYYY-Www version key for a date or datetime"""
+    year, week, _ = value.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def open_report(archive_dir, version: str, latest_base=None, formats=FORMATS) -> ReportWriter:
+    """
+    Open a versioned report, e.g. open_report("Reports/CEO_Weekly", "2026-W42", "Reports/CEO_Weekly").
+
+    Args:
+        archive_dir: Directory holding every version
+        version: Version key; files are <archive_dir>/<version>.<format>
+        latest_base: Optional path (without extension) for copies of the latest report
+        formats: Any of "md", "html", "json"
+    """
+    archive_dir = Path(archive_dir)
+    unknown = [fmt for fmt in formats if fmt not in SINK_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown report format(s) {unknown}. Use any of: {', '.join(FORMATS)}")
+    sinks = [SINK_TYPES[fmt](archive_dir / f"{version}.{fmt}") for fmt in formats]
+    return ReportWriter(sinks, archive_dir, version, latest_base)
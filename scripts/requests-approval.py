@@ -32,6 +32,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 
+from metrics_store import record_event, approval_key
+from metrics_registry import counter, gauge, histogram, write_textfile
+from profiling import add_profile_arguments, profile_cycle, profile_main
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -303,7 +307,8 @@ def update_file_status(filepath: Path, new_status: str, dry_run: bool = False) -
                         new_fm_lines.append(line)
                 
                 if status_updated:
-                    new_content = f"---\n{'\n'.join(new_fm_lines)}\n---{parts[2]}"
+                    fm_text = "\n".join(new_fm_lines)
+                    new_content = f"---\n{fm_text}\n---{parts[2]}"
                     
                     if not dry_run:
                         filepath.write_text(new_content, encoding='utf-8')
@@ -319,10 +324,21 @@ def update_file_status(filepath: Path, new_status: str, dry_run: bool = False) -
         return False
 
 
+# =============================================================================
+# METRICS
+# =============================================================================
+
+APPROVAL_DECISIONS = counter("approval_decisions_total", "Approval requests resolved, by outcome", ["outcome"])
+APPROVAL_ERRORS = counter("approval_errors_total", "Errors while checking approval files")
+APPROVALS_PENDING = gauge("approvals_pending", "Approval files awaiting a human decision")
+APPROVAL_SCAN_SECONDS = histogram("approval_scan_seconds", "Time to scan Needs_Action for approvals")
+
+
 # =============================================================================
 # APPROVAL CHECKER CLASS
 # =============================================================================
 
+
 class ApprovalChecker:
     """
     Human Approval Checker - Monitors and processes approval requests.
@@ -365,11 +381,13 @@ class ApprovalChecker:
             log_action("Needs_Action folder does not exist")
             return self.stats
         
-        # Get all files in Needs_Action
-        all_files = [f for f in NEEDS_ACTION_DIR.iterdir() if f.is_file()]
-        
-        # Filter for pending approval files
-        pending_files = [f for f in all_files if is_pending_approval(f)]
+        with APPROVAL_SCAN_SECONDS.time():
+            # Get all files in Needs_Action
+            all_files = [f for f in NEEDS_ACTION_DIR.iterdir() if f.is_file()]
+            
+            # Filter for pending approval files
+            pending_files = [f for f in all_files if is_pending_approval(f)]
+        APPROVALS_PENDING.set(len(pending_files))
         
         if not pending_files:
             print("[INFO] No pending approval files found")
@@ -416,9 +434,14 @@ class ApprovalChecker:
             if status == 'approved':
                 # Human approved!
                 self.stats['approved'] += 1
+                APPROVAL_DECISIONS.labels("approved").inc()
                 reviewer_info = f" (by {reviewer})" if reviewer else ""
                 print(f"[APPROVED] {filename}{reviewer_info}")
                 log_action(f"Detected approval for {filename}{reviewer_info}")
+                if not self.dry_run:
+                    now = datetime.now()
+                    record_event("approvals", key=approval_key(filename, now),
+                                 detail=f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] APPROVAL: Detected approval for {filename}{reviewer_info}")
                 
                 # Rename file
                 if rename_file_with_status(filepath, 'approved', self.dry_run):
@@ -428,6 +451,7 @@ class ApprovalChecker:
             elif status == 'rejected':
                 # Human rejected!
                 self.stats['rejected'] += 1
+                APPROVAL_DECISIONS.labels("rejected").inc()
                 reviewer_info = f" (by {reviewer})" if reviewer else ""
                 print(f"[REJECTED] {filename}{reviewer_info}")
                 log_action(f"Detected rejection for {filename}{reviewer_info}")
@@ -445,6 +469,7 @@ class ApprovalChecker:
         except Exception as e:
             log_error(f"Error checking '{filename}': {e}")
             self.stats['errors'] += 1
+            APPROVAL_ERRORS.inc()
             print(f"[ERROR] {filename}: {e}")
             return False
     
@@ -467,6 +492,7 @@ class ApprovalChecker:
             if elapsed_seconds >= self.timeout_seconds:
                 # Timeout elapsed!
                 self.stats['timed_out'] += 1
+                APPROVAL_DECISIONS.labels("timeout").inc()
                 self.stats['pending'] -= 1  # Remove from pending count
                 
                 timeout_hours = elapsed_seconds / 3600
@@ -486,6 +512,7 @@ class ApprovalChecker:
         except Exception as e:
             log_error(f"Error checking timeout for '{filepath.name}': {e}")
             self.stats['errors'] += 1
+            APPROVAL_ERRORS.inc()
             return False
     
     def _mark_processed(self, filename: str) -> None:
@@ -541,8 +568,10 @@ Press Ctrl+C to stop watching
     
     try:
         while True:
-            checker.check_all()
-            checker.print_summary()
+            with profile_cycle():
+                checker.check_all()
+                checker.print_summary()
+                write_textfile("approvals")
             time.sleep(interval)
     except KeyboardInterrupt:
         print("\n\nWatch mode stopped by user.")
@@ -585,6 +614,7 @@ def main():
         default=60,
         help="Check interval in seconds for watch mode (default: 60)"
     )
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
@@ -611,6 +641,7 @@ def main():
     
     # Print summary
     checker.print_summary()
+    write_textfile("approvals")
     
     # Exit with error code if there were errors
     if checker.stats['errors'] > 0:
@@ -622,4 +653,4 @@ def main():
 # =============================================================================
 
 if __name__ == "__main__":
-    main()
+    profile_main(main, "approvals")
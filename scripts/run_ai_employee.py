@@ -30,6 +30,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from health_monitor import get_health, describe_probe
+from vault_events import ensure_event_server, publish_status, release_event_server
+from dashboard_data import COUNTED_FOLDERS, scan_files
+from metrics_registry import counter, gauge, histogram, write_textfile
+from tracing import span, trace_cycle
+from profiling import add_profile_arguments, profile_cycle, profile_main
+from worker_pool import ensure_pool, release_pool, run_script
+
 # Cross-platform lock file support
 try:
     import fcntl  # Unix/Linux/Mac
@@ -319,8 +327,9 @@ def run_vault_watcher() -> Dict[str, Any]:
                 # Create task file for new inbox file (simplified watcher logic)
                 from watch_inbox import create_task_file, save_processed_file
                 
-                create_task_file(filename)
-                save_processed_file(filename, processed_files)
+                with span("watch_file", cat="file", file=filename):
+                    create_task_file(filename)
+                    save_processed_file(filename, processed_files)
                 stats["processed"] += 1
                 
             except Exception as e:
@@ -406,7 +415,9 @@ def run_ralph_wiggum() -> Dict[str, Any]:
         }
 
         for task_file in pending_tasks[:5]:  # Limit to 5 tasks per cycle
-            result = loop.run_loop(task_file)
+            with span("ralph_task", cat="file", file=task_file.name) as attrs:
+                result = loop.run_loop(task_file)
+                attrs["status"] = result.get("status")
             stats["tasks_processed"] += 1
 
             if result.get("completed"):
@@ -512,13 +523,9 @@ def run_ceo_briefing() -> Dict[str, Any]:
             write_log("CEO briefing script not found")
             return {"generated": False, "reason": "Script not found"}
 
-        result = subprocess.run(
-            [sys.executable, str(briefing_script)],
-            capture_output=True,
-            text=True,
-            timeout=120,
-            cwd=str(BASE_DIR)
-        )
+        with span("subprocess", cat="subprocess", script=briefing_script.name) as attrs:
+            result = run_script(briefing_script, timeout=120, cwd=BASE_DIR)
+            attrs["returncode"] = result.returncode
 
         if result.returncode == 0:
             write_log(f"CEO briefing generated successfully")
@@ -556,14 +563,10 @@ def run_gmail_watcher() -> Dict[str, Any]:
             write_log("Gmail-watcher script not found")
             return {"emails_checked": 0, "tasks_created": 0, "errors": 0}
 
-        # Run gmail watcher as subprocess (non-interactive)
-        result = subprocess.run(
-            [sys.executable, str(gmail_watcher_script)],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=str(gmail_watcher_script.parent)
-        )
+        # Run gmail watcher non-interactively (in a warm pool worker when available)
+        with span("subprocess", cat="subprocess", script=gmail_watcher_script.name) as attrs:
+            result = run_script(gmail_watcher_script, timeout=60, cwd=gmail_watcher_script.parent)
+            attrs["returncode"] = result.returncode
 
         # Parse output for stats
         emails_checked = 0
@@ -670,6 +673,30 @@ def print_status():
 """
     print(banner)
 
+    health = get_health()
+    print(f"  System Health: {health['status']} (checked {health['checked_at']})")
+    for probe in health["probes"]:
+        print(f"    [{probe['status']:<8}] {describe_probe(probe)}")
+    print()
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+CYCLES = counter("ai_employee_cycles_total", "Completed scheduler cycles")
+CYCLE_SECONDS = histogram("ai_employee_cycle_duration_seconds", "Duration of a full scheduler cycle")
+STAGE_SECONDS = histogram("ai_employee_stage_duration_seconds", "Duration of each scheduler stage", ["stage"])
+STAGE_ERRORS = counter("ai_employee_stage_errors_total", "Scheduler stages that reported errors", ["stage"])
+QUEUE_DEPTH = gauge("ai_employee_queue_depth", "Files waiting in each vault folder", ["folder"])
+
+
+def update_queue_depths() -> None:
+    """Set the queue depth gauges from the vault folders"""
+    vault_dir = BASE_DIR / "AI_Employee_Vault"
+    for folder, suffix in COUNTED_FOLDERS.items():
+        QUEUE_DEPTH.labels(folder).set(len(scan_files(vault_dir / folder, suffix)))
+
 
 # =============================================================================
 # SCHEDULER MAIN LOOP
@@ -684,9 +711,43 @@ class Scheduler:
         self.interval = interval
         self.running = False
         self.cycle_count = 0
-        
+        self.last_cycle_at: Optional[str] = None
+
+    def publish(self, state: str, **fields) -> None:
+        """Publish scheduler state for the live dashboard (see vault_events.py)"""
+        publish_status("scheduler", state, cycle=self.cycle_count, interval=self.interval,
+                       last_cycle_at=self.last_cycle_at, **fields)
+
+    def run_stage(self, index: int, name: str, func) -> Dict[str, Any]:
+        """
+        Run one cycle stage: publish it as the current stage, time it and
+        count it as failed if its stats report errors. The stage is traced
+        as a span carrying its numeric stats, so swallowed errors still
+        show up in Logs/traces/.
+
+        Args:
+            index: Position in the cycle (1-6)
+            name: Stage name used in status and metric labels
+            func: Stage function returning a stats dict
+        """
+        self.publish("running", stage=f"[{index}/6] {name}")
+        with STAGE_SECONDS.labels(name).time(), span(name, cat="stage", index=index) as attrs:
+            stats = func()
+            attrs.update((key, value) for key, value in stats.items()
+                         if isinstance(value, (int, float, bool)))
+        if stats.get("errors"):
+            STAGE_ERRORS.labels(name).inc()
+        return stats
+
     def run_cycle(self) -> None:
         """Run a single scheduler cycle"""
+        with profile_cycle(), trace_cycle("scheduler", cycle=self.cycle_count + 1), CYCLE_SECONDS.time():
+            self._run_cycle()
+        CYCLES.inc()
+        update_queue_depths()
+        write_textfile("scheduler")
+
+    def _run_cycle(self) -> None:
         self.cycle_count += 1
         write_log(f"Starting scheduler cycle #{self.cycle_count}")
 
@@ -694,7 +755,7 @@ class Scheduler:
 
         # [1/6] Run error recovery (process retry queue first)
         print("[1/6] Running error recovery...")
-        error_stats = run_error_recovery()
+        error_stats = self.run_stage(1, "error-recovery", run_error_recovery)
         if error_stats.get('retried', 0) > 0:
             print(f"        Errors: {error_stats.get('retried', 0)} retried, {error_stats.get('success', 0)} successful")
         else:
@@ -702,33 +763,35 @@ class Scheduler:
 
         # [2/6] Run vault-watcher
         print("[2/6] Running vault-watcher...")
-        watcher_stats = run_vault_watcher()
+        watcher_stats = self.run_stage(2, "vault-watcher", run_vault_watcher)
         print(f"        Inbox: {watcher_stats['inbox_count']} files, {watcher_stats['new_files']} new")
 
         # [3/6] Run gmail-watcher (check for new emails)
         print("[3/6] Running gmail-watcher...")
-        gmail_stats = run_gmail_watcher()
+        gmail_stats = self.run_stage(3, "gmail-watcher", run_gmail_watcher)
         print(f"        Gmail: {gmail_stats['emails_checked']} checked, {gmail_stats['tasks_created']} new tasks")
 
         # [4/6] Run task-planner
         print("[4/6] Running task-planner...")
-        planner_stats = run_task_planner()
+        planner_stats = self.run_stage(4, "task-planner", run_task_planner)
         print(f"        Processed: {planner_stats['files_processed']}, Plans: {planner_stats['plans_created']}")
 
         # [5/6] Run Ralph Wiggum autonomous loop
         print("[5/6] Running Ralph Wiggum autonomous loop...")
-        ralph_stats = run_ralph_wiggum()
+        ralph_stats = self.run_stage(5, "ralph-wiggum", run_ralph_wiggum)
         print(f"        Ralph: {ralph_stats['tasks_processed']} processed, {ralph_stats['completed']} completed")
 
         # [6/6] Run CEO briefing (weekly - checks schedule internally)
         print("[6/6] Checking CEO briefing schedule...")
-        briefing_stats = run_ceo_briefing()
+        briefing_stats = self.run_stage(6, "ceo-briefing", run_ceo_briefing)
         if briefing_stats.get('generated'):
             print(f"        CEO Briefing: Generated successfully")
         else:
             print(f"        CEO Briefing: {briefing_stats.get('reason', briefing_stats.get('error', 'Skipped'))}")
 
         write_log(f"Cycle complete - Errors: {error_stats.get('retried', 0)}, Inbox: {watcher_stats['inbox_count']}, Gmail: {gmail_stats['emails_checked']}, Processed: {planner_stats['files_processed']}, Ralph: {ralph_stats['completed']} completed, CEO Briefing: {briefing_stats.get('generated', False)}")
+        self.last_cycle_at = datetime.now().isoformat(timespec="seconds")
+        self.publish("idle")
         print(f"[CYCLE {self.cycle_count}] Complete")
     
     def run_daemon(self) -> None:
@@ -754,6 +817,17 @@ Press Ctrl+C to stop
         
         write_log(f"Scheduler started in daemon mode (interval={self.interval}s)")
         
+        # Warm workers for the gmail watcher / CEO briefing runs, shared with the inbox watcher
+        pool = ensure_pool()
+        if pool:
+            write_log(f"Worker pool started with {pool.size} workers")
+        
+        # Live status stream for the web dashboard (see vault_events.py)
+        events = ensure_event_server()
+        if events:
+            host, port = events[0].server_address[:2]
+            write_log(f"Vault events serving on http://{host}:{port}/events")
+        
         try:
             while self.running:
                 self.run_cycle()
@@ -761,6 +835,8 @@ Press Ctrl+C to stop
                 # Wait for next cycle
                 next_run = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 print(f"\n[Zzz] Next cycle in {self.interval} seconds...")
+                next_cycle_at = datetime.fromtimestamp(time.time() + self.interval)
+                self.publish("idle", next_cycle_at=next_cycle_at.isoformat(timespec="seconds"))
                 write_log(f"Next cycle in {self.interval} seconds")
                 
                 # Sleep in small intervals to respond to signals quickly
@@ -772,7 +848,10 @@ Press Ctrl+C to stop
         except Exception as e:
             log_error(f"Daemon error: {e}")
         finally:
+            release_pool(pool)
+            release_event_server(events)
             write_log(f"Scheduler stopped after {self.cycle_count} cycles")
+            self.publish("stopped")
             print("\nScheduler stopped.")
     
     def _signal_handler(self, signum, frame) -> None:
@@ -826,6 +905,7 @@ def main():
         action="store_true",
         help="Force start (ignore existing lock)"
     )
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
@@ -887,4 +967,4 @@ def main():
 # =============================================================================
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(profile_main(main, "scheduler"))
@@ -23,11 +23,18 @@ Features:
 
 import os
 import sys
+import time
 import argparse
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+from metrics_store import record_event, task_key
+from dashboard_data import record_latest_plan, index_summaries
+from metrics_registry import counter, gauge, histogram, write_textfile
+from tracing import span
+from profiling import add_profile_arguments, profile_main
 
 # =============================================================================
 # CONFIGURATION
@@ -343,13 +350,28 @@ source_file: {analysis.get('filename', 'unknown')}
     return plan_content
 
 
-def create_plan_file(analysis: Dict[str, Any], dry_run: bool = False) -> Optional[Path]:
+def publish_plans(plans: List[Tuple[Path, str]]) -> None:
+    """
+    Index newly written plans for the dashboard and point it at the last one.
+    
+    Args:
+        plans: (path, contents) pairs in the order they were written
+    """
+    if plans:
+        index_summaries(plans)
+        record_latest_plan(plans[-1][0])
+
+
+def create_plan_file(analysis: Dict[str, Any], dry_run: bool = False,
+                     written: Optional[List[Tuple[Path, str]]] = None) -> Optional[Path]:
     """
     Create Plan.md file in Needs_Action folder.
     
     Args:
         analysis: File analysis results
         dry_run: If True, don't actually write the file
+        written: Collects (path, contents) of the new plan for a later
+                 publish_plans() call; the plan is published right away if None
         
     Returns:
         Path to created file, or None if dry_run
@@ -369,6 +391,10 @@ def create_plan_file(analysis: Dict[str, Any], dry_run: bool = False) -> Optiona
         if not dry_run:
             with open(plan_filepath, "w", encoding='utf-8') as f:
                 f.write(plan_content)
+            if written is None:
+                publish_plans([(plan_filepath, plan_content)])
+            else:
+                written.append((plan_filepath, plan_content))
             log_action(f"TASK_PLANNER: Created {plan_filename} in Needs_Action")
             return plan_filepath
         else:
@@ -412,6 +438,8 @@ def move_to_done(filepath: Path, dry_run: bool = False) -> bool:
         # Move the file
         shutil.move(str(filepath), str(dest_path))
         log_action(f"TASK_PLANNER: Moved {filepath.name} to Done")
+        record_event("tasks_completed", key=task_key(dest_path.name, dest_path.stat().st_mtime_ns),
+                     detail=f"{filepath.name} (Completed: {datetime.now().strftime('%Y-%m-%d')})")
         return True
         
     except Exception as e:
@@ -419,10 +447,22 @@ def move_to_done(filepath: Path, dry_run: bool = False) -> bool:
         return False
 
 
+# =============================================================================
+# METRICS
+# =============================================================================
+
+FILES_PROCESSED = counter("task_planner_files_processed_total", "Inbox files turned into plans")
+PLANS_CREATED = counter("task_planner_plans_created_total", "Plan files written")
+PLANNER_ERRORS = counter("task_planner_errors_total", "Inbox files that failed to plan")
+FILE_SECONDS = histogram("task_planner_file_seconds", "Time to analyze and plan one inbox file")
+FILES_PER_SECOND = gauge("task_planner_files_per_second", "Planning throughput of the last inbox run")
+
+
 # =============================================================================
 # MAIN PLANNER CLASS
 # =============================================================================
 
+
 class TaskPlanner:
     """
     Task Planner - Callable interface for processing inbox files.
@@ -442,6 +482,8 @@ class TaskPlanner:
         self.plans_created = 0
         self.files_moved = 0
         self.errors = 0
+        # Plans written during a process_inbox() run, published once at its end
+        self._written: Optional[List[Tuple[Path, str]]] = None
         
     def load_tracker(self) -> None:
         """Load processed files tracker"""
@@ -472,8 +514,18 @@ class TaskPlanner:
         print(f"Found {len(inbox_files)} .md file(s) in Inbox")
         log_action(f"TASK_PLANNER: Found {len(inbox_files)} .md file(s) to analyze")
         
-        for filepath in inbox_files:
-            self.process_file(filepath)
+        start = time.perf_counter()
+        processed_before = self.files_processed
+        self._written = []
+        try:
+            for filepath in inbox_files:
+                self.process_file(filepath)
+        finally:
+            publish_plans(self._written)
+            self._written = None
+        elapsed = time.perf_counter() - start
+        if elapsed > 0:
+            FILES_PER_SECOND.set((self.files_processed - processed_before) / elapsed)
         
         return self._get_stats()
     
@@ -497,23 +549,39 @@ class TaskPlanner:
         print(f"\n[PROCESS] {filename}")
         log_action(f"TASK_PLANNER: Analyzing {filename}")
         
+        start = time.perf_counter()
+        try:
+            with span("plan_file", cat="file", file=filename) as attrs:
+                attrs["ok"] = self._plan_file(filepath)
+                return attrs["ok"]
+        finally:
+            FILE_SECONDS.observe(time.perf_counter() - start)
+
+    def _plan_file(self, filepath: Path) -> bool:
+        filename = filepath.name
         try:
             # Analyze file content
-            analysis = analyze_file_content(filepath)
+            with span("analyze"):
+                analysis = analyze_file_content(filepath)
             
             if "error" in analysis:
                 print(f"[ERROR] Failed to analyze: {filename}")
                 self.errors += 1
+                PLANNER_ERRORS.inc()
                 return False
             
             # Create plan file
-            plan_path = create_plan_file(analysis, dry_run=self.dry_run)
+            with span("create_plan"):
+                plan_path = create_plan_file(analysis, dry_run=self.dry_run, written=self._written)
             if plan_path:
                 self.plans_created += 1
+                PLANS_CREATED.inc()
                 print(f"[PLAN] Created: {plan_path.name}")
             
             # Move original file to Done
-            if move_to_done(filepath, dry_run=self.dry_run):
+            with span("move_to_done"):
+                moved = move_to_done(filepath, dry_run=self.dry_run)
+            if moved:
                 self.files_moved += 1
                 print(f"[MOVED] {filename} -> Done/")
             
@@ -523,11 +591,13 @@ class TaskPlanner:
                 self.processed_files.add(filename)
             
             self.files_processed += 1
+            FILES_PROCESSED.inc()
             return True
             
         except Exception as e:
             log_error(f"Error processing '{filename}': {e}")
             self.errors += 1
+            PLANNER_ERRORS.inc()
             print(f"[ERROR] {filename}: {e}")
             return False
     
@@ -576,6 +646,7 @@ def main():
         action="store_true",
         help="Preview actions without making changes"
     )
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
@@ -600,6 +671,7 @@ def main():
     
     # Print summary
     planner.print_summary()
+    write_textfile("task_planner")
     
     # Exit with error code if there were errors
     if planner.errors > 0:
@@ -611,4 +683,4 @@ def main():
 # =============================================================================
 
 if __name__ == "__main__":
-    main()
+    profile_main(main, "task_planner")
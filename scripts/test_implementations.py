@@ -9,6 +9,7 @@ import os
 import sys
 import time
 import shutil
+import tempfile
 from pathlib import Path
 from datetime import datetime
 
@@ -28,6 +29,9 @@ NEEDS_ACTION_DIR = VAULT_DIR / "Needs_Action"
 DONE_DIR = VAULT_DIR / "Done"
 LOGS_DIR = BASE_DIR / "Logs"
 
+# Keep metrics recorded by the code under test out of the real Logs/metrics.db
+os.environ.setdefault("METRICS_DB_PATH", str(Path(tempfile.mkdtemp(prefix="metrics_test_")) / "metrics.db"))
+
 # Test colors
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -90,6 +94,15 @@ def create_test_file(filename: str, content: str) -> Path:
     return filepath
 
 
+def copy_scripts_tree(dest: Path) -> Path:
+    """Copy ai_employee.py and scripts/*.py into dest, so runs there use dest's vault"""
+    (dest / "scripts").mkdir(parents=True, exist_ok=True)
+    shutil.copy(BASE_DIR / "ai_employee.py", dest)
+    for script in SCRIPT_DIR.glob("*.py"):
+        shutil.copy(script, dest / "scripts")
+    return dest
+
+
 # =============================================================================
 # VAULT WATCHER TESTS
 # =============================================================================
@@ -181,6 +194,118 @@ def test_vault_watcher():
         print_test("Check interval randomization", False, str(e))
         results["failed"] += 1
     
+    # Test 7: A burst of detections costs one run plus one follow-up
+    try:
+        import threading
+        from watch_inbox import ProcessingTrigger
+        running, release = threading.Event(), threading.Event()
+        batches = []
+        
+        def slow_run():
+            running.set()
+            release.wait(10)
+            return True
+        
+        trigger = ProcessingTrigger(run=slow_run, on_complete=lambda files, ok: batches.append(files))
+        started = trigger.request(["first.md"])
+        running.wait(10)
+        queued = [trigger.request([f"burst_{i}.md"]) for i in range(10)]
+        release.set()
+        finished = trigger.wait(timeout=10)
+        passed = (started and not any(queued) and finished and trigger.runs == 2
+                  and batches == [["first.md"], [f"burst_{i}.md" for i in range(10)]])
+        print_test("Coalesced processing triggers", passed, f"{trigger.runs} runs for 11 files")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Coalesced processing triggers", False, str(e))
+        results["failed"] += 1
+    
+    # Test 8: A processing run and a detection scan that overlap get separate traces
+    try:
+        import threading
+        import tracing
+        from watch_inbox import ProcessingTrigger, span, trace_cycle
+        traces_dir = Path(tempfile.mkdtemp(prefix="watcher_trace_test_"))
+        saved_dir, tracing.TRACES_DIR = tracing.TRACES_DIR, traces_dir
+        in_run, release = threading.Event(), threading.Event()
+        
+        def traced_run():
+            with span("subprocess", cat="subprocess", script="ai_employee.py"):
+                in_run.set()
+                release.wait(10)
+            return True
+        
+        trigger = ProcessingTrigger(run=traced_run)
+        trigger.request(["a.md", "b.md"])
+        in_run.wait(10)
+        # The next scan runs while the processing run is still in its subprocess
+        with trace_cycle("watcher", files=1):
+            with span("watch_file", cat="file", file="c.md"):
+                pass
+        release.set()
+        trigger.wait(timeout=10)
+        tracing.TRACES_DIR = saved_dir
+        
+        def span_names(pattern):
+            files = list(traces_dir.glob(pattern))
+            events = tracing.load_trace(files[0])["traceEvents"] if len(files) == 1 else []
+            return {event["name"]: event.get("args", {}) for event in events if event.get("ph") == "X"}
+        
+        processing = span_names("watcher-processing_*.json")
+        scan = span_names("watcher_*.json")
+        shutil.rmtree(traces_dir, ignore_errors=True)
+        passed = (set(processing) == {"watcher-processing cycle", "subprocess"}
+                  and processing["watcher-processing cycle"].get("files") == 2
+                  and set(scan) == {"watcher cycle", "watch_file"})
+        print_test("Overlapping scan and run traced separately", passed,
+                   f"Processing: {sorted(processing)}, scan: {sorted(scan)}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Overlapping scan and run traced separately", False, str(e))
+        results["failed"] += 1
+    
+    # Test 9: A detected file is tracked and still planned by ai_employee.py --once
+    import watch_inbox
+    patched = ("BASE_DIR", "INBOX_DIR", "LOGS_DIR", "NEEDS_ACTION_DIR", "PROCESSED_TRACKER_FILE",
+               "ACTION_LOG_FILE", "ERROR_LOG_FILE", "AI_EMPLOYEE_SCRIPT")
+    saved = {name: getattr(watch_inbox, name) for name in patched}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="watcher_e2e_test_"))
+    try:
+        copy_scripts_tree(tmp_dir)
+        watch_inbox.BASE_DIR = tmp_dir
+        watch_inbox.INBOX_DIR = tmp_dir / "AI_Employee_Vault" / "Inbox"
+        watch_inbox.LOGS_DIR = tmp_dir / "Logs"
+        watch_inbox.NEEDS_ACTION_DIR = tmp_dir / "Needs_Action"
+        watch_inbox.PROCESSED_TRACKER_FILE = tmp_dir / "Logs" / "processed_files.txt"
+        watch_inbox.ACTION_LOG_FILE = tmp_dir / "Logs" / "action.log"
+        watch_inbox.ERROR_LOG_FILE = tmp_dir / "Logs" / "watcher_errors.log"
+        watch_inbox.AI_EMPLOYEE_SCRIPT = tmp_dir / "ai_employee.py"
+        watch_inbox.ensure_folders()
+        (watch_inbox.INBOX_DIR / "client_request.md").write_text(
+            "---\npriority: high\n---\n\n# Client request\n\nPlease send the invoice.\n", encoding="utf-8")
+        
+        processed = set()
+        new_files = watch_inbox.check_for_new_files(processed)
+        for filename in new_files:
+            watch_inbox.process_new_file(filename, processed)
+        
+        tracked = watch_inbox.load_processed_files()
+        plans = list((tmp_dir / "AI_Employee_Vault" / "Needs_Action").glob("Plan_*client_request*"))
+        done = (tmp_dir / "AI_Employee_Vault" / "Done" / "client_request.md").exists()
+        errors = watch_inbox.ERROR_LOG_FILE.read_text() if watch_inbox.ERROR_LOG_FILE.exists() else ""
+        passed = (new_files == ["client_request.md"] and "client_request.md" in tracked
+                  and len(plans) == 1 and done and not errors)
+        print_test("Watcher run_script creates plan", passed,
+                   f"Plans: {[p.name for p in plans]}, moved to Done: {done}" + (f", errors: {errors}" if errors else ""))
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Watcher run_script creates plan", False, str(e))
+        results["failed"] += 1
+    finally:
+        for name, value in saved.items():
+            setattr(watch_inbox, name, value)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
     return results
 
 
@@ -327,92 +452,1985 @@ This is a test file for full processing.
         print_test("Full dry-run processing", False, str(e))
         results["failed"] += 1
     
+    # Test 9: An inbox run rewrites the dashboard index once, not once per plan
+    tmp_dir = Path(tempfile.mkdtemp(prefix="planner_index_test_"))
+    try:
+        import json
+        import subprocess
+        copy_scripts_tree(tmp_dir)
+        inbox = tmp_dir / "AI_Employee_Vault" / "Inbox"
+        inbox.mkdir(parents=True)
+        for i in range(3):
+            (inbox / f"batch_{i}.md").write_text(f"# Batch {i}\n\nPlan me.\n", encoding="utf-8")
+        counting = (
+            "import dashboard_data, task_planner\n"
+            "saves = []\n"
+            "save = dashboard_data._save_index\n"
+            "dashboard_data._save_index = lambda *a: (saves.append(1), save(*a))\n"
+            "task_planner.TaskPlanner().process_inbox()\n"
+            "print(len(saves))\n"
+        )
+        proc = subprocess.run([sys.executable, "-c", counting], cwd=str(tmp_dir / "scripts"),
+                              capture_output=True, text=True, timeout=120)
+        saves = int(proc.stdout.split()[-1]) if proc.returncode == 0 else None
+        indexed = json.loads((tmp_dir / "Logs" / "vault_index.json").read_text(encoding="utf-8"))
+        names = sorted(indexed["folders"].get("Needs_Action", {}))
+        latest = json.loads((tmp_dir / "Logs" / "latest_plan.json").read_text(encoding="utf-8"))
+        passed = (saves == 1 and len(names) == 3 and all(n.startswith("Plan_batch_") for n in names)
+                  and latest["name"].startswith("Plan_batch_"))
+        print_test("Index written once per inbox run", passed, f"{saves} index writes, {len(names)} plans indexed")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Index written once per inbox run", False, str(e))
+        results["failed"] += 1
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
     return results
 
 
 # =============================================================================
-# INTEGRATION TEST
+# LEDGER ENGINE TESTS
 # =============================================================================
 
-def test_integration():
-    """Test integration between watcher and planner"""
-    print_header("INTEGRATION TESTS")
+def test_ledger_engine():
+    """Test the indexed accounting ledger"""
+    print_header("LEDGER ENGINE TESTS")
+    
+    import tempfile
+    from datetime import date
+    from ledger_engine import LedgerEngine
     
     results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="ledger_test_"))
+    ledger_file = tmp_dir / "Current_Month.md"
+    ledger_file.write_text(
+        "| Date       | Type    | Amount  | Description              |\n"
+        "|------------|---------|---------|--------------------------|\n",
+        encoding='utf-8'
+    )
     
-    # Test 1: Both modules can be imported together
     try:
-        from watch_inbox import WatcherState
-        from task_planner import TaskPlanner
-        passed = True
-        print_test("Module compatibility", passed)
+        engine = LedgerEngine(ledger_file)
+        engine.append_row("| 2026-03-02 | income  |  500.00 | Client payment           |\n")
+        engine.append_row("| 2026-03-04 | expense |  120.50 | Hosting                  |\n")
+        # Back-dated entry forces a reindex
+        engine.append_row("| 2026-02-20 | income  |   99.99 | Old invoice              |\n")
+    except Exception as e:
+        print_test("Append rows", False, str(e))
+        results["failed"] += 1
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return results
+    
+    # Test 1: Totals from the index
+    try:
+        totals = engine.totals()
+        passed = totals["income"] == 599.99 and totals["expense"] == 120.5 and totals["count"] == 3
+        print_test("Ledger totals", passed, f"Totals: {totals}")
         results["passed" if passed else "failed"] += 1
     except Exception as e:
-        print_test("Module compatibility", False, str(e))
+        print_test("Ledger totals", False, str(e))
         results["failed"] += 1
     
-    # Test 2: Shared log file works
+    # Test 2: Date range lookup
     try:
-        from watch_inbox import log_action as watcher_log
-        from task_planner import log_action as planner_log
+        week = engine.range_totals(date(2026, 3, 1), date(2026, 3, 7))
+        rows = engine.transactions_between(date(2026, 3, 1), date(2026, 3, 7))
+        passed = week["net"] == 379.5 and [t["description"] for t in rows] == ["Client payment", "Hosting"]
+        print_test("Date range lookup", passed, f"Week: {week}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Date range lookup", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Hand edits to the Markdown trigger a rebuild
+    try:
+        with open(ledger_file, "a", encoding='utf-8') as f:
+            f.write("| 2026-03-05 | expense |   10.00 | Manual entry             |\n")
+        totals = LedgerEngine(ledger_file).totals()
+        passed = totals["expense"] == 130.5 and totals["count"] == 4
+        print_test("Rebuild after hand edit", passed, f"Totals: {totals}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Rebuild after hand edit", False, str(e))
+        results["failed"] += 1
+    
+    # Test 4: Rolling over into March archives February with its snapshot
+    try:
+        import json
+        from ledger_archive import LedgerArchive
+        archive = LedgerArchive(ledger_file)
+        moved = archive.ensure_rolled_over(today=date(2026, 3, 15))
+        archived = (archive.archive_dir / "2026-02.md").read_text(encoding="utf-8")
+        snapshot = json.loads((archive.archive_dir / "2026-02.snapshot.json").read_text(encoding="utf-8"))
+        rollup = json.loads((archive.archive_dir / "snapshots.json").read_text(encoding="utf-8"))
+        live = LedgerEngine(ledger_file)
+        live_text = ledger_file.read_text(encoding="utf-8")
+        combined = [archive.all_time_totals()[k] + live.totals()[k] for k in ("income", "expense", "count")]
+        passed = (
+            moved == ["2026-02"] and "Old invoice" in archived and "Old invoice" not in live_text
+            and (snapshot["income"], snapshot["count"]) == (99.99, 1)
+            and rollup["live_month"] == "2026-03" and list(rollup["months"]) == ["2026-02"]
+            and rollup["all"] == {"income_cents": 9999, "expense_cents": 0, "count": 1}
+            and live.totals()["count"] == 3 and [round(v, 2) for v in combined] == [599.99, 130.5, 4]
+            and archive.ensure_rolled_over(today=date(2026, 3, 20)) == []
+        )
+        print_test("Monthly rollover and snapshots", passed, f"Moved {moved}, live rows {live.totals()['count']}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Monthly rollover and snapshots", False, str(e))
+        results["failed"] += 1
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_accounting_aggregates():
+    """Test the vectorized accounting reports and their CLI summaries"""
+    print_header("ACCOUNTING AGGREGATES TESTS")
+    
+    import io
+    from contextlib import redirect_stdout
+    from datetime import date
+    import accounting_aggregates as aggregates
+    from ledger_engine import LedgerEngine, MARKDOWN_HEADER
+    
+    results = {"passed": 0, "failed": 0}
+    if not aggregates.HAS_NUMPY:
+        print(f"  {YELLOW}Skipped - numpy not installed (pip install numpy){RESET}")
+        return results
+    
+    tmp_dir = Path(tempfile.mkdtemp(prefix="aggregates_test_"))
+    rows = (
+        "| 2025-01-05 | income  | 1000.00 | Client A                 |\n"
+        "| 2025-01-20 | expense |  200.00 | Hosting                  |\n"
+        "| 2025-03-03 | income  |  500.00 | Client B                 |\n"
+        "| 2025-03-10 | expense |   50.25 | Hosting                  |\n"
+    )
+    ledger_file = tmp_dir / "ledger.md"
+    ledger_file.write_text(MARKDOWN_HEADER + rows, encoding="utf-8")
+    empty_file = tmp_dir / "empty.md"
+    empty_file.write_text(MARKDOWN_HEADER, encoding="utf-8")
+    
+    # Test 1: bincount/cumsum totals per month, week and category
+    try:
+        arrays = aggregates.load_ledger_arrays(LedgerEngine(ledger_file))
+        months = aggregates.summarize_by_period(arrays, "month")
+        weeks = aggregates.summarize_by_period(arrays, "week")
+        categories = {c["category"]: c for c in aggregates.summarize_by_category(arrays)}
+        passed = (
+            [(m["period"], m["income"], m["expense"], m["net"], m["balance"], m["count"]) for m in months]
+            == [("2025-01", 1000.0, 200.0, 800.0, 800.0, 2), ("2025-03", 500.0, 50.25, 449.75, 1249.75, 2)]
+            and [w["period"] for w in weeks] == ["2025-W01", "2025-W04", "2025-W10", "2025-W11"]
+            and weeks[-1]["balance"] == 1249.75
+            and categories["Hosting"]["net"] == -250.25 and categories["Hosting"]["count"] == 2
+            and aggregates.summarize_range(arrays, date(2025, 3, 1), date(2025, 3, 31))["net"] == 449.75
+        )
+        print_test("Period and category totals", passed, f"{len(months)} months, {len(weeks)} weeks")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Period and category totals", False, str(e))
+        results["failed"] += 1
+    
+    # The CLI summaries resolve the ledger relative to the working directory
+    old_cwd = os.getcwd()
+    os.chdir(tmp_dir)
+    try:
+        import accounting_manager
+        live = Path(accounting_manager.ACCOUNTING_FILE)
+        live.parent.mkdir(parents=True, exist_ok=True)
+        live.write_text(MARKDOWN_HEADER + rows, encoding="utf-8")
         
-        watcher_log("INTEGRATION: Watcher log test")
-        planner_log("INTEGRATION: Planner log test")
+        def run(func, *args):
+            out = io.StringIO()
+            with redirect_stdout(out):
+                func(*args)
+            return out.getvalue()
         
-        action_log = LOGS_DIR / "action.log"
-        content = action_log.read_text()
-        passed = "Watcher log test" in content and "Planner log test" in content
-        print_test("Shared log file", passed)
+        # Test 2: monthly-summary and range-summary output for a known ledger
+        try:
+            monthly = run(accounting_manager.generate_monthly_summary, 2025)
+            ranged = run(accounting_manager.generate_range_summary, "2025-01-01", "2025-01-31", "category")
+            passed = (
+                "2025-01  |    1000.00 |     200.00 |     800.00 |     800.00" in monthly
+                and "2025-03  |     500.00 |      50.25 |     449.75 |    1249.75" in monthly
+                and "Total Income:     1500.00" in monthly
+                and "- Client A                | +  1000.00 | -     0.00 |    1000.00" in ranged
+                and "- Hosting                 | +     0.00 | -   200.00 |    -200.00" in ranged
+                and "Client B" not in ranged and "Net:               800.00" in ranged
+            )
+            print_test("Monthly and range summaries", passed)
+            results["passed" if passed else "failed"] += 1
+        except Exception as e:
+            print_test("Monthly and range summaries", False, str(e))
+            results["failed"] += 1
+        
+        # Test 3: An empty ledger and an empty range report zero totals
+        try:
+            arrays = aggregates.load_ledger_arrays(LedgerEngine(empty_file))
+            totals = aggregates.summarize_range(arrays)
+            monthly = run(accounting_manager.generate_monthly_summary, 2024)
+            ranged = run(accounting_manager.generate_range_summary, "2025-06-01", "2025-06-30", "week")
+            passed = (
+                aggregates.summarize_by_period(arrays, "month") == []
+                and aggregates.summarize_by_category(arrays) == []
+                and totals == {"income": 0.0, "expense": 0.0, "net": 0.0, "count": 0}
+                and "No transactions recorded for this year." in monthly
+                and "No transactions in this range." in ranged and "Net:                 0.00" in ranged
+            )
+            print_test("Empty ledger", passed, f"Totals: {totals}")
+            results["passed" if passed else "failed"] += 1
+        except Exception as e:
+            print_test("Empty ledger", False, str(e))
+            results["failed"] += 1
+        
+        # Test 4: The in-process summary API covers exactly 7 days ending on end_date
+        try:
+            summary = accounting_manager.get_summary("2025-01-01", "2025-01-31")
+            week = accounting_manager.get_weekly_summary("2025-01-11")
+            next_week = accounting_manager.get_weekly_summary(date(2025, 1, 12))
+            passed = (
+                summary["income"] == 1000.0 and summary["expense"] == 200.0 and summary["count"] == 2
+                and [t["description"] for t in summary["transactions"]] == ["Client A", "Hosting"]
+                and len(summary["daily"]) == 31 and summary["daily"][19]["net"] == -200.0
+                and (week["start_date"], week["end_date"]) == ("2025-01-05", "2025-01-11")
+                and len(week["daily"]) == 7 and week["income"] == 1000.0 and week["count"] == 1
+                and next_week["start_date"] == "2025-01-06" and next_week["count"] == 0
+            )
+            print_test("Summary API and weekly window", passed,
+                       f"Week {week['start_date']}..{week['end_date']}, {len(week['daily'])} days")
+            results["passed" if passed else "failed"] += 1
+        except Exception as e:
+            print_test("Summary API and weekly window", False, str(e))
+            results["failed"] += 1
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    return results
+
+
+def test_briefing_collector():
+    """Test the single-pass briefing log scanner"""
+    print_header("BRIEFING COLLECTOR TESTS")
+    
+    import tempfile
+    from briefing_collector import collect_log_metrics
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="collector_test_"))
+    (tmp_dir / "emails_sent.log").write_text(
+        "[2026-02-27 09:00:00] Email sent successfully to old@example.com\n"
+        "[2026-03-02 10:00:00] Email sent successfully to a@example.com\n"
+        "[2026-03-03 10:00:00] Queued message\n"
+        "[2026-03-09 10:00:00] Email sent successfully to late@example.com\n",
+        encoding='utf-8'
+    )
+    (tmp_dir / "gmail_watcher.log").write_text(
+        "[2026-03-04 09:30:00] Gmail watcher: Processed email ID 12345, sent reply.\n",
+        encoding='utf-8'
+    )
+    (tmp_dir / "business.log").write_text(
+        "2026-03-05 11:00:00,123 - business-mcp - INFO - BUSINESS_ACTIVITY: LinkedIn post requested: Hello\n"
+        "2026-03-05 11:01:00,123 - business-mcp - INFO - Email sent successfully to b@example.com\n",
+        encoding='utf-8'
+    )
+    week_start, week_end = datetime(2026, 3, 2), datetime(2026, 3, 8)
+    
+    # Test 1: All metrics from one pass, limited to the week and the right files
+    try:
+        metrics = collect_log_metrics(str(tmp_dir), week_start, week_end)
+        passed = metrics["emails"]["count"] == 2 and metrics["linkedin_posts"]["count"] == 1
+        print_test("Single-pass metrics", passed,
+                   f"Emails: {metrics['emails']['count']}, LinkedIn: {metrics['linkedin_posts']['count']}")
         results["passed" if passed else "failed"] += 1
     except Exception as e:
-        print_test("Shared log file", False, str(e))
+        print_test("Single-pass metrics", False, str(e))
         results["failed"] += 1
     
-    # Test 3: Folder structure consistency
+    # Test 2: Seeking to the window matches a full scan
     try:
-        folders = [
-            VAULT_DIR / "Inbox",
-            VAULT_DIR / "Needs_Action",
-            VAULT_DIR / "Done",
-            LOGS_DIR
-        ]
-        passed = all(f.exists() for f in folders)
-        print_test("Folder structure consistency", passed,
-                  f"All folders exist: {passed}")
+        full = collect_log_metrics(str(tmp_dir), week_start, week_end, seek=False)
+        passed = full == metrics
+        print_test("Seek matches full scan", passed)
         results["passed" if passed else "failed"] += 1
     except Exception as e:
-        print_test("Folder structure consistency", False, str(e))
+        print_test("Seek matches full scan", False, str(e))
         results["failed"] += 1
     
+    shutil.rmtree(tmp_dir, ignore_errors=True)
     return results
 
 
-# =============================================================================
-# MAIN TEST RUNNER
-# =============================================================================
+def test_metrics_store():
+    """Test the incremental daily metrics store"""
+    print_header("METRICS STORE TESTS")
+    
+    from datetime import date
+    from metrics_store import MetricsStore, task_key, approval_key
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="metrics_store_test_"))
+    log_dir = tmp_dir / "vault_logs"
+    done_dir = tmp_dir / "Done"
+    log_dir.mkdir()
+    done_dir.mkdir()
+    action_log = tmp_dir / "action.log"
+    (log_dir / "emails_sent.log").write_text(
+        "[2026-03-02 10:00:00] Email sent successfully to a@example.com\n"
+        "[2026-03-10 10:00:00] Email sent successfully to b@example.com\n",
+        encoding='utf-8'
+    )
+    action_log.write_text("[2026-03-03 09:00:00] APPROVAL: Detected approval for Plan_x.md (by CEO)\n",
+                          encoding='utf-8')
+    sources = {"log_dir": log_dir, "done_dir": done_dir, "action_log": action_log,
+               "accounting_file": tmp_dir / "missing.md"}
+    store = MetricsStore(tmp_dir / "metrics.db")
+    
+    # Test 1: Backfill from raw sources, then hooks de-duplicate by key
+    try:
+        store.backfill(**sources)
+        store.record("approvals", day="2026-03-03", key=approval_key("Plan_x.md", "2026-03-03"))
+        store.record("income_cents", 50000, day="2026-03-04")
+        totals = store.week_totals(date(2026, 3, 2), date(2026, 3, 8))
+        passed = totals["emails_sent"] == 1 and totals["approvals"] == 1 and totals["income_cents"] == 50000
+        print_test("Backfill and hooks", passed, f"Totals: {totals}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Backfill and hooks", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Catch-up reads only appended lines
+    try:
+        with open(log_dir / "emails_sent.log", "a", encoding='utf-8') as f:
+            f.write("[2026-03-11 10:00:00] Email sent successfully to c@example.com\n")
+        sources.pop("accounting_file")
+        counted = store.catch_up(**sources)
+        trend = store.weekly_trend(date(2026, 3, 9), weeks=2)
+        passed = counted == 1 and [w["metrics"]["emails_sent"] for w in trend] == [1, 2]
+        print_test("Catch-up and weekly trend", passed, f"Counted: {counted}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Catch-up and weekly trend", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: A task is counted once by hook and catch-up, a later one reusing its name again
+    try:
+        done_file = done_dir / "report.md"
+        done_file.write_text("first", encoding='utf-8')
+        hooked = store.record("tasks_completed", key=task_key(done_file.name, done_file.stat().st_mtime_ns))
+        first_catch_up = store.catch_up(**sources)
+        done_file.write_text("second", encoding='utf-8')
+        os.utime(done_file, ns=(done_file.stat().st_mtime_ns + 10**9,) * 2)
+        os.utime(done_dir, ns=(done_dir.stat().st_mtime_ns + 10**9,) * 2)
+        second_catch_up = store.catch_up(**sources)
+        passed = hooked and first_catch_up == 0 and second_catch_up == 1
+        print_test("Task keys scoped by mtime", passed,
+                   f"Catch-ups counted {first_catch_up} then {second_catch_up}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Task keys scoped by mtime", False, str(e))
+        results["failed"] += 1
+    
+    store.close()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
 
-def main():
-    print(f"""
-{BLUE}╔══════════════════════════════════════════════════════════╗
-║           AI Employee - Implementation Tests                  ║
-║           Vault Watcher & Task Planner                        ║
-╚══════════════════════════════════════════════════════════╝{RESET}
-""")
+
+def test_run_collectors():
+    """Test the CEO briefing's concurrent, time-boxed collectors"""
+    print_header("BRIEFING COLLECTOR RUNNER TESTS")
     
-    # Cleanup before tests
-    cleanup_test_files()
+    import io
+    from contextlib import redirect_stdout
     
-    total_results = {"passed": 0, "failed": 0}
+    results = {"passed": 0, "failed": 0}
     
-    # Run Vault Watcher tests
-    watcher_results = test_vault_watcher()
-    total_results["passed"] += watcher_results["passed"]
-    total_results["failed"] += watcher_results["failed"]
+    # accounting_manager creates its folders relative to the working directory on import
+    tmp_dir = Path(tempfile.mkdtemp(prefix="collectors_test_"))
+    old_cwd = os.getcwd()
+    os.chdir(tmp_dir)
+    try:
+        from ceo_briefing_generator import collector, run_collectors
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
     
-    # Run Task Planner tests
-    planner_results = test_task_planner()
-    total_results["passed"] += planner_results["passed"]
-    total_results["failed"] += planner_results["failed"]
+    def hang():
+        time.sleep(5)
+    
+    def fail():
+        raise ValueError("source offline")
+    
+    def run(collectors):
+        started = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            values, timings = run_collectors(collectors)
+        return values, {t["name"]: t["status"] for t in timings}, time.perf_counter() - started
+    
+    # Test 1: A hung collector times out to its fallback without blocking the others
+    try:
+        values, statuses, elapsed = run([
+            collector("slow", hang, timeout=0.3, fallback=lambda message: message),
+            collector("fast", lambda: 42, timeout=0.3),
+        ])
+        passed = (statuses == {"slow": "timeout", "fast": "ok"} and values["fast"] == 42
+                  and "timed out after 0.3s" in values["slow"] and elapsed < 1.0)
+        print_test("Timeout uses the fallback value", passed, f"{elapsed:.2f}s")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Timeout uses the fallback value", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: A failing collector reports its error through the fallback
+    try:
+        values, statuses, _ = run([collector("broken", fail, timeout=1, fallback=lambda message: {"error": message})])
+        passed = statuses == {"broken": "error"} and values["broken"] == {"error": "Data unavailable: source offline"}
+        print_test("Error uses the fallback value", passed, str(values["broken"]))
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Error uses the fallback value", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Fallback collectors run only when needed and overlap a hung primary
+    try:
+        calls = []
+        
+        def backup():
+            calls.append("backup")
+            return "from raw files"
+        
+        def make(primary, timeout):
+            return collector("primary", primary, timeout=timeout,
+                             fallbacks=[collector("backup", backup, timeout=0.4)])
+        
+        served, served_statuses, _ = run([make(lambda: {"stored": True}, 1)])
+        skipped_calls = list(calls)
+        empty, empty_statuses, _ = run([make(lambda: None, 1)])
+        hung, hung_statuses, elapsed = run([make(hang, 0.8)])
+        passed = (
+            served == {"primary": {"stored": True}} and skipped_calls == []
+            and empty == {"primary": None, "backup": "from raw files"}
+            and empty_statuses == {"primary": "ok", "backup": "ok"}
+            and hung["backup"] == "from raw files" and hung_statuses == {"primary": "timeout", "backup": "ok"}
+            and elapsed < 1.1
+        )
+        print_test("Fallback collectors", passed, f"Hung primary plus fallback took {elapsed:.2f}s (primary timeout 0.8s)")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Fallback collectors", False, str(e))
+        results["failed"] += 1
+    
+    return results
+
+
+def test_report_writer():
+    """Test the streaming multi-format report writer"""
+    print_header("REPORT WRITER TESTS")
+    
+    import json
+    from report_writer import open_report, read_index
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="report_test_"))
+    archive_dir = tmp_dir / "CEO_Weekly"
+    latest_base = tmp_dir / "CEO_Weekly"
+    
+    def write(version, tasks):
+        with open_report(archive_dir, version, latest_base=latest_base) as writer:
+            writer.begin("Briefing", {"Week": version})
+            writer.section("Key Metrics Summary")
+            writer.key_values([("Tasks Completed", tasks)])
+            writer.table(["Income", "Net"], [["10.00", "-5.00"]])
+            writer.data("metrics", {"tasks_completed": tasks})
+    
+    # Test 1: All formats written and the JSON is readable without Markdown parsing
+    try:
+        write("2026-W42", 3)
+        data = json.loads((archive_dir / "2026-W42.json").read_text(encoding='utf-8'))
+        html_text = (archive_dir / "2026-W42.html").read_text(encoding='utf-8')
+        passed = (data["data"]["metrics"]["tasks_completed"] == 3
+                  and "<strong>Tasks Completed:</strong> 3" in html_text
+                  and "**Tasks Completed:** 3" in (latest_base.with_suffix(".md")).read_text(encoding='utf-8'))
+        print_test("Markdown, HTML and JSON sinks", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Markdown, HTML and JSON sinks", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: An older week is archived without replacing the latest copy
+    try:
+        write("2026-W40", 1)
+        latest = json.loads(latest_base.with_suffix(".json").read_text(encoding='utf-8'))
+        index = read_index(archive_dir)
+        passed = (latest["data"]["metrics"]["tasks_completed"] == 3
+                  and list(index["reports"]) == ["2026-W40", "2026-W42"] and index["latest"] == "2026-W42")
+        print_test("Versioned by ISO week", passed, f"Index: {list(index['reports'])}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Versioned by ISO week", False, str(e))
+        results["failed"] += 1
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_health_monitor():
+    """Test the cached system health probes"""
+    print_header("HEALTH MONITOR TESTS")
+    
+    import health_monitor
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="health_test_"))
+    original_cache = health_monitor.CACHE_FILE
+    health_monitor.CACHE_FILE = tmp_dir / "health_cache.json"
+    
+    # Test 1: Every probe reports a status
+    try:
+        health = health_monitor.get_health(force=True)
+        names = [p["name"] for p in health["probes"]]
+        expected = ["disk_free", "log_size", "retry_queue", "scheduler", "oldest_pending_task", "watcher_lag"]
+        passed = names == expected and all(p["status"] in health_monitor.STATUS_ORDER for p in health["probes"])
+        print_test("All probes run", passed, f"Overall: {health['status']}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("All probes run", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Results are served from the shared cache within the TTL
+    try:
+        health_monitor._memory_cache = {}
+        cached = health_monitor.get_health(ttl=60)
+        passed = cached["checked_ts"] == health["checked_ts"] and health_monitor.CACHE_FILE.exists()
+        print_test("Cached within TTL", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Cached within TTL", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: A single retry entry stuck for days is critical despite the low depth
+    try:
+        import json
+        from datetime import timedelta
+        original_queues = health_monitor.RETRY_QUEUE_FILES
+        queue_file = tmp_dir / "error_retry_queue.json"
+        health_monitor.RETRY_QUEUE_FILES = [queue_file]
+        statuses = []
+        for age in (timedelta(minutes=5), timedelta(days=3)):
+            added = (datetime.now() - age).isoformat(timespec="seconds")
+            queue_file.write_text(json.dumps([{"task": "retry.md", "added_at": added}]), encoding="utf-8")
+            statuses.append(health_monitor.probe_retry_queue()["status"])
+        health_monitor.RETRY_QUEUE_FILES = original_queues
+        passed = statuses == [health_monitor.STATUS_OK, health_monitor.STATUS_CRITICAL]
+        print_test("Retry queue age threshold", passed, f"Fresh/stuck: {statuses}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Retry queue age threshold", False, str(e))
+        results["failed"] += 1
+    
+    health_monitor.CACHE_FILE = original_cache
+    health_monitor._memory_cache = {}
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_dashboard_data():
+    """Test the cached dashboard data layer"""
+    print_header("DASHBOARD DATA TESTS")
+    
+    import json
+    import dashboard_data
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="dashboard_test_"))
+    for name in dashboard_data.COUNTED_FOLDERS:
+        (tmp_dir / name).mkdir()
+    (tmp_dir / "Inbox" / "a.md").write_text("a")
+    (tmp_dir / "Errors" / "b.txt").write_text("b")
+    for name in dashboard_data.COUNTED_FOLDERS:
+        os.utime(tmp_dir / name, (1, 1))  # old enough to trust the mtime
+    cache = dashboard_data._cache
+    original_ttl = cache.ttl
+    dashboard_data.clear_cache()
+    
+    # Test 1: Repeated reads within the TTL are served from memory
+    try:
+        cache.ttl = 60
+        first = dashboard_data.get_task_counts(tmp_dir)
+        misses = cache.misses
+        (tmp_dir / "Inbox" / "c.md").write_text("c")
+        second = dashboard_data.get_task_counts(tmp_dir)
+        passed = first == second and first["Inbox"] == 1 and first["Errors"] == 1 and cache.misses == misses
+        print_test("Counts cached within TTL", passed, str(first))
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Counts cached within TTL", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: After the TTL only changed folders are rescanned
+    try:
+        cache.ttl = 0
+        misses = cache.misses
+        counts = dashboard_data.get_task_counts(tmp_dir)
+        passed = counts["Inbox"] == 2 and cache.misses == misses + 1
+        print_test("Only changed folder rescanned", passed, f"{cache.misses - misses} rescan(s)")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Only changed folder rescanned", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Tail reader returns the last lines of a large log, newest first
+    try:
+        log_file = tmp_dir / "action.log"
+        with open(log_file, "w", encoding="utf-8") as f:
+            for i in range(50000):
+                f.write(f"[2026-01-01 00:00:00] entry {i}\n")
+        recent = dashboard_data.get_recent_actions(3, log_file)
+        passed = [line.split()[-1] for line in recent] == ["49999", "49998", "49997"]
+        print_test("Tail of large action log", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Tail of large action log", False, str(e))
+        results["failed"] += 1
+    
+    # Test 4: Latest plan comes from the pointer, with a scan fallback when stale
+    try:
+        plans_dir = tmp_dir / "Needs_Action"
+        pointer = tmp_dir / "latest_plan.json"
+        old_plan = plans_dir / "Plan_old.md"
+        new_plan = plans_dir / "Plan_new.md"
+        old_plan.write_text("old")
+        new_plan.write_text("new")
+        os.utime(old_plan, (1, 1))
+        dashboard_data.record_latest_plan(old_plan, pointer)
+        from_pointer = dashboard_data.get_latest_plan(plans_dir, pointer)
+        old_plan.unlink()
+        dashboard_data.record_latest_plan(old_plan, pointer)
+        fallback = dashboard_data.get_latest_plan(plans_dir, pointer)
+        repaired = json.loads(pointer.read_text())["name"]
+        passed = from_pointer == old_plan and fallback == new_plan and repaired == "Plan_new.md"
+        print_test("Latest plan pointer", passed, f"Fallback: {fallback.name if fallback else None}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Latest plan pointer", False, str(e))
+        results["failed"] += 1
+    
+    # Test 5: Summaries come from the index; only unseen or modified files are read
+    try:
+        index_file = tmp_dir / "vault_index.json"
+        plan = plans_dir / "Plan_indexed.md"
+        plan.write_text("# Plan: stale\n\nignored while the mtime matches the index")
+        dashboard_data.index_summary(plan, "---\npriority: high\n---\n\n# Plan: indexed.md\n\n"
+                                           "## 🧠 Reasoning (Chain-of-Thought)\n\nBecause.\n\n## Next\n", index_file)
+        (plans_dir / "Plan_unseen.md").write_text("---\npriority: low\n---\n\n# Plan: unseen.md\n\nFirst paragraph.\n")
+        summaries = {s["name"]: s for s in dashboard_data.get_summaries(plans_dir, ".md", "Plan_", index_file)}
+        indexed = summaries["Plan_indexed.md"]
+        unseen = summaries["Plan_unseen.md"]
+        stored = json.loads(index_file.read_text())["folders"]["Needs_Action"]
+        
+        # Rewritten in place: the folder mtime is unchanged but the file's is not
+        plan.write_text("# Plan: edited\n\nEdited on disk.\n")
+        os.utime(plan, ns=(stored["Plan_indexed.md"]["mtime_ns"] + 10**9,) * 2)
+        dashboard_data.clear_cache()
+        edited = {s["name"]: s for s in dashboard_data.get_summaries(plans_dir, ".md", "Plan_", index_file)}
+        restored = json.loads(index_file.read_text())["folders"]["Needs_Action"]
+        passed = (indexed["title"] == "Plan: indexed.md" and indexed["priority"] == "high"
+                  and indexed["excerpt"] == "Because." and unseen["excerpt"] == "First paragraph."
+                  and unseen["priority"] == "low" and "Plan_unseen.md" in stored
+                  and edited["Plan_indexed.md"]["title"] == "Plan: edited"
+                  and edited["Plan_indexed.md"]["excerpt"] == "Edited on disk."
+                  and restored["Plan_indexed.md"]["mtime_ns"] == os.stat(plan).st_mtime_ns)
+        print_test("Summary index", passed, f"{len(summaries)} summaries, edited: {edited['Plan_indexed.md']['title']}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Summary index", False, str(e))
+        results["failed"] += 1
+    
+    # Test 6: Pagination clamps to the available pages
+    try:
+        items = list(range(45))
+        first, pages = dashboard_data.paginate(items, 1, 20)
+        last, _ = dashboard_data.paginate(items, 99, 20)
+        passed = pages == 3 and first == list(range(20)) and last == list(range(40, 45))
+        print_test("Pagination", passed, f"{pages} pages")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Pagination", False, str(e))
+        results["failed"] += 1
+    
+    cache.ttl = original_ttl
+    dashboard_data.clear_cache()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_vault_events():
+    """Test the live status event stream for the dashboard"""
+    print_header("VAULT EVENTS TESTS")
+    
+    import vault_events
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="events_test_"))
+    vault_dir = tmp_dir / "vault"
+    status_dir = tmp_dir / "status"
+    (vault_dir / "Inbox").mkdir(parents=True)
+    
+    # Test 1: The hub only records real changes and wakes waiters
+    try:
+        hub = vault_events.EventHub()
+        hub.publish("counts", {"Inbox": 1})
+        unchanged = hub.publish("counts", {"Inbox": 1})
+        hub.publish("counts", {"Inbox": 2})
+        events = hub.wait(1, timeout=0.1)
+        passed = not unchanged and [e[2] for e in events] == [{"Inbox": 2}] and hub.wait(2, timeout=0.05) == []
+        print_test("Hub publishes changes only", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Hub publishes changes only", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Published statuses carry liveness from the PID
+    try:
+        vault_events.publish_status("scheduler", "running", status_dir=status_dir, stage="[4/6] task-planner")
+        vault_events.publish_status("watcher", "stopped", status_dir=status_dir)
+        statuses = vault_events.with_liveness(vault_events.read_statuses(status_dir))
+        passed = (statuses["scheduler"]["alive"] and statuses["scheduler"]["stage"] == "[4/6] task-planner"
+                  and not statuses["watcher"]["alive"])
+        print_test("Status files with liveness", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Status files with liveness", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Vault changes reach an SSE subscriber
+    try:
+        server, watcher = vault_events.start_event_server(
+            "127.0.0.1", 0, vault_dir, status_dir, tmp_dir / "action.log", interval=0.1)
+        port = server.server_address[1]
+        live = vault_events.LiveState(f"http://127.0.0.1:{port}/events").start()
+        deadline = time.time() + 5
+        while time.time() < deadline and "counts" not in live.data:
+            time.sleep(0.05)
+        (vault_dir / "Inbox" / "new_task.md").write_text("# New task")
+        while time.time() < deadline and live.data.get("counts", {}).get("Inbox") != 1:
+            time.sleep(0.05)
+        server.shutdown()
+        watcher.stop()
+        passed = live.connected and live.data["counts"]["Inbox"] == 1 and "scheduler" in live.data["status"]
+        print_test("Changes pushed over SSE", passed, f"Counts: {live.data.get('counts')}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Changes pushed over SSE", False, str(e))
+        results["failed"] += 1
+    
+    # Test 4: The embedded server starts once and yields to one already on the port
+    try:
+        import urllib.request
+        started = vault_events.ensure_event_server("127.0.0.1", 0)
+        port = started[0].server_address[1]
+        # No CORS header: other origins in the browser must not read the stream
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/events", timeout=5) as response:
+            cors = response.headers.get("Access-Control-Allow-Origin")
+        second = vault_events.ensure_event_server("127.0.0.1", port)
+        vault_events.EVENTS_ENABLED = False
+        disabled = vault_events.ensure_event_server("127.0.0.1", 0)
+        vault_events.EVENTS_ENABLED = True
+        vault_events.release_event_server(started)
+        passed = started is not None and second is None and disabled is None and cors is None
+        print_test("Embedded event server", passed, f"Port: {port}, CORS: {cors}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        vault_events.EVENTS_ENABLED = True
+        print_test("Embedded event server", False, str(e))
+        results["failed"] += 1
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_metrics_registry():
+    """Test the Prometheus-style operational metrics registry"""
+    print_header("METRICS REGISTRY TESTS")
+    
+    import metrics_registry
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="prom_test_"))
+    
+    # Test 1: Counters, gauges and histograms render in the text format
+    try:
+        registry = metrics_registry.MetricsRegistry()
+        stage_errors = registry.counter("stage_errors_total", "Stage errors", ["stage"])
+        stage_errors.labels("task-planner").inc()
+        stage_errors.labels(stage="task-planner").inc(2)
+        registry.gauge("queue_depth", "Queue depth").set(7)
+        latency = registry.histogram("send_seconds", "Send latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value)
+        text = registry.render()
+        expected = [
+            '# TYPE stage_errors_total counter',
+            'stage_errors_total{stage="task-planner"} 3',
+            'queue_depth 7',
+            'send_seconds_bucket{le="0.1"} 1',
+            'send_seconds_bucket{le="1"} 2',
+            'send_seconds_bucket{le="+Inf"} 3',
+            'send_seconds_count 3',
+        ]
+        missing = [line for line in expected if line not in text.splitlines()]
+        passed = not missing and registry.counter("stage_errors_total", "", ["stage"]) is stage_errors
+        print_test("Text exposition format", passed, f"Missing: {missing}" if missing else "")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Text exposition format", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Registering a name twice with another type is rejected
+    try:
+        try:
+            registry.gauge("stage_errors_total", "Not a gauge")
+            passed = False
+        except ValueError:
+            passed = True
+        print_test("Type conflict rejected", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Type conflict rejected", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Textfiles from several components merge into one exposition
+    try:
+        other = metrics_registry.MetricsRegistry()
+        other.gauge("queue_depth", "Queue depth").set(2)
+        metrics_registry.write_textfile("scheduler", registry, tmp_dir)
+        metrics_registry.write_textfile("watcher", other, tmp_dir)
+        merged = metrics_registry.collect_textfiles(tmp_dir).splitlines()
+        passed = (merged.count("# TYPE queue_depth gauge") == 1
+                  and 'queue_depth{component="scheduler"} 7' in merged
+                  and 'queue_depth{component="watcher"} 2' in merged)
+        print_test("Textfiles merged", passed, f"{len(merged)} lines")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Textfiles merged", False, str(e))
+        results["failed"] += 1
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_tracing():
+    """Test per-cycle span traces in the Chrome trace-event format"""
+    print_header("TRACING TESTS")
+    
+    import tracing
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="trace_test_"))
+    
+    # Test 1: Nested stage/file spans are written as one trace per cycle
+    try:
+        with tracing.trace_cycle("scheduler", min_seconds=0, directory=tmp_dir, cycle=1) as root:
+            with tracing.span("task-planner", cat="stage") as stage:
+                for name in ("a.md", "b.md"):
+                    with tracing.span("plan_file", cat="file", file=name):
+                        time.sleep(0.002)
+                stage["files_processed"] = 2
+        trace = tracing.load_trace(root["trace_file"])
+        spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        by_name = {e["name"]: e for e in spans}
+        stage_span, cycle_span = by_name["task-planner"], by_name["scheduler cycle"]
+        files = [e for e in spans if e["cat"] == "file"]
+        nested = all(stage_span["ts"] <= e["ts"] and e["ts"] + e["dur"] <= stage_span["ts"] + stage_span["dur"]
+                     for e in files)
+        passed = (len(files) == 2 and nested and cycle_span["dur"] >= stage_span["dur"]
+                  and stage_span["args"]["files_processed"] == 2 and cycle_span["args"]["cycle"] == 1)
+        print_test("Nested spans exported", passed, f"{len(spans)} spans")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Nested spans exported", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Exceptions mark the span; spans outside a trace record nothing
+    try:
+        try:
+            with tracing.trace_cycle("watcher", min_seconds=0, directory=tmp_dir) as root:
+                with tracing.span("subprocess", cat="subprocess", script="ai_employee.py"):
+                    raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        slowest = tracing.slowest_spans(tracing.load_trace(root["trace_file"]), cat="subprocess")
+        with tracing.span("untraced"):
+            pass
+        passed = (len(slowest) == 1 and "boom" in slowest[0]["args"]["error"]
+                  and not tracing.TRACER.recording)
+        print_test("Errors recorded on spans", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Errors recorded on spans", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Fast cycles below the threshold are dropped; old traces pruned
+    try:
+        with tracing.trace_cycle("scheduler", min_seconds=60, directory=tmp_dir) as root:
+            pass
+        dropped = "trace_file" not in root
+        for _ in range(3):
+            with tracing.trace_cycle("scheduler", min_seconds=0, directory=tmp_dir):
+                pass
+        tracing.prune_traces(tmp_dir, keep=2)
+        passed = dropped and len(tracing.list_traces(tmp_dir)) == 2
+        print_test("Threshold and retention", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Threshold and retention", False, str(e))
+        results["failed"] += 1
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_profiling():
+    """Test the shared --profile facility"""
+    print_header("PROFILING TESTS")
+    
+    import pstats
+    import profiling
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="profile_test_"))
+    
+    def busy_loop(seconds=0.05):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            sum(range(100))
+    
+    # Test 1: profile_main strips the options and writes a pstats file
+    old_argv = sys.argv[:]
+    try:
+        out = tmp_dir / "planner.prof"
+        sys.argv = ["task_planner.py", "--dry-run", "--profile", "--profile-out", str(out)]
+        seen = []
+        profiling.profile_main(lambda: seen.append(sys.argv[1:]) or busy_loop(), "task_planner")
+        names = {func[2] for func in pstats.Stats(str(out)).stats}
+        passed = seen == [["--dry-run"]] and "busy_loop" in names
+        print_test("cProfile entry point", passed, f"Args seen: {seen}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("cProfile entry point", False, str(e))
+        results["failed"] += 1
+    finally:
+        sys.argv = old_argv
+    
+    # Test 2: The sampler writes collapsed stacks
+    try:
+        profiler = profiling.Profiler("sample", tmp_dir / "run.folded", interval=0.001)
+        profiler.enable()
+        busy_loop(0.1)
+        profiler.disable()
+        lines = profiler.save().read_text(encoding="utf-8").splitlines()
+        passed = bool(lines) and any("busy_loop" in line for line in lines) and all(
+            line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        print_test("Collapsed stacks written", passed, f"{len(lines)} stacks")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Collapsed stacks written", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: --profile-cycles profiles the first N cycles, then saves
+    try:
+        cycles = profiling.CycleProfiler(profiling.Profiler("cprofile", tmp_dir / "cycles.prof"), 2)
+        for _ in range(4):
+            with cycles.cycle():
+                busy_loop(0.01)
+        calls = [stat[0] for func, stat in pstats.Stats(str(cycles.saved)).stats.items()
+                 if func[2] == "busy_loop"]
+        passed = cycles.profiled == 2 and calls == [2]
+        print_test("Only first N cycles profiled", passed, f"busy_loop calls: {calls}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Only first N cycles profiled", False, str(e))
+        results["failed"] += 1
+    
+    # Test 4: ai_employee.py --watch marks each scan as a cycle
+    try:
+        import threading
+        sys.path.insert(0, str(BASE_DIR))
+        import ai_employee
+        saved = {name: getattr(ai_employee, name)
+                 for name in ("INBOX_FOLDER", "NEEDS_ACTION_FOLDER", "PROCESSED_TRACKER_FILE", "WATCH_INTERVAL")}
+        ai_employee.INBOX_FOLDER = tmp_dir / "Inbox"
+        ai_employee.NEEDS_ACTION_FOLDER = tmp_dir / "Needs_Action"
+        ai_employee.PROCESSED_TRACKER_FILE = tmp_dir / "processed_files.txt"
+        ai_employee.WATCH_INTERVAL = 0.05
+        for folder in (ai_employee.INBOX_FOLDER, ai_employee.NEEDS_ACTION_FOLDER):
+            folder.mkdir()
+        (ai_employee.INBOX_FOLDER / "profiled.txt").write_text("x")
+        
+        cycles = profiling.CycleProfiler(profiling.Profiler("cprofile", tmp_dir / "watch.prof"), 2)
+        profiling._cycle_profiler = cycles
+        watcher = ai_employee.FileWatcher()
+        watcher.running = True
+        thread = threading.Thread(target=watcher._watch_loop, daemon=True)
+        thread.start()
+        deadline = time.time() + 5
+        while time.time() < deadline and cycles.saved is None:
+            time.sleep(0.02)
+        watcher.running = False
+        thread.join(timeout=5)
+        profiling._cycle_profiler = None
+        for name, value in saved.items():
+            setattr(ai_employee, name, value)
+        
+        scans = [stat[0] for func, stat in pstats.Stats(str(cycles.saved)).stats.items()
+                 if func[2] == "scan_once"] if cycles.saved else []
+        passed = cycles.profiled == 2 and scans == [2] and (tmp_dir / "Needs_Action" / "task_profiled.txt.md").exists()
+        print_test("Watch loop cycles profiled", passed, f"scan_once calls: {scans}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        profiling._cycle_profiler = None
+        print_test("Watch loop cycles profiled", False, str(e))
+        results["failed"] += 1
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_benchmark():
+    """Test the synthetic-vault benchmark suite"""
+    print_header("BENCHMARK SUITE TESTS")
+    
+    import benchmark
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench_test_"))
+    sizes = {"inbox": 5, "tasks": 10, "approvals": 3, "log_mb": 1, "ledger_rows": 400}
+    
+    # Test 1: The synthetic vault has the requested shape and a usable ledger
+    try:
+        vault = benchmark.generate_vault(tmp_dir, sizes)
+        root = tmp_dir / "AI_Employee_Vault"
+        counts = {name: len(list((root / name).glob("*.md"))) for name in ["Inbox", "Needs_Action", "Needs_Approval"]}
+        from ledger_archive import LedgerArchive
+        from ledger_engine import LedgerEngine
+        live = root / "Accounting" / "Current_Month.md"
+        archive = LedgerArchive(live)
+        ledger_rows = archive.all_time_totals()["count"] + LedgerEngine(live).totals()["count"]
+        passed = (counts == {"Inbox": 5, "Needs_Action": 13, "Needs_Approval": 3}
+                  and ledger_rows == 400 and (tmp_dir / "scripts" / "benchmark.py").exists()
+                  and vault["logs_mb"] > 0.5)
+        print_test("Synthetic vault generated", passed, f"{counts}, {ledger_rows} ledger rows")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Synthetic vault generated", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: A case runs in a worker inside the synthetic vault
+    try:
+        before = (BASE_DIR / "Logs" / "vault_index.json").exists()
+        result = benchmark.run_case(tmp_dir, "dashboard", 2)
+        passed = ("warm" in result and result["cold_ms"] > 0
+                  and (tmp_dir / "Logs" / "vault_index.json").exists()
+                  and (BASE_DIR / "Logs" / "vault_index.json").exists() == before)
+        print_test("Worker isolated to synthetic vault", passed, str(result.get("error", "")))
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Worker isolated to synthetic vault", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Comparison flags real slowdowns but not sub-millisecond noise
+    try:
+        baseline = {"results": {"planner": {"total_ms": 1000.0, "files_per_second": 50.0},
+                                "dashboard": {"warm": {"median_ms": 0.1, "min_ms": 0.1}}}}
+        current = {"results": {"planner": {"total_ms": 1500.0, "files_per_second": 33.0},
+                               "dashboard": {"warm": {"median_ms": 0.3, "min_ms": 0.3}}}}
+        rows = {row["metric"]: row for row in benchmark.compare_results(baseline, current)}
+        passed = (rows["planner.total_ms"]["regressed"] and rows["planner.files_per_second"]["regressed"]
+                  and not rows["dashboard.warm.median_ms"]["regressed"]
+                  and "dashboard.warm.min_ms" not in rows)
+        print_test("Regression comparison", passed, f"{sorted(rows)}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Regression comparison", False, str(e))
+        results["failed"] += 1
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_worker_pool():
+    """Test the resident worker pool and its subprocess fallback"""
+    print_header("WORKER POOL TESTS")
+    
+    import json
+    import subprocess
+    import threading
+    import worker_pool
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="pool_test_"))
+    state_file = tmp_dir / "worker_pool.json"
+    script = tmp_dir / "job.py"
+    script.write_text(
+        "import os, sys, time, threading\n"
+        "if '--sleep' in sys.argv:\n"
+        "    time.sleep(10)\n"
+        "if '--thread' in sys.argv:\n"
+        "    threading.Thread(target=time.sleep, args=(10,), daemon=True).start()\n"
+        "print('pid', os.getpid(), 'args', ' '.join(sys.argv[1:]))\n"
+        "sys.exit(3 if '--fail' in sys.argv else 0)\n",
+        encoding="utf-8"
+    )
+    pool = worker_pool.WorkerPool(1, state_file, preload=()).start()
+    
+    # Test 1: Jobs sent over the pipe reuse the same warm worker
+    try:
+        first = worker_pool.run_script(script, ["a"], cwd=tmp_dir, timeout=30, state_file=state_file)
+        second = worker_pool.run_script(script, ["--fail"], cwd=tmp_dir, timeout=30, state_file=state_file)
+        pids = {first.stdout.split()[1], second.stdout.split()[1]}
+        passed = (isinstance(first, subprocess.CompletedProcess) and first.returncode == 0
+                  and first.stdout.strip().endswith("args a") and second.returncode == 3
+                  and pids == {str(pool.pids()[0])})
+        print_test("Warm worker reused over the pipe", passed, f"pids {pids}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Warm worker reused over the pipe", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: A job over its timeout raises TimeoutExpired and the worker is replaced
+    try:
+        old_pids = pool.pids()
+        try:
+            worker_pool.run_script(script, ["--sleep"], timeout=0.5, state_file=state_file)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            timed_out = True
+        after = worker_pool.run_script(script, ["b"], timeout=30, state_file=state_file)
+        passed = timed_out and after.returncode == 0 and pool.pids() != old_pids
+        print_test("Timed-out worker replaced", passed, f"{old_pids} -> {pool.pids()}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Timed-out worker replaced", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: A job that leaves a thread running gets its worker recycled
+    try:
+        clean = worker_pool.run_script(script, ["d"], timeout=30, state_file=state_file)
+        kept = pool.pids()
+        leaky = worker_pool.run_script(script, ["--thread"], timeout=30, state_file=state_file)
+        recycled = pool.pids()
+        passed = (clean.returncode == 0 and leaky.returncode == 0
+                  and kept == [int(clean.stdout.split()[1])] and recycled != kept)
+        print_test("Worker recycled after leaked thread", passed, f"{kept} -> {recycled}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Worker recycled after leaked thread", False, str(e))
+        results["failed"] += 1
+    
+    # Test 4: Waiting for a busy pool counts against the caller's timeout
+    try:
+        busy = threading.Thread(target=pool.run, args=(script, ["--sleep"]),
+                                kwargs={"timeout": 2.0}, daemon=True)
+        busy.start()
+        deadline = time.time() + 10
+        while pool._idle.qsize() and time.time() < deadline:
+            time.sleep(0.02)
+        started = time.monotonic()
+        try:
+            worker_pool.run_script(script, ["e"], timeout=0.3, state_file=state_file)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            timed_out = True
+        waited = time.monotonic() - started
+        busy.join(10)
+        passed = timed_out and waited < 1.5
+        print_test("Queue wait bounded by timeout", passed, f"{waited:.2f}s")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Queue wait bounded by timeout", False, str(e))
+        results["failed"] += 1
+    
+    # Test 5: A pool host that never replies does not hang the caller
+    try:
+        from multiprocessing.connection import Listener
+        authkey = os.urandom(16)
+        listener = Listener(family=pool.family, authkey=authkey)
+        held = []
+        threading.Thread(target=lambda: held.append(listener.accept()), daemon=True).start()
+        hung_state = tmp_dir / "hung_pool.json"
+        hung_state.write_text(json.dumps({"address": listener.address, "family": pool.family,
+                                          "authkey": authkey.hex(), "pid": os.getpid()}),
+                              encoding="utf-8")
+        margin = worker_pool.REQUEST_MARGIN_SECONDS
+        worker_pool.REQUEST_MARGIN_SECONDS = 0.2
+        started = time.monotonic()
+        try:
+            worker_pool.run_script(script, ["f"], timeout=0.3, state_file=hung_state)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            timed_out = True
+        finally:
+            worker_pool.REQUEST_MARGIN_SECONDS = margin
+        waited = time.monotonic() - started
+        for conn in held:
+            conn.close()
+        listener.close()
+        passed = timed_out and waited < 2.0
+        print_test("Unresponsive pool host times out", passed, f"{waited:.2f}s")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Unresponsive pool host times out", False, str(e))
+        results["failed"] += 1
+    
+    # Test 6: Without a running pool, run_script falls back to a subprocess
+    try:
+        pool.stop()
+        result = worker_pool.run_script(script, ["c"], timeout=30, state_file=state_file)
+        passed = (not state_file.exists() and not worker_pool.pool_available(state_file)
+                  and result.returncode == 0 and result.stdout.strip().endswith("args c"))
+        print_test("Subprocess fallback without a pool", passed, result.stdout.strip())
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Subprocess fallback without a pool", False, str(e))
+        results["failed"] += 1
+    
+    pool.stop()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_startup_budget():
+    """Test that the headless ai_employee.py paths start without UI modules"""
+    print_header("STARTUP BUDGET TESTS")
+    
+    import subprocess
+    
+    results = {"passed": 0, "failed": 0}
+    
+    def importtime_run(args, cwd=BASE_DIR):
+        """Run python -X importtime; returns (returncode, {module: cumulative ms}, top-level total ms)"""
+        proc = subprocess.run([sys.executable, "-X", "importtime", *args],
+                              cwd=str(cwd), capture_output=True, text=True, timeout=120)
+        modules, total = {}, 0.0
+        for line in proc.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative, name = line.split("|")
+                if cumulative.strip().isdigit():
+                    modules[name.strip()] = int(cumulative) / 1000
+                    # Nested imports are indented; top-level ones add up to the total
+                    if not name.startswith("  "):
+                        total += int(cumulative) / 1000
+        return proc.returncode, modules, total
+    
+    # Test 1: An actual ai_employee.py --once run loads no Rich or colorama module
+    tmp_dir = Path(tempfile.mkdtemp(prefix="startup_test_"))
+    try:
+        copy_scripts_tree(tmp_dir)
+        inbox = tmp_dir / "AI_Employee_Vault" / "Inbox"
+        inbox.mkdir(parents=True)
+        (inbox / "startup_check.md").write_text("# Startup check\n\nPlan me.\n", encoding="utf-8")
+        returncode, modules, _ = importtime_run(["ai_employee.py", "--once"], cwd=tmp_dir)
+        ui_modules = sorted(m for m in modules if m.split(".")[0] in ("rich", "colorama"))
+        planned = list((tmp_dir / "AI_Employee_Vault" / "Needs_Action").glob("Plan_startup_check*"))
+        passed = returncode == 0 and "task_planner" in modules and len(planned) == 1 and not ui_modules
+        print_test("--once run skips UI modules", passed, ", ".join(ui_modules[:5]) or "none loaded")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("--once run skips UI modules", False, str(e))
+        results["failed"] += 1
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    # Test 2: The headless start stays within its import budget (best of 3 each):
+    # an absolute ceiling (STARTUP_BUDGET_MS overrides it for slow machines) and,
+    # when Rich/colorama are installed, at most 60% of the eager UI import
+    try:
+        budget_ms = float(os.environ.get("STARTUP_BUDGET_MS", "150"))
+        headless = "import ai_employee; ai_employee.FileWatcher()"
+        eager = "import ai_employee; ai_employee.load_ui(); ai_employee.FileWatcher()"
+        headless_ms = min(importtime_run(["-c", headless])[2] for _ in range(3))
+        eager_runs = [importtime_run(["-c", eager]) for _ in range(3)]
+        passed = headless_ms <= budget_ms
+        details = f"{headless_ms:.1f} ms (budget {budget_ms:.0f} ms)"
+        if all(returncode == 0 for returncode, _, _ in eager_runs):
+            eager_ms = min(total for _, _, total in eager_runs)
+            passed = passed and headless_ms <= 0.6 * eager_ms
+            details += f", eager {eager_ms:.1f} ms"
+        else:
+            details += ", no eager baseline"
+        print_test("Headless start within import budget", passed, details)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Headless start within import budget", False, str(e))
+        results["failed"] += 1
+    
+    return results
+
+
+def start_local_smtp_server(received: list):
+    """
+    Start a throwaway SMTP server on localhost for the pool tests.
+    
+    Uses aiosmtpd when installed, otherwise the stdlib smtpd module (Python < 3.12).
+    
+    Returns:
+        (port, stop_function) or None if neither is available
+    """
+    import socket
+    import threading
+    import warnings
+    
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    
+    try:
+        from aiosmtpd.controller import Controller
+        
+        class Handler:
+            async def handle_DATA(self, server, session, envelope):
+                received.append(envelope.rcpt_tos)
+                return "250 OK"
+        
+        controller = Controller(Handler(), hostname="127.0.0.1", port=port)
+        controller.start()
+        return port, controller.stop
+    except ImportError:
+        pass
+    
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            import asyncore
+            import smtpd
+    except ImportError:
+        return None
+    
+    class Server(smtpd.SMTPServer):
+        def process_message(self, peer, mailfrom, rcpttos, data, **kwargs):
+            received.append(rcpttos)
+    
+    smtp_server = Server(("127.0.0.1", port), None)
+    thread = threading.Thread(target=asyncore.loop, kwargs={"timeout": 0.05}, daemon=True)
+    thread.start()
+    
+    def stop():
+        smtp_server.close()
+        asyncore.close_all()
+    
+    return port, stop
+
+
+def test_smtp_pool():
+    """Test the business MCP SMTP connection pool against a local server"""
+    print_header("SMTP POOL TESTS")
+    
+    sys.path.insert(0, str(BASE_DIR / "mcp" / "business-mcp"))
+    from email.mime.text import MIMEText
+    import socket
+    from smtp_pool import SMTPConnectionPool
+    
+    results = {"passed": 0, "failed": 0}
+    received = []
+    started = start_local_smtp_server(received)
+    if started is None:
+        print(f"  {YELLOW}Skipped - no local SMTP server available (pip install aiosmtpd){RESET}")
+        return results
+    port, stop = started
+    
+    def message(to):
+        msg = MIMEText("Pool test body")
+        msg["Subject"] = "Pool test"
+        msg["From"] = "sender@example.com"
+        msg["To"] = to
+        return msg
+    
+    pool = SMTPConnectionPool("127.0.0.1", port, use_tls=False, idle_timeout=60, connect_timeout=5)
+    
+    # Test 1: A batch plus single sends share one session
+    try:
+        batch = pool.send_many("sender@example.com", [message(f"client{i}@example.com") for i in range(10)])
+        pool.send("sender@example.com", message("single@example.com"))
+        passed = (all(r["status"] == "success" for r in batch) and len(received) == 11
+                  and pool.stats["opened"] == 1)
+        print_test("Batch reuses one session", passed, f"Stats: {pool.stats}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Batch reuses one session", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Idle sessions are evicted and replaced on the next send
+    try:
+        pool.idle_timeout = 0
+        time.sleep(0.01)
+        evicted = pool.evict_idle()
+        pool.idle_timeout = 60
+        pool.send("sender@example.com", message("after-evict@example.com"))
+        passed = evicted == 1 and pool.stats["opened"] == 2 and len(received) == 12
+        print_test("Idle session evicted", passed, f"Stats: {pool.stats}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Idle session evicted", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: A session the server dropped fails its NOOP check and is replaced
+    try:
+        pool.health_check_after = 0
+        pool._idle[0].smtp.sock.shutdown(socket.SHUT_RDWR)
+        pool.send("sender@example.com", message("after-drop@example.com"))
+        passed = pool.stats["unhealthy"] == 1 and pool.stats["opened"] == 3 and len(received) == 13
+        print_test("Dead session replaced", passed, f"Stats: {pool.stats}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Dead session replaced", False, str(e))
+        results["failed"] += 1
+    
+    # Test 4: Queued emails are drained through send_many in one batch
+    try:
+        import server
+        from outbox import Outbox
+        tmp_dir = Path(tempfile.mkdtemp(prefix="smtp_outbox_test_"))
+        saved = {name: getattr(server, name) for name in ("EMAIL_USERNAME", "EMAIL_FROM", "_smtp_pool")}
+        server.EMAIL_USERNAME = server.EMAIL_FROM = "sender@example.com"
+        server._smtp_pool = pool
+        batches = []
+        send_many = pool.send_many
+        pool.send_many = lambda from_addr, messages: batches.append(len(messages)) or send_many(from_addr, messages)
+        outbox = Outbox(str(tmp_dir / "outbox.db"), server.OUTBOX_HANDLERS,
+                        batch_handlers=server.OUTBOX_BATCH_HANDLERS)
+        before = len(received)
+        ids = [message_id for message_id, _ in outbox.enqueue_many([
+            ("email", "smtp:127.0.0.1", {"to": f"queued{i}@example.com", "subject": "Queued", "body": "Hi"}, None)
+            for i in range(5)
+        ])]
+        processed = outbox.process_due()
+        statuses = {outbox.get(message_id)["status"] for message_id in ids}
+        del pool.send_many
+        for name, value in saved.items():
+            setattr(server, name, value)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        passed = processed == 5 and batches == [5] and statuses == {"sent"} and len(received) == before + 5
+        print_test("Outbox drains emails via send_many", passed, f"Batches: {batches}, statuses: {statuses}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Outbox drains emails via send_many", False, str(e))
+        results["failed"] += 1
+    
+    pool.close_all()
+    stop()
+    return results
+
+
+def test_tool_runner():
+    """Test that blocking MCP tool actions overlap, time out and respect limits"""
+    print_header("MCP TOOL RUNNER TESTS")
+    
+    import asyncio
+    sys.path.insert(0, str(BASE_DIR / "mcp" / "business-mcp"))
+    from tool_runner import ToolRunner, ToolTimeoutError
+    
+    results = {"passed": 0, "failed": 0}
+    runner = ToolRunner(max_workers=4, timeouts={"slow": 0.2}, limits={"single": 1})
+    
+    async def timed(*calls):
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        return outcomes, time.perf_counter() - start
+    
+    # Test 1: Concurrent calls overlap instead of serializing
+    try:
+        outcomes, elapsed = asyncio.run(timed(*(runner.run("fast", time.sleep, 0.2) for _ in range(3))))
+        passed = elapsed < 0.45 and not any(isinstance(o, Exception) for o in outcomes)
+        print_test("Calls overlap", passed, f"3 x 0.2s in {elapsed:.2f}s")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Calls overlap", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: A hung action returns a timeout error
+    try:
+        outcomes, elapsed = asyncio.run(timed(runner.run("slow", time.sleep, 1)))
+        passed = isinstance(outcomes[0], ToolTimeoutError) and elapsed < 0.5
+        print_test("Per-tool timeout", passed, f"Returned after {elapsed:.2f}s")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Per-tool timeout", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: A concurrency limit of one serializes that tool only
+    try:
+        outcomes, elapsed = asyncio.run(timed(*(runner.run("single", time.sleep, 0.1) for _ in range(3))))
+        passed = elapsed >= 0.3 and not any(isinstance(o, Exception) for o in outcomes)
+        print_test("Per-tool concurrency limit", passed, f"3 x 0.1s in {elapsed:.2f}s")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Per-tool concurrency limit", False, str(e))
+        results["failed"] += 1
+    
+    runner.shutdown()
+    return results
+
+
+def test_outbox():
+    """Test the durable MCP outbox: retries, idempotency and recovery"""
+    print_header("MCP OUTBOX TESTS")
+    
+    sys.path.insert(0, str(BASE_DIR / "mcp" / "business-mcp"))
+    from outbox import Outbox, PermanentDeliveryError
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="outbox_test_"))
+    db_path = str(tmp_dir / "outbox.db")
+    attempts = {}
+    
+    def flaky(payload):
+        attempts[payload["to"]] = attempts.get(payload["to"], 0) + 1
+        if attempts[payload["to"]] < 3:
+            raise ConnectionError("provider unavailable")
+        return {"delivered": payload["to"]}
+    
+    def refused(payload):
+        raise PermanentDeliveryError("recipient refused")
+    
+    def wait_for(outbox, message_id, status, timeout=5):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            message = outbox.get(message_id)
+            if message["status"] == status:
+                return message
+            time.sleep(0.02)
+        return outbox.get(message_id)
+    
+    outbox = Outbox(db_path, {"email": flaky, "bounce": refused}, base_delay=0.01, max_delay=0.05)
+    outbox.start()
+    
+    # Test 1: Transient failures are retried until delivered
+    try:
+        message_id, _ = outbox.enqueue("email", "smtp", {"to": "client@example.com"})
+        message = wait_for(outbox, message_id, "sent")
+        passed = message["status"] == "sent" and message["attempts"] == 3
+        print_test("Retried with backoff", passed, f"Status: {message['status']}, attempts: {message['attempts']}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Retried with backoff", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Permanent errors fail without retrying
+    try:
+        message_id, _ = outbox.enqueue("bounce", "smtp", {"to": "nobody@example.com"})
+        message = wait_for(outbox, message_id, "failed")
+        passed = message["status"] == "failed" and message["attempts"] == 1
+        print_test("Permanent error not retried", passed, f"Error: {message['last_error']}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Permanent error not retried", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Re-enqueueing an idempotency key returns the original message
+    try:
+        first, _ = outbox.enqueue("email", "smtp", {"to": "once@example.com"}, idempotency_key="invoice-42")
+        second, duplicate = outbox.enqueue("email", "smtp", {"to": "once@example.com"}, idempotency_key="invoice-42")
+        passed = first == second and duplicate
+        print_test("Idempotency key deduplicates", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Idempotency key deduplicates", False, str(e))
+        results["failed"] += 1
+    
+    outbox.stop()
+    
+    # Test 4: Messages interrupted mid-delivery are delivered after a restart
+    try:
+        import sqlite3
+        stopped = Outbox(db_path, {"email": lambda payload: "ok"})
+        message_id, _ = stopped.enqueue("email", "smtp", {"to": "crash@example.com"})
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE outbox SET status = 'sending' WHERE id = ?", (message_id,))
+        restarted = Outbox(db_path, {"email": lambda payload: "ok"})
+        restarted.start()
+        message = wait_for(restarted, message_id, "sent")
+        restarted.stop()
+        passed = message["status"] == "sent"
+        print_test("Interrupted message recovered", passed, f"Status: {message['status']}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Interrupted message recovered", False, str(e))
+        results["failed"] += 1
+    
+    # Test 5: A batch handler gets due messages per destination and reports each outcome
+    try:
+        calls = []
+        
+        def batch(payloads):
+            calls.append([payload["to"] for payload in payloads])
+            return [PermanentDeliveryError("refused") if payload["to"] == "bad@example.com" else "ok"
+                    for payload in payloads]
+        
+        batched = Outbox(str(tmp_dir / "batch.db"), {"email": lambda payload: "ok"},
+                         batch_handlers={"email": batch})
+        ids = [message_id for message_id, _ in batched.enqueue_many([
+            ("email", "smtp", {"to": "a@example.com"}, None),
+            ("email", "smtp", {"to": "bad@example.com"}, None),
+            ("email", "other-smtp", {"to": "c@example.com"}, None),
+            ("email", "smtp", {"to": "d@example.com"}, None),
+        ])]
+        processed = batched.process_due()
+        statuses = [batched.get(message_id)["status"] for message_id in ids]
+        passed = (processed == 4 and statuses == ["sent", "failed", "sent", "sent"]
+                  and calls == [["a@example.com", "bad@example.com", "d@example.com"], ["c@example.com"]])
+        print_test("Batch delivery per destination", passed, f"Calls: {calls}, statuses: {statuses}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Batch delivery per destination", False, str(e))
+        results["failed"] += 1
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_rate_limiter():
+    """Test token buckets, coalescing and Retry-After against a local HTTP server"""
+    print_header("MCP RATE LIMITER TESTS")
+    
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    sys.path.insert(0, str(BASE_DIR / "mcp" / "business-mcp"))
+    import server
+    from outbox import Outbox
+    from rate_limiter import RateLimiter, TokenBucket
+    
+    results = {"passed": 0, "failed": 0}
+    
+    # Test 1: Burst is allowed, then tokens refill at the configured rate
+    try:
+        bucket = TokenBucket(rate_per_minute=60, burst=3)
+        start = bucket.updated
+        burst = [bucket.try_acquire(start) for _ in range(4)]
+        wait = bucket.wait_time(start)
+        refilled = bucket.try_acquire(start + 1.0)
+        passed = burst == [True, True, True, False] and abs(wait - 1.0) < 0.01 and refilled
+        print_test("Token bucket burst and refill", passed, f"Burst: {burst}, wait: {wait:.2f}s")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Token bucket burst and refill", False, str(e))
+        results["failed"] += 1
+    
+    # Local stand-in for the LinkedIn API: throttles the first request only
+    requests_seen = []
+    
+    class StandIn(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            share = body["specificContent"]["com.linkedin.ugc.ShareContent"]
+            requests_seen.append((time.time(), share["shareCommentary"]["text"], self.headers["Authorization"]))
+            if len(requests_seen) == 1:
+                self.send_response(429)
+                self.send_header("Retry-After", "1")
+                self.end_headers()
+                return
+            self.send_response(201)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(json.dumps({"id": f"urn:li:share:{len(requests_seen)}"}).encode())
+        
+        def log_message(self, *args):
+            pass
+    
+    http_server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    # Deliver through the server's own LinkedIn action so its 429 -> RetryAfterError mapping is exercised
+    saved_url, saved_token = server.LINKEDIN_API_URL, os.environ.get("LINKEDIN_ACCESS_TOKEN")
+    server.LINKEDIN_API_URL = f"http://127.0.0.1:{http_server.server_address[1]}/v2/shares"
+    os.environ["LINKEDIN_ACCESS_TOKEN"] = "test-token"
+    
+    tmp_dir = Path(tempfile.mkdtemp(prefix="ratelimit_test_"))
+    # One worker so the order is deterministic: the pause must hold back the other post too
+    outbox = Outbox(str(tmp_dir / "outbox.db"), {"linkedin": server.OUTBOX_HANDLERS["linkedin"]}, workers=1,
+                    rate_limiter=RateLimiter({"linkedin": (600, 2)}),
+                    coalesce_windows={"linkedin": 60})
+    
+    # Test 2: Identical content within the window is coalesced
+    try:
+        first, _ = outbox.enqueue("linkedin", "linkedin", {"content": "Launch day!"})
+        repeat, duplicate = outbox.enqueue("linkedin", "linkedin", {"content": "Launch day!"})
+        second, _ = outbox.enqueue("linkedin", "linkedin", {"content": "Thanks everyone"})
+        passed = repeat == first and duplicate and second != first
+        print_test("Duplicate content coalesced", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Duplicate content coalesced", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: A 429 pauses the platform for Retry-After, then both posts go out
+    try:
+        started = time.time()
+        outbox.start()
+        deadline = started + 10
+        while time.time() < deadline and outbox.counts().get("sent", 0) < 2:
+            time.sleep(0.05)
+        outbox.stop()
+        statuses = [outbox.get(first)["status"], outbox.get(second)["status"]]
+        resumed = requests_seen[1][0] - requests_seen[0][0] if len(requests_seen) > 1 else 0
+        # A 429 mapped to RetryAfterError does not count as a failed attempt
+        attempts = outbox.get(first)["attempts"]
+        passed = (statuses == ["sent", "sent"] and len(requests_seen) == 3 and resumed >= 0.95
+                  and attempts == 1 and all(seen[2] == "Bearer test-token" for seen in requests_seen))
+        print_test("Retry-After honoured", passed,
+                   f"Requests: {len(requests_seen)}, resumed after {resumed:.2f}s, statuses: {statuses}, "
+                   f"attempts: {attempts}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Retry-After honoured", False, str(e))
+        results["failed"] += 1
+    
+    server.LINKEDIN_API_URL = saved_url
+    if saved_token is None:
+        os.environ.pop("LINKEDIN_ACCESS_TOKEN", None)
+    else:
+        os.environ["LINKEDIN_ACCESS_TOKEN"] = saved_token
+    http_server.shutdown()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def test_log_pipeline():
+    """Test the batched MCP logging pipeline"""
+    print_header("MCP LOG PIPELINE TESTS")
+    
+    import logging
+    import queue
+    sys.path.insert(0, str(BASE_DIR / "mcp" / "business-mcp"))
+    from log_pipeline import BatchFileHandler, BatchingLogListener, InProcessQueueHandler
+    
+    results = {"passed": 0, "failed": 0}
+    tmp_dir = Path(tempfile.mkdtemp(prefix="log_pipeline_test_"))
+    log_file = tmp_dir / "business.log"
+    
+    handler = BatchFileHandler(str(log_file))
+    handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = BatchingLogListener(log_queue, [handler], max_batch=100)
+    logger = logging.getLogger("business-mcp.pipeline-test")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    queue_handler = InProcessQueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    
+    # Test 1: Every message is written, in order, by the time stop() returns
+    try:
+        for index in range(1000):
+            logger.info("BUSINESS_ACTIVITY: message %d", index)
+        listener.start()
+        listener.stop()
+        lines = log_file.read_text().splitlines()
+        expected = [f"INFO - BUSINESS_ACTIVITY: message {i}" for i in range(1000)]
+        passed = lines == expected
+        print_test("All records written in order", passed, f"{len(lines)} lines")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("All records written in order", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Records are flushed in batches, not one by one
+    try:
+        passed = listener.records == 1000 and listener.batches <= 11
+        print_test("Flushed in batches", passed, f"{listener.records} records in {listener.batches} batches")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Flushed in batches", False, str(e))
+        results["failed"] += 1
+    
+    logger.removeHandler(queue_handler)
+    handler.close()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+# =============================================================================
+# INTEGRATION TEST
+# =============================================================================
+
+def test_integration():
+    """Test integration between watcher and planner"""
+    print_header("INTEGRATION TESTS")
+    
+    results = {"passed": 0, "failed": 0}
+    
+    # Test 1: Both modules can be imported together
+    try:
+        from watch_inbox import WatcherState
+        from task_planner import TaskPlanner
+        passed = True
+        print_test("Module compatibility", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Module compatibility", False, str(e))
+        results["failed"] += 1
+    
+    # Test 2: Shared log file works
+    try:
+        from watch_inbox import log_action as watcher_log
+        from task_planner import log_action as planner_log
+        
+        watcher_log("INTEGRATION: Watcher log test")
+        planner_log("INTEGRATION: Planner log test")
+        
+        action_log = LOGS_DIR / "action.log"
+        content = action_log.read_text()
+        passed = "Watcher log test" in content and "Planner log test" in content
+        print_test("Shared log file", passed)
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Shared log file", False, str(e))
+        results["failed"] += 1
+    
+    # Test 3: Folder structure consistency
+    try:
+        folders = [
+            VAULT_DIR / "Inbox",
+            VAULT_DIR / "Needs_Action",
+            VAULT_DIR / "Done",
+            LOGS_DIR
+        ]
+        passed = all(f.exists() for f in folders)
+        print_test("Folder structure consistency", passed,
+                  f"All folders exist: {passed}")
+        results["passed" if passed else "failed"] += 1
+    except Exception as e:
+        print_test("Folder structure consistency", False, str(e))
+        results["failed"] += 1
+    
+    return results
+
+
+# =============================================================================
+# MAIN TEST RUNNER
+# =============================================================================
+
+def main():
+    print(f"""
+{BLUE}╔══════════════════════════════════════════════════════════╗
+║           AI Employee - Implementation Tests                  ║
+║           Vault Watcher & Task Planner                        ║
+╚══════════════════════════════════════════════════════════╝{RESET}
+""")
+    
+    # Cleanup before tests
+    cleanup_test_files()
+    
+    total_results = {"passed": 0, "failed": 0}
+    
+    # Run Vault Watcher tests
+    watcher_results = test_vault_watcher()
+    total_results["passed"] += watcher_results["passed"]
+    total_results["failed"] += watcher_results["failed"]
+    
+    # Run Task Planner tests
+    planner_results = test_task_planner()
+    total_results["passed"] += planner_results["passed"]
+    total_results["failed"] += planner_results["failed"]
+    
+    # Run Ledger Engine tests
+    ledger_results = test_ledger_engine()
+    total_results["passed"] += ledger_results["passed"]
+    total_results["failed"] += ledger_results["failed"]
+    
+    # Run Accounting Aggregates tests
+    aggregates_results = test_accounting_aggregates()
+    total_results["passed"] += aggregates_results["passed"]
+    total_results["failed"] += aggregates_results["failed"]
+    
+    # Run Briefing Collector tests
+    collector_results = test_briefing_collector()
+    total_results["passed"] += collector_results["passed"]
+    total_results["failed"] += collector_results["failed"]
+    
+    # Run Metrics Store tests
+    metrics_results = test_metrics_store()
+    total_results["passed"] += metrics_results["passed"]
+    total_results["failed"] += metrics_results["failed"]
+    
+    # Run Briefing Collector Runner tests
+    runner_results = test_run_collectors()
+    total_results["passed"] += runner_results["passed"]
+    total_results["failed"] += runner_results["failed"]
+    
+    # Run Report Writer tests
+    report_results = test_report_writer()
+    total_results["passed"] += report_results["passed"]
+    total_results["failed"] += report_results["failed"]
+    
+    # Run Health Monitor tests
+    health_results = test_health_monitor()
+    total_results["passed"] += health_results["passed"]
+    total_results["failed"] += health_results["failed"]
+    
+    # Run Dashboard Data tests
+    dashboard_results = test_dashboard_data()
+    total_results["passed"] += dashboard_results["passed"]
+    total_results["failed"] += dashboard_results["failed"]
+    
+    # Run Vault Events tests
+    events_results = test_vault_events()
+    total_results["passed"] += events_results["passed"]
+    total_results["failed"] += events_results["failed"]
+    
+    # Run Metrics Registry tests
+    prom_results = test_metrics_registry()
+    total_results["passed"] += prom_results["passed"]
+    total_results["failed"] += prom_results["failed"]
+    
+    # Run Tracing tests
+    trace_results = test_tracing()
+    total_results["passed"] += trace_results["passed"]
+    total_results["failed"] += trace_results["failed"]
+    
+    # Run Profiling tests
+    profile_results = test_profiling()
+    total_results["passed"] += profile_results["passed"]
+    total_results["failed"] += profile_results["failed"]
+    
+    # Run Benchmark Suite tests
+    bench_results = test_benchmark()
+    total_results["passed"] += bench_results["passed"]
+    total_results["failed"] += bench_results["failed"]
+    
+    # Run Worker Pool tests
+    pool_results = test_worker_pool()
+    total_results["passed"] += pool_results["passed"]
+    total_results["failed"] += pool_results["failed"]
+    
+    # Run Startup Budget tests
+    startup_results = test_startup_budget()
+    total_results["passed"] += startup_results["passed"]
+    total_results["failed"] += startup_results["failed"]
+    
+    # Run SMTP Pool tests
+    smtp_results = test_smtp_pool()
+    total_results["passed"] += smtp_results["passed"]
+    total_results["failed"] += smtp_results["failed"]
+    
+    # Run MCP Tool Runner tests
+    runner_results = test_tool_runner()
+    total_results["passed"] += runner_results["passed"]
+    total_results["failed"] += runner_results["failed"]
+    
+    # Run MCP Outbox tests
+    outbox_results = test_outbox()
+    total_results["passed"] += outbox_results["passed"]
+    total_results["failed"] += outbox_results["failed"]
+    
+    # Run MCP Rate Limiter tests
+    limiter_results = test_rate_limiter()
+    total_results["passed"] += limiter_results["passed"]
+    total_results["failed"] += limiter_results["failed"]
+    
+    # Run MCP Log Pipeline tests
+    pipeline_results = test_log_pipeline()
+    total_results["passed"] += pipeline_results["passed"]
+    total_results["failed"] += pipeline_results["failed"]
     
     # Run Integration tests
     integration_results = test_integration()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Tracing - Per-Cycle Span Traces
+
+Lightweight, stdlib-only tracing for the scheduler and inbox watcher. A
+trace covers one cycle (or one watcher scan batch) and records nested
+spans: the cycle, each stage, each file and each subprocess. Finished
+traces are written in the Chrome trace-event format, one file per cycle,
+to Logs/traces/ and can be opened in a flame-style viewer:
+
+    https://ui.perfetto.dev            (Open trace file)
+    chrome://tracing                   (Load)
+    python scripts/tracing.py          # list recent traces
+    python scripts/tracing.py Logs/traces/scheduler_....json --top 15
+
+Spans opened while no trace is active cost a single attribute check, so
+the instrumented functions stay cheap when run standalone.
+
+Usage:
+    from tracing import span, trace_cycle
+
+    with trace_cycle("scheduler", cycle=3):
+        with span("task-planner", cat="stage"):
+            for path in files:
+                with span("plan_file", cat="file", file=path.name) as attrs:
+                    attrs["plan"] = plan(path).name
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterator
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+
+TRACES_DIR = Path(os.environ.get("TRACE_DIR", BASE_DIR / "Logs" / "traces"))
+
+# Only keep traces of cycles at least this slow (0 keeps every cycle)
+TRACE_MIN_SECONDS = float(os.environ.get("TRACE_MIN_SECONDS", "0"))
+
+# Newest trace files kept on disk; older ones are pruned after each write
+TRACE_KEEP = int(os.environ.get("TRACE_KEEP", "200"))
+
+TRACING_ENABLED = os.environ.get("TRACING", "1").lower() not in ("0", "false", "no", "off")
+
+
+# =============================================================================
+# TRACER
+# =============================================================================
+
+class Tracer:
+    """
+    Collects spans for the active trace as Chrome "complete" events.
+
+    Traces belong to the thread that began them: each thread records at
+    most one trace at a time, and a span is added only to its own thread's
+    trace. A watcher scan and a processing run on another thread therefore
+    trace independently instead of sharing (or discarding) one trace.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def recording(self) -> bool:
+        """True while the calling thread is recording a trace"""
+        return getattr(self._local, "events", None) is not None
+
+    def begin(self) -> None:
+        """Start recording a new trace on this thread, discarding anything unfinished"""
+        self._local.events = []
+        self._local.origin_ns = time.perf_counter_ns()
+
+    def end(self) -> List[Dict[str, Any]]:
+        """
+        Stop recording this thread's trace and return its events.
+
+        Returns:
+            list: Span events followed by the thread-name metadata event
+        """
+        events = getattr(self._local, "events", None) or []
+        self._local.events = None
+        thread = threading.current_thread()
+        events.append({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": thread.ident,
+                       "args": {"name": thread.name}})
+        return events
+
+    @contextmanager
+    def span(self, name: str, cat: str = "function", **args) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block as a span of this thread's active trace.
+
+        Args:
+            name: Span name shown in the viewer
+            cat: Category (cycle, stage, file, subprocess, ...)
+            **args: Attributes attached to the span
+
+        Yields:
+            dict: The span attributes; callers may add results to it
+        """
+        if not self.recording:
+            yield args
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield args
+        except BaseException as e:
+            args["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._add(name, cat, start, time.perf_counter_ns(), args)
+
+    def _add(self, name: str, cat: str, start_ns: int, end_ns: int, args: Dict[str, Any]) -> None:
+        events = getattr(self._local, "events", None)
+        if events is None:
+            return
+        origin_ns = self._local.origin_ns
+        events.append({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (start_ns - origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+
+TRACER = Tracer()
+span = TRACER.span
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def write_trace(events: List[Dict[str, Any]], component: str,
+                directory: Path = TRACES_DIR, keep: int = TRACE_KEEP,
+                **metadata) -> Path:
+    """
+    Write trace events as a Chrome trace-event JSON file.
+
+    Args:
+        events: Events returned by Tracer.end()
+        component: Process name, used for the file name and process label
+        directory: Traces folder
+        keep: Newest files to keep in the folder (0 keeps all)
+        **metadata: Extra fields stored under "otherData"
+
+    Returns:
+        Path: The written trace file
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    path = directory / f"{component}_{stamp}.json"
+
+    events = [{"name": "process_name", "ph": "M", "pid": os.getpid(),
+               "args": {"name": component}}] + events
+    trace = {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {"component": component, **metadata},
+    }
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(trace, f, default=str)
+    os.replace(tmp, path)
+
+    if keep > 0:
+        prune_traces(directory, keep)
+    return path
+
+
+def _trace_files(directory: Path) -> List[Path]:
+    """Trace files oldest first, across all components"""
+    files = []
+    for path in Path(directory).glob("*.json"):
+        try:
+            files.append((path.stat().st_mtime_ns, path.name, path))
+        except OSError:
+            continue
+    return [path for _, _, path in sorted(files)]
+
+
+def prune_traces(directory: Path = TRACES_DIR, keep: int = TRACE_KEEP) -> int:
+    """Delete all but the newest `keep` trace files; returns how many were removed"""
+    traces = _trace_files(directory)
+    removed = 0
+    for path in traces[:-keep] if keep > 0 else []:
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+@contextmanager
+def trace_cycle(component: str, min_seconds: Optional[float] = None,
+                directory: Optional[Path] = None, **args) -> Iterator[Dict[str, Any]]:
+    """
+    Record one cycle as a trace and write it when the cycle finishes.
+
+    The cycle itself is the root span. The trace is dropped when tracing
+    is disabled, when this thread is already recording a trace, or when
+    the cycle was faster than min_seconds. Other threads may record their
+    own cycles at the same time.
+
+    Args:
+        component: Name of the traced process (scheduler, watcher, ...)
+        min_seconds: Slowness threshold (defaults to TRACE_MIN_SECONDS)
+        directory: Traces folder (defaults to TRACES_DIR)
+        **args: Attributes of the root span
+
+    Yields:
+        dict: Root span attributes; "trace_file" is set once written
+    """
+    if not TRACING_ENABLED or TRACER.recording:
+        yield args
+        return
+
+    threshold = TRACE_MIN_SECONDS if min_seconds is None else min_seconds
+    TRACER.begin()
+    started_at = datetime.now().isoformat(timespec="seconds")
+    start = time.perf_counter()
+    try:
+        with TRACER.span(f"{component} cycle", cat="cycle", **args) as args:
+            yield args
+    finally:
+        events = TRACER.end()
+        elapsed = time.perf_counter() - start
+        if elapsed >= threshold:
+            try:
+                args["trace_file"] = write_trace(
+                    events, component, directory or TRACES_DIR,
+                    started_at=started_at, duration_seconds=round(elapsed, 6))
+            except OSError as e:
+                print(f"[WARN] Could not write trace: {e}", file=sys.stderr)
+
+
+# =============================================================================
+# READING TRACES
+# =============================================================================
+
+def load_trace(path: Path) -> Dict[str, Any]:
+    """Load a trace file written by write_trace()"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def list_traces(directory: Path = TRACES_DIR, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Summaries of the most recent traces, newest first.
+
+    Returns:
+        list: Dicts with path, component, started_at and duration_seconds
+    """
+    summaries = []
+    for path in reversed(_trace_files(directory)[-limit:]):
+        try:
+            other = load_trace(path).get("otherData", {})
+        except (OSError, ValueError):
+            continue
+        summaries.append({
+            "path": path,
+            "component": other.get("component", "?"),
+            "started_at": other.get("started_at", ""),
+            "duration_seconds": other.get("duration_seconds", 0.0),
+        })
+    return summaries
+
+
+def slowest_spans(trace: Dict[str, Any], top: int = 10,
+                  cat: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    The slowest spans of a trace.
+
+    Args:
+        trace: Loaded trace
+        top: Number of spans to return
+        cat: Only spans of this category
+
+    Returns:
+        list: Span events sorted by duration, slowest first
+    """
+    spans = [e for e in trace.get("traceEvents", [])
+             if e.get("ph") == "X" and (cat is None or e.get("cat") == cat)]
+    spans.sort(key=lambda e: e.get("dur", 0), reverse=True)
+    return spans[:top]
+
+
+def _describe(event: Dict[str, Any]) -> str:
+    attrs = event.get("args", {})
+    detail = attrs.get("file") or attrs.get("script") or ""
+    error = " ERROR" if attrs.get("error") else ""
+    return f"{event['name']}" + (f" [{detail}]" if detail else "") + error
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Inspect cycle traces in Logs/traces/")
+    parser.add_argument("trace", nargs="?", help="Trace file to summarize (default: list recent traces)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest spans to show")
+    parser.add_argument("--cat", help="Only spans of this category (stage, file, subprocess)")
+    parser.add_argument("--dir", default=str(TRACES_DIR), help="Traces folder")
+    args = parser.parse_args()
+
+    if not args.trace:
+        traces = list_traces(Path(args.dir))
+        if not traces:
+            print(f"No traces in {args.dir}")
+            return 0
+        for t in traces:
+            print(f"{t['duration_seconds'] * 1000:>10.1f} ms  {t['component']:<10} "
+                  f"{t['started_at']:<20} {t['path'].name}")
+        return 0
+
+    trace = load_trace(Path(args.trace))
+    for event in slowest_spans(trace, args.top, args.cat):
+        print(f"{event['dur'] / 1000:>10.1f} ms  {event.get('cat', ''):<11} {_describe(event)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
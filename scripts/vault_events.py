@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Vault Events - Live Status Stream for the Web Dashboard
+
+The scheduler and the inbox watcher publish their state to small JSON files
+under Logs/status/. This module watches those files and the vault folders
+and pushes every change to subscribers as Server-Sent Events, so the
+dashboard learns about new tasks, running stages and the next sync time as
+they happen instead of re-reading the vault on every rerun.
+
+    publish_status()   Writer side, used by run_ai_employee.py and watch_inbox.py
+    VaultWatcher       Detects changes (watchdog if installed, else one stat()
+                       per watched path per interval)
+    EventHub           Keeps the latest value per event and wakes subscribers
+    /events            SSE stream: a snapshot on connect, then changes only
+    /state             Current snapshot as plain JSON
+    /metrics           Merged Prometheus textfiles (see metrics_registry.py)
+    LiveState          Dashboard-side subscriber running on a background thread
+
+Events:
+    status    {"scheduler": {...}, "watcher": {...}} including "alive"
+    counts    Items per vault stage (as dashboard_data.get_task_counts)
+    actions   Newest action log lines, newest first
+
+The scheduler daemon (run_ai_employee.py --daemon) serves the stream itself
+via ensure_event_server(); run this module directly only to serve it
+without the scheduler. Set VAULT_EVENTS=0 to disable the embedded server.
+
+Usage:
+    python scripts/vault_events.py                  # Serve on 127.0.0.1:8765
+    python scripts/vault_events.py --port 9000
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import urllib.request
+from collections import deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.resolve()))
+from dashboard_data import (
+    COUNTED_FOLDERS, RACY_WINDOW_NS, path_signature, scan_files, tail_lines,
+)
+from metrics_registry import CONTENT_TYPE, METRICS_DIR, collect_textfiles
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+
+VAULT_DIR = BASE_DIR / "AI_Employee_Vault"
+LOGS_DIR = BASE_DIR / "Logs"
+STATUS_DIR = LOGS_DIR / "status"
+ACTION_LOG = LOGS_DIR / "action.log"
+
+EVENTS_HOST = os.environ.get("VAULT_EVENTS_HOST", "127.0.0.1")
+EVENTS_PORT = int(os.environ.get("VAULT_EVENTS_PORT", "8765"))
+EVENTS_URL = os.environ.get("VAULT_EVENTS_URL", f"http://{EVENTS_HOST}:{EVENTS_PORT}/events")
+# The scheduler daemon embeds the server unless this is switched off
+EVENTS_ENABLED = os.environ.get("VAULT_EVENTS", "1").lower() not in ("0", "false", "no", "off")
+
+POLL_INTERVAL_SECONDS = 1.0   # fallback check interval without watchdog
+HEARTBEAT_SECONDS = 15        # SSE comment sent on idle streams
+RECENT_ACTIONS = 10
+HISTORY_LENGTH = 256          # events kept for slow subscribers
+
+MAX_RECONNECT_SECONDS = 30
+
+
+# =============================================================================
+# STATUS PUBLISHING
+# =============================================================================
+
+def publish_status(component: str, state: str, status_dir: Path = STATUS_DIR, **fields) -> None:
+    """
+    Publish a component's current state to Logs/status/<component>.json.
+
+    Written atomically; failures are ignored so status reporting can never
+    break the component itself.
+
+    Args:
+        component: e.g. "scheduler" or "watcher"
+        state: Short state name ("running", "idle", "watching", "stopped", ...)
+        **fields: Extra JSON-serializable details (stage, next_cycle_at, ...)
+    """
+    status = {"component": component, "state": state, "pid": os.getpid(),
+              "updated_at": datetime.now().isoformat(timespec="seconds")}
+    status.update(fields)
+    try:
+        status_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = status_dir / f".{component}.tmp"
+        tmp_file.write_text(json.dumps(status), encoding="utf-8")
+        os.replace(tmp_file, status_dir / f"{component}.json")
+    except OSError:
+        pass
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def read_statuses(status_dir: Path = STATUS_DIR) -> Dict[str, Dict[str, Any]]:
+    """All published statuses keyed by component, without liveness"""
+    statuses = {}
+    for name in scan_files(status_dir, ".json"):
+        try:
+            with open(status_dir / name, "r", encoding="utf-8") as f:
+                statuses[name[:-len(".json")]] = json.load(f)
+        except (OSError, ValueError):
+            continue
+    return statuses
+
+
+def with_liveness(statuses: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Copy of statuses with "alive" set from the publishing process's PID"""
+    return {
+        component: dict(status, alive=status.get("state") != "stopped" and _pid_alive(status.get("pid")))
+        for component, status in statuses.items()
+    }
+
+
+# =============================================================================
+# EVENT HUB
+# =============================================================================
+
+class EventHub:
+    """
+    Latest value per event name plus a short history, with blocking waits.
+
+    Publishing a value equal to the current one is a no-op, so watchers can
+    publish freely and subscribers only see real changes.
+    """
+
+    def __init__(self, history: int = HISTORY_LENGTH):
+        self._condition = threading.Condition()
+        self._latest: Dict[str, Tuple[int, Any]] = {}
+        self._history: deque = deque(maxlen=history)
+        self.last_id = 0
+
+    def publish(self, event: str, data: Any) -> bool:
+        """Record a new value; returns False if it was unchanged"""
+        with self._condition:
+            current = self._latest.get(event)
+            if current is not None and current[1] == data:
+                return False
+            self.last_id += 1
+            self._latest[event] = (self.last_id, data)
+            self._history.append((self.last_id, event, data))
+            self._condition.notify_all()
+            return True
+
+    def snapshot(self) -> List[Tuple[int, str, Any]]:
+        """Current value of every event, oldest first"""
+        with self._condition:
+            return sorted((event_id, event, data) for event, (event_id, data) in self._latest.items())
+
+    def wait(self, after_id: int, timeout: float) -> List[Tuple[int, str, Any]]:
+        """
+        Events newer than after_id, waiting up to timeout for one to arrive.
+
+        A subscriber that fell behind the history gets a fresh snapshot.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.last_id > after_id, timeout)
+            if self.last_id <= after_id:
+                return []
+            if not self._history or self._history[0][0] > after_id + 1:
+                return [item for item in self.snapshot() if item[0] > after_id]
+            return [item for item in self._history if item[0] > after_id]
+
+
+# =============================================================================
+# VAULT WATCHER
+# =============================================================================
+
+class VaultWatcher:
+    """
+    Publishes status, counts and actions events whenever their sources change.
+
+    Each source is re-read only when the signature (mtime, size) of one of
+    its paths changes. Signatures taken within RACY_WINDOW_NS of the change
+    are re-checked on the next pass, since coarse timestamps can hide a
+    second change.
+    """
+
+    def __init__(self, hub: EventHub, vault_dir: Path = VAULT_DIR,
+                 status_dir: Path = STATUS_DIR, action_log: Path = ACTION_LOG,
+                 interval: float = POLL_INTERVAL_SECONDS):
+        self.hub = hub
+        self.vault_dir = Path(vault_dir)
+        self.status_dir = Path(status_dir)
+        self.action_log = Path(action_log)
+        self.interval = interval
+        self._signatures: Dict[str, Optional[tuple]] = {}
+        self._statuses: Dict[str, Dict[str, Any]] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+
+        self.sources: List[Tuple[str, Callable[[], List[Path]], Callable[[], Any]]] = [
+            ("status", lambda: [self.status_dir], self._load_statuses),
+            ("counts", lambda: [self.vault_dir / name for name in COUNTED_FOLDERS], self._count_tasks),
+            ("actions", lambda: [self.action_log], lambda: tail_lines(self.action_log, RECENT_ACTIONS)[::-1]),
+        ]
+
+    def _load_statuses(self) -> None:
+        self._statuses = read_statuses(self.status_dir)
+
+    def _count_tasks(self) -> Dict[str, int]:
+        return {name: len(scan_files(self.vault_dir / name, suffix)) for name, suffix in COUNTED_FOLDERS.items()}
+
+    def check(self) -> int:
+        """Re-read changed sources and publish them; returns events published"""
+        published = 0
+        now_ns = time.time_ns()
+        for event, paths, load in self.sources:
+            signature = tuple(path_signature(p) for p in paths())
+            if self._signatures.get(event) != signature:
+                payload = load()
+                if event != "status":
+                    published += self.hub.publish(event, payload)
+                racy = any(now_ns - mtime < RACY_WINDOW_NS for mtime, _ in signature)
+                self._signatures[event] = None if racy else signature
+
+        # Liveness can change without any file changing (a crashed process)
+        published += self.hub.publish("status", with_liveness(self._statuses))
+        return published
+
+    def wake(self) -> None:
+        """Check now instead of at the next interval"""
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                print(f"[vault-events] check failed: {e}", file=sys.stderr)
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _start_observer(self) -> None:
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                watcher.wake()
+
+        self._observer = Observer()
+        for folder in [self.vault_dir, self.status_dir, self.action_log.parent]:
+            if folder.exists():
+                self._observer.schedule(Handler(), str(folder), recursive=folder == self.vault_dir)
+        self._observer.start()
+
+    def start(self) -> None:
+        if self._thread is None:
+            if HAS_WATCHDOG:
+                self._start_observer()
+            self._thread = threading.Thread(target=self._run, name="vault-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join(5)
+            self._thread = None
+
+
+# =============================================================================
+# SSE SERVER
+# =============================================================================
+
+def format_event(event_id: int, event: str, data: Any) -> bytes:
+    """One Server-Sent Events message"""
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+
+
+class EventStreamHandler(BaseHTTPRequestHandler):
+    """GET /events (SSE stream), /state (JSON snapshot) and /metrics"""
+
+    hub: EventHub = None
+    heartbeat = HEARTBEAT_SECONDS
+    metrics_dir = METRICS_DIR
+
+    def _send_body(self, content_type: str, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/state":
+            body = json.dumps({event: data for _, event, data in self.hub.snapshot()})
+            self._send_body("application/json", body.encode("utf-8"))
+            return
+        if path == "/metrics":
+            self._send_body(CONTENT_TYPE, collect_textfiles(self.metrics_dir).encode("utf-8"))
+            return
+        if path != "/events":
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        try:
+            last_id = 0
+            pending = self.hub.snapshot()
+            while True:
+                if pending:
+                    for item in pending:
+                        self.wfile.write(format_event(*item))
+                    last_id = pending[-1][0]
+                else:
+                    self.wfile.write(b": ping\n\n")
+                self.wfile.flush()
+                pending = self.hub.wait(last_id, self.heartbeat)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_event_server(host: str = EVENTS_HOST, port: int = EVENTS_PORT,
+                       vault_dir: Path = VAULT_DIR, status_dir: Path = STATUS_DIR,
+                       action_log: Path = ACTION_LOG,
+                       interval: float = POLL_INTERVAL_SECONDS) -> Tuple[ThreadingHTTPServer, VaultWatcher]:
+    """
+    Start the watcher and the SSE server on background threads.
+
+    Returns:
+        (server, watcher); call server.shutdown() and watcher.stop() to stop
+    """
+    hub = EventHub()
+    watcher = VaultWatcher(hub, vault_dir, status_dir, action_log, interval)
+    watcher.check()
+    watcher.start()
+
+    handler = type("BoundEventStreamHandler", (EventStreamHandler,), {"hub": hub})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="vault-events", daemon=True).start()
+    return server, watcher
+
+
+def ensure_event_server(host: str = EVENTS_HOST,
+                        port: int = EVENTS_PORT) -> Optional[Tuple[ThreadingHTTPServer, VaultWatcher]]:
+    """
+    Start the event server for this process unless it is disabled or another
+    process (e.g. a standalone vault_events.py) already serves the port.
+
+    Returns:
+        (server, watcher) for release_event_server(), or None
+    """
+    if not EVENTS_ENABLED:
+        return None
+    try:
+        return start_event_server(host, port)
+    except OSError as e:
+        print(f"[INFO] Vault events not started on {host}:{port}: {e}", file=sys.stderr)
+        return None
+
+
+def release_event_server(started: Optional[Tuple[ThreadingHTTPServer, VaultWatcher]]) -> None:
+    """Stop a server returned by ensure_event_server()"""
+    if started is None:
+        return
+    server, watcher = started
+    server.shutdown()
+    server.server_close()
+    watcher.stop()
+
+
+# =============================================================================
+# SUBSCRIBER (DASHBOARD SIDE)
+# =============================================================================
+
+class LiveState:
+    """
+    Latest event values from the stream, kept current by a background thread.
+
+    Reading `data` never blocks or touches the disk; `connected` is False
+    while the stream is down (callers then fall back to reading files).
+    """
+
+    def __init__(self, url: str = EVENTS_URL):
+        self.url = url
+        self.data: Dict[str, Any] = {}
+        self.version = 0
+        self.connected = False
+        self._thread: Optional[threading.Thread] = None
+
+    def _consume(self, lines) -> None:
+        event, data = None, []
+        for raw in lines:
+            line = raw.decode("utf-8").rstrip("\r\n")
+            if not line:
+                if event and data:
+                    self.data[event] = json.loads("\n".join(data))
+                    self.version += 1
+                event, data = None, []
+            elif line.startswith("event:"):
+                event = line[6:].strip()
+            elif line.startswith("data:"):
+                data.append(line[5:].strip())
+
+    def _run(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                with urllib.request.urlopen(self.url, timeout=HEARTBEAT_SECONDS * 2) as response:
+                    self.connected = True
+                    delay = 1.0
+                    self._consume(response)
+            except Exception:
+                pass
+            self.connected = False
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_SECONDS)
+
+    def start(self) -> "LiveState":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="live-state", daemon=True)
+            self._thread.start()
+        return self
+
+
+_live_states: Dict[str, LiveState] = {}
+_live_lock = threading.Lock()
+
+
+def get_live_state(url: str = EVENTS_URL) -> LiveState:
+    """Process-wide subscriber for url, started on first use"""
+    with _live_lock:
+        if url not in _live_states:
+            _live_states[url] = LiveState(url).start()
+        return _live_states[url]
+
+
+# =============================================================================
+# CLI ENTRY POINT
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve live vault status as Server-Sent Events")
+    parser.add_argument("--host", default=EVENTS_HOST, help=f"Bind address (default: {EVENTS_HOST})")
+    parser.add_argument("--port", type=int, default=EVENTS_PORT, help=f"Port (default: {EVENTS_PORT})")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL_SECONDS,
+                        help="Seconds between change checks")
+    args = parser.parse_args()
+
+    server, watcher = start_event_server(args.host, args.port, interval=args.interval)
+    mode = "watchdog + polling" if HAS_WATCHDOG else f"polling every {args.interval:g}s"
+    print(f"Vault events on http://{args.host}:{args.port}/events ({mode}). Press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        watcher.stop()
+
+
+if __name__ == "__main__":
+    main()
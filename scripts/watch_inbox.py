@@ -24,10 +24,16 @@ import sys
 import time
 import random
 import signal
+import threading
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Set, Optional
+from typing import Set, Optional, List, Callable, Sequence
+
+from vault_events import publish_status
+from metrics_registry import counter, gauge, histogram, write_textfile
+from tracing import span, trace_cycle
+from worker_pool import ensure_pool, release_pool, run_script
 
 # =============================================================================
 # CONFIGURATION
@@ -94,6 +100,20 @@ class WatcherState:
 # Global state instance
 state = WatcherState()
 
+# Metrics (written to Logs/metrics/watcher.prom after every scan)
+DETECTIONS = counter("watcher_detections_total", "New inbox files detected")
+INBOX_FILES = gauge("watcher_inbox_files", "Markdown files currently in the inbox")
+SCAN_SECONDS = histogram("watcher_scan_seconds", "Time to scan the inbox for new files")
+PROCESSING_SECONDS = histogram("watcher_ai_processing_seconds", "Duration of triggered AI processing runs")
+PROCESSING_FAILURES = counter("watcher_ai_processing_failures_total", "AI processing runs that failed or timed out")
+COALESCED_FILES = counter("watcher_ai_processing_coalesced_total", "Detected files that shared a processing run with others")
+
+
+def publish_watcher_status(status: str, **fields) -> None:
+    """Publish watcher state for the live dashboard (see vault_events.py)"""
+    publish_status("watcher", status, files_processed=state.files_processed,
+                   detections=state.detections_logged, **fields)
+
 
 # =============================================================================
 # LOGGING UTILITIES
@@ -167,19 +187,28 @@ def trigger_ai_processing() -> bool:
     Returns:
         bool: True if triggered successfully, False otherwise
     """
+    with PROCESSING_SECONDS.time():
+        succeeded = _run_ai_processing()
+    if not succeeded:
+        PROCESSING_FAILURES.inc()
+    return succeeded
+
+
+def _run_ai_processing() -> bool:
     try:
         if not AI_EMPLOYEE_SCRIPT.exists():
             log_error(f"AI Employee script not found: {AI_EMPLOYEE_SCRIPT}")
             return False
         
-        # Run the AI employee script in once mode
-        result = subprocess.run(
-            [sys.executable, str(AI_EMPLOYEE_SCRIPT), "--once"],
-            cwd=str(BASE_DIR),
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        # Run the AI employee script in once mode (in a warm pool worker when available)
+        with span("subprocess", cat="subprocess", script=AI_EMPLOYEE_SCRIPT.name) as attrs:
+            result = run_script(
+                AI_EMPLOYEE_SCRIPT,
+                ["--once"],
+                cwd=BASE_DIR,
+                timeout=300  # 5 minute timeout
+            )
+            attrs["returncode"] = result.returncode
         
         if result.returncode == 0:
             log_action(f"AI Processing completed successfully")
@@ -196,6 +225,92 @@ def trigger_ai_processing() -> bool:
         return False
 
 
+class ProcessingTrigger:
+    """
+    Coalesces AI processing requests into as few runs as possible.
+    
+    Each run of ai_employee.py --once processes the whole inbox, so one run
+    covers every file detected before it started. Requests made while a run
+    is in progress are queued for exactly one follow-up run, however many
+    files arrive meanwhile, so a burst costs at most two runs.
+    """
+    
+    def __init__(self, run: Callable[[], bool] = trigger_ai_processing,
+                 on_complete: Optional[Callable[[List[str], bool], None]] = None):
+        self._run = run
+        self._on_complete = on_complete
+        self._pending: List[str] = []
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.runs = 0
+    
+    @property
+    def busy(self) -> bool:
+        """True while a run (or its follow-up) is in progress"""
+        return self._thread is not None
+    
+    def request(self, filenames: Sequence[str]) -> bool:
+        """
+        Ask for a processing run covering these files.
+        
+        Args:
+            filenames: Newly detected files
+        
+        Returns:
+            bool: True if a run was started, False if the files were queued
+            for the follow-up run of the one in progress
+        """
+        with self._lock:
+            self._pending.extend(filenames)
+            if self._thread is not None:
+                return False
+            self._thread = threading.Thread(target=self._drain, name="ai-processing", daemon=True)
+            self._thread.start()
+            return True
+    
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if not batch:
+                    self._thread = None
+                    return
+            if len(batch) > 1:
+                COALESCED_FILES.inc(len(batch) - 1)
+            try:
+                # Runs after the detection cycle's trace has ended, so it gets its own
+                with trace_cycle("watcher-processing", files=len(batch)):
+                    succeeded = self._run()
+            except Exception as e:
+                log_error(f"Failed to trigger AI Processing: {e}")
+                succeeded = False
+            self.runs += 1
+            if self._on_complete:
+                self._on_complete(batch, succeeded)
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the current run and its follow-up to finish.
+        
+        Returns:
+            bool: True if no run is in progress any more
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._thread is None
+
+
+def processing_finished(filenames: List[str], succeeded: bool) -> None:
+    """Record the outcome of a coalesced processing run"""
+    if succeeded:
+        state.files_processed += len(filenames)
+        log_action(f"AI Processing covered {len(filenames)} file(s)")
+    else:
+        for filename in filenames:
+            log_error(f"AI Processing failed for: {filename}")
+
+
 # =============================================================================
 # FILE MONITORING
 # =============================================================================
@@ -220,34 +335,43 @@ def check_for_new_files(processed_files: Set[str]) -> list:
         list: List of new filenames to process
     """
     try:
-        current_files = get_inbox_md_files()
-        new_files = list(current_files - processed_files)
+        with SCAN_SECONDS.time():
+            current_files = get_inbox_md_files()
+            new_files = list(current_files - processed_files)
+        INBOX_FILES.set(len(current_files))
         return sorted(new_files)
     except Exception as e:
         log_error(f"Error checking for new files: {e}")
         return []
 
 
-def process_new_file(filename: str, processed_files: Set[str]) -> None:
+def process_new_file(filename: str, processed_files: Set[str],
+                     trigger: Optional[ProcessingTrigger] = None) -> None:
     """
     Process a newly detected file:
     1. Log detection
     2. Add to processed tracker
-    3. Trigger AI Processing workflow
+    3. Trigger AI Processing workflow (unless a trigger coalesces it)
     
     Args:
         filename: Name of the file to process
         processed_files: Set of already processed filenames
+        trigger: Coalescing trigger; the caller requests one run for the
+            whole scan batch instead of one run per file
     """
     try:
         # Log detection
         log_action(f"DETECTED: {filename} - Triggering AI Processing")
         state.detections_logged += 1
+        DETECTIONS.inc()
         
         # Add to processed tracker immediately to avoid duplicates
         save_processed_file(filename, processed_files)
         log_action(f"PROCESSED: {filename} - Added to tracker")
         
+        if trigger is not None:
+            return
+        
         # Trigger AI Processing workflow
         if trigger_ai_processing():
             state.files_processed += 1
@@ -326,6 +450,13 @@ def main() -> None:
     print(f"Loaded {len(processed_files)} previously processed files")
     print()
     
+    # Reuse a running worker pool (e.g. the scheduler's) or start one
+    pool = ensure_pool()
+    
+    # One AI processing run per scan batch, plus at most one follow-up
+    # for files detected while it runs
+    processing = ProcessingTrigger(on_complete=processing_finished)
+    
     try:
         # Main monitoring loop
         while state.running:
@@ -334,12 +465,25 @@ def main() -> None:
                 new_files = check_for_new_files(processed_files)
                 
                 if new_files:
-                    for filename in new_files:
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] 📥 Detected: {filename}")
-                        process_new_file(filename, processed_files)
+                    publish_watcher_status("processing", pending=len(new_files))
+                    with trace_cycle("watcher", files=len(new_files)):
+                        for filename in new_files:
+                            print(f"[{datetime.now().strftime('%H:%M:%S')}] 📥 Detected: {filename}")
+                            with span("watch_file", cat="file", file=filename):
+                                process_new_file(filename, processed_files, processing)
+                    if not processing.request(new_files):
+                        log_action(f"QUEUED: {len(new_files)} file(s) for the follow-up AI Processing run")
                 
                 # Randomized sleep interval (10-30 seconds)
+                write_textfile("watcher")
                 sleep_time = random.randint(MIN_CHECK_INTERVAL, MAX_CHECK_INTERVAL)
+                now = time.time()
+                publish_watcher_status(
+                    "watching",
+                    ai_processing=processing.busy,
+                    last_scan_at=datetime.fromtimestamp(now).isoformat(timespec="seconds"),
+                    next_scan_at=datetime.fromtimestamp(now + sleep_time).isoformat(timespec="seconds"),
+                )
                 time.sleep(sleep_time)
                 
             except Exception as e:
@@ -352,8 +496,11 @@ def main() -> None:
         print(f"\n[ERROR] Unexpected error: {e}", file=sys.stderr)
         
     finally:
-        # Cleanup
+        # Cleanup: let an in-flight run finish before its worker pool stops
+        processing.wait(timeout=300)
+        release_pool(pool)
         log_action(f"WATCHER_STOPPED - Processed {state.files_processed} files, Uptime: {state.uptime()}")
+        publish_watcher_status("stopped")
         print_shutdown_summary()
 
 
@@ -1,10 +1,17 @@
 import streamlit as st
 import pandas as pd
-import os
-import json
 from datetime import datetime
 from pathlib import Path
-import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.resolve()))
+from health_monitor import get_health, describe_probe, DEFAULT_TTL_SECONDS
+from dashboard_data import (
+    get_task_counts, get_recent_actions, get_latest_plan, list_files,
+    load_json, read_text, tail_lines, clear_cache, cached,
+    get_summaries, get_summary, paginate, PLAN_PREFIX,
+)
+from vault_events import get_live_state, read_statuses, with_liveness, STATUS_DIR
 
 # =============================================================================
 # SET PAGE CONFIG
@@ -85,25 +92,104 @@ ERRORS_LOG = LOGS_DIR / "errors.log"
 RETRY_QUEUE = LOGS_DIR / "retry_queue.json"
 RALPH_STATE = SKILLS_DIR / "ralph-wiggum" / "state.json"
 
-def load_json(path):
-    if not path.exists(): return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+ERROR_LOG_LINES = 200
+LIVE_REFRESH_SECONDS = 2
 
-def get_task_counts():
-    counts = {
-        "Inbox": len(list((VAULT_DIR / "Inbox").glob("*.md"))),
-        "Needs_Action": len(list((VAULT_DIR / "Needs_Action").glob("*.md"))),
-        "Needs_Approval": len(list((VAULT_DIR / "Needs_Approval").glob("*.md"))),
-        "Done": len(list((VAULT_DIR / "Done").glob("*.md"))),
-        "Errors": len(list((VAULT_DIR / "Errors").glob("*")))
-    }
-    return counts
+# Vault reads go through dashboard_data: cached between reruns and only
+# refreshed when the underlying folder or file changes.
+
+HEALTH_ICONS = {"OK": "✅", "WARNING": "⚠️", "CRITICAL": "🛑"}
+HEALTH_ALERTS = {"OK": st.success, "WARNING": st.warning, "CRITICAL": st.error}
+PRIORITY_ICONS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+def select_page(summaries, key):
+    """Page picker; returns the summaries on the selected page"""
+    pages = paginate(summaries, 1)[1]
+    page = 1
+    if pages > 1:
+        page = st.number_input(f"Page (1-{pages})", min_value=1, max_value=pages, value=1, key=f"{key}_page")
+    items, pages = paginate(summaries, page)
+    st.caption(f"{len(summaries)} item(s) - page {page} of {pages}")
+    return items
+
+def summary_caption(summary):
+    priority = summary.get("priority") or "-"
+    return f"{PRIORITY_ICONS.get(priority, '⚪')} {priority} | `{summary['name']}`"
+
+# =============================================================================
+# LIVE UPDATES
+# =============================================================================
+# vault_events.py pushes scheduler/watcher status and task counts over SSE;
+# LiveState keeps the latest values in memory on a background thread.
+# Streamlit cannot redraw a session from another thread, so the live widgets
+# are fragments that re-render from that in-memory state every
+# LIVE_REFRESH_SECONDS - only the fragment reruns, with no disk I/O.
+# Without the event server they fall back to the cached file reads.
+
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+def live_fragment(func):
+    if _fragment is None:
+        return func
+    return _fragment(run_every=LIVE_REFRESH_SECONDS)(func)
+
+def live_data(event):
+    live = get_live_state()
+    if live.connected and event in live.data:
+        return live.data[event]
+    if event == "counts":
+        return get_task_counts()
+    if event == "status":
+        return with_liveness(cached(("statuses",), [STATUS_DIR], read_statuses))
+    return None
+
+def format_time(value):
+    if not value:
+        return "-"
+    try:
+        return datetime.fromisoformat(value).strftime("%H:%M:%S")
+    except ValueError:
+        return value
+
+@live_fragment
+def live_status_panel():
+    statuses = live_data("status")
+    scheduler = statuses.get("scheduler", {})
+    if scheduler.get("alive"):
+        st.success(f"🟢 Scheduler ONLINE - {scheduler.get('stage') or scheduler.get('state', 'idle')}")
+        st.caption(f"Last cycle: {format_time(scheduler.get('last_cycle_at'))} | "
+                   f"Next sync: {format_time(scheduler.get('next_cycle_at'))}")
+    else:
+        st.error("🔴 Scheduler OFFLINE")
+        if scheduler.get("last_cycle_at"):
+            st.caption(f"Last cycle: {format_time(scheduler['last_cycle_at'])}")
 
-def get_recent_actions(limit=10):
-    if not ACTION_LOG.exists(): return []
-    with open(ACTION_LOG, "r", encoding="utf-8") as f:
-        return f.readlines()[-limit:][::-1]
+    watcher = statuses.get("watcher", {})
+    if watcher.get("alive"):
+        st.success(f"👁️ Watcher {watcher.get('state', 'watching')} - next scan {format_time(watcher.get('next_scan_at'))}")
+    else:
+        st.warning("👁️ Watcher stopped")
+
+    source = "live event stream" if get_live_state().connected else "status files (event stream offline)"
+    st.caption(f"Updated {datetime.now().strftime('%H:%M:%S')} from {source}")
+
+@live_fragment
+def live_task_metrics():
+    counts = live_data("counts")
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("📥 Total Inbox", counts["Inbox"])
+    c2.metric("📋 Active Tasks", counts["Needs_Action"])
+    c3.metric("✅ Successfully Completed", counts["Done"])
+    c4.metric("⚠️ Quarantine (Errors)", counts["Errors"], delta_color="inverse")
+
+@live_fragment
+def live_task_chart():
+    counts = live_data("counts")
+    df = pd.DataFrame({
+        'Stage': ['Inbox', 'Needs Action', 'Needs Approval', 'Completed'],
+        'Count': [counts['Inbox'], counts['Needs_Action'], counts['Needs_Approval'], counts['Done']]
+    })
+    st.bar_chart(df.set_index('Stage'))
 
 # =============================================================================
 # SIDEBAR - NAVIGATION & STATUS
@@ -117,11 +203,15 @@ with st.sidebar:
     
     st.markdown("---")
     st.subheader("📡 System Status")
-    st.success("✅ Main Scheduler: ONLINE")
-    st.success("✅ Vault Watcher: ACTIVE")
-    st.info("🕒 Next Sync: 2:45 mins")
+    live_status_panel()
+    health = get_health()
+    for probe in health["probes"]:
+        show = HEALTH_ALERTS[probe["status"]]
+        show(f"{HEALTH_ICONS[probe['status']]} {describe_probe(probe)}")
+    st.caption(f"Health checked {health['checked_at']} (cached {DEFAULT_TTL_SECONDS}s)")
     
     if st.button("🔄 Sync Operations"):
+        clear_cache()
         st.rerun()
 
 # =============================================================================
@@ -131,13 +221,8 @@ if menu == "Dashboard":
     st.title("🚀 Operational Command Center")
     st.markdown(f"**Last Unified Sync:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Unified Metrics
-    counts = get_task_counts()
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("📥 Total Inbox", counts["Inbox"])
-    c2.metric("📋 Active Tasks", counts["Needs_Action"])
-    c3.metric("✅ Successfully Completed", counts["Done"])
-    c4.metric("⚠️ Quarantine (Errors)", counts["Errors"], delta_color="inverse")
+    # Unified Metrics (live)
+    live_task_metrics()
 
     st.markdown("---")
     
@@ -146,25 +231,18 @@ if menu == "Dashboard":
     
     with col_left:
         st.subheader("📊 Task Lifecycle Visual")
-        df = pd.DataFrame({
-            'Stage': ['Inbox', 'Needs Action', 'Needs Approval', 'Completed'],
-            'Count': [counts['Inbox'], counts['Needs_Action'], counts['Needs_Approval'], counts['Done']]
-        })
-        st.bar_chart(df.set_index('Stage'))
+        live_task_chart()
         
     with col_right:
         st.subheader("🧠 Strategic Reasoning")
-        latest_plans = list((VAULT_DIR / "Needs_Action").glob("Plan_*.md"))
-        if latest_plans:
-            latest_plan = sorted(latest_plans, key=os.path.getmtime)[-1]
+        latest_plan = get_latest_plan()
+        if latest_plan:
             st.info(f"**Latest Logic Chain:** {latest_plan.name}")
-            with open(latest_plan, "r", encoding="utf-8") as f:
-                content = f.read()
-                reasoning = re.search(r"## 🧠 Reasoning \(Chain-of-Thought\)\n\n(.*?)\n\n##", content, re.DOTALL)
-                if reasoning:
-                    st.markdown(reasoning.group(1))
-                else:
-                    st.write("Strategic deliberation in progress...")
+            summary = get_summary(latest_plan, PLAN_PREFIX)
+            if summary and summary["excerpt"]:
+                st.markdown(summary["excerpt"])
+            else:
+                st.write("Strategic deliberation in progress...")
         else:
             st.write("No active plans to display.")
 
@@ -178,9 +256,9 @@ elif menu == "🥉 Bronze: Core":
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("📥 Inbox Status")
-        files = list((VAULT_DIR / "Inbox").glob("*.md"))
+        files = list_files(VAULT_DIR / "Inbox", ".md")
         if files:
-            for f in files: st.markdown(f"- 📄 `{f.name}`")
+            for name in files: st.markdown(f"- 📄 `{name}`")
         else:
             st.write("Inbox is clean.")
             
@@ -201,24 +279,31 @@ elif menu == "🥈 Silver: Advanced":
     
     with tab_a:
         st.subheader("Active Execution Plans")
-        plans = list((VAULT_DIR / "Needs_Action").glob("Plan_*.md"))
+        plans = get_summaries(VAULT_DIR / "Needs_Action", ".md", PLAN_PREFIX)
         if plans:
-            for p in plans:
-                with st.expander(f"🔍 {p.name}"):
-                    with open(p, "r", encoding="utf-8") as f:
-                        st.markdown(f.read())
+            for plan in select_page(plans, "plans"):
+                st.markdown(f"**🔍 {plan['title']}**")
+                st.caption(summary_caption(plan))
+                if plan["excerpt"]:
+                    st.markdown(plan["excerpt"])
+                # The full plan is only read when opened
+                if st.checkbox("Show full plan", key=f"plan_{plan['name']}"):
+                    st.markdown(read_text(VAULT_DIR / "Needs_Action" / plan["name"]))
+                st.markdown("---")
         else:
             st.write("No active plans found.")
             
     with tab_b:
         st.subheader("Pending Human Approvals")
-        approvals = list((VAULT_DIR / "Needs_Approval").glob("*.md"))
+        approvals = get_summaries(VAULT_DIR / "Needs_Approval", ".md")
         if approvals:
-            for a in approvals:
-                st.warning(f"⚠️ **Action Required:** {a.name}")
-                if st.button(f"View Details: {a.name}"):
-                    with open(a, "r", encoding="utf-8") as f:
-                        st.code(f.read(), language="markdown")
+            for approval in select_page(approvals, "approvals"):
+                st.warning(f"⚠️ **Action Required:** {approval['title']}")
+                st.caption(summary_caption(approval))
+                if approval["excerpt"]:
+                    st.markdown(approval["excerpt"])
+                if st.checkbox(f"View Details: {approval['name']}", key=f"approval_{approval['name']}"):
+                    st.code(read_text(VAULT_DIR / "Needs_Approval" / approval["name"]), language="markdown")
         else:
             st.success("All approvals cleared!")
 
@@ -235,7 +320,7 @@ elif menu == "🥇 Gold: Autonomous":
     c1, c2, c3 = st.columns(3)
     c1.metric("🔁 Current Iteration", state.get("current_iteration", 0))
     c2.metric("🤖 Active Loops", len(state.get("active_tasks", [])))
-    c3.metric("📊 Reports Generated", len(list((VAULT_DIR / "Reports").glob("*.md"))))
+    c3.metric("📊 Reports Generated", len(list_files(VAULT_DIR / "Reports", ".md")))
     
     st.markdown("---")
     
@@ -259,9 +344,10 @@ elif menu == "⚙️ System Logs":
         actions = get_recent_actions(50)
         st.code("".join(actions), language="text")
     else:
-        if ERRORS_LOG.exists():
-            with open(ERRORS_LOG, "r", encoding="utf-8") as f:
-                st.error(f.read())
+        errors = tail_lines(ERRORS_LOG, ERROR_LOG_LINES)
+        if errors:
+            st.caption(f"Last {ERROR_LOG_LINES} lines of {ERRORS_LOG.name}")
+            st.error("".join(errors))
         else:
             st.info("No system errors recorded.")
 
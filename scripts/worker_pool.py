@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+Worker Pool - Resident Warm Python Workers for Script Runs
+
+The scheduler and inbox watcher used to start a fresh interpreter for every
+script run (ai_employee.py --once per inbox batch, the gmail watcher and
+CEO briefing each cycle), paying interpreter startup and the Google client
+imports every time. The pool keeps a few worker processes alive with those
+modules already imported and runs each script inside one of them with
+runpy, so a job costs only the script itself.
+
+Jobs reach the pool over a local pipe (multiprocessing.connection: a named
+pipe on Windows, a Unix socket elsewhere) authenticated with a random key
+stored in Logs/worker_pool.json. A burst of jobs queues for the fixed set
+of workers instead of forking one interpreter per job. A worker is
+replaced after a timeout, after MAX_JOBS_PER_WORKER jobs, and after any
+job that leaves threads running (such as a timed-out briefing collector),
+so no job's threads run on into the next one. When no pool is
+running, run_script() falls back to subprocess.run, so callers work the
+same either way.
+
+    python scripts/worker_pool.py              # serve in the foreground
+    python scripts/worker_pool.py --status     # is a pool running?
+
+Usage:
+    from worker_pool import ensure_pool, run_script
+
+    pool = ensure_pool()                       # embedded pool unless one is running
+    result = run_script(AI_EMPLOYEE_SCRIPT, ["--once"], cwd=BASE_DIR, timeout=300)
+    print(result.returncode, result.stdout)
+    if pool:
+        pool.stop()
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import queue
+import runpy
+import signal
+import argparse
+import threading
+import traceback
+import subprocess
+import multiprocessing
+from multiprocessing.connection import Listener, Client
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Sequence
+
+from metrics_registry import counter, histogram, TextfileWriter
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BASE_DIR = SCRIPT_DIR.parent
+LOGS_DIR = BASE_DIR / "Logs"
+
+# Address, auth key and pid of the running pool
+STATE_FILE = LOGS_DIR / "worker_pool.json"
+
+DEFAULT_WORKERS = int(os.environ.get("WORKER_POOL_SIZE", "2"))
+
+# Workers are replaced after this many jobs to bound leaked state
+MAX_JOBS_PER_WORKER = 100
+
+# WORKER_POOL=0 disables pooling; every run_script() call starts a subprocess
+POOL_ENABLED = os.environ.get("WORKER_POOL", "1").lower() not in ("0", "false", "no", "off")
+
+# Imported once per worker so jobs start warm; missing optional modules are skipped
+# (ai_employee.py --once needs no UI modules, so Rich is not preloaded)
+PRELOAD_MODULES = (
+    "google.oauth2.credentials", "google_auth_oauthlib.flow", "googleapiclient.discovery",
+)
+
+# Seconds to wait for a worker to start and preload
+STARTUP_TIMEOUT = 60
+
+# Grace period for threads a job started to finish once the script returns
+THREAD_GRACE_SECONDS = 0.2
+
+# A remote pool enforces the job timeout itself; clients wait this much longer
+# for its reply before giving up (e.g. when the hosting process hangs)
+REQUEST_MARGIN_SECONDS = 5.0
+PING_TIMEOUT = 5.0
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+JOBS = counter("worker_pool_jobs_total", "Script runs served by the worker pool", ("outcome",))
+JOB_SECONDS = histogram("worker_pool_job_seconds", "Time to run one script in a warm worker")
+RECYCLED = counter("worker_pool_leaked_thread_recycles_total",
+                   "Workers replaced because a job left threads running")
+
+
+# =============================================================================
+# WORKER PROCESS
+# =============================================================================
+
+def execute_script(script: str, args: Sequence[str] = (), cwd: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a script as __main__ in this process and capture its output.
+
+    Args:
+        script: Path to the Python script
+        args: Command-line arguments (without the script name)
+        cwd: Working directory for the run
+
+    Returns:
+        dict: returncode, stdout, stderr, seconds and leaked_threads (threads
+        the script started that were still running after it returned)
+    """
+    saved = (list(sys.argv), list(sys.path), os.getcwd(), sys.stdout, sys.stderr)
+    threads_before = set(threading.enumerate())
+    # Byte buffers keep .buffer available for scripts that rewrap sys.stdout
+    out_buf, err_buf = io.BytesIO(), io.BytesIO()
+    sys.stdout = io.TextIOWrapper(out_buf, encoding="utf-8", errors="replace", write_through=True)
+    sys.stderr = io.TextIOWrapper(err_buf, encoding="utf-8", errors="replace", write_through=True)
+    sys.argv = [str(script)] + [str(a) for a in args]
+    sys.path.insert(0, str(Path(script).parent))
+
+    returncode = 0
+    start = time.perf_counter()
+    try:
+        if cwd:
+            os.chdir(cwd)
+        runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        elif isinstance(e.code, int):
+            returncode = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except BaseException:
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+        stdout = out_buf.getvalue().decode("utf-8", errors="replace")
+        stderr = err_buf.getvalue().decode("utf-8", errors="replace")
+        sys.argv, sys.path[:] = saved[0], saved[1]
+        os.chdir(saved[2])
+        sys.stdout, sys.stderr = saved[3], saved[4]
+    seconds = time.perf_counter() - start
+
+    # e.g. a timed-out collector thread: it would keep running into later
+    # jobs and resolve its relative paths against their working directory
+    deadline = time.monotonic() + THREAD_GRACE_SECONDS
+    leaked = [t for t in threading.enumerate() if t not in threads_before]
+    for thread in leaked:
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+    return {
+        "returncode": returncode,
+        "stdout": stdout,
+        "stderr": stderr,
+        "seconds": seconds,
+        "leaked_threads": sum(1 for t in leaked if t.is_alive()),
+    }
+
+
+def _worker_main(conn, preload: Sequence[str]) -> None:
+    """Worker process loop: preload modules, then run jobs until told to stop"""
+    # Shutdown is driven by the pool, not by Ctrl+C in the parent's console
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for name in preload:
+        try:
+            __import__(name)
+        except Exception:
+            pass
+    conn.send({"ready": True, "pid": os.getpid()})
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        result = execute_script(job["script"], job.get("args", ()), job.get("cwd"))
+        result["pid"] = os.getpid()
+        conn.send(result)
+
+
+class _Worker:
+    """Parent-side handle of one worker process"""
+
+    def __init__(self, preload: Sequence[str]):
+        ctx = multiprocessing.get_context("spawn")
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child, tuple(preload)),
+                                   name="worker-pool", daemon=True)
+        self.process.start()
+        child.close()
+        self.jobs = 0
+        try:
+            if not self.conn.poll(STARTUP_TIMEOUT):
+                raise RuntimeError("Worker did not start")
+            self.pid = self.conn.recv()["pid"]
+        except (EOFError, OSError):
+            self.kill()
+            raise RuntimeError(f"Worker exited during startup (exit code {self.process.exitcode})")
+        except RuntimeError:
+            self.kill()
+            raise
+
+    def run(self, job: Dict[str, Any], timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+        """
+        Send a job and wait for its result.
+
+        Returns:
+            dict: The job result, or None if it timed out
+        """
+        self.jobs += 1
+        self.conn.send(job)
+        if not self.conn.poll(timeout):
+            return None
+        return self.conn.recv()
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(5)
+        self.conn.close()
+
+    def close(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(5)
+        self.conn.close()
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+class WorkerPool:
+    """
+    A fixed set of warm workers plus a local listener that accepts jobs
+    from other processes.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, state_file: Path = STATE_FILE,
+                 preload: Sequence[str] = PRELOAD_MODULES, max_jobs: int = MAX_JOBS_PER_WORKER):
+        self.size = max(1, workers)
+        self.state_file = Path(state_file)
+        self.preload = tuple(preload)
+        self.max_jobs = max_jobs
+        self.address = None
+        self.family = "AF_PIPE" if sys.platform == "win32" else "AF_UNIX"
+        self._authkey = os.urandom(16)
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._listener: Optional[Listener] = None
+        self._running = False
+
+    def start(self, listen: bool = True) -> "WorkerPool":
+        """
+        Start the workers and (optionally) the listener for other processes.
+
+        Args:
+            listen: Accept jobs over the local pipe and write the state file
+
+        Returns:
+            WorkerPool: self
+        """
+        for _ in range(self.size):
+            self._add_worker()
+        self._running = True
+        if listen:
+            self._listener = Listener(family=self.family, authkey=self._authkey)
+            self.address = self._listener.address
+            self._write_state()
+            threading.Thread(target=self._accept_loop, name="worker-pool-accept",
+                             daemon=True).start()
+        return self
+
+    def _add_worker(self) -> _Worker:
+        worker = _Worker(self.preload)
+        with self._lock:
+            self._workers.append(worker)
+        self._idle.put(worker)
+        return worker
+
+    def _retire(self, worker: _Worker, kill: bool = False) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.kill() if kill else worker.close()
+        if self._running:
+            self._add_worker()
+
+    def pids(self) -> List[int]:
+        with self._lock:
+            return [w.pid for w in self._workers]
+
+    def run(self, script: Path, args: Sequence[str] = (), cwd: Optional[Path] = None,
+            timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run a script in the next idle worker, waiting for one if all are busy.
+
+        Args:
+            script: Path to the Python script
+            args: Command-line arguments
+            cwd: Working directory for the run
+            timeout: Seconds from this call (time spent waiting for an idle
+                     worker included) before the job is abandoned; a worker
+                     running it is killed and replaced
+
+        Returns:
+            dict: returncode, stdout, stderr, seconds and pid; "timeout": True
+            when the job was killed or no worker became idle in time
+        """
+        job = {"script": str(script), "args": [str(a) for a in args],
+               "cwd": str(cwd) if cwd else None}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            JOBS.labels("queue_timeout").inc()
+            return {"returncode": -9, "stdout": "", "stderr": "", "seconds": timeout,
+                    "pid": None, "timeout": True}
+
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            result = worker.run(job, remaining)
+        except (EOFError, OSError) as e:
+            JOBS.labels("crashed").inc()
+            self._retire(worker, kill=True)
+            return {"returncode": 1, "stdout": "", "stderr": f"Worker died: {e}\n",
+                    "seconds": 0.0, "pid": worker.pid}
+
+        if result is None:
+            JOBS.labels("timeout").inc()
+            self._retire(worker, kill=True)
+            return {"returncode": -9, "stdout": "", "stderr": "", "seconds": timeout,
+                    "pid": worker.pid, "timeout": True}
+
+        JOBS.labels("ok" if result["returncode"] == 0 else "failed").inc()
+        JOB_SECONDS.observe(result["seconds"])
+        if result.get("leaked_threads"):
+            # Threads left behind by the job must not outlive it: replace the worker
+            RECYCLED.inc()
+            self._retire(worker, kill=True)
+        elif worker.jobs >= self.max_jobs:
+            self._retire(worker)
+        else:
+            self._idle.put(worker)
+        return result
+
+    def _accept_loop(self) -> None:
+        while self._running:
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                # Failed handshakes must not stop the pool
+                if not self._running:
+                    break
+                continue
+            threading.Thread(target=self._serve, args=(conn,), name="worker-pool-conn",
+                             daemon=True).start()
+
+    def _serve(self, conn) -> None:
+        try:
+            request = conn.recv()
+            if request.get("op") == "ping":
+                conn.send({"ok": True, "pid": os.getpid(), "workers": self.pids()})
+            elif request.get("op") == "run" and self._running:
+                conn.send(self.run(request["script"], request.get("args", ()),
+                                   request.get("cwd"), request.get("timeout")))
+            else:
+                conn.send({"error": f"Unsupported request: {request.get('op')}"})
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+
+    def _write_state(self) -> None:
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "address": self.address,
+            "family": self.family,
+            "authkey": self._authkey.hex(),
+            "pid": os.getpid(),
+            "workers": self.size,
+        }
+        tmp = self.state_file.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_file)
+
+    def stop(self) -> None:
+        """Stop accepting jobs, shut the workers down and remove the state file"""
+        if not self._running:
+            return
+        self._running = False
+        if self._listener is not None:
+            # Wake the accept loop so it can see the pool is stopping
+            try:
+                Client(self.address, authkey=self._authkey).close()
+            except Exception:
+                pass
+            self._listener.close()
+            state = _read_state(self.state_file)
+            if state and state.get("pid") == os.getpid():
+                try:
+                    self.state_file.unlink()
+                except OSError:
+                    pass
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start() if not self._running else self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+# Pool started by ensure_pool() in this process; used without the pipe
+_local_pool: Optional[WorkerPool] = None
+
+
+def _pid_alive(pid: int) -> bool:
+    if sys.platform == "win32":
+        import ctypes
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)
+        if handle:
+            ctypes.windll.kernel32.CloseHandle(handle)
+            return True
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_state(state_file: Path = STATE_FILE) -> Optional[Dict[str, Any]]:
+    """The running pool's state, or None if there is none (or it died)"""
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not state.get("address") or not _pid_alive(int(state.get("pid", 0))):
+        return None
+    return state
+
+
+def _request(state: Dict[str, Any], request: Dict[str, Any],
+             timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Send one request to a pool process and wait for its reply.
+
+    Raises:
+        TimeoutError: If no reply arrived within timeout seconds
+    """
+    conn = Client(state["address"], family=state.get("family"),
+                  authkey=bytes.fromhex(state["authkey"]))
+    try:
+        conn.send(request)
+        if timeout is not None and not conn.poll(timeout):
+            raise TimeoutError(f"No reply from the worker pool within {timeout:g}s")
+        return conn.recv()
+    finally:
+        conn.close()
+
+
+def pool_available(state_file: Path = STATE_FILE) -> bool:
+    """True if a pool process answers on its pipe"""
+    state = _read_state(state_file)
+    if state is None:
+        return False
+    try:
+        return bool(_request(state, {"op": "ping"}, timeout=PING_TIMEOUT).get("ok"))
+    except Exception:
+        return False
+
+
+def run_script(script: Path, args: Sequence[str] = (), cwd: Optional[Path] = None,
+               timeout: Optional[float] = 300,
+               state_file: Path = STATE_FILE) -> subprocess.CompletedProcess:
+    """
+    Run a Python script in a warm pool worker, or in a new interpreter if
+    no pool is running.
+
+    Args:
+        script: Path to the Python script
+        args: Command-line arguments
+        cwd: Working directory for the run
+        timeout: Seconds before the run is abandoned, counted from this call
+                 (queueing for a busy pool included)
+        state_file: State file of the pool to use
+
+    Returns:
+        CompletedProcess: With returncode, stdout and stderr as text
+
+    Raises:
+        subprocess.TimeoutExpired: If the run exceeded the timeout
+    """
+    cmd = [sys.executable, str(script)] + [str(a) for a in args]
+    deadline = None if timeout is None else time.monotonic() + timeout
+    result = None
+
+    if POOL_ENABLED:
+        if _local_pool is not None and _local_pool.state_file == Path(state_file):
+            result = _local_pool.run(script, args, cwd, timeout)
+        else:
+            state = _read_state(state_file)
+            if state is not None:
+                wait = None if timeout is None else timeout + REQUEST_MARGIN_SECONDS
+                try:
+                    result = _request(state, {"op": "run", "script": str(script),
+                                              "args": [str(a) for a in args],
+                                              "cwd": str(cwd) if cwd else None,
+                                              "timeout": timeout}, timeout=wait)
+                except TimeoutError:
+                    # The job may still be running there: do not start it twice
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                except Exception:
+                    # Pool went away: fall back to a subprocess
+                    result = None
+                if result is not None and "error" in result:
+                    result = None
+
+    if result is None:
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return subprocess.run(cmd, cwd=str(cwd) if cwd else None, capture_output=True,
+                              text=True, timeout=remaining)
+    if result.get("timeout"):
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(cmd, result["returncode"], result["stdout"], result["stderr"])
+
+
+def ensure_pool(workers: int = DEFAULT_WORKERS,
+                state_file: Path = STATE_FILE) -> Optional[WorkerPool]:
+    """
+    Start an embedded pool for this process unless pooling is disabled or
+    another process already serves one. The embedded pool also listens on
+    the pipe, so other processes (e.g. the inbox watcher) can share it.
+
+    Returns:
+        WorkerPool: The started pool (caller stops it), or None
+    """
+    global _local_pool
+    if not POOL_ENABLED or pool_available(state_file):
+        return None
+    try:
+        _local_pool = WorkerPool(workers, state_file).start()
+    except Exception as e:
+        print(f"[WARN] Worker pool unavailable, using subprocesses: {e}", file=sys.stderr)
+        _local_pool = None
+    return _local_pool
+
+
+def release_pool(pool: Optional[WorkerPool]) -> None:
+    """Stop a pool returned by ensure_pool()"""
+    global _local_pool
+    if pool is None:
+        return
+    pool.stop()
+    if _local_pool is pool:
+        _local_pool = None
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Resident warm worker pool for script runs")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Worker processes")
+    parser.add_argument("--status", action="store_true", help="Show whether a pool is running")
+    args = parser.parse_args()
+
+    if args.status:
+        state = _read_state()
+        if state is None or not pool_available():
+            print("No worker pool running")
+            return 1
+        info = _request(state, {"op": "ping"})
+        print(f"Worker pool running (pid {info['pid']}), workers: {info['workers']}")
+        return 0
+
+    if pool_available():
+        print("A worker pool is already running")
+        return 1
+
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    pool = WorkerPool(args.workers).start()
+    writer = TextfileWriter("worker_pool").start()
+    print(f"Worker pool serving on {pool.address} with {pool.size} workers (pids {pool.pids()})")
+    print("Press Ctrl+C to stop")
+    try:
+        while not stop.wait(1):
+            pass
+    finally:
+        writer.stop()
+        pool.stop()
+        print("Worker pool stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())